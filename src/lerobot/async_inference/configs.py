@@ -20,9 +20,14 @@ import torch
 from lerobot.robots.config import RobotConfig
 
 from .constants import (
+    DEFAULT_BATCH_TIMEOUT,
+    DEFAULT_CLIENT_TIMEOUT,
     DEFAULT_FPS,
     DEFAULT_INFERENCE_LATENCY,
+    DEFAULT_MAX_BATCH_SIZE,
+    DEFAULT_MAX_CLIENTS,
     DEFAULT_OBS_QUEUE_TIMEOUT,
+    IMAGE_ENCODINGS,
 )
 
 # Aggregate function registry for CLI usage
@@ -64,6 +69,26 @@ class PolicyServerConfig:
         default=DEFAULT_OBS_QUEUE_TIMEOUT, metadata={"help": "Timeout for observation queue in seconds"}
     )
 
+    # Multi-client configuration
+    max_clients: int = field(
+        default=DEFAULT_MAX_CLIENTS, metadata={"help": "Maximum number of robot clients served at once"}
+    )
+    max_batch_size: int = field(
+        default=DEFAULT_MAX_BATCH_SIZE,
+        metadata={"help": "Maximum number of observations, one per client, run through the policy at once"},
+    )
+    batch_timeout: float = field(
+        default=DEFAULT_BATCH_TIMEOUT,
+        metadata={
+            "help": "Latency budget in seconds to wait for the observations of the other clients "
+            "before running inference on a partial batch"
+        },
+    )
+    client_timeout: float = field(
+        default=DEFAULT_CLIENT_TIMEOUT,
+        metadata={"help": "Clients not sending observations for this long, in seconds, are disconnected"},
+    )
+
     def __post_init__(self):
         """Validate configuration after initialization."""
         if self.port < 1 or self.port > 65535:
@@ -78,6 +103,18 @@ class PolicyServerConfig:
         if self.obs_queue_timeout < 0:
             raise ValueError(f"obs_queue_timeout must be non-negative, got {self.obs_queue_timeout}")
 
+        if self.max_clients < 1:
+            raise ValueError(f"max_clients must be positive, got {self.max_clients}")
+
+        if self.max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {self.max_batch_size}")
+
+        if self.batch_timeout < 0:
+            raise ValueError(f"batch_timeout must be non-negative, got {self.batch_timeout}")
+
+        if self.client_timeout <= 0:
+            raise ValueError(f"client_timeout must be positive, got {self.client_timeout}")
+
     @classmethod
     def from_dict(cls, config_dict: dict) -> "PolicyServerConfig":
         """Create a PolicyServerConfig from a dictionary."""
@@ -96,6 +133,9 @@ class PolicyServerConfig:
             "fps": self.fps,
             "environment_dt": self.environment_dt,
             "inference_latency": self.inference_latency,
+            "max_clients": self.max_clients,
+            "max_batch_size": self.max_batch_size,
+            "batch_timeout": self.batch_timeout,
         }
 
 
@@ -131,6 +171,19 @@ class RobotClientConfig:
     chunk_size_threshold: float = field(default=0.5, metadata={"help": "Threshold for chunk size control"})
     fps: int = field(default=DEFAULT_FPS, metadata={"help": "Frames per second"})
 
+    # Observation transport configuration
+    image_encoding: str = field(
+        default="raw", metadata={"help": f"Encoding of the camera images sent. Options: {IMAGE_ENCODINGS}"}
+    )
+    jpeg_quality: int = field(default=90, metadata={"help": "Quality of the JPEG images, between 0 and 100"})
+    resize_images: bool = field(
+        default=False,
+        metadata={
+            "help": "Resize the camera images to the input resolution of the policy before sending them, "
+            "which requires the policy config to be available on the client"
+        },
+    )
+
     # Aggregate function configuration (CLI-compatible)
     aggregate_fn_name: str = field(
         default="weighted_average",
@@ -170,6 +223,12 @@ class RobotClientConfig:
         if self.actions_per_chunk <= 0:
             raise ValueError(f"actions_per_chunk must be positive, got {self.actions_per_chunk}")
 
+        if self.image_encoding not in IMAGE_ENCODINGS:
+            raise ValueError(f"image_encoding must be one of {IMAGE_ENCODINGS}, got {self.image_encoding}")
+
+        if not 0 <= self.jpeg_quality <= 100:
+            raise ValueError(f"jpeg_quality must be between 0 and 100, got {self.jpeg_quality}")
+
         self.aggregate_fn = get_aggregate_function(self.aggregate_fn_name)
 
     @classmethod
@@ -187,6 +246,9 @@ class RobotClientConfig:
             "chunk_size_threshold": self.chunk_size_threshold,
             "fps": self.fps,
             "actions_per_chunk": self.actions_per_chunk,
+            "image_encoding": self.image_encoding,
+            "jpeg_quality": self.jpeg_quality,
+            "resize_images": self.resize_images,
             "task": self.task,
             "debug_visualize_queue_size": self.debug_visualize_queue_size,
             "aggregate_fn_name": self.aggregate_fn_name,
@@ -22,6 +22,19 @@ DEFAULT_INFERENCE_LATENCY = 1 / DEFAULT_FPS
 """Server side: Timeout for observation queue in seconds"""
 DEFAULT_OBS_QUEUE_TIMEOUT = 2
 
+"""Server side: Maximum number of robot clients, and of observations batched into a single inference"""
+DEFAULT_MAX_CLIENTS = 4
+DEFAULT_MAX_BATCH_SIZE = 4
+
+"""Server side: Latency budget to gather a batch of observations, in seconds"""
+DEFAULT_BATCH_TIMEOUT = 0.005
+
+"""Server side: Clients not sending observations for this long, in seconds, are disconnected"""
+DEFAULT_CLIENT_TIMEOUT = 30
+
+"""Client side: Encodings of the camera images sent to the server"""
+IMAGE_ENCODINGS = ("raw", "jpeg")
+
 # All action chunking policies
 SUPPORTED_POLICIES = ["act", "smolvla", "diffusion", "tdmpc", "vqbet", "pi0", "pi05"]
 
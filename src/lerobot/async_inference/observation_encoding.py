@@ -0,0 +1,239 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Binary format of the observations sent by the robot client to the policy server.
+
+Observations are serialized with the tensor wire format of `lerobot.transport.utils`, so the server never
+unpickles data received from the network. The camera images are sent either as raw uint8 frames or as JPEG,
+optionally resized on the client to the resolution of the policy, which reduces the size of the upload.
+"""
+
+import threading
+import weakref
+from typing import Any
+
+import cv2
+import numpy as np
+import torch
+
+from lerobot.configs.policies import PreTrainedConfig
+from lerobot.transport.utils import bytes_to_tensors, tensors_to_bytes
+from lerobot.utils.constants import OBS_IMAGES
+
+from .constants import IMAGE_ENCODINGS
+from .helpers import TimedObservation
+
+_IMAGE_KEY = "__image__"
+
+
+def is_raw_image(value: Any) -> bool:
+    """Whether a value of a raw robot observation is a (H, W, C) uint8 camera image."""
+    if isinstance(value, torch.Tensor):
+        return value.ndim == 3 and value.dtype == torch.uint8
+    return isinstance(value, np.ndarray) and value.ndim == 3 and value.dtype == np.uint8
+
+
+def resize_raw_image(image: np.ndarray, size: tuple[int, int]) -> np.ndarray:
+    """Resize a (H, W, C) image to (height, width)."""
+    height, width = size
+    if image.shape[:2] == (height, width):
+        return image
+    return cv2.resize(image, (width, height), interpolation=cv2.INTER_AREA)
+
+
+def policy_image_sizes(pretrained_name_or_path: str) -> dict[str, tuple[int, int]]:
+    """(height, width) of the input images of a pretrained policy, by camera name."""
+    policy_config = PreTrainedConfig.from_pretrained(pretrained_name_or_path)
+    return {
+        key.removeprefix(f"{OBS_IMAGES}."): tuple(feature.shape[1:])
+        for key, feature in policy_config.image_features.items()
+    }
+
+
+def encode_observation(
+    observation: TimedObservation,
+    image_encoding: str = "raw",
+    jpeg_quality: int = 90,
+    image_sizes: dict[str, tuple[int, int]] | None = None,
+) -> bytes:
+    """Serialize a timed observation.
+
+    Args:
+        observation: The observation to send, with the raw observation of the robot.
+        image_encoding: "raw" or "jpeg", the encoding of the camera images.
+        jpeg_quality: The quality of the JPEG encoding, between 0 and 100.
+        image_sizes: (height, width) to resize the camera images to, by camera name.
+    """
+    if image_encoding not in IMAGE_ENCODINGS:
+        raise ValueError(f"Unknown image encoding {image_encoding}, must be one of {IMAGE_ENCODINGS}")
+    image_sizes = image_sizes or {}
+
+    values = {}
+    for key, value in observation.get_observation().items():
+        if not is_raw_image(value):
+            values[key] = value
+            continue
+
+        image = value.numpy() if isinstance(value, torch.Tensor) else value
+        if key in image_sizes:
+            image = resize_raw_image(image, image_sizes[key])
+        if image_encoding == "jpeg":
+            if image.shape[2] == 3:
+                # OpenCV encodes BGR images
+                image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
+            success, data = cv2.imencode(".jpg", image, [cv2.IMWRITE_JPEG_QUALITY, jpeg_quality])
+            if not success:
+                raise RuntimeError(f"Failed to encode the image {key} to JPEG")
+            data = data.tobytes()
+        else:
+            data = np.ascontiguousarray(image)
+        values[key] = {_IMAGE_KEY: image_encoding, "shape": list(image.shape), "data": data}
+
+    return tensors_to_bytes(
+        {
+            "timestamp": observation.get_timestamp(),
+            "timestep": observation.get_timestep(),
+            "must_go": observation.must_go,
+            "observation": values,
+        }
+    )
+
+
+class ObservationDecoder:
+    """Deserialize the observations of a robot client into reusable image buffers.
+
+    The images are decoded into buffers taken from a pool per camera, instead of new arrays for every
+    observation. The buffers of an observation go back to the pool only when it is given to `release`, once
+    the observation is no longer used, e.g. dropped from the queue of the server or replaced as the last
+    processed observation. Observations never released keep their buffers, which are then garbage
+    collected. With CUDA, the buffers are pinned, so that copying the images to the GPU doesn't go through an
+    intermediate buffer.
+
+    Args:
+        num_buffers: The maximum number of free buffers kept per camera.
+        pin_memory: Whether to pin the buffers, by default when CUDA is available.
+    """
+
+    def __init__(self, num_buffers: int = 3, pin_memory: bool | None = None):
+        if num_buffers < 1:
+            raise ValueError(f"num_buffers must be positive, got {num_buffers}")
+        self.num_buffers = num_buffers
+        self.pin_memory = torch.cuda.is_available() if pin_memory is None else pin_memory
+        self._free_buffers: dict[str, list[torch.Tensor]] = {}
+        # Buffers of the decoded observations, by id of the observation
+        self._used_buffers: dict[int, tuple[weakref.ref, list[tuple[str, torch.Tensor]]]] = {}
+        # Observations are decoded and released from different threads of the server
+        self._lock = threading.Lock()
+
+    def release(self, observation: TimedObservation) -> None:
+        """Give back the image buffers of an observation decoded by this decoder, which must no longer be used."""
+        with self._lock:
+            entry = self._used_buffers.get(id(observation))
+            if entry is None or entry[0]() is not observation:
+                return
+            del self._used_buffers[id(observation)]
+        self._give_back(entry[1])
+
+    def decode(self, buffer: bytes | bytearray) -> TimedObservation:
+        """Deserialize an observation created with `encode_observation`. Raises ValueError if it's invalid."""
+        message = bytes_to_tensors(buffer)
+        try:
+            values = message["observation"]
+            observation = TimedObservation(
+                timestamp=float(message["timestamp"]),
+                timestep=int(message["timestep"]),
+                observation={},
+                must_go=bool(message["must_go"]),
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError("Invalid observation message") from e
+        if not isinstance(values, dict):
+            raise ValueError("Invalid observation message")
+
+        buffers = []
+        try:
+            for key, value in values.items():
+                if isinstance(value, dict) and _IMAGE_KEY in value:
+                    try:
+                        value = self._decode_image(key, value, buffers)
+                    except (KeyError, TypeError) as e:
+                        raise ValueError(f"Invalid image {key}") from e
+                elif isinstance(value, torch.Tensor):
+                    try:
+                        value = value.numpy()
+                    except TypeError as e:
+                        # e.g. bfloat16, which numpy can't represent
+                        raise ValueError(f"Invalid tensor {key}") from e
+                observation.observation[key] = value
+        except Exception:
+            self._give_back(buffers)
+            raise
+
+        if buffers:
+            with self._lock:
+                # Forget the observations garbage collected without being released
+                for obs_id, (ref, _) in list(self._used_buffers.items()):
+                    if ref() is None:
+                        del self._used_buffers[obs_id]
+                self._used_buffers[id(observation)] = (weakref.ref(observation), buffers)
+        return observation
+
+    def _decode_image(self, key: str, value: dict, buffers: list[tuple[str, torch.Tensor]]) -> np.ndarray:
+        encoding, shape, data = value[_IMAGE_KEY], tuple(value["shape"]), value["data"]
+        if encoding not in IMAGE_ENCODINGS or len(shape) != 3:
+            raise ValueError(f"Invalid image {key}: encoding {encoding}, shape {shape}")
+
+        if encoding == "raw":
+            if not isinstance(data, torch.Tensor) or tuple(data.shape) != shape or data.dtype != torch.uint8:
+                raise ValueError(f"Invalid raw image {key}")
+            if not self.pin_memory:
+                # The image is a view of the received message, no need to copy it
+                return data.numpy()
+            image = self._take_buffer(key, shape, buffers)
+            image.copy_(data)
+            return image.numpy()
+
+        flags = cv2.IMREAD_COLOR if shape[2] == 3 else cv2.IMREAD_GRAYSCALE
+        decoded = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flags)
+        if decoded is None or decoded.shape[:2] != shape[:2]:
+            raise ValueError(f"Invalid JPEG image {key}")
+        image = self._take_buffer(key, shape, buffers).numpy()
+        if shape[2] == 3:
+            cv2.cvtColor(decoded, cv2.COLOR_BGR2RGB, dst=image)
+        else:
+            image[..., 0] = decoded
+        return image
+
+    def _take_buffer(
+        self, key: str, shape: tuple[int, ...], buffers: list[tuple[str, torch.Tensor]]
+    ) -> torch.Tensor:
+        with self._lock:
+            free_buffers = self._free_buffers.get(key, [])
+            buffer = None
+            while free_buffers and buffer is None:
+                buffer = free_buffers.pop()
+                if tuple(buffer.shape) != shape:
+                    # The resolution of the camera changed
+                    buffer = None
+        if buffer is None:
+            buffer = torch.empty(shape, dtype=torch.uint8, pin_memory=self.pin_memory)
+        buffers.append((key, buffer))
+        return buffer
+
+    def _give_back(self, buffers: list[tuple[str, torch.Tensor]]) -> None:
+        with self._lock:
+            for key, buffer in buffers:
+                free_buffers = self._free_buffers.setdefault(key, [])
+                if len(free_buffers) < self.num_buffers:
+                    free_buffers.append(buffer)
@@ -20,8 +20,14 @@ python -m lerobot.async_inference.policy_server \
      --port=8080 \
      --fps=30 \
      --inference_latency=0.033 \
-     --obs_queue_timeout=1
+     --obs_queue_timeout=1 \
+     --max_clients=4 \
+     --batch_timeout=0.005
 ```
+
+Several robot clients can connect to the same server. Their observations are batched, within a latency budget
+of `batch_timeout` seconds, into a single forward pass of the policy, and the action chunks are routed back to
+each client.
 """
 
 import logging
@@ -29,9 +35,10 @@ import pickle  # nosec
 import threading
 import time
 from concurrent import futures
-from dataclasses import asdict
+from contextlib import suppress
+from dataclasses import asdict, dataclass, field
 from pprint import pformat
-from queue import Empty, Queue
+from queue import Empty, Full, Queue
 from typing import Any
 
 import draccus
@@ -61,6 +68,70 @@ from .helpers import (
     observations_similar,
     raw_observation_to_observation,
 )
+from .observation_encoding import ObservationDecoder
+
+# Timeout of the batcher waiting for observations, to check for shutdown and idle clients
+BATCHER_POLL_TIMEOUT = 0.1
+
+
+@dataclass
+class ClientSession:
+    """State of a robot client connected to the server.
+
+    Each client has its own observation and action queues, so that the observations of all the clients can be
+    batched into a single inference, and each action chunk is routed back to the client that asked for it.
+    """
+
+    client_id: str
+    fps_tracker: FPSTracker
+    observation_queue: Queue = field(default_factory=lambda: Queue(maxsize=1))
+    action_queue: Queue = field(default_factory=lambda: Queue(maxsize=1))
+    predicted_timesteps: set[int] = field(default_factory=set)
+    predicted_timesteps_lock: threading.Lock = field(default_factory=threading.Lock)
+    last_processed_obs: TimedObservation | None = None
+    # Set by SendPolicyInstructions, as the clients sharing the policy can have different robots and chunk sizes
+    lerobot_features: dict[str, dict] | None = None
+    actions_per_chunk: int | None = None
+    observation_decoder: ObservationDecoder = field(default_factory=ObservationDecoder)
+    last_seen: float = field(default_factory=time.perf_counter)
+    enqueued_at: float = 0.0
+
+    # Metrics
+    observations_received: int = 0
+    observations_enqueued: int = 0
+    chunks_predicted: int = 0
+    chunks_sent: int = 0
+    total_batch_size: int = 0
+    total_queue_time: float = 0.0
+    total_inference_time: float = 0.0
+
+    def record_prediction(self, batch_size: int, queue_time: float, inference_time: float) -> None:
+        self.chunks_predicted += 1
+        self.total_batch_size += batch_size
+        self.total_queue_time += queue_time
+        self.total_inference_time += inference_time
+
+    def put_actions(self, observation: TimedObservation, action_chunk: list[TimedAction]) -> None:
+        """Make an action chunk available to the client, replacing the one it didn't fetch yet."""
+        while True:
+            try:
+                self.action_queue.put_nowait((observation, action_chunk))
+                return
+            except Full:
+                with suppress(Empty):
+                    self.action_queue.get_nowait()
+
+    def metrics(self) -> dict[str, float]:
+        chunks = max(self.chunks_predicted, 1)
+        return {
+            "observations_received": self.observations_received,
+            "observations_enqueued": self.observations_enqueued,
+            "chunks_predicted": self.chunks_predicted,
+            "chunks_sent": self.chunks_sent,
+            "avg_batch_size": self.total_batch_size / chunks,
+            "avg_queue_time": self.total_queue_time / chunks,
+            "avg_inference_time": self.total_inference_time / chunks,
+        }
 
 
 class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
@@ -71,21 +142,22 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         self.config = config
         self.shutdown_event = threading.Event()
 
-        # FPS measurement
-        self.fps_tracker = FPSTracker(target_fps=config.fps)
+        # One session per connected client, keyed by the peer address
+        self.sessions: dict[str, ClientSession] = {}
+        self._sessions_lock = threading.Lock()
 
-        self.observation_queue = Queue(maxsize=1)
+        # Notified whenever an observation is enqueued, to wake up the batcher
+        self._observations_ready = threading.Condition()
+        self._batcher_thread: threading.Thread | None = None
+        self._next_session = 0
 
-        self._predicted_timesteps_lock = threading.Lock()
-        self._predicted_timesteps = set()
-
-        self.last_processed_obs = None
+        # Guards the policy, which can be replaced by a client while the batcher runs inference
+        self._policy_lock = threading.Lock()
+        self._policy_specs: RemotePolicyConfig | None = None
 
         # Attributes will be set by SendPolicyInstructions
         self.device = None
         self.policy_type = None
-        self.lerobot_features = None
-        self.actions_per_chunk = None
         self.policy = None
         self.preprocessor: PolicyProcessorPipeline[dict[str, Any], dict[str, Any]] | None = None
         self.postprocessor: PolicyProcessorPipeline[PolicyAction, PolicyAction] | None = None
@@ -99,22 +171,58 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         return self.policy.config.image_features
 
     def _reset_server(self) -> None:
-        """Flushes server state when new client connects."""
-        # only running inference on the latest observation received by the server
+        """Flushes server state, disconnecting all the clients."""
         self.shutdown_event.set()
-        self.observation_queue = Queue(maxsize=1)
+        with self._sessions_lock:
+            self.sessions = {}
+
+        with self._observations_ready:
+            self._observations_ready.notify_all()
+
+    def _get_session(self, client_id: str, context) -> ClientSession:
+        """Return the session of a client, aborting the call if the client didn't call Ready or was dropped.
 
-        with self._predicted_timesteps_lock:
-            self._predicted_timesteps = set()
+        Sessions are only created by Ready, which enforces `max_clients`.
+        """
+        with self._sessions_lock:
+            session = self.sessions.get(client_id)
+        if session is None:
+            self.logger.warning(f"Rejecting call of {client_id}: the client didn't call Ready")
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, "Call Ready before the other methods")
+        return session
+
+    def client_metrics(self) -> dict[str, dict[str, float]]:
+        """Metrics of each connected client."""
+        with self._sessions_lock:
+            sessions = list(self.sessions.values())
+        return {session.client_id: session.metrics() for session in sessions}
 
     def Ready(self, request, context):  # noqa: N802
         client_id = context.peer()
-        self.logger.info(f"Client {client_id} connected and ready")
-        self._reset_server()
+
+        with self._sessions_lock:
+            if client_id not in self.sessions and len(self.sessions) >= self.config.max_clients:
+                self.logger.warning(f"Rejecting client {client_id}: {len(self.sessions)} clients connected")
+                context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    f"The server already serves {self.config.max_clients} clients",
+                )
+            # Flush the state of a client reconnecting
+            self.sessions[client_id] = ClientSession(client_id, FPSTracker(target_fps=self.config.fps))
+            num_clients = len(self.sessions)
+
+        self.logger.info(f"Client {client_id} connected and ready ({num_clients} clients connected)")
         self.shutdown_event.clear()
+        self._start_batcher()
 
         return services_pb2.Empty()
 
+    def _start_batcher(self) -> None:
+        if self._batcher_thread is not None and self._batcher_thread.is_alive():
+            return
+        self._batcher_thread = threading.Thread(target=self._run_batcher, name="policy_batcher", daemon=True)
+        self._batcher_thread.start()
+
     def SendPolicyInstructions(self, request, context):  # noqa: N802
         """Receive policy instructions from the robot client"""
 
@@ -123,6 +231,7 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             return services_pb2.Empty()
 
         client_id = context.peer()
+        session = self._get_session(client_id, context)
 
         policy_specs = pickle.loads(request.data)  # nosec
 
@@ -143,21 +252,30 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             f"Device: {policy_specs.device}"
         )
 
-        self.device = policy_specs.device
-        self.policy_type = policy_specs.policy_type  # act, pi0, etc.
-        self.lerobot_features = policy_specs.lerobot_features
-        self.actions_per_chunk = policy_specs.actions_per_chunk
+        # All the clients share the policy, so that their observations can be batched together
+        if self.policy is not None and _same_policy(self._policy_specs, policy_specs):
+            self.logger.info(f"Client {client_id} shares the policy already loaded")
+            session.lerobot_features = policy_specs.lerobot_features
+            session.actions_per_chunk = policy_specs.actions_per_chunk
+            return services_pb2.Empty()
+
+        with self._sessions_lock:
+            num_other_clients = len(self.sessions.keys() - {client_id})
+        if self.policy is not None and num_other_clients > 0:
+            self.logger.warning(
+                f"Client {client_id} replaces the policy shared with {num_other_clients} other clients"
+            )
 
-        policy_class = get_policy_class(self.policy_type)
+        policy_class = get_policy_class(policy_specs.policy_type)
 
         start = time.perf_counter()
-        self.policy = policy_class.from_pretrained(policy_specs.pretrained_name_or_path)
-        self.policy.to(self.device)
+        policy = policy_class.from_pretrained(policy_specs.pretrained_name_or_path)
+        policy.to(policy_specs.device)
 
         # Load preprocessor and postprocessor, overriding device to match requested device
-        device_override = {"device": self.device}
-        self.preprocessor, self.postprocessor = make_pre_post_processors(
-            self.policy.config,
+        device_override = {"device": policy_specs.device}
+        preprocessor, postprocessor = make_pre_post_processors(
+            policy.config,
             pretrained_path=policy_specs.pretrained_name_or_path,
             preprocessor_overrides={
                 "device_processor": device_override,
@@ -166,6 +284,15 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             postprocessor_overrides={"device_processor": device_override},
         )
 
+        with self._policy_lock:
+            self.device = policy_specs.device
+            self.policy_type = policy_specs.policy_type  # act, pi0, etc.
+            self.policy = policy
+            self.preprocessor, self.postprocessor = preprocessor, postprocessor
+            self._policy_specs = policy_specs
+        session.lerobot_features = policy_specs.lerobot_features
+        session.actions_per_chunk = policy_specs.actions_per_chunk
+
         end = time.perf_counter()
 
         self.logger.info(f"Time taken to put policy on {self.device}: {end - start:.4f} seconds")
@@ -176,25 +303,35 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         """Receive observations from the robot client"""
         client_id = context.peer()
         self.logger.debug(f"Receiving observations from {client_id}")
+        session = self._get_session(client_id, context)
+        if session.lerobot_features is None:
+            context.abort(grpc.StatusCode.FAILED_PRECONDITION, "Send the policy instructions first")
 
         receive_time = time.time()  # comparing timestamps so need time.time()
         start_deserialize = time.perf_counter()
         received_bytes = receive_bytes_in_chunks(
             request_iterator, None, self.shutdown_event, self.logger
         )  # blocking call while looping over request_iterator
-        timed_observation = pickle.loads(received_bytes)  # nosec
+        try:
+            timed_observation = session.observation_decoder.decode(received_bytes)
+        except ValueError as e:
+            self.logger.error(f"Invalid observation from {client_id}: {e}")
+            return services_pb2.Empty()
         deserialize_time = time.perf_counter() - start_deserialize
 
-        self.logger.debug(f"Received observation #{timed_observation.get_timestep()}")
+        self.logger.debug(f"Received observation #{timed_observation.get_timestep()} from {client_id}")
 
         obs_timestep = timed_observation.get_timestep()
         obs_timestamp = timed_observation.get_timestamp()
 
+        session.last_seen = time.perf_counter()
+        session.observations_received += 1
+
         # Calculate FPS metrics
-        fps_metrics = self.fps_tracker.calculate_fps_metrics(obs_timestamp)
+        fps_metrics = session.fps_tracker.calculate_fps_metrics(obs_timestamp)
 
         self.logger.debug(
-            f"Received observation #{obs_timestep} | "
+            f"Received observation #{obs_timestep} from {client_id} | "
             f"Avg FPS: {fps_metrics['avg_fps']:.2f} | "  # fps at which observations are received from client
             f"Target: {fps_metrics['target_fps']:.2f} | "
             f"One-way latency: {(receive_time - obs_timestamp) * 1000:.2f}ms"
@@ -207,9 +344,10 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         )
 
         if not self._enqueue_observation(
-            timed_observation  # wrapping a RawObservation
+            session,
+            timed_observation,  # wrapping a RawObservation
         ):
-            self.logger.debug(f"Observation #{obs_timestep} has been filtered out")
+            self.logger.debug(f"Observation #{obs_timestep} from {client_id} has been filtered out")
 
         return services_pb2.Empty()
 
@@ -218,21 +356,12 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         chunk, containing multiple actions."""
         client_id = context.peer()
         self.logger.debug(f"Client {client_id} connected for action streaming")
+        session = self._get_session(client_id, context)
 
-        # Generate action based on the most recent observation and its timestep
+        # Wait for the batcher to predict an action chunk from the most recent observation of the client
         try:
             getactions_starts = time.perf_counter()
-            obs = self.observation_queue.get(timeout=self.config.obs_queue_timeout)
-            self.logger.info(
-                f"Running inference for observation #{obs.get_timestep()} (must_go: {obs.must_go})"
-            )
-
-            with self._predicted_timesteps_lock:
-                self._predicted_timesteps.add(obs.get_timestep())
-
-            start_time = time.perf_counter()
-            action_chunk = self._predict_action_chunk(obs)
-            inference_time = time.perf_counter() - start_time
+            obs, action_chunk = session.action_queue.get(timeout=self.config.obs_queue_timeout)
 
             start_time = time.perf_counter()
             actions_bytes = pickle.dumps(action_chunk)  # nosec
@@ -240,17 +369,20 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
             # Create and return the action chunk
             actions = services_pb2.Actions(data=actions_bytes)
+            session.chunks_sent += 1
 
+            metrics = session.metrics()
             self.logger.info(
-                f"Action chunk #{obs.get_timestep()} generated | "
-                f"Total time: {(inference_time + serialize_time) * 1000:.2f}ms"
+                f"Action chunk #{obs.get_timestep()} sent to {client_id} | "
+                f"Observation to action latency: {(time.time() - obs.get_timestamp()) * 1000:.2f}ms | "
+                f"Avg batch size: {metrics['avg_batch_size']:.2f}"
             )
 
             self.logger.debug(
-                f"Action chunk #{obs.get_timestep()} generated | "
-                f"Inference time: {inference_time:.2f}s |"
-                f"Serialize time: {serialize_time:.2f}s |"
-                f"Total time: {inference_time + serialize_time:.2f}s"
+                f"Action chunk #{obs.get_timestep()} sent to {client_id} | "
+                f"Avg queue time: {metrics['avg_queue_time']:.4f}s | "
+                f"Avg inference time: {metrics['avg_inference_time']:.4f}s | "
+                f"Serialize time: {serialize_time:.4f}s"
             )
 
             time.sleep(
@@ -259,7 +391,7 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
             return actions
 
-        except Empty:  # no observation added to queue in obs_queue_timeout
+        except Empty:  # no action chunk predicted in obs_queue_timeout
             return services_pb2.Empty()
 
         except Exception as e:
@@ -267,16 +399,18 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
 
             return services_pb2.Empty()
 
-    def _obs_sanity_checks(self, obs: TimedObservation, previous_obs: TimedObservation) -> bool:
+    def _obs_sanity_checks(
+        self, session: ClientSession, obs: TimedObservation, previous_obs: TimedObservation
+    ) -> bool:
         """Check if the observation is valid to be processed by the policy"""
-        with self._predicted_timesteps_lock:
-            predicted_timesteps = self._predicted_timesteps
+        with session.predicted_timesteps_lock:
+            predicted_timesteps = session.predicted_timesteps
 
         if obs.get_timestep() in predicted_timesteps:
             self.logger.debug(f"Skipping observation #{obs.get_timestep()} - Timestep predicted already!")
             return False
 
-        elif observations_similar(obs, previous_obs, lerobot_features=self.lerobot_features):
+        elif observations_similar(obs, previous_obs, lerobot_features=session.lerobot_features):
             self.logger.debug(
                 f"Skipping observation #{obs.get_timestep()} - Observation too similar to last obs predicted!"
             )
@@ -285,32 +419,127 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
         else:
             return True
 
-    def _enqueue_observation(self, obs: TimedObservation) -> bool:
+    def _enqueue_observation(self, session: ClientSession, obs: TimedObservation) -> bool:
         """Enqueue an observation if it must go through processing, otherwise skip it.
         Observations not in queue are never run through the policy network"""
 
         if (
             obs.must_go
-            or self.last_processed_obs is None
-            or self._obs_sanity_checks(obs, self.last_processed_obs)
+            or session.last_processed_obs is None
+            or self._obs_sanity_checks(session, obs, session.last_processed_obs)
         ):
-            last_obs = self.last_processed_obs.get_timestep() if self.last_processed_obs else "None"
+            last_obs = session.last_processed_obs.get_timestep() if session.last_processed_obs else "None"
             self.logger.debug(
                 f"Enqueuing observation. Must go: {obs.must_go} | Last processed obs: {last_obs}"
             )
 
-            # If queue is full, get the old observation to make room
-            if self.observation_queue.full():
-                # pops from queue
-                _ = self.observation_queue.get_nowait()
-                self.logger.debug("Observation queue was full, removed oldest observation")
-
-            # Now put the new observation (never blocks as queue is non-full here)
-            self.observation_queue.put(obs)
+            with self._observations_ready:
+                # If queue is full, get the old observation to make room
+                if session.observation_queue.full():
+                    # pops from queue
+                    dropped_obs = session.observation_queue.get_nowait()
+                    session.observation_decoder.release(dropped_obs)
+                    self.logger.debug("Observation queue was full, removed oldest observation")
+
+                # Now put the new observation (never blocks as queue is non-full here)
+                session.observation_queue.put(obs)
+                session.enqueued_at = time.perf_counter()
+                session.observations_enqueued += 1
+                self._observations_ready.notify()
             return True
 
+        session.observation_decoder.release(obs)
         return False
 
+    def _num_pending_observations(self) -> int:
+        with self._sessions_lock:
+            return sum(not session.observation_queue.empty() for session in self.sessions.values())
+
+    def _batch_is_full(self) -> bool:
+        with self._sessions_lock:
+            num_sessions = len(self.sessions)
+        return self._num_pending_observations() >= min(self.config.max_batch_size, num_sessions)
+
+    def _drop_idle_sessions(self) -> None:
+        now = time.perf_counter()
+        with self._sessions_lock:
+            idle = [
+                client_id
+                for client_id, session in self.sessions.items()
+                if now - session.last_seen > self.config.client_timeout
+            ]
+            for client_id in idle:
+                del self.sessions[client_id]
+        for client_id in idle:
+            self.logger.info(f"Client {client_id} disconnected after {self.config.client_timeout}s idle")
+
+    def _collect_batch(self) -> list[tuple[ClientSession, TimedObservation]]:
+        """Wait for observations, and gather those of the other clients within the latency budget."""
+        with self._observations_ready:
+            if not self._observations_ready.wait_for(
+                lambda: not self.running or self._num_pending_observations() > 0, timeout=BATCHER_POLL_TIMEOUT
+            ):
+                return []
+            self._observations_ready.wait_for(
+                lambda: not self.running or self._batch_is_full(), timeout=self.config.batch_timeout
+            )
+
+            with self._sessions_lock:
+                sessions = list(self.sessions.values())
+
+            # Start from a different client at every batch, so that none is starved when the batch is full
+            if sessions:
+                self._next_session %= len(sessions)
+                sessions = sessions[self._next_session :] + sessions[: self._next_session]
+                self._next_session += 1
+
+            batch = []
+            for session in sessions:
+                if len(batch) == self.config.max_batch_size:
+                    break
+                try:
+                    batch.append((session, session.observation_queue.get_nowait()))
+                except Empty:
+                    continue
+            return batch
+
+    def _run_batcher(self) -> None:
+        """Run the policy on batches of observations from the connected clients."""
+        self.logger.info("Batcher started")
+        while self.running:
+            self._drop_idle_sessions()
+            batch = self._collect_batch()
+            if batch:
+                self._process_batch(batch)
+        self.logger.info("Batcher stopped")
+
+    def _process_batch(self, batch: list[tuple[ClientSession, TimedObservation]]) -> None:
+        """Predict the action chunks of a batch of observations and route them to their clients."""
+        start_inference = time.perf_counter()
+        for session, obs in batch:
+            self.logger.info(
+                f"Running inference for observation #{obs.get_timestep()} of {session.client_id} "
+                f"(must_go: {obs.must_go}, batch size: {len(batch)})"
+            )
+            with session.predicted_timesteps_lock:
+                session.predicted_timesteps.add(obs.get_timestep())
+            previous_obs, session.last_processed_obs = session.last_processed_obs, obs
+            if previous_obs is not None:
+                # Its images are no longer compared to, nor run through the policy
+                session.observation_decoder.release(previous_obs)
+
+        try:
+            with self._policy_lock:
+                action_chunks = self._predict_action_chunks(batch)
+        except Exception as e:
+            self.logger.error(f"Error running inference on a batch of {len(batch)} observations: {e}")
+            return
+        inference_time = time.perf_counter() - start_inference
+
+        for (session, obs), action_chunk in zip(batch, action_chunks, strict=True):
+            session.record_prediction(len(batch), start_inference - session.enqueued_at, inference_time)
+            session.put_actions(obs, action_chunk)
+
     def _time_action_chunk(self, t_0: float, action_chunk: list[torch.Tensor], i_0: int) -> list[TimedAction]:
         """Turn a chunk of actions into a list of TimedAction instances,
         with the first action corresponding to t_0 and the rest corresponding to
@@ -321,42 +550,65 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             for i, action in enumerate(action_chunk)
         ]
 
-    def _get_action_chunk(self, observation: dict[str, torch.Tensor]) -> torch.Tensor:
-        """Get an action chunk from the policy. The chunk contains only"""
+    def _get_action_chunk(self, observation: dict[str, torch.Tensor], actions_per_chunk: int) -> torch.Tensor:
+        """Get an action chunk from the policy. The chunk contains only the first `actions_per_chunk` actions"""
         chunk = self.policy.predict_action_chunk(observation)
         if chunk.ndim != 3:
             chunk = chunk.unsqueeze(0)  # adding batch dimension, now shape is (B, chunk_size, action_dim)
 
-        return chunk[:, : self.actions_per_chunk, :]
+        return chunk[:, :actions_per_chunk, :]
+
+    def _predict_action_chunk(
+        self, session: ClientSession, observation_t: TimedObservation
+    ) -> list[TimedAction]:
+        """Predict an action chunk based on a single observation of a client."""
+        return self._predict_action_chunks([(session, observation_t)])[0]
 
-    def _predict_action_chunk(self, observation_t: TimedObservation) -> list[TimedAction]:
-        """Predict an action chunk based on an observation.
+    def _predict_action_chunks(
+        self, batch: list[tuple[ClientSession, TimedObservation]]
+    ) -> list[list[TimedAction]]:
+        """Predict the action chunks of a batch of observations, with a single forward pass of the policy.
+
+        Each observation is prepared with the features of its client, and its chunk truncated to the number of
+        actions per chunk of its client.
 
         Pipeline:
-        1. Convert raw observation to LeRobot format
-        2. Apply preprocessor (tokenization, normalization, batching, device placement)
-        3. Run policy inference to get action chunk
+        1. Convert raw observations to LeRobot format
+        2. Apply preprocessor (tokenization, normalization, batching, device placement) and concatenate the
+           observations along the batch dimension
+        3. Run policy inference to get the action chunks
         4. Apply postprocessor (unnormalization, device movement)
-        5. Convert to TimedAction list
+        5. Convert to TimedAction lists
         """
-        """1. Prepare observation"""
+        """1. Prepare observations"""
         start_prepare = time.perf_counter()
-        observation: Observation = raw_observation_to_observation(
-            observation_t.get_observation(),
-            self.lerobot_features,
-            self.policy_image_features,
-        )
+        observations: list[Observation] = [
+            raw_observation_to_observation(
+                observation_t.get_observation(),
+                session.lerobot_features,
+                self.policy_image_features,
+            )
+            for session, observation_t in batch
+        ]
         prepare_time = time.perf_counter() - start_prepare
 
         """2. Apply preprocessor"""
         start_preprocess = time.perf_counter()
-        observation = self.preprocessor(observation)
-        self.last_processed_obs: TimedObservation = observation_t
+        observations = [self.preprocessor(observation) for observation in observations]
+        try:
+            observation = _collate_observations(observations)
+        except (KeyError, RuntimeError) as e:
+            if len(batch) == 1:
+                raise
+            # Observations of clients with different features can't be batched together
+            self.logger.warning(f"Running inference on each observation, as they can't be batched: {e}")
+            return [self._predict_action_chunk(session, observation_t) for session, observation_t in batch]
         preprocessing_time = time.perf_counter() - start_preprocess
 
-        """3. Get action chunk"""
+        """3. Get action chunks"""
         start_inference = time.perf_counter()
-        action_tensor = self._get_action_chunk(observation)
+        actions_per_chunk = max(session.actions_per_chunk for session, _ in batch)
+        action_tensor = self._get_action_chunk(observation, actions_per_chunk)
         inference_time = time.perf_counter() - start_inference
         self.logger.info(
             f"Preprocessing and inference took {inference_time:.4f}s, action shape: {action_tensor.shape}"
@@ -377,24 +629,29 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             processed_action = self.postprocessor(single_action)
             processed_actions.append(processed_action)
 
-        # Stack back to (B, chunk_size, action_dim), then remove batch dim
-        action_tensor = torch.stack(processed_actions, dim=1).squeeze(0)
+        # Stack back to (B, chunk_size, action_dim)
+        action_tensor = torch.stack(processed_actions, dim=1)
         self.logger.debug(f"Postprocessed action shape: {action_tensor.shape}")
 
-        """5. Convert to TimedAction list"""
-        action_chunk = self._time_action_chunk(
-            observation_t.get_timestamp(), list(action_tensor), observation_t.get_timestep()
-        )
+        """5. Convert to TimedAction lists"""
+        action_chunks = [
+            self._time_action_chunk(
+                observation_t.get_timestamp(),
+                list(action_tensor[i, : session.actions_per_chunk]),
+                observation_t.get_timestep(),
+            )
+            for i, (session, observation_t) in enumerate(batch)
+        ]
         postprocess_stops = time.perf_counter()
         postprocessing_time = postprocess_stops - start_postprocess
 
+        timesteps = [observation_t.get_timestep() for _, observation_t in batch]
         self.logger.info(
-            f"Observation {observation_t.get_timestep()} | "
-            f"Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
+            f"Observations {timesteps} | Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
         )
 
         self.logger.debug(
-            f"Observation {observation_t.get_timestep()} | "
+            f"Observations {timesteps} | "
             f"Prepare time: {1000 * prepare_time:.2f}ms | "
             f"Preprocessing time: {1000 * preprocessing_time:.2f}ms | "
             f"Inference time: {1000 * inference_time:.2f}ms | "
@@ -402,14 +659,44 @@ class PolicyServer(services_pb2_grpc.AsyncInferenceServicer):
             f"Total time: {1000 * (postprocess_stops - start_prepare):.2f}ms"
         )
 
-        return action_chunk
+        return action_chunks
 
     def stop(self):
         """Stop the server"""
         self._reset_server()
+        if self._batcher_thread is not None:
+            self._batcher_thread.join()
         self.logger.info("Server stopping...")
 
 
+def _same_policy(specs: RemotePolicyConfig | None, other: RemotePolicyConfig) -> bool:
+    """Whether two clients ask for the same policy, which can then be shared."""
+    return specs is not None and (
+        specs.policy_type,
+        specs.pretrained_name_or_path,
+        specs.device,
+        specs.rename_map,
+    ) == (other.policy_type, other.pretrained_name_or_path, other.device, other.rename_map)
+
+
+def _collate_observations(observations: list[Observation]) -> Observation:
+    """Concatenate preprocessed observations along their batch dimension."""
+    if len(observations) == 1:
+        return observations[0]
+
+    batch = {}
+    for key, value in observations[0].items():
+        values = [observation[key] for observation in observations]
+        if isinstance(value, torch.Tensor):
+            batch[key] = torch.cat(values, dim=0)
+        elif isinstance(value, list):
+            batch[key] = [item for items in values for item in items]
+        else:
+            # e.g. the task of VLAs, given as a string for a single observation
+            batch[key] = values
+    return batch
+
+
 @draccus.wrap()
 def serve(cfg: PolicyServerConfig):
     """Start the PolicyServer with the given configuration.
@@ -423,7 +710,7 @@ def serve(cfg: PolicyServerConfig):
     policy_server = PolicyServer(cfg)
 
     # Setup and start gRPC server
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=4 * cfg.max_clients))
     services_pb2_grpc.add_AsyncInferenceServicer_to_server(policy_server, server)
     server.add_insecure_port(f"{cfg.host}:{cfg.port}")
 
@@ -77,6 +77,7 @@ from .helpers import (
     map_robot_keys_to_lerobot_features,
     visualize_action_queue_size,
 )
+from .observation_encoding import encode_observation, policy_image_sizes
 
 
 class RobotClient:
@@ -106,6 +107,8 @@ class RobotClient:
             config.actions_per_chunk,
             config.policy_device,
         )
+        # Cameras are resized on the client, so that only the resolution used by the policy is sent
+        self.image_sizes = policy_image_sizes(config.pretrained_name_or_path) if config.resize_images else {}
         self.channel = grpc.insecure_channel(
             self.server_address, grpc_channel_options(initial_backoff=f"{config.environment_dt:.4f}s")
         )
@@ -192,7 +195,12 @@ class RobotClient:
             raise ValueError("Input observation needs to be a TimedObservation!")
 
         start_time = time.perf_counter()
-        observation_bytes = pickle.dumps(obs)
+        observation_bytes = encode_observation(
+            obs,
+            image_encoding=self.config.image_encoding,
+            jpeg_quality=self.config.jpeg_quality,
+            image_sizes=self.image_sizes,
+        )
         serialize_time = time.perf_counter() - start_time
         self.logger.debug(f"Observation serialization time: {serialize_time:.6f}s")
 
@@ -0,0 +1,279 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Capture timestamps of camera frames, and synchronization of the frames of several cameras.
+
+All the timestamps are in the time base of `time.perf_counter`, which is monotonic and shared by the
+processes of the machine, and by the motor state snapshots of `MotorsBusThread`.
+"""
+
+import logging
+import math
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+from .camera import Camera
+from .frame_bus import Frame, FrameBus, FrameCursor
+
+logger = logging.getLogger(__name__)
+
+# Driver timestamps at most this old when received are considered in the time base of `time.perf_counter`,
+# which is the case of the V4L2 buffer timestamps (CLOCK_MONOTONIC).
+SAME_CLOCK_MAX_DELAY = 1.0
+
+
+class CaptureClock:
+    """Maps the timestamps given by a camera driver to the time base of `time.perf_counter`.
+
+    The driver timestamp of a frame, e.g. `cv2.CAP_PROP_POS_MSEC`, is taken when the frame is captured, and
+    doesn't include the time spent in the driver buffers. When it isn't in the same time base as
+    `time.perf_counter`, the offset of the clocks is estimated by the smallest delay between the driver
+    timestamp and the reception of a frame. Without usable driver timestamps, e.g. when reading a file, the
+    capture time is the reception time.
+    """
+
+    def __init__(self):
+        self._offset: float | None = None
+        self._last_driver_timestamp: float | None = None
+
+    def reset(self) -> None:
+        self._offset = None
+        self._last_driver_timestamp = None
+
+    def stamp(self, received: float, driver_timestamp_ms: float | None = None) -> float:
+        """Return the capture time of a frame received at `received`, with the timestamp given by the driver."""
+        if driver_timestamp_ms is None or not math.isfinite(driver_timestamp_ms) or driver_timestamp_ms <= 0:
+            self.reset()
+            return received
+        if self._last_driver_timestamp is not None and driver_timestamp_ms <= self._last_driver_timestamp:
+            # The driver clock was reset, e.g. the video restarted
+            self.reset()
+        self._last_driver_timestamp = driver_timestamp_ms
+
+        driver_timestamp = driver_timestamp_ms / 1e3
+        delay = received - driver_timestamp
+        if self._offset is None:
+            self._offset = 0.0 if 0 <= delay < SAME_CLOCK_MAX_DELAY else delay
+        elif self._offset != 0.0:
+            self._offset = min(self._offset, delay)
+        return min(driver_timestamp + self._offset, received)
+
+
+@dataclass
+class CaptureTimingStats:
+    """Latency and jitter of the frames captured by a camera."""
+
+    frames: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    intervals: int = 0
+    total_interval: float = 0.0
+    total_interval_sq: float = 0.0
+    last_capture_timestamp: float | None = None
+
+    def record(self, capture_timestamp: float, publish_timestamp: float) -> None:
+        latency = publish_timestamp - capture_timestamp
+        self.frames += 1
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        if self.last_capture_timestamp is not None:
+            interval = capture_timestamp - self.last_capture_timestamp
+            self.intervals += 1
+            self.total_interval += interval
+            self.total_interval_sq += interval**2
+        self.last_capture_timestamp = capture_timestamp
+
+    @property
+    def mean_interval(self) -> float | None:
+        return self.total_interval / self.intervals if self.intervals else None
+
+    def as_dict(self) -> dict[str, float]:
+        mean_interval = self.mean_interval
+        jitter = 0.0
+        if mean_interval is not None:
+            jitter = math.sqrt(max(self.total_interval_sq / self.intervals - mean_interval**2, 0.0))
+        return {
+            "frames": self.frames,
+            "fps": 1 / mean_interval if mean_interval else 0.0,
+            "avg_latency_ms": 1e3 * self.total_latency / self.frames if self.frames else 0.0,
+            "max_latency_ms": 1e3 * self.max_latency,
+            "jitter_ms": 1e3 * jitter,
+        }
+
+
+@dataclass
+class CaptureBundle:
+    """Frames of several cameras, selected by their capture time nearest to a reference time."""
+
+    frames: dict[str, NDArray[Any]]
+    timestamps: dict[str, float]
+    reference_timestamp: float
+
+    @property
+    def skews(self) -> dict[str, float]:
+        """Signed difference between the capture time of each frame and the reference time, in seconds."""
+        return {key: timestamp - self.reference_timestamp for key, timestamp in self.timestamps.items()}
+
+    @property
+    def max_skew(self) -> float:
+        return max((abs(skew) for skew in self.skews.values()), default=0.0)
+
+
+@dataclass
+class _SyncStats:
+    bundles: int = 0
+    total_skew: float = 0.0
+    max_skew: float = 0.0
+    out_of_bound: int = 0
+    waits: int = 0
+
+    def record(self, skew: float, in_bound: bool, waited: bool) -> None:
+        self.bundles += 1
+        self.total_skew += abs(skew)
+        self.max_skew = max(self.max_skew, abs(skew))
+        self.out_of_bound += not in_bound
+        self.waits += waited
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "avg_skew_ms": 1e3 * self.total_skew / self.bundles if self.bundles else 0.0,
+            "max_skew_ms": 1e3 * self.max_skew,
+            "out_of_bound": self.out_of_bound,
+            "waits": self.waits,
+        }
+
+
+@dataclass
+class _CameraSync:
+    camera: Camera
+    cursor: FrameCursor | None = None
+    stats: _SyncStats = field(default_factory=_SyncStats)
+
+
+class CaptureSynchronizer:
+    """Assembles the frames of several cameras captured nearest to a reference time, e.g. the time the
+    motor state was read.
+
+    For the cameras publishing their frames on a `FrameBus` (`OpenCVCamera`), the frame with the nearest
+    capture timestamp is selected among those still in the ring. When it is further than `max_skew_ms` from
+    the reference, and the next frame of the camera would be nearer, the next frame is waited for. Bundles
+    out of bound are still returned, and counted in the statistics. The other cameras are read with
+    `async_read`, and their frames are stamped with the time they were received.
+
+    Args:
+        cameras: The connected cameras, by name.
+        max_skew_ms: Bound on the difference between the capture time of a frame and the reference time.
+            If None, the nearest frames are returned without waiting.
+        timeout_ms: Maximum time to wait for the frames of a camera.
+    """
+
+    def __init__(self, cameras: dict[str, Camera], max_skew_ms: float | None = None, timeout_ms: float = 200):
+        if max_skew_ms is not None and max_skew_ms < 0:
+            raise ValueError(f"max_skew_ms must be positive, got {max_skew_ms}")
+        self.max_skew_ms = max_skew_ms
+        self.timeout_ms = timeout_ms
+        self._cameras = {key: _CameraSync(camera) for key, camera in cameras.items()}
+
+    def capture(self, reference_timestamp: float | None = None) -> CaptureBundle:
+        """Return the frames of all the cameras captured nearest to `reference_timestamp`, which defaults to
+        now, in the time base of `time.perf_counter`.
+
+        Raises:
+            TimeoutError: If a camera has no frame within `timeout_ms`.
+        """
+        if reference_timestamp is None:
+            reference_timestamp = time.perf_counter()
+        bundle = CaptureBundle({}, {}, reference_timestamp)
+        for key, camera_sync in self._cameras.items():
+            if isinstance(getattr(camera_sync.camera, "frame_bus", None), FrameBus):
+                frame, waited = self._nearest_frame(camera_sync, reference_timestamp)
+                bundle.frames[key], bundle.timestamps[key] = frame.data, frame.timestamp
+            else:
+                bundle.frames[key] = camera_sync.camera.async_read(timeout_ms=self.timeout_ms)
+                bundle.timestamps[key] = time.perf_counter()
+                waited = False
+
+            skew = bundle.timestamps[key] - reference_timestamp
+            in_bound = self._in_bound(skew)
+            if not in_bound:
+                logger.debug(f"Frame of {key} captured {1e3 * skew:.1f}ms from the reference time")
+            camera_sync.stats.record(skew, in_bound, waited)
+        return bundle
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Skew of the frames selected for each camera, with their capture latency and jitter if available."""
+        stats = {}
+        for key, camera_sync in self._cameras.items():
+            stats[key] = camera_sync.stats.as_dict()
+            timing_stats = getattr(camera_sync.camera, "timing_stats", None)
+            if timing_stats is not None:
+                stats[key].update(timing_stats.as_dict())
+        return stats
+
+    def _in_bound(self, skew: float) -> bool:
+        return self.max_skew_ms is None or abs(skew) <= self.max_skew_ms / 1e3
+
+    def _nearest_frame(self, camera_sync: _CameraSync, reference: float) -> tuple[Frame, bool]:
+        camera = camera_sync.camera
+        if camera_sync.cursor is None or camera_sync.cursor.bus is not getattr(camera, "frame_bus", None):
+            camera_sync.cursor = camera.frame_cursor()
+        bus = camera_sync.cursor.bus
+        timeout = self.timeout_ms / 1e3
+        if not bus.wait_for(1, timeout):
+            raise TimeoutError(f"No frame from {camera} after {self.timeout_ms} ms.")
+
+        waited = False
+        while True:
+            head = bus.head
+            nearest = self._nearest_in_ring(bus, head, reference)
+            if nearest is None:
+                # The writer lapped the search
+                continue
+            skew = nearest.timestamp - reference
+            if self._in_bound(skew) or waited or nearest.seq != head:
+                break
+            # The next frame would be nearer if the reference is closer to its expected capture time
+            interval = getattr(camera, "timing_stats", CaptureTimingStats()).mean_interval
+            if interval is None or reference - nearest.timestamp <= interval / 2:
+                break
+            waited = True
+            if not bus.wait_for(head + 1, timeout):
+                break
+
+        frame = bus.read(nearest.seq)
+        if frame is None:
+            # Overwritten since it was selected
+            return self._nearest_frame(camera_sync, reference)
+        return frame, waited
+
+    @staticmethod
+    def _nearest_in_ring(bus: FrameBus, head: int, reference: float) -> Frame | None:
+        nearest = None
+        # The slot after the head is the one being written
+        for seq in range(head, max(head - bus.num_slots + 1, 0), -1):
+            frame = bus.read(seq, copy=False)
+            if frame is None:
+                break
+            if nearest is None or abs(frame.timestamp - reference) < abs(nearest.timestamp - reference):
+                nearest = frame
+            elif frame.timestamp < reference:
+                # Older frames are further away
+                break
+        return nearest
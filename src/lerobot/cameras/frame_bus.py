@@ -0,0 +1,352 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Provides the FrameBus, a ring of camera frames shared by several consumers, possibly in other processes.
+
+Example:
+    ```python
+    # In the process capturing the frames
+    bus = FrameBus((480, 640, 3), name="lekiwi_front")
+    bus.publish(frame)
+
+    # In any thread or process
+    cursor = FrameBus.attach("lekiwi_front").cursor()
+    frame = cursor.latest(timeout=0.2)  # Newest frame
+    frame = cursor.next(timeout=0.2)  # Following frame, without skipping any
+    ```
+"""
+
+import logging
+import struct
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"LRFB"
+# magic, number of slots, number of dimensions, dtype, shape
+_HEADER = struct.Struct("<4sII8s4Q")
+_HEAD_OFFSET = 64
+_SLOTS_OFFSET = 128
+_ALIGNMENT = 64
+MAX_FRAME_NDIM = 4
+# Readers in other processes can't be notified by the writer, so they poll the ring
+ATTACHED_POLL_INTERVAL = 0.001
+
+# Shared memory segments created by the buses of this process
+_created_segments: set[str] = set()
+
+
+def _align(offset: int) -> int:
+    return (offset + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    if name in _created_segments:
+        return shm
+    # Before Python 3.13, the resource tracker unlinks the segments attached by a process when it exits,
+    # which would remove the segment from under the process publishing the frames.
+    resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+    return shm
+
+
+@dataclass(frozen=True)
+class Frame:
+    """A frame read from a `FrameBus`."""
+
+    data: NDArray
+    timestamp: float
+    seq: int
+
+
+class FrameBus:
+    """A ring of the last frames of a camera, with sequence numbers and timestamps.
+
+    A single writer publishes frames in the ring, and any number of readers follow them with their own
+    `FrameCursor`, so that reading a frame never hides it from the other readers. With a `name`, the ring is
+    allocated in shared memory, and other processes can read it with `FrameBus.attach(name)`.
+
+    Frames are numbered from 1. The slot a frame is written to is invalidated while it's written, and readers
+    check the sequence number of the slot after reading it, so a frame overwritten during a read is never
+    returned. Frames can also be read without copy, as views of the ring: the views stay valid until the
+    writer has published `num_slots - 1` newer frames, which `is_current` checks.
+
+    Args:
+        shape: Shape of the frames, e.g. (height, width, channels).
+        dtype: Data type of the frames.
+        num_slots: Number of frames in the ring, at least 2 since the oldest slot is being written.
+        name: Name of the shared memory segment. If None, the ring is private to the process.
+    """
+
+    def __init__(
+        self,
+        shape: tuple[int, ...],
+        dtype: np.dtype | type = np.uint8,
+        num_slots: int = 4,
+        name: str | None = None,
+    ):
+        if num_slots < 2:
+            raise ValueError(f"num_slots must be at least 2, got {num_slots}")
+        if not 0 < len(shape) <= MAX_FRAME_NDIM:
+            raise ValueError(f"Frames must have 1 to {MAX_FRAME_NDIM} dimensions, got shape {shape}")
+        self.shape = tuple(int(dim) for dim in shape)
+        self.dtype = np.dtype(dtype)
+        self.num_slots = num_slots
+        self.name = name
+        self.is_writer = True
+
+        size = self._layout_size()
+        self._shm: shared_memory.SharedMemory | None = None
+        if name is None:
+            buffer = np.zeros(size, dtype=np.uint8)
+        else:
+            # New segments are filled with zeros
+            self._shm = self._create_shared_memory(name, size)
+            _created_segments.add(name)
+            buffer = self._shm.buf
+
+        shape_field = self.shape + (0,) * (MAX_FRAME_NDIM - len(self.shape))
+        _HEADER.pack_into(
+            buffer, 0, _MAGIC, num_slots, len(self.shape), self.dtype.str.encode(), *shape_field
+        )
+        self._map(buffer)
+
+    @classmethod
+    def attach(cls, name: str) -> "FrameBus":
+        """Read the frames of a bus created in another process with the same `name`."""
+        shm = _attach_shared_memory(name)
+        try:
+            magic, num_slots, ndim, dtype, *shape = _HEADER.unpack_from(shm.buf)
+        except struct.error as e:
+            shm.close()
+            raise ValueError(f"Shared memory segment {name} is not a frame bus") from e
+        if magic != _MAGIC:
+            shm.close()
+            raise ValueError(f"Shared memory segment {name} is not a frame bus")
+
+        bus = cls.__new__(cls)
+        bus.shape = tuple(shape[:ndim])
+        bus.dtype = np.dtype(dtype.rstrip(b"\0").decode())
+        bus.num_slots = num_slots
+        bus.name = name
+        bus.is_writer = False
+        bus._shm = shm
+        bus._map(shm.buf)
+        return bus
+
+    @staticmethod
+    def _create_shared_memory(name: str, size: int) -> shared_memory.SharedMemory:
+        try:
+            return shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left over by a process that didn't exit cleanly
+            logger.warning(f"Replacing the existing shared memory segment {name}")
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            return shared_memory.SharedMemory(name=name, create=True, size=size)
+
+    def _layout_size(self) -> int:
+        return self._frames_offset() + self.num_slots * self._slot_nbytes()
+
+    def _frames_offset(self) -> int:
+        return _align(_SLOTS_OFFSET + 16 * self.num_slots)
+
+    def _slot_nbytes(self) -> int:
+        return _align(int(np.prod(self.shape)) * self.dtype.itemsize)
+
+    def _map(self, buffer) -> None:
+        self._head = np.ndarray((1,), dtype=np.uint64, buffer=buffer, offset=_HEAD_OFFSET)
+        self._slot_seqs = np.ndarray((self.num_slots,), dtype=np.uint64, buffer=buffer, offset=_SLOTS_OFFSET)
+        self._slot_timestamps = np.ndarray(
+            (self.num_slots,), dtype=np.float64, buffer=buffer, offset=_SLOTS_OFFSET + 8 * self.num_slots
+        )
+        self._frames = [
+            np.ndarray(
+                self.shape,
+                dtype=self.dtype,
+                buffer=buffer,
+                offset=self._frames_offset() + slot * self._slot_nbytes(),
+            )
+            for slot in range(self.num_slots)
+        ]
+        self._writing: int | None = None
+        self._closed = False
+        # Only the readers in the process of the writer can be woken up when a frame is published
+        self._frame_published = threading.Condition() if self.is_writer else None
+
+    @property
+    def head(self) -> int:
+        """Sequence number of the last frame published, 0 if there is none yet."""
+        return int(self._head[0])
+
+    def begin_write(self) -> NDArray:
+        """Return the slot of the next frame, to write it in place, before calling `end_write`."""
+        if not self.is_writer:
+            raise RuntimeError(f"{self} is attached to the bus of another process, it can't publish frames.")
+        seq = self.head + 1
+        slot = seq % self.num_slots
+        self._slot_seqs[slot] = 0
+        self._writing = seq
+        return self._frames[slot]
+
+    def end_write(self, timestamp: float | None = None) -> int:
+        """Publish the frame written in the slot returned by `begin_write`, and return its sequence number.
+
+        Args:
+            timestamp: The capture time of the frame, from `time.perf_counter`. Defaults to now.
+        """
+        if self._writing is None:
+            raise RuntimeError("end_write called without begin_write")
+        seq, self._writing = self._writing, None
+        slot = seq % self.num_slots
+        self._slot_timestamps[slot] = time.perf_counter() if timestamp is None else timestamp
+        self._slot_seqs[slot] = seq
+        self._head[0] = seq
+        with self._frame_published:
+            self._frame_published.notify_all()
+        return seq
+
+    def publish(self, frame: NDArray, timestamp: float | None = None) -> int:
+        """Copy a frame in the ring, and return its sequence number."""
+        if frame.shape != self.shape or frame.dtype != self.dtype:
+            raise ValueError(
+                f"Expected a frame of shape {self.shape} and dtype {self.dtype}, "
+                f"got {frame.shape} and {frame.dtype}."
+            )
+        np.copyto(self.begin_write(), frame)
+        return self.end_write(timestamp)
+
+    def read(self, seq: int, copy: bool = True) -> Frame | None:
+        """Read the frame `seq`, or return None if it isn't in the ring anymore, or not yet."""
+        slot = seq % self.num_slots
+        if seq <= 0 or int(self._slot_seqs[slot]) != seq:
+            return None
+        timestamp = float(self._slot_timestamps[slot])
+        data = self._frames[slot].copy() if copy else self._frames[slot]
+        if int(self._slot_seqs[slot]) != seq:
+            # Overwritten while it was read
+            return None
+        return Frame(data, timestamp, seq)
+
+    def is_current(self, frame: Frame) -> bool:
+        """Whether a frame read without copy still holds its data, i.e. wasn't overwritten since."""
+        return int(self._slot_seqs[frame.seq % self.num_slots]) == frame.seq
+
+    def wait_for(self, seq: int, timeout: float | None = None) -> bool:
+        """Wait until the frame `seq` is published, and return False on timeout or when the bus is closed."""
+        if self.head >= seq:
+            return True
+        if self._frame_published is not None:
+            with self._frame_published:
+                self._frame_published.wait_for(lambda: self.head >= seq or self._closed, timeout)
+            return self.head >= seq and not self._closed
+
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while self.head < seq:
+            if self._closed or (deadline is not None and time.perf_counter() >= deadline):
+                return False
+            time.sleep(ATTACHED_POLL_INTERVAL)
+        return True
+
+    def cursor(self) -> "FrameCursor":
+        """Create a cursor following the frames published from the last one on."""
+        return FrameCursor(self)
+
+    def close(self) -> None:
+        """Wake up the readers and release the ring. The writer also removes the shared memory segment."""
+        self._closed = True
+        if self._frame_published is not None:
+            with self._frame_published:
+                self._frame_published.notify_all()
+        if self._shm is None:
+            return
+
+        del self._head, self._slot_seqs, self._slot_timestamps, self._frames
+        try:
+            self._shm.close()
+        except BufferError:
+            # Frames read without copy are still referenced, the mapping is released with them
+            logger.debug(f"{self} is still referenced by frames read without copy.")
+        if self.is_writer:
+            self._shm.unlink()
+            _created_segments.discard(self.name)
+        self._shm = None
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}({self.name or id(self)})"
+
+
+class FrameCursor:
+    """The position of a reader in a `FrameBus`.
+
+    Every reader uses its own cursor, so they all get every frame, whatever the order they read them.
+    `latest` returns the newest frame, skipping the ones published since the previous read, while `next`
+    returns the frames in order, and only skips those overwritten before they could be read, which are
+    counted in `dropped`. A new cursor starts at the last frame published, if any.
+    """
+
+    def __init__(self, bus: FrameBus):
+        self.bus = bus
+        self.last_seq = max(bus.head - 1, 0)
+        self.dropped = 0
+
+    def latest(self, timeout: float | None = None, copy: bool = True) -> Frame:
+        """Return the newest frame, waiting for one if it was already read with this cursor.
+
+        Raises:
+            TimeoutError: If no new frame is published within `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            self._wait(deadline)
+            frame = self.bus.read(self.bus.head, copy)
+            if frame is not None:
+                self.last_seq = frame.seq
+                return frame
+
+    def next(self, timeout: float | None = None, copy: bool = True) -> Frame:
+        """Return the frame following the previous one read with this cursor, or the oldest one still in the
+        ring if it was overwritten.
+
+        Raises:
+            TimeoutError: If no new frame is published within `timeout` seconds.
+        """
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            self._wait(deadline)
+            # The slot after the head is the one being written
+            oldest = self.bus.head - self.bus.num_slots + 2
+            frame = self.bus.read(max(self.last_seq + 1, oldest), copy)
+            if frame is not None:
+                self.dropped += frame.seq - self.last_seq - 1
+                self.last_seq = frame.seq
+                return frame
+
+    def _wait(self, deadline: float | None) -> None:
+        timeout = None if deadline is None else max(deadline - time.perf_counter(), 0.0)
+        if not self.bus.wait_for(self.last_seq + 1, timeout):
+            raise TimeoutError(f"No new frame published on {self.bus} within the timeout.")
@@ -22,7 +22,7 @@ import os
 import platform
 import time
 from pathlib import Path
-from threading import Event, Lock, Thread
+from threading import Event, Thread, local
 from typing import Any
 
 from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for numpy.typing
@@ -31,10 +31,13 @@ from numpy.typing import NDArray  # type: ignore  # TODO: add type stubs for num
 if platform.system() == "Windows" and "OPENCV_VIDEOIO_MSMF_ENABLE_HW_TRANSFORMS" not in os.environ:
     os.environ["OPENCV_VIDEOIO_MSMF_ENABLE_HW_TRANSFORMS"] = "0"
 import cv2  # type: ignore  # TODO: add type stubs for OpenCV
+import numpy as np
 
 from lerobot.utils.errors import DeviceAlreadyConnectedError, DeviceNotConnectedError
 
 from ..camera import Camera
+from ..capture_sync import CaptureClock, CaptureTimingStats
+from ..frame_bus import FrameBus, FrameCursor
 from ..utils import get_cv2_backend, get_cv2_rotation
 from .configuration_opencv import ColorMode, OpenCVCameraConfig
 
@@ -84,6 +87,11 @@ class OpenCVCamera(Camera):
         # Read 1 frame asynchronously
         async_image = camera.async_read()
 
+        # Follow the frames with a cursor of your own, e.g. from another thread
+        cursor = camera.frame_cursor()
+        frame = cursor.next(timeout=0.2)
+        print(frame.seq, frame.timestamp, frame.data.shape)  # timestamp: capture time, in time.perf_counter
+
         # When done, properly disconnect the camera using
         camera.disconnect()
 
@@ -121,9 +129,14 @@ class OpenCVCamera(Camera):
 
         self.thread: Thread | None = None
         self.stop_event: Event | None = None
-        self.frame_lock: Lock = Lock()
-        self.latest_frame: NDArray[Any] | None = None
-        self.new_frame_event: Event = Event()
+        self.frame_bus: FrameBus | None = None
+        self.capture_clock = CaptureClock()
+        self.last_capture_timestamp: float | None = None
+        self.timing_stats = CaptureTimingStats()
+        # Cursors used by `async_read`, one per calling thread
+        self._async_cursors = local()
+        # Intermediate images of the postprocessing, reused for every frame
+        self._buffers: dict[str, NDArray[Any]] = {}
 
         self.rotation: int | None = get_cv2_rotation(config.rotation)
         self.backend: int = get_cv2_backend()
@@ -170,6 +183,22 @@ class OpenCVCamera(Camera):
             )
 
         self._configure_capture_settings()
+        if self.config.crop is not None:
+            top, left, crop_height, crop_width = self.config.crop
+            if top + crop_height > self.height or left + crop_width > self.width:
+                self.videocapture.release()
+                self.videocapture = None
+                raise ValueError(
+                    f"{self} crop={self.config.crop} exceeds the frame size {self.width}x{self.height}."
+                )
+        self.capture_clock.reset()
+        self.timing_stats = CaptureTimingStats()
+        self._buffers = {}
+        self.frame_bus = FrameBus(
+            self.output_shape,
+            num_slots=self.config.frame_bus_slots,
+            name=self.config.frame_bus_name,
+        )
 
         if warmup:
             start_time = time.time()
@@ -179,6 +208,16 @@ class OpenCVCamera(Camera):
 
         logger.info(f"{self} connected.")
 
+    @property
+    def output_shape(self) -> tuple[int, int, int]:
+        """Shape of the frames returned, after rotation and the optional crop, resize and channels first."""
+        height, width = self.height, self.width
+        if self.config.crop is not None:
+            height, width = self.config.crop[2:]
+        if self.config.resize is not None:
+            height, width = self.config.resize
+        return (3, height, width) if self.config.channels_first else (height, width, 3)
+
     def _configure_capture_settings(self) -> None:
         """
         Applies the specified FOURCC, FPS, width, and height settings to the connected camera.
@@ -339,7 +378,7 @@ class OpenCVCamera(Camera):
 
         return found_cameras_info
 
-    def read(self, color_mode: ColorMode | None = None) -> NDArray[Any]:
+    def read(self, color_mode: ColorMode | None = None, out: NDArray[Any] | None = None) -> NDArray[Any]:
         """
         Reads a single frame synchronously from the camera.
 
@@ -350,11 +389,14 @@ class OpenCVCamera(Camera):
             color_mode (Optional[ColorMode]): If specified, overrides the default
                 color mode (`self.color_mode`) for this read operation (e.g.,
                 request RGB even if default is BGR).
+            out (Optional[np.ndarray]): A uint8 array of shape `output_shape` to write
+                the frame into, instead of allocating a new one.
 
         Returns:
             np.ndarray: The captured frame as a NumPy array in the format
-                       (height, width, channels), using the specified or default
-                       color mode and applying any configured rotation.
+                       (height, width, channels), or (channels, height, width) with
+                       `channels_first`, using the specified or default color mode
+                       and applying any configured rotation, crop and resize.
 
         Raises:
             DeviceNotConnectedError: If the camera is not connected.
@@ -370,32 +412,47 @@ class OpenCVCamera(Camera):
         if self.videocapture is None:
             raise DeviceNotConnectedError(f"{self} videocapture is not initialized")
 
-        ret, frame = self.videocapture.read()
+        # Decode into the same buffer for every frame
+        ret, frame = self.videocapture.read(self._buffers.get("captured"))
 
         if not ret or frame is None:
             raise RuntimeError(f"{self} read failed (status={ret}).")
+        self._buffers["captured"] = frame
 
-        processed_frame = self._postprocess_image(frame, color_mode)
+        # The driver timestamp of the frame, when the backend provides it (e.g. V4L2 buffer timestamps)
+        self.last_capture_timestamp = self.capture_clock.stamp(
+            time.perf_counter(), self.videocapture.get(cv2.CAP_PROP_POS_MSEC)
+        )
+
+        processed_frame = self._postprocess_image(frame, color_mode, out)
 
         read_duration_ms = (time.perf_counter() - start_time) * 1e3
         logger.debug(f"{self} read took: {read_duration_ms:.1f}ms")
 
         return processed_frame
 
-    def _postprocess_image(self, image: NDArray[Any], color_mode: ColorMode | None = None) -> NDArray[Any]:
+    def _postprocess_image(
+        self, image: NDArray[Any], color_mode: ColorMode | None = None, out: NDArray[Any] | None = None
+    ) -> NDArray[Any]:
         """
-        Applies color conversion, dimension validation, and rotation to a raw frame.
+        Applies color conversion, dimension validation, rotation, crop and resize to a raw frame.
+
+        Every step writes into a buffer of the camera, reused for every frame, and the last one into `out`,
+        so that no array is allocated when `out` is given. The crop is a view and the color conversion is
+        applied last, on the smallest image.
 
         Args:
             image (np.ndarray): The raw image frame (expected BGR format from OpenCV).
             color_mode (Optional[ColorMode]): The target color mode (RGB or BGR). If None,
                                              uses the instance's default `self.color_mode`.
+            out (Optional[np.ndarray]): A uint8 array of shape `output_shape` to write the
+                                        processed frame into. If None, a new array is returned.
 
         Returns:
             np.ndarray: The processed image frame.
 
         Raises:
-            ValueError: If the requested `color_mode` is invalid.
+            ValueError: If the requested `color_mode` is invalid, or `out` has the wrong shape.
             RuntimeError: If the raw frame dimensions do not match the configured
                           `width` and `height`.
         """
@@ -416,36 +473,71 @@ class OpenCVCamera(Camera):
         if c != 3:
             raise RuntimeError(f"{self} frame channels={c} do not match expected 3 channels (RGB/BGR).")
 
+        output_shape = self.output_shape
+        if out is None:
+            out = np.empty(output_shape, dtype=np.uint8)
+        elif out.shape != output_shape or out.dtype != np.uint8:
+            raise ValueError(f"{self} expected an output of shape {output_shape}, got {out.shape}.")
+
+        convert = requested_color_mode == ColorMode.RGB
+        rotate = self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]
+        crop, resize = self.config.crop, self.config.resize
+        if self.config.channels_first:
+            hwc_out = self._get_buffer("channels_last", output_shape[1:] + output_shape[:1])
+        else:
+            hwc_out = out
+
         processed_image = image
-        if requested_color_mode == ColorMode.RGB:
-            processed_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        if rotate:
+            last_step = crop is None and resize is None and not convert
+            rotated = hwc_out if last_step else self._get_buffer("rotated", (self.height, self.width, 3))
+            processed_image = cv2.rotate(processed_image, self.rotation, dst=rotated)
+
+        if crop is not None:
+            top, left, crop_height, crop_width = crop
+            processed_image = processed_image[top : top + crop_height, left : left + crop_width]
+
+        if resize is not None:
+            resized = self._get_buffer("resized", hwc_out.shape) if convert else hwc_out
+            processed_image = cv2.resize(
+                processed_image, resize[::-1], dst=resized, interpolation=cv2.INTER_AREA
+            )
+
+        if convert:
+            processed_image = cv2.cvtColor(processed_image, cv2.COLOR_BGR2RGB, dst=hwc_out)
+        if processed_image is not hwc_out:
+            np.copyto(hwc_out, processed_image)
+
+        if self.config.channels_first:
+            np.copyto(out, hwc_out.transpose(2, 0, 1))
 
-        if self.rotation in [cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE, cv2.ROTATE_180]:
-            processed_image = cv2.rotate(processed_image, self.rotation)
+        return out
 
-        return processed_image
+    def _get_buffer(self, name: str, shape: tuple[int, ...]) -> NDArray[Any]:
+        buffer = self._buffers.get(name)
+        if buffer is None or buffer.shape != shape:
+            buffer = self._buffers[name] = np.empty(shape, dtype=np.uint8)
+        return buffer
 
     def _read_loop(self) -> None:
         """
         Internal loop run by the background thread for asynchronous reading.
 
         On each iteration:
-        1. Reads a color frame
-        2. Stores result in latest_frame (thread-safe)
-        3. Sets new_frame_event to notify listeners
+        1. Reads a color frame directly into the next slot of the frame bus
+        2. Publishes it with its capture timestamp, which wakes up the readers
+        3. Updates the latency and jitter statistics
 
         Stops on DeviceNotConnectedError, logs other errors and continues.
         """
-        if self.stop_event is None:
+        if self.stop_event is None or self.frame_bus is None:
             raise RuntimeError(f"{self}: stop_event is not initialized before starting read loop.")
 
         while not self.stop_event.is_set():
             try:
-                color_image = self.read()
-
-                with self.frame_lock:
-                    self.latest_frame = color_image
-                self.new_frame_event.set()
+                self.read(out=self.frame_bus.begin_write())
+                self.frame_bus.end_write(self.last_capture_timestamp)
+                self.timing_stats.record(self.last_capture_timestamp, time.perf_counter())
 
             except DeviceNotConnectedError:
                 break
@@ -475,6 +567,24 @@ class OpenCVCamera(Camera):
         self.thread = None
         self.stop_event = None
 
+    def frame_cursor(self) -> FrameCursor:
+        """
+        Creates a cursor following the frames captured by the background read thread.
+
+        Unlike `async_read`, which returns copies, the frames of a cursor can be read without copy
+        (`copy=False`), and `next` returns every frame in order. Each reader must use its own cursor.
+
+        Raises:
+            DeviceNotConnectedError: If the camera is not connected.
+        """
+        if not self.is_connected or self.frame_bus is None:
+            raise DeviceNotConnectedError(f"{self} is not connected.")
+
+        if self.thread is None or not self.thread.is_alive():
+            self._start_read_thread()
+
+        return self.frame_bus.cursor()
+
     def async_read(self, timeout_ms: float = 200) -> NDArray[Any]:
         """
         Reads the latest available frame asynchronously.
@@ -483,6 +593,9 @@ class OpenCVCamera(Camera):
         read thread. It does not block waiting for the camera hardware directly,
         but may wait up to timeout_ms for the background thread to provide a frame.
 
+        Each calling thread follows the frames with its own cursor: a frame is returned
+        at most once per thread, and reading it doesn't hide it from the other threads.
+
         Args:
             timeout_ms (float): Maximum time in milliseconds to wait for a frame
                 to become available. Defaults to 200ms (0.2 seconds).
@@ -496,34 +609,32 @@ class OpenCVCamera(Camera):
             TimeoutError: If no frame becomes available within the specified timeout.
             RuntimeError: If an unexpected error occurs.
         """
-        if not self.is_connected:
+        if not self.is_connected or self.frame_bus is None:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        if self.thread is None or not self.thread.is_alive():
+        cursor = getattr(self._async_cursors, "cursor", None)
+        if cursor is None or cursor.bus is not self.frame_bus:
+            cursor = self._async_cursors.cursor = self.frame_cursor()
+        elif self.thread is None or not self.thread.is_alive():
             self._start_read_thread()
 
-        if not self.new_frame_event.wait(timeout=timeout_ms / 1000.0):
+        try:
+            frame = cursor.latest(timeout=timeout_ms / 1000.0)
+        except TimeoutError as e:
             thread_alive = self.thread is not None and self.thread.is_alive()
             raise TimeoutError(
                 f"Timed out waiting for frame from camera {self} after {timeout_ms} ms. "
                 f"Read thread alive: {thread_alive}."
-            )
-
-        with self.frame_lock:
-            frame = self.latest_frame
-            self.new_frame_event.clear()
+            ) from e
 
-        if frame is None:
-            raise RuntimeError(f"Internal error: Event set but no frame available for {self}.")
-
-        return frame
+        return frame.data
 
     def disconnect(self) -> None:
         """
         Disconnects from the camera and cleans up resources.
 
-        Stops the background read thread (if running) and releases the OpenCV
-        VideoCapture object.
+        Stops the background read thread (if running), closes the frame bus and
+        releases the OpenCV VideoCapture object.
 
         Raises:
             DeviceNotConnectedError: If the camera is already disconnected.
@@ -534,6 +645,10 @@ class OpenCVCamera(Camera):
         if self.thread is not None:
             self._stop_read_thread()
 
+        if self.frame_bus is not None:
+            self.frame_bus.close()
+            self.frame_bus = None
+
         if self.videocapture is not None:
             self.videocapture.release()
             self.videocapture = None
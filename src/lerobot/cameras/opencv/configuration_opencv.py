@@ -50,11 +50,22 @@ class OpenCVCameraConfig(CameraConfig):
         rotation: Image rotation setting (0°, 90°, 180°, or 270°). Defaults to no rotation.
         warmup_s: Time reading frames before returning from connect (in seconds)
         fourcc: FOURCC code for video format (e.g., "MJPG", "YUYV", "I420"). Defaults to None (auto-detect).
+        crop: Optional crop (top, left, height, width) of the rotated frames, as the `crop_params_dict` of
+            `ImageCropResizeProcessorStep`. Defaults to None (no crop).
+        resize: Optional (height, width) to resize the rotated and cropped frames to, as the `resize_size` of
+            `ImageCropResizeProcessorStep`. Defaults to None (no resize).
+        channels_first: Whether to return the frames as (channels, height, width), e.g. to create tensors with
+            `torch.from_numpy` without copy. Defaults to False.
+        frame_bus_slots: Number of frames kept for the readers of `async_read` and of the frame bus.
+        frame_bus_name: Name of the shared memory segment of the frame bus, to read the frames from other
+            processes with `FrameBus.attach`. Defaults to None (frames are only readable in this process).
 
     Note:
         - Only 3-channel color output (RGB/BGR) is currently supported.
         - FOURCC codes must be 4-character strings (e.g., "MJPG", "YUYV"). Some common FOUCC codes: https://learn.microsoft.com/en-us/windows/win32/medfound/video-fourccs#fourcc-constants
         - Setting FOURCC can help achieve higher frame rates on some cameras.
+        - `width` and `height` are the size of the captured frames after rotation, the frames returned have the
+          size of `resize` or `crop` when set.
     """
 
     index_or_path: int | Path
@@ -62,6 +73,11 @@ class OpenCVCameraConfig(CameraConfig):
     rotation: Cv2Rotation = Cv2Rotation.NO_ROTATION
     warmup_s: int = 1
     fourcc: str | None = None
+    crop: tuple[int, int, int, int] | None = None
+    resize: tuple[int, int] | None = None
+    channels_first: bool = False
+    frame_bus_slots: int = 4
+    frame_bus_name: str | None = None
 
     def __post_init__(self) -> None:
         if self.color_mode not in (ColorMode.RGB, ColorMode.BGR):
@@ -83,3 +99,16 @@ class OpenCVCameraConfig(CameraConfig):
             raise ValueError(
                 f"`fourcc` must be a 4-character string (e.g., 'MJPG', 'YUYV'), but '{self.fourcc}' is provided."
             )
+
+        if self.crop is not None and (
+            len(self.crop) != 4 or min(self.crop[:2]) < 0 or min(self.crop[2:]) <= 0
+        ):
+            raise ValueError(
+                f"`crop` must be (top, left, height, width) with a positive size, but {self.crop} is provided."
+            )
+
+        if self.resize is not None and (len(self.resize) != 2 or min(self.resize) <= 0):
+            raise ValueError(f"`resize` must be a positive (height, width), but {self.resize} is provided.")
+
+        if self.frame_bus_slots < 2:
+            raise ValueError(f"`frame_bus_slots` must be at least 2, but {self.frame_bus_slots} is provided.")
@@ -35,6 +35,17 @@ class DatasetConfig:
     use_imagenet_stats: bool = True
     video_backend: str = field(default_factory=get_safe_default_codec)
     streaming: bool = False
+    # Local directory where video frames are decoded once into a memory-mapped uint8 store, which is then used
+    # instead of decoding the videos at every step. Requires num_frames x C x H x W bytes of disk per camera.
+    frame_store_root: str | None = None
+    # Return camera frames as uint8 in [0, 255] instead of float32 in [0, 1]. They are converted to float on the
+    # policy device by the preprocessor, which makes batches 4 times smaller until then.
+    return_uint8_images: bool = False
+    # Shuffle training frames in blocks of `sampler_block_size` consecutive frames of an episode, interleaving the
+    # frames of `sampler_interleave_blocks` blocks. Batches then share video files and keyframes, which makes video
+    # decoding cheaper. 1 shuffles frames independently.
+    sampler_block_size: int = 1
+    sampler_interleave_blocks: int = 1
 
 
 @dataclass
@@ -15,10 +15,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import logging
 import shutil
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import tqdm
 
@@ -31,6 +33,7 @@ from lerobot.datasets.utils import (
     DEFAULT_EPISODES_PATH,
     DEFAULT_VIDEO_FILE_SIZE_IN_MB,
     DEFAULT_VIDEO_PATH,
+    INFO_PATH,
     get_file_size_in_mb,
     get_parquet_file_size_in_mb,
     to_parquet_with_hf_images,
@@ -39,7 +42,12 @@ from lerobot.datasets.utils import (
     write_stats,
     write_tasks,
 )
-from lerobot.datasets.video_utils import concatenate_video_files, get_video_duration_in_s
+from lerobot.datasets.video_utils import (
+    concatenate_video_files,
+    get_video_duration_in_s,
+    write_video_index,
+)
+from lerobot.utils.constants import HF_LEROBOT_HOME
 
 
 def validate_all_metadata(all_metadata: list[LeRobotDatasetMetadata]):
@@ -78,23 +86,25 @@ def validate_all_metadata(all_metadata: list[LeRobotDatasetMetadata]):
     return fps, robot_type, features
 
 
-def update_data_df(df, src_meta, dst_meta):
+def update_data_df(df, src_meta, dst_meta, episode_offset, frame_offset):
     """Updates a data DataFrame with new indices and task mappings for aggregation.
 
     Adjusts episode indices, frame indices, and task indices to account for
-    previously aggregated data in the destination dataset.
+    the data placed before the source dataset in the destination dataset.
 
     Args:
         df: DataFrame containing the data to be updated.
         src_meta: Source dataset metadata.
         dst_meta: Destination dataset metadata.
+        episode_offset: Index of the first episode of the source dataset in the destination dataset.
+        frame_offset: Index of the first frame of the source dataset in the destination dataset.
 
     Returns:
         pd.DataFrame: Updated DataFrame with adjusted indices.
     """
 
-    df["episode_index"] = df["episode_index"] + dst_meta.info["total_episodes"]
-    df["index"] = df["index"] + dst_meta.info["total_frames"]
+    df["episode_index"] = df["episode_index"] + episode_offset
+    df["index"] = df["index"] + frame_offset
 
     src_task_names = src_meta.tasks.index.take(df["task_index"].to_numpy())
     df["task_index"] = dst_meta.tasks.loc[src_task_names, "task_index"].to_numpy()
@@ -102,85 +112,34 @@ def update_data_df(df, src_meta, dst_meta):
     return df
 
 
-def update_meta_data(
-    df,
-    dst_meta,
-    meta_idx,
-    data_idx,
-    videos_idx,
-):
+def update_meta_data(df, src_plan):
     """Updates metadata DataFrame with new chunk, file, and timestamp indices.
 
-    Adjusts all indices and timestamps to account for previously aggregated
-    data and videos in the destination dataset.
+    Maps the data, video and episodes metadata files of every episode to their destination files,
+    and shifts the episode indices, frame indices and video timestamps according to the plan of
+    the source dataset.
 
     Args:
         df: DataFrame containing the metadata to be updated.
-        dst_meta: Destination dataset metadata.
-        meta_idx: Dictionary containing current metadata chunk and file indices.
-        data_idx: Dictionary containing current data chunk and file indices.
-        videos_idx: Dictionary containing current video indices and timestamps.
+        src_plan: Aggregation plan of the source dataset, as returned by `plan_aggregation`.
 
     Returns:
         pd.DataFrame: Updated DataFrame with adjusted indices and timestamps.
     """
+    # Timestamp offsets depend on the source video files, so apply them before remapping the files
+    for key, src_to_offset in src_plan["video_offsets"].items():
+        offsets = np.array([src_to_offset[src] for src in _get_chunk_file_pairs(df, f"videos/{key}")])
+        df[f"videos/{key}/from_timestamp"] = df[f"videos/{key}/from_timestamp"] + offsets
+        df[f"videos/{key}/to_timestamp"] = df[f"videos/{key}/to_timestamp"] + offsets
 
-    df["meta/episodes/chunk_index"] = df["meta/episodes/chunk_index"] + meta_idx["chunk"]
-    df["meta/episodes/file_index"] = df["meta/episodes/file_index"] + meta_idx["file"]
-    df["data/chunk_index"] = df["data/chunk_index"] + data_idx["chunk"]
-    df["data/file_index"] = df["data/file_index"] + data_idx["file"]
-    for key, video_idx in videos_idx.items():
-        # Store original video file indices before updating
-        orig_chunk_col = f"videos/{key}/chunk_index"
-        orig_file_col = f"videos/{key}/file_index"
-        df["_orig_chunk"] = df[orig_chunk_col].copy()
-        df["_orig_file"] = df[orig_file_col].copy()
-
-        # Get mappings for this video key
-        src_to_offset = video_idx.get("src_to_offset", {})
-        src_to_dst = video_idx.get("src_to_dst", {})
-
-        # Apply per-source-file mappings
-        if src_to_dst:
-            # Map each episode to its correct destination file and apply offset
-            for idx in df.index:
-                # Convert to Python int to avoid numpy type mismatch in dict lookup
-                src_key = (int(df.at[idx, "_orig_chunk"]), int(df.at[idx, "_orig_file"]))
-
-                # Get destination chunk/file for this source file
-                dst_chunk, dst_file = src_to_dst.get(src_key, (video_idx["chunk"], video_idx["file"]))
-                df.at[idx, orig_chunk_col] = dst_chunk
-                df.at[idx, orig_file_col] = dst_file
-
-                # Apply timestamp offset
-                offset = src_to_offset.get(src_key, 0)
-                df.at[idx, f"videos/{key}/from_timestamp"] += offset
-                df.at[idx, f"videos/{key}/to_timestamp"] += offset
-        elif src_to_offset:
-            # Fallback: use same destination for all, but apply per-file offsets
-            df[orig_chunk_col] = video_idx["chunk"]
-            df[orig_file_col] = video_idx["file"]
-            for idx in df.index:
-                # Convert to Python int to avoid numpy type mismatch in dict lookup
-                src_key = (int(df.at[idx, "_orig_chunk"]), int(df.at[idx, "_orig_file"]))
-                offset = src_to_offset.get(src_key, 0)
-                df.at[idx, f"videos/{key}/from_timestamp"] += offset
-                df.at[idx, f"videos/{key}/to_timestamp"] += offset
-        else:
-            # Fallback to simple offset (for backward compatibility)
-            df[orig_chunk_col] = video_idx["chunk"]
-            df[orig_file_col] = video_idx["file"]
-            df[f"videos/{key}/from_timestamp"] = (
-                df[f"videos/{key}/from_timestamp"] + video_idx["latest_duration"]
-            )
-            df[f"videos/{key}/to_timestamp"] = df[f"videos/{key}/to_timestamp"] + video_idx["latest_duration"]
+    for prefix, src_to_dst in src_plan["files"].items():
+        dst_pairs = [src_to_dst[src] for src in _get_chunk_file_pairs(df, prefix)]
+        df[f"{prefix}/chunk_index"] = [chunk_idx for chunk_idx, _ in dst_pairs]
+        df[f"{prefix}/file_index"] = [file_idx for _, file_idx in dst_pairs]
 
-        # Clean up temporary columns
-        df = df.drop(columns=["_orig_chunk", "_orig_file"])
-
-    df["dataset_from_index"] = df["dataset_from_index"] + dst_meta.info["total_frames"]
-    df["dataset_to_index"] = df["dataset_to_index"] + dst_meta.info["total_frames"]
-    df["episode_index"] = df["episode_index"] + dst_meta.info["total_episodes"]
+    df["dataset_from_index"] = df["dataset_from_index"] + src_plan["frame_offset"]
+    df["dataset_to_index"] = df["dataset_to_index"] + src_plan["frame_offset"]
+    df["episode_index"] = df["episode_index"] + src_plan["episode_offset"]
 
     return df
 
@@ -193,14 +152,20 @@ def aggregate_datasets(
     data_files_size_in_mb: float | None = None,
     video_files_size_in_mb: float | None = None,
     chunk_size: int | None = None,
+    num_workers: int | None = None,
+    append: bool = False,
 ):
     """Aggregates multiple LeRobot datasets into a single unified dataset.
 
     This is the main function that orchestrates the aggregation process by:
     1. Loading and validating all source dataset metadata
-    2. Creating a new destination dataset with unified tasks
-    3. Aggregating videos, data, and metadata from all source datasets
-    4. Finalizing the aggregated dataset with proper statistics
+    2. Creating a new destination dataset with unified tasks, or loading the existing one when appending
+    3. Planning the destination layout of the data, videos and metadata of all source datasets
+    4. Writing all destination files concurrently with a pool of workers
+    5. Finalizing the aggregated dataset with proper statistics
+
+    When `append` is True and the aggregated dataset already exists, the source datasets are added after
+    its last episode. Its existing files are left untouched: the new episodes are written to new files.
 
     Args:
         repo_ids: List of repository IDs for the datasets to aggregate.
@@ -210,16 +175,11 @@ def aggregate_datasets(
         data_files_size_in_mb: Maximum size for data files in MB (defaults to DEFAULT_DATA_FILE_SIZE_IN_MB)
         video_files_size_in_mb: Maximum size for video files in MB (defaults to DEFAULT_VIDEO_FILE_SIZE_IN_MB)
         chunk_size: Maximum number of files per chunk (defaults to DEFAULT_CHUNK_SIZE)
+        num_workers: Number of threads writing destination files. Defaults to the ThreadPoolExecutor default.
+        append: Whether to append the source datasets to an existing aggregated dataset.
     """
     logging.info("Start aggregate_datasets")
 
-    if data_files_size_in_mb is None:
-        data_files_size_in_mb = DEFAULT_DATA_FILE_SIZE_IN_MB
-    if video_files_size_in_mb is None:
-        video_files_size_in_mb = DEFAULT_VIDEO_FILE_SIZE_IN_MB
-    if chunk_size is None:
-        chunk_size = DEFAULT_CHUNK_SIZE
-
     all_metadata = (
         [LeRobotDatasetMetadata(repo_id) for repo_id in repo_ids]
         if roots is None
@@ -227,326 +187,258 @@ def aggregate_datasets(
             LeRobotDatasetMetadata(repo_id, root=root) for repo_id, root in zip(repo_ids, roots, strict=False)
         ]
     )
-    fps, robot_type, features = validate_all_metadata(all_metadata)
-    video_keys = [key for key in features if features[key]["dtype"] == "video"]
-
-    dst_meta = LeRobotDatasetMetadata.create(
-        repo_id=aggr_repo_id,
-        fps=fps,
-        robot_type=robot_type,
-        features=features,
-        root=aggr_root,
-        use_videos=len(video_keys) > 0,
-        chunks_size=chunk_size,
-        data_files_size_in_mb=data_files_size_in_mb,
-        video_files_size_in_mb=video_files_size_in_mb,
-    )
+    aggr_root = Path(aggr_root) if aggr_root is not None else HF_LEROBOT_HOME / aggr_repo_id
+
+    if append and (aggr_root / INFO_PATH).exists():
+        dst_meta = LeRobotDatasetMetadata(aggr_repo_id, root=aggr_root)
+        validate_all_metadata([dst_meta, *all_metadata])
+        if data_files_size_in_mb is None:
+            data_files_size_in_mb = dst_meta.info["data_files_size_in_mb"]
+        if video_files_size_in_mb is None:
+            video_files_size_in_mb = dst_meta.info["video_files_size_in_mb"]
+        if chunk_size is None:
+            chunk_size = dst_meta.info["chunks_size"]
+        existing_tasks = dst_meta.tasks.sort_values("task_index").index
+    else:
+        if data_files_size_in_mb is None:
+            data_files_size_in_mb = DEFAULT_DATA_FILE_SIZE_IN_MB
+        if video_files_size_in_mb is None:
+            video_files_size_in_mb = DEFAULT_VIDEO_FILE_SIZE_IN_MB
+        if chunk_size is None:
+            chunk_size = DEFAULT_CHUNK_SIZE
+
+        fps, robot_type, features = validate_all_metadata(all_metadata)
+        video_keys = [key for key in features if features[key]["dtype"] == "video"]
+
+        dst_meta = LeRobotDatasetMetadata.create(
+            repo_id=aggr_repo_id,
+            fps=fps,
+            robot_type=robot_type,
+            features=features,
+            root=aggr_root,
+            use_videos=len(video_keys) > 0,
+            chunks_size=chunk_size,
+            data_files_size_in_mb=data_files_size_in_mb,
+            video_files_size_in_mb=video_files_size_in_mb,
+        )
+        existing_tasks = pd.Index([])
 
     logging.info("Find all tasks")
-    unique_tasks = pd.concat([m.tasks for m in all_metadata]).index.unique()
+    new_tasks = pd.concat([m.tasks for m in all_metadata]).index.unique()
+    unique_tasks = existing_tasks.append(new_tasks.difference(existing_tasks, sort=False))
     dst_meta.tasks = pd.DataFrame({"task_index": range(len(unique_tasks))}, index=unique_tasks)
 
-    meta_idx = {"chunk": 0, "file": 0}
-    data_idx = {"chunk": 0, "file": 0}
-    videos_idx = {
-        key: {"chunk": 0, "file": 0, "latest_duration": 0, "episode_duration": 0} for key in video_keys
-    }
-
-    dst_meta.episodes = {}
-
-    for src_meta in tqdm.tqdm(all_metadata, desc="Copy data and videos"):
-        videos_idx = aggregate_videos(src_meta, dst_meta, videos_idx, video_files_size_in_mb, chunk_size)
-        data_idx = aggregate_data(src_meta, dst_meta, data_idx, data_files_size_in_mb, chunk_size)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=num_workers) as executor:
+        logging.info("Plan aggregation")
+        src_plans, dst_files = plan_aggregation(
+            all_metadata, dst_meta, data_files_size_in_mb, video_files_size_in_mb, chunk_size, executor
+        )
 
-        meta_idx = aggregate_metadata(src_meta, dst_meta, meta_idx, data_idx, videos_idx)
+        futures = [
+            executor.submit(
+                write_aggregated_file, prefix, dst_chunk_file, sources, all_metadata, src_plans, dst_meta
+            )
+            for prefix, files in dst_files.items()
+            for dst_chunk_file, sources in files.items()
+        ]
+        for future in tqdm.tqdm(
+            concurrent.futures.as_completed(futures), total=len(futures), desc="Copy data and videos"
+        ):
+            future.result()
 
-        dst_meta.info["total_episodes"] += src_meta.total_episodes
-        dst_meta.info["total_frames"] += src_meta.total_frames
+    dst_meta.info["total_episodes"] += sum(m.total_episodes for m in all_metadata)
+    dst_meta.info["total_frames"] += sum(m.total_frames for m in all_metadata)
 
     finalize_aggregation(dst_meta, all_metadata)
     logging.info("Aggregation complete.")
 
 
-def aggregate_videos(src_meta, dst_meta, videos_idx, video_files_size_in_mb, chunk_size):
-    """Aggregates video chunks from a source dataset into the destination dataset.
+def plan_aggregation(
+    all_metadata, dst_meta, data_files_size_in_mb, video_files_size_in_mb, chunk_size, executor
+):
+    """Plans the layout of the aggregated dataset before any file is written.
 
-    Handles video file concatenation and rotation based on file size limits.
-    Creates new video files when size limits are exceeded.
+    Every data, video and episodes metadata file of the source datasets is assigned to a destination file,
+    and the episode, frame and timestamp offsets of every source dataset are computed. Destination files
+    can then be written independently of each other. Source files are grouped in order into destination
+    files, rotating to a new destination file when its size limit would be reached. When the destination
+    dataset already contains episodes, new files are started after its last ones.
 
     Args:
-        src_meta: Source dataset metadata.
+        all_metadata: List of all source dataset metadata objects.
         dst_meta: Destination dataset metadata.
-        videos_idx: Dictionary tracking video chunk and file indices.
-        video_files_size_in_mb: Maximum size for video files in MB (defaults to DEFAULT_VIDEO_FILE_SIZE_IN_MB)
-        chunk_size: Maximum number of files per chunk (defaults to DEFAULT_CHUNK_SIZE)
+        data_files_size_in_mb: Maximum size for data files in MB.
+        video_files_size_in_mb: Maximum size for video files in MB.
+        chunk_size: Maximum number of files per chunk.
+        executor: Executor used to read the sizes and durations of the source files.
 
     Returns:
-        dict: Updated videos_idx with current chunk and file indices.
+        tuple: A tuple containing:
+            - list[dict]: The plan of each source dataset, with its "episode_offset" and "frame_offset",
+              its "files" mapping from (chunk, file) indices of its source files to destination ones for
+              each file prefix, and its "video_offsets" mapping video files to their timestamp offset.
+            - dict: For each file prefix, the list of (source dataset index, source path) to write in
+              each destination (chunk, file).
     """
-    for key in videos_idx:
-        videos_idx[key]["episode_duration"] = 0
-        # Track offset for each source (chunk, file) pair
-        videos_idx[key]["src_to_offset"] = {}
-        # Track destination (chunk, file) for each source (chunk, file) pair
-        videos_idx[key]["src_to_dst"] = {}
-        # Initialize dst_file_durations if not present
-        # dst_file_durations tracks duration of each destination file
-        if "dst_file_durations" not in videos_idx[key]:
-            videos_idx[key]["dst_file_durations"] = {}
-
-    for key, video_idx in videos_idx.items():
-        unique_chunk_file_pairs = {
-            (chunk, file)
-            for chunk, file in zip(
-                src_meta.episodes[f"videos/{key}/chunk_index"],
-                src_meta.episodes[f"videos/{key}/file_index"],
-                strict=False,
-            )
-        }
-        unique_chunk_file_pairs = sorted(unique_chunk_file_pairs)
-
-        chunk_idx = video_idx["chunk"]
-        file_idx = video_idx["file"]
-        dst_file_durations = video_idx["dst_file_durations"]
-
-        for src_chunk_idx, src_file_idx in unique_chunk_file_pairs:
-            # Convert to Python int to ensure consistent dict keys
-            src_chunk_idx = int(src_chunk_idx)
-            src_file_idx = int(src_file_idx)
-
-            src_path = src_meta.root / DEFAULT_VIDEO_PATH.format(
-                video_key=key,
-                chunk_index=src_chunk_idx,
-                file_index=src_file_idx,
-            )
-
-            dst_path = dst_meta.root / DEFAULT_VIDEO_PATH.format(
-                video_key=key,
-                chunk_index=chunk_idx,
-                file_index=file_idx,
-            )
-
-            src_duration = get_video_duration_in_s(src_path)
-            dst_key = (chunk_idx, file_idx)
-
-            if not dst_path.exists():
-                # New destination file: offset is 0
-                videos_idx[key]["src_to_offset"][(src_chunk_idx, src_file_idx)] = 0
-                videos_idx[key]["src_to_dst"][(src_chunk_idx, src_file_idx)] = dst_key
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(str(src_path), str(dst_path))
-                # Track duration of this destination file
-                dst_file_durations[dst_key] = src_duration
-                videos_idx[key]["episode_duration"] += src_duration
-                continue
-
-            # Check file sizes before appending
-            src_size = get_file_size_in_mb(src_path)
-            dst_size = get_file_size_in_mb(dst_path)
-
-            if dst_size + src_size >= video_files_size_in_mb:
-                # Rotate to a new file - offset is 0
-                chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, chunk_size)
-                dst_key = (chunk_idx, file_idx)
-                videos_idx[key]["src_to_offset"][(src_chunk_idx, src_file_idx)] = 0
-                videos_idx[key]["src_to_dst"][(src_chunk_idx, src_file_idx)] = dst_key
-                dst_path = dst_meta.root / DEFAULT_VIDEO_PATH.format(
-                    video_key=key,
-                    chunk_index=chunk_idx,
-                    file_index=file_idx,
-                )
-                dst_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy(str(src_path), str(dst_path))
-                # Track duration of this new destination file
-                dst_file_durations[dst_key] = src_duration
+    prefixes = ["data", "meta/episodes"] + [f"videos/{key}" for key in dst_meta.video_keys]
+
+    src_plans = []
+    src_files = {prefix: [] for prefix in prefixes}
+    episode_offset = dst_meta.info["total_episodes"]
+    frame_offset = dst_meta.info["total_frames"]
+    for src_idx, src_meta in enumerate(all_metadata):
+        src_plans.append(
+            {
+                "episode_offset": episode_offset,
+                "frame_offset": frame_offset,
+                "files": {prefix: {} for prefix in prefixes},
+                "video_offsets": {key: {} for key in dst_meta.video_keys},
+            }
+        )
+        for prefix in prefixes:
+            for src_chunk_file in sorted(set(_get_chunk_file_pairs(src_meta.episodes, prefix))):
+                src_path = _get_file_path(src_meta.root, prefix, *src_chunk_file)
+                src_files[prefix].append((src_idx, src_chunk_file, src_path))
+        episode_offset += src_meta.total_episodes
+        frame_offset += src_meta.total_frames
+
+    dst_files = {}
+    for prefix in prefixes:
+        src_paths = [src_path for _, _, src_path in src_files[prefix]]
+        if prefix.startswith("videos/"):
+            sizes = list(executor.map(get_file_size_in_mb, src_paths))
+            durations = list(executor.map(get_video_duration_in_s, src_paths))
+            max_mb, prefix_chunk_size = video_files_size_in_mb, chunk_size
+        else:
+            sizes = list(executor.map(get_parquet_file_size_in_mb, src_paths))
+            durations = [0.0] * len(src_paths)
+            if prefix == "data":
+                max_mb, prefix_chunk_size = data_files_size_in_mb, chunk_size
             else:
-                # Append to existing destination file
-                # Offset is the current duration of this destination file
-                current_dst_duration = dst_file_durations.get(dst_key, 0)
-                videos_idx[key]["src_to_offset"][(src_chunk_idx, src_file_idx)] = current_dst_duration
-                videos_idx[key]["src_to_dst"][(src_chunk_idx, src_file_idx)] = dst_key
-                concatenate_video_files(
-                    [dst_path, src_path],
-                    dst_path,
-                )
-                # Update duration of this destination file
-                dst_file_durations[dst_key] = current_dst_duration + src_duration
+                max_mb, prefix_chunk_size = DEFAULT_DATA_FILE_SIZE_IN_MB, DEFAULT_CHUNK_SIZE
 
-            videos_idx[key]["episode_duration"] += src_duration
+        start = _get_next_chunk_file_index(dst_meta, prefix, prefix_chunk_size)
+        dst_chunk_files = _plan_file_layout(sizes, start, max_mb, prefix_chunk_size)
 
-        videos_idx[key]["chunk"] = chunk_idx
-        videos_idx[key]["file"] = file_idx
+        dst_files[prefix] = {}
+        dst_durations = {}
+        for (src_idx, src_chunk_file, src_path), dst_chunk_file, duration in zip(
+            src_files[prefix], dst_chunk_files, durations, strict=True
+        ):
+            src_plans[src_idx]["files"][prefix][src_chunk_file] = dst_chunk_file
+            dst_files[prefix].setdefault(dst_chunk_file, []).append((src_idx, src_path))
+            if prefix.startswith("videos/"):
+                # The segment starts where the previous segments of the destination video end
+                offset = dst_durations.get(dst_chunk_file, 0.0)
+                src_plans[src_idx]["video_offsets"][prefix.removeprefix("videos/")][src_chunk_file] = offset
+                dst_durations[dst_chunk_file] = offset + duration
 
-    return videos_idx
+    return src_plans, dst_files
 
 
-def aggregate_data(src_meta, dst_meta, data_idx, data_files_size_in_mb, chunk_size):
-    """Aggregates data chunks from a source dataset into the destination dataset.
+def write_aggregated_file(prefix, dst_chunk_file, sources, all_metadata, src_plans, dst_meta):
+    """Writes a single destination file of the aggregated dataset from its source files.
 
-    Reads source data files, updates indices to match the aggregated dataset,
-    and writes them to the destination with proper file rotation.
+    Videos are copied when a destination video holds a single source video, and concatenated without
+    re-encoding otherwise. Data and episodes metadata are read, updated and written in one go.
 
     Args:
-        src_meta: Source dataset metadata.
+        prefix: File prefix, i.e. "data", "meta/episodes" or "videos/{video_key}".
+        dst_chunk_file: Destination (chunk, file) indices.
+        sources: Ordered list of (source dataset index, source path) to write in the destination file.
+        all_metadata: List of all source dataset metadata objects.
+        src_plans: Aggregation plan of each source dataset, as returned by `plan_aggregation`.
         dst_meta: Destination dataset metadata.
-        data_idx: Dictionary tracking data chunk and file indices.
-
-    Returns:
-        dict: Updated data_idx with current chunk and file indices.
     """
-    unique_chunk_file_ids = {
-        (c, f)
-        for c, f in zip(
-            src_meta.episodes["data/chunk_index"], src_meta.episodes["data/file_index"], strict=False
-        )
-    }
-
-    unique_chunk_file_ids = sorted(unique_chunk_file_ids)
+    dst_path = _get_file_path(dst_meta.root, prefix, *dst_chunk_file)
+    dst_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if prefix.startswith("videos/"):
+        src_paths = [src_path for _, src_path in sources]
+        if len(src_paths) == 1:
+            shutil.copy(str(src_paths[0]), str(dst_path))
+            write_video_index(dst_path)
+        else:
+            concatenate_video_files(src_paths, dst_path)
+        return
 
-    for src_chunk_idx, src_file_idx in unique_chunk_file_ids:
-        src_path = src_meta.root / DEFAULT_DATA_PATH.format(
-            chunk_index=src_chunk_idx, file_index=src_file_idx
-        )
+    dfs = []
+    for src_idx, src_path in sources:
         df = pd.read_parquet(src_path)
-        df = update_data_df(df, src_meta, dst_meta)
-
-        data_idx = append_or_create_parquet_file(
-            df,
-            src_path,
-            data_idx,
-            data_files_size_in_mb,
-            chunk_size,
-            DEFAULT_DATA_PATH,
-            contains_images=len(dst_meta.image_keys) > 0,
-            aggr_root=dst_meta.root,
-        )
-
-    return data_idx
-
-
-def aggregate_metadata(src_meta, dst_meta, meta_idx, data_idx, videos_idx):
-    """Aggregates metadata from a source dataset into the destination dataset.
-
-    Reads source metadata files, updates all indices and timestamps,
-    and writes them to the destination with proper file rotation.
+        src_plan = src_plans[src_idx]
+        if prefix == "data":
+            df = update_data_df(
+                df, all_metadata[src_idx], dst_meta, src_plan["episode_offset"], src_plan["frame_offset"]
+            )
+        else:
+            df = update_meta_data(df, src_plan)
+        dfs.append(df)
+    df = pd.concat(dfs, ignore_index=True)
 
-    Args:
-        src_meta: Source dataset metadata.
-        dst_meta: Destination dataset metadata.
-        meta_idx: Dictionary tracking metadata chunk and file indices.
-        data_idx: Dictionary tracking data chunk and file indices.
-        videos_idx: Dictionary tracking video indices and timestamps.
+    if prefix == "data" and len(dst_meta.image_keys) > 0:
+        to_parquet_with_hf_images(df, dst_path)
+    else:
+        df.to_parquet(dst_path)
 
-    Returns:
-        dict: Updated meta_idx with current chunk and file indices.
-    """
-    chunk_file_ids = {
-        (c, f)
-        for c, f in zip(
-            src_meta.episodes["meta/episodes/chunk_index"],
-            src_meta.episodes["meta/episodes/file_index"],
-            strict=False,
-        )
-    }
 
-    chunk_file_ids = sorted(chunk_file_ids)
-    for chunk_idx, file_idx in chunk_file_ids:
-        src_path = src_meta.root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
-        df = pd.read_parquet(src_path)
-        df = update_meta_data(
-            df,
-            dst_meta,
-            meta_idx,
-            data_idx,
-            videos_idx,
+def _get_chunk_file_pairs(episodes, prefix: str) -> list[tuple[int, int]]:
+    return [
+        (int(chunk_idx), int(file_idx))
+        for chunk_idx, file_idx in zip(
+            episodes[f"{prefix}/chunk_index"], episodes[f"{prefix}/file_index"], strict=True
         )
+    ]
 
-        meta_idx = append_or_create_parquet_file(
-            df,
-            src_path,
-            meta_idx,
-            DEFAULT_DATA_FILE_SIZE_IN_MB,
-            DEFAULT_CHUNK_SIZE,
-            DEFAULT_EPISODES_PATH,
-            contains_images=False,
-            aggr_root=dst_meta.root,
-        )
 
-    # Increment latest_duration by the total duration added from this source dataset
-    for k in videos_idx:
-        videos_idx[k]["latest_duration"] += videos_idx[k]["episode_duration"]
+def _get_file_path(root: Path, prefix: str, chunk_idx: int, file_idx: int) -> Path:
+    if prefix == "data":
+        return root / DEFAULT_DATA_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
+    if prefix == "meta/episodes":
+        return root / DEFAULT_EPISODES_PATH.format(chunk_index=chunk_idx, file_index=file_idx)
+    return root / DEFAULT_VIDEO_PATH.format(
+        video_key=prefix.removeprefix("videos/"), chunk_index=chunk_idx, file_index=file_idx
+    )
 
-    return meta_idx
 
+def _get_next_chunk_file_index(dst_meta, prefix: str, chunk_size: int) -> tuple[int, int]:
+    if dst_meta.episodes is None or len(dst_meta.episodes) == 0:
+        return 0, 0
+    chunk_idx, file_idx = max(_get_chunk_file_pairs(dst_meta.episodes, prefix))
+    return update_chunk_file_indices(chunk_idx, file_idx, chunk_size)
 
-def append_or_create_parquet_file(
-    df: pd.DataFrame,
-    src_path: Path,
-    idx: dict[str, int],
-    max_mb: float,
-    chunk_size: int,
-    default_path: str,
-    contains_images: bool = False,
-    aggr_root: Path = None,
-):
-    """Appends data to an existing parquet file or creates a new one based on size constraints.
 
-    Manages file rotation when size limits are exceeded to prevent individual files
-    from becoming too large. Handles both regular parquet files and those containing images.
+def _plan_file_layout(
+    sizes: list[float], start: tuple[int, int], max_mb: float, chunk_size: int
+) -> list[tuple[int, int]]:
+    """Assigns consecutive source files to destination files.
 
-    Args:
-        df: DataFrame to write to the parquet file.
-        src_path: Path to the source file (used for size estimation).
-        idx: Dictionary containing current 'chunk' and 'file' indices.
-        max_mb: Maximum allowed file size in MB before rotation.
-        chunk_size: Maximum number of files per chunk before incrementing chunk index.
-        default_path: Format string for generating file paths.
-        contains_images: Whether the data contains images requiring special handling.
-        aggr_root: Root path for the aggregated dataset.
+    A source file is added to the current destination file unless their combined size reaches `max_mb`,
+    in which case it starts a new destination file.
 
     Returns:
-        dict: Updated index dictionary with current chunk and file indices.
+        list[tuple[int, int]]: Destination (chunk, file) indices of each source file.
     """
-    dst_path = aggr_root / default_path.format(chunk_index=idx["chunk"], file_index=idx["file"])
-
-    if not dst_path.exists():
-        dst_path.parent.mkdir(parents=True, exist_ok=True)
-        if contains_images:
-            to_parquet_with_hf_images(df, dst_path)
-        else:
-            df.to_parquet(dst_path)
-        return idx
-
-    src_size = get_parquet_file_size_in_mb(src_path)
-    dst_size = get_parquet_file_size_in_mb(dst_path)
-
-    if dst_size + src_size >= max_mb:
-        idx["chunk"], idx["file"] = update_chunk_file_indices(idx["chunk"], idx["file"], chunk_size)
-        new_path = aggr_root / default_path.format(chunk_index=idx["chunk"], file_index=idx["file"])
-        new_path.parent.mkdir(parents=True, exist_ok=True)
-        final_df = df
-        target_path = new_path
-    else:
-        existing_df = pd.read_parquet(dst_path)
-        final_df = pd.concat([existing_df, df], ignore_index=True)
-        target_path = dst_path
-
-    if contains_images:
-        to_parquet_with_hf_images(final_df, target_path)
-    else:
-        final_df.to_parquet(target_path)
-
-    return idx
+    chunk_idx, file_idx = start
+    dst_size = None
+    dst_chunk_files = []
+    for size in sizes:
+        if dst_size is not None and dst_size + size >= max_mb:
+            chunk_idx, file_idx = update_chunk_file_indices(chunk_idx, file_idx, chunk_size)
+            dst_size = None
+        dst_size = size if dst_size is None else dst_size + size
+        dst_chunk_files.append((chunk_idx, file_idx))
+    return dst_chunk_files
 
 
 def finalize_aggregation(aggr_meta, all_metadata):
     """Finalizes the dataset aggregation by writing summary files and statistics.
 
     Writes the tasks file, info file with total counts and splits, and
-    aggregated statistics from all source datasets.
+    aggregated statistics from all source datasets and, when appending, the
+    existing aggregated dataset.
 
     Args:
-        aggr_meta: Aggregated dataset metadata.
+        aggr_meta: Aggregated dataset metadata, with its total counts already updated.
         all_metadata: List of all source dataset metadata objects.
     """
     logging.info("write tasks")
@@ -556,13 +448,14 @@ def finalize_aggregation(aggr_meta, all_metadata):
     aggr_meta.info.update(
         {
             "total_tasks": len(aggr_meta.tasks),
-            "total_episodes": sum(m.total_episodes for m in all_metadata),
-            "total_frames": sum(m.total_frames for m in all_metadata),
-            "splits": {"train": f"0:{sum(m.total_episodes for m in all_metadata)}"},
+            "splits": {"train": f"0:{aggr_meta.info['total_episodes']}"},
         }
     )
     write_info(aggr_meta.info, aggr_meta.root)
 
     logging.info("write stats")
-    aggr_meta.stats = aggregate_stats([m.stats for m in all_metadata])
+    stats_list = [m.stats for m in all_metadata]
+    if aggr_meta.stats is not None:
+        stats_list.insert(0, aggr_meta.stats)
+    aggr_meta.stats = aggregate_stats(stats_list)
     write_stats(aggr_meta.stats, aggr_meta.root)
@@ -191,6 +191,149 @@ class RunningQuantileStats:
         return edges[idx] + fraction * (edges[idx + 1] - edges[idx])
 
 
+class MergeableQuantileStats:
+    """
+    Mergeable counterpart of `RunningQuantileStats`.
+
+    Mean and variance are tracked with the parallel algorithm of Chan et al. and quantiles
+    with a KLL-style sketch: level h holds at most `capacity` vectors standing for 2**h
+    original vectors each. When a level overflows, it is sorted per feature dimension and
+    every other value, starting at a random offset, is promoted to the next level. Merging
+    two sketches concatenates their levels and compacts them, so sketches computed
+    independently (e.g. per episode in different processes) can be reduced in any order with
+    a bounded memory footprint.
+    """
+
+    def __init__(
+        self, quantile_list: list[float] | None = None, capacity: int = 2048, seed: int | None = None
+    ):
+        self._count = 0
+        self._num_vectors = 0
+        self._mean = None
+        self._m2 = None
+        self._min = None
+        self._max = None
+        self._levels: list[np.ndarray] = []
+        self._capacity = capacity
+        self._rng = np.random.default_rng(seed)
+
+        self._quantile_list = quantile_list
+        if self._quantile_list is None:
+            self._quantile_list = DEFAULT_QUANTILES
+        self._quantile_keys = [f"q{int(q * 100):02d}" for q in self._quantile_list]
+
+    def update(self, batch: np.ndarray, num_samples: int | None = None) -> None:
+        """Update the statistics with a batch of vectors.
+
+        Args:
+            batch: An array where all dimensions except the last are batch dimensions.
+            num_samples: Number of samples represented by the batch, reported as `count`. Defaults to the
+                number of vectors; for images, the number of images whose pixels are in the batch.
+        """
+        batch = batch.reshape(-1, batch.shape[-1]).astype(np.float64)
+        if self._mean is not None and batch.shape[1] != self._mean.size:
+            raise ValueError("The length of new vectors does not match the initialized vector length.")
+
+        batch_mean = np.mean(batch, axis=0)
+        self._merge_moments(
+            len(batch),
+            batch_mean,
+            np.sum((batch - batch_mean) ** 2, axis=0),
+            np.min(batch, axis=0),
+            np.max(batch, axis=0),
+        )
+        self._count += len(batch) if num_samples is None else num_samples
+        self._add_to_level(0, batch)
+        self._compact()
+
+    def merge(self, other: "MergeableQuantileStats") -> "MergeableQuantileStats":
+        """Merge the statistics of `other` into these statistics and return them."""
+        if other._num_vectors == 0:
+            return self
+        if self._mean is not None and other._mean.size != self._mean.size:
+            raise ValueError("The length of merged vectors does not match the initialized vector length.")
+
+        self._merge_moments(other._num_vectors, other._mean, other._m2, other._min, other._max)
+        self._count += other._count
+        for level_idx, level in enumerate(other._levels):
+            self._add_to_level(level_idx, level)
+        self._compact()
+        return self
+
+    def get_statistics(self) -> dict[str, np.ndarray]:
+        """Compute and return the statistics of the vectors processed so far.
+
+        Returns:
+            Dictionary containing the computed statistics.
+        """
+        if self._num_vectors < 2:
+            raise ValueError("Cannot compute statistics for less than 2 vectors.")
+
+        stats = {
+            "min": self._min.copy(),
+            "max": self._max.copy(),
+            "mean": self._mean.copy(),
+            "std": np.sqrt(np.maximum(0, self._m2 / self._num_vectors)),
+            "count": np.array([self._count]),
+        }
+
+        values = np.concatenate(self._levels, axis=0)
+        weights = np.concatenate([np.full(len(level), 2.0**i) for i, level in enumerate(self._levels)])
+        order = np.argsort(values, axis=0)
+        sorted_values = np.take_along_axis(values, order, axis=0)
+        cum_weights = np.cumsum(weights[order], axis=0)
+        for q, q_key in zip(self._quantile_list, self._quantile_keys, strict=True):
+            # First value whose cumulative weight reaches the quantile, per feature dimension
+            idx = np.minimum((cum_weights < q * cum_weights[-1]).sum(axis=0), len(values) - 1)
+            stats[q_key] = sorted_values[idx, np.arange(values.shape[1])]
+
+        return stats
+
+    def _merge_moments(self, num_vectors, mean, m2, min_, max_) -> None:
+        if self._num_vectors == 0:
+            self._num_vectors = num_vectors
+            self._mean, self._m2 = mean.copy(), m2.copy()
+            self._min, self._max = min_.copy(), max_.copy()
+            return
+
+        total = self._num_vectors + num_vectors
+        delta = mean - self._mean
+        self._mean = self._mean + delta * (num_vectors / total)
+        self._m2 = self._m2 + m2 + delta**2 * (self._num_vectors * num_vectors / total)
+        self._num_vectors = total
+        self._min = np.minimum(self._min, min_)
+        self._max = np.maximum(self._max, max_)
+
+    def _add_to_level(self, level_idx: int, values: np.ndarray) -> None:
+        while len(self._levels) <= level_idx:
+            self._levels.append(np.empty((0, values.shape[1])))
+        self._levels[level_idx] = np.concatenate([self._levels[level_idx], values], axis=0)
+
+    def _compact(self) -> None:
+        """Compact the overflowing levels, from the lowest one up."""
+        level_idx = 0
+        while level_idx < len(self._levels):
+            level = self._levels[level_idx]
+            if len(level) <= self._capacity:
+                level_idx += 1
+                continue
+
+            level = np.sort(level, axis=0)
+            # An odd value out stays at its level to preserve the total weight
+            self._levels[level_idx] = level[len(level) - len(level) % 2 :]
+            level = level[: len(level) - len(level) % 2]
+
+            # Halving a sorted level keeps it sorted, so large batches are compacted with a single sort
+            promoted_idx = level_idx
+            while len(level) > self._capacity and len(level) % 2 == 0:
+                level = level[self._rng.integers(2) :: 2]
+                promoted_idx += 1
+            if promoted_idx == level_idx:
+                level = level[self._rng.integers(2) :: 2]
+                promoted_idx += 1
+            self._add_to_level(promoted_idx, level)
+
+
 def estimate_num_samples(
     dataset_len: int, min_num_samples: int = 100, max_num_samples: int = 10_000, power: float = 0.75
 ) -> int:
@@ -217,14 +360,14 @@ def sample_indices(data_len: int) -> list[int]:
 
 
 def auto_downsample_height_width(img: np.ndarray, target_size: int = 150, max_size_threshold: int = 300):
-    _, height, width = img.shape
+    *_, height, width = img.shape
 
     if max(width, height) < max_size_threshold:
         # no downsampling needed
         return img
 
     downsample_factor = int(width / target_size) if width > height else int(height / target_size)
-    return img[:, ::downsample_factor, ::downsample_factor]
+    return img[..., ::downsample_factor, ::downsample_factor]
 
 
 def sample_images(image_paths: list[str]) -> np.ndarray:
@@ -474,6 +617,30 @@ def get_feature_stats(
     return stats
 
 
+def get_feature_sketch(
+    array: np.ndarray,
+    axis: int | tuple[int, ...] | None,
+    quantile_list: list[float] | None = None,
+) -> MergeableQuantileStats:
+    """Mergeable counterpart of `get_feature_stats`.
+
+    Sketches of several arrays with the same layout can be merged before computing their
+    statistics with `MergeableQuantileStats.get_statistics`, which returns them without
+    reduced dimensions (e.g. of shape (C,) for images).
+
+    Args:
+        array: Input data array with shape appropriate for the specified axis
+        axis: Axis or axes along which to compute statistics (see `get_feature_stats`)
+
+    Returns:
+        The sketch of the array.
+    """
+    reshaped, sample_count = _prepare_array_for_stats(array, axis)
+    sketch = MergeableQuantileStats(quantile_list)
+    sketch.update(reshaped, num_samples=sample_count)
+    return sketch
+
+
 def compute_episode_stats(
     episode_data: dict[str, list[str] | np.ndarray],
     features: dict,
@@ -488,7 +655,7 @@ def compute_episode_stats(
 
     Args:
         episode_data: Dictionary mapping feature names to data
-            - For images/videos: list of file paths
+            - For images/videos: list of file paths, or uint8 array of frames of shape (N, C, H, W)
             - For numerical data: numpy arrays
         features: Dictionary describing each feature's dtype and shape
 
@@ -509,7 +676,11 @@ def compute_episode_stats(
             continue
 
         if features[key]["dtype"] in ["image", "video"]:
-            ep_ft_array = sample_images(data)
+            if isinstance(data, np.ndarray):
+                # frames already loaded as uint8 (N, C, H, W), e.g. by the streaming video encoder
+                ep_ft_array = data[sample_indices(len(data))]
+            else:
+                ep_ft_array = sample_images(data)
             axes_to_reduce = (0, 2, 3)
             keepdims = True
         else:
@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Parallel computation of the statistics of a whole dataset.
+
+Each episode is turned into mergeable sketches (see `MergeableQuantileStats`) in a pool of worker
+processes: numerical features are read from the data parquet files and camera frames are decoded in
+batches straight from the video files. The per-episode sketches are then merged pairwise in a tree, also in
+the pool, so that the quantiles of the dataset are computed over all its samples instead of being averaged
+across episodes.
+"""
+
+import concurrent.futures
+import io
+import logging
+from pathlib import Path
+
+import numpy as np
+import pyarrow.parquet as pq
+from tqdm import tqdm
+
+from lerobot.datasets.compute_stats import (
+    MergeableQuantileStats,
+    auto_downsample_height_width,
+    get_feature_sketch,
+    sample_indices,
+)
+from lerobot.datasets.lerobot_dataset import LeRobotDatasetMetadata
+from lerobot.datasets.utils import load_episodes, load_image_as_numpy
+from lerobot.datasets.video_utils import decode_video_frames, get_safe_default_codec
+
+# Number of camera frames decoded at once from a video file
+DEFAULT_VIDEO_BATCH_SIZE = 32
+
+
+def _compute_episode_sketches(
+    episode: dict,
+    data_path: Path,
+    video_paths: dict[str, Path],
+    features: dict,
+    quantile_list: list[float] | None,
+    video_backend: str,
+    video_batch_size: int,
+    tolerance_s: float,
+) -> dict[str, MergeableQuantileStats]:
+    """Compute the mergeable sketches of all the features of an episode."""
+    columns = [key for key, ft in features.items() if ft["dtype"] not in ["video", "string"]]
+    table = pq.read_table(
+        data_path, columns=columns, filters=[("episode_index", "==", episode["episode_index"])]
+    )
+
+    sketches = {}
+    for key in columns:
+        if features[key]["dtype"] == "image":
+            values = table[key].to_pylist()
+            images = np.stack(
+                [
+                    auto_downsample_height_width(
+                        load_image_as_numpy(
+                            io.BytesIO(values[idx]["bytes"]) if values[idx]["bytes"] else values[idx]["path"],
+                            dtype=np.uint8,
+                            channel_first=True,
+                        )
+                    )
+                    for idx in sample_indices(len(values))
+                ]
+            )
+            sketches[key] = get_feature_sketch(images, axis=(0, 2, 3), quantile_list=quantile_list)
+        else:
+            values = table[key].to_numpy(zero_copy_only=False)
+            array = np.stack(values) if values.dtype == object else values
+            sketches[key] = get_feature_sketch(array, axis=0, quantile_list=quantile_list)
+
+    # Query the same timestamps as LeRobotDataset does for the sampled frames
+    timestamps = table["timestamp"].to_numpy() if "timestamp" in columns else None
+    for key, video_path in video_paths.items():
+        if timestamps is None:
+            timestamps = pq.read_table(
+                data_path, columns=["timestamp"], filters=[("episode_index", "==", episode["episode_index"])]
+            )["timestamp"].to_numpy()
+        from_timestamp = episode[f"videos/{key}/from_timestamp"]
+        query_timestamps = [from_timestamp + timestamps[idx] for idx in sample_indices(len(timestamps))]
+
+        sketch = MergeableQuantileStats(quantile_list)
+        for start in range(0, len(query_timestamps), video_batch_size):
+            frames = decode_video_frames(
+                video_path,
+                query_timestamps[start : start + video_batch_size],
+                tolerance_s,
+                video_backend,
+                return_uint8=True,
+            )
+            frames = auto_downsample_height_width(frames.numpy())
+            sketch.merge(get_feature_sketch(frames, axis=(0, 2, 3), quantile_list=quantile_list))
+        sketches[key] = sketch
+
+    return sketches
+
+
+def _merge_episode_sketches(
+    sketches: dict[str, MergeableQuantileStats], other: dict[str, MergeableQuantileStats]
+) -> dict[str, MergeableQuantileStats]:
+    for key, sketch in other.items():
+        if key in sketches:
+            sketches[key].merge(sketch)
+        else:
+            sketches[key] = sketch
+    return sketches
+
+
+def compute_dataset_stats(
+    meta: LeRobotDatasetMetadata,
+    episodes: list[int] | None = None,
+    quantile_list: list[float] | None = None,
+    num_workers: int | None = None,
+    video_backend: str | None = None,
+    video_batch_size: int = DEFAULT_VIDEO_BATCH_SIZE,
+    tolerance_s: float = 1e-4,
+) -> dict[str, dict[str, np.ndarray]]:
+    """Compute the statistics of a dataset from its files, in parallel.
+
+    Like when recording, camera statistics are computed on a subset of downsampled frames of each episode,
+    and are normalized to [0, 1]. Unlike `aggregate_stats`, which averages per-episode quantiles, the quantiles
+    are computed over the samples of all episodes.
+
+    Args:
+        meta: Metadata of the dataset. Its data and videos must be available locally.
+        episodes: Episodes to compute the statistics of. If None, all episodes are used.
+        quantile_list: Quantiles to compute. Defaults to DEFAULT_QUANTILES.
+        num_workers: Number of worker processes. Defaults to the ProcessPoolExecutor default.
+        video_backend: Video decoding backend. Defaults to the one of `get_safe_default_codec`.
+        video_batch_size: Number of camera frames decoded at once.
+        tolerance_s: Tolerance in seconds used to match the decoded frames to the queried timestamps.
+
+    Returns:
+        Dictionary mapping feature names to their statistics dictionaries, in the format of `stats.json`.
+    """
+    if meta.episodes is None:
+        meta.episodes = load_episodes(meta.root)
+    if episodes is None:
+        episodes = list(range(meta.total_episodes))
+    if len(episodes) == 0:
+        raise ValueError("No episode data found for computing statistics")
+    if video_backend is None:
+        video_backend = get_safe_default_codec()
+
+    logging.info(f"Computing statistics for {len(episodes)} episodes")
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = []
+        for ep_idx in episodes:
+            episode = {k: v for k, v in meta.episodes[ep_idx].items() if not k.startswith("stats/")}
+            video_paths = {key: meta.root / meta.get_video_file_path(ep_idx, key) for key in meta.video_keys}
+            futures.append(
+                executor.submit(
+                    _compute_episode_sketches,
+                    episode,
+                    meta.root / meta.get_data_file_path(ep_idx),
+                    video_paths,
+                    meta.features,
+                    quantile_list,
+                    video_backend,
+                    video_batch_size,
+                    tolerance_s,
+                )
+            )
+        sketches = [future.result() for future in tqdm(futures, desc="Computing episode stats")]
+
+        # Merge the sketches pairwise in a tree, each level in parallel
+        while len(sketches) > 1:
+            merged = list(executor.map(_merge_episode_sketches, sketches[0::2], sketches[1::2]))
+            sketches = merged + sketches[len(merged) * 2 :]
+
+    stats = {}
+    for key, sketch in sketches[0].items():
+        stats[key] = sketch.get_statistics()
+        if meta.features[key]["dtype"] in ["image", "video"]:
+            stats[key] = {
+                k: v if k == "count" else v.reshape(-1, 1, 1) / 255.0 for k, v in stats[key].items()
+            }
+
+    return stats
@@ -21,6 +21,7 @@ This module provides utilities for:
 - Splitting datasets into multiple smaller datasets
 - Adding/removing features from datasets
 - Merging datasets (wrapper around aggregate functionality)
+- Recomputing dataset statistics
 """
 
 import logging
@@ -37,6 +38,7 @@ from tqdm import tqdm
 
 from lerobot.datasets.aggregate import aggregate_datasets
 from lerobot.datasets.compute_stats import aggregate_stats
+from lerobot.datasets.dataset_stats import compute_dataset_stats
 from lerobot.datasets.lerobot_dataset import LeRobotDataset, LeRobotDatasetMetadata
 from lerobot.datasets.utils import (
     DATA_DIR,
@@ -51,6 +53,7 @@ from lerobot.datasets.utils import (
     write_stats,
     write_tasks,
 )
+from lerobot.datasets.video_utils import write_video_index
 from lerobot.utils.constants import HF_LEROBOT_HOME
 
 
@@ -234,6 +237,8 @@ def merge_datasets(
     datasets: list[LeRobotDataset],
     output_repo_id: str,
     output_dir: str | Path | None = None,
+    num_workers: int | None = None,
+    append: bool = False,
 ) -> LeRobotDataset:
     """Merge multiple LeRobotDatasets into a single dataset.
 
@@ -243,6 +248,8 @@ def merge_datasets(
         datasets: List of LeRobotDatasets to merge.
         output_repo_id: Repository ID for the merged dataset.
         output_dir: Directory to save the merged dataset. If None, uses default location.
+        num_workers: Number of threads writing the merged files. If None, uses the executor default.
+        append: If True and the merged dataset already exists, append the datasets to it.
     """
     if not datasets:
         raise ValueError("No datasets to merge")
@@ -257,6 +264,8 @@ def merge_datasets(
         aggr_repo_id=output_repo_id,
         roots=roots,
         aggr_root=output_dir,
+        num_workers=num_workers,
+        append=append,
     )
 
     merged_dataset = LeRobotDataset(
@@ -440,6 +449,33 @@ def remove_feature(
     )
 
 
+def recompute_stats(
+    dataset: LeRobotDataset,
+    quantile_list: list[float] | None = None,
+    num_workers: int | None = None,
+) -> dict[str, dict[str, np.ndarray]]:
+    """Recompute the statistics of a LeRobotDataset from its files and write them to its metadata.
+
+    Args:
+        dataset: The LeRobotDataset to recompute the statistics of, in place.
+        quantile_list: Quantiles to compute. If None, uses the default quantiles.
+        num_workers: Number of worker processes. If None, uses the executor default.
+
+    Returns:
+        The new statistics of the dataset.
+    """
+    stats = compute_dataset_stats(
+        dataset.meta,
+        quantile_list=quantile_list,
+        num_workers=num_workers,
+        video_backend=dataset.video_backend,
+        tolerance_s=dataset.tolerance_s,
+    )
+    dataset.meta.stats = stats
+    write_stats(stats, dataset.meta.root)
+    return stats
+
+
 def _fractions_to_episode_indices(
     total_episodes: int,
     splits: dict[str, float],
@@ -734,6 +770,7 @@ def _copy_and_reindex_videos(
                 )
                 dst_video_path.parent.mkdir(parents=True, exist_ok=True)
                 shutil.copy(src_video_path, dst_video_path)
+                write_video_index(dst_video_path)
 
                 for old_idx in episodes_in_file:
                     new_idx = episode_mapping[old_idx]
@@ -779,6 +816,7 @@ def _copy_and_reindex_videos(
                     vcodec,
                     pix_fmt,
                 )
+                write_video_index(dst_video_path)
 
                 cumulative_ts = 0.0
                 for old_idx in sorted_keep_episodes:
@@ -1038,6 +1076,7 @@ def _copy_videos(
             dst_path = dst_meta.root / src_path
             dst_path.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy(src_dataset.root / src_path, dst_path)
+            write_video_index(dst_path)
 
 
 def _copy_episodes_metadata_and_stats(
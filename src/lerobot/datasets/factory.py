@@ -98,6 +98,8 @@ def make_dataset(cfg: TrainPipelineConfig) -> LeRobotDataset | MultiLeRobotDatas
                 image_transforms=image_transforms,
                 revision=cfg.dataset.revision,
                 video_backend=cfg.dataset.video_backend,
+                frame_store_root=cfg.dataset.frame_store_root,
+                return_uint8_images=cfg.dataset.return_uint8_images,
             )
         else:
             dataset = StreamingLeRobotDataset(
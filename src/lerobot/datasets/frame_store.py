@@ -0,0 +1,242 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A store of pre-decoded video frames, used to only pay the video decoding cost once when training.
+
+Each (video key, episode) is decoded once into its own uint8 numpy memmap file of shape
+(num_frames, channels, height, width) on local disk. Reading frames afterwards is a simple (zero-copy when
+contiguous) slice of the memmap, which is much cheaper than decoding the frames from the mp4 files again.
+
+A typical frame store looks like this:
+.
+├── info.json
+├── observation.images.laptop
+│   ├── episode-000000.u8
+│   ├── episode-000001.u8
+│   └── ...
+└── observation.images.phone
+    └── ...
+"""
+
+import bisect
+import logging
+import os
+import shutil
+from pathlib import Path
+
+import av
+import numpy as np
+
+from lerobot.datasets.utils import _make_memmap_safe, load_json, write_json
+
+FRAME_STORE_INFO_PATH = "info.json"
+FRAME_STORE_EPISODE_PATH = "{video_key}/episode-{episode_index:06d}.u8"
+
+
+class VideoFrameStore:
+    """Memory-mapped store of decoded uint8 video frames, keyed by video key, episode and frame index.
+
+    Episode files are written to a temporary file and atomically renamed once all their frames have been
+    decoded, so an interrupted build never leaves a partially decoded episode behind and can be resumed.
+
+    Memmaps are opened lazily and are not pickled, so the store can be sent to DataLoader workers cheaply.
+
+    The store records the dataset it was built from, and the layout of each episode in the video files. A store
+    built from another dataset, revision or fps is cleared, and the episodes whose layout changed are decoded
+    again.
+
+    Args:
+        root: Local directory where the decoded frames are stored.
+        fps: Frames per second of the dataset, used to convert timestamps to frame indices.
+        repo_id: Repository id of the dataset the frames are decoded from.
+        revision: Revision of the dataset the frames are decoded from.
+    """
+
+    def __init__(self, root: str | Path, fps: int, repo_id: str | None = None, revision: str | None = None):
+        self.root = Path(root)
+        self.fps = fps
+        self.repo_id = repo_id
+        self.revision = revision
+        self.root.mkdir(parents=True, exist_ok=True)
+        info_path = self.root / FRAME_STORE_INFO_PATH
+        info = load_json(info_path) if info_path.exists() else None
+        built_for = (info.get("repo_id"), info.get("revision"), info.get("fps")) if info else None
+        if info is not None and built_for != (repo_id, revision, fps):
+            logging.warning(
+                f"Clearing the frame store at '{self.root}', built for (repo_id, revision, fps)={built_for}."
+            )
+            for video_key in info.get("shapes", {}):
+                shutil.rmtree(self.root / video_key, ignore_errors=True)
+            info = None
+        info = info or {"shapes": {}, "episodes": {}}
+        self._shapes: dict[str, tuple[int, int, int]] = {
+            key: tuple(shape) for key, shape in info["shapes"].items()
+        }
+        # (video path, from_timestamp, num_frames) of the stored episodes, by video key and episode index
+        self._layouts: dict[str, dict[int, tuple[str, float, int]]] = {
+            key: {int(ep_idx): tuple(layout) for ep_idx, layout in layouts.items()}
+            for key, layouts in info["episodes"].items()
+        }
+        self._memmaps: dict[tuple[str, int], np.memmap] = {}
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        state["_memmaps"] = {}
+        return state
+
+    def get_episode_path(self, video_key: str, episode_index: int) -> Path:
+        return self.root / FRAME_STORE_EPISODE_PATH.format(video_key=video_key, episode_index=episode_index)
+
+    def has_episode(
+        self, video_key: str, episode_index: int, layout: tuple[str | Path, float, int] | None = None
+    ) -> bool:
+        """Whether an episode is in the store, decoded from the given (video path, from_timestamp, num_frames)
+        if provided."""
+        stored_layout = self._layouts.get(video_key, {}).get(episode_index)
+        if stored_layout is None or video_key not in self._shapes:
+            return False
+        if layout is not None and stored_layout != _as_layout(*layout):
+            return False
+        return self.get_episode_path(video_key, episode_index).exists()
+
+    def _write_info(self) -> None:
+        info = {
+            "fps": self.fps,
+            "repo_id": self.repo_id,
+            "revision": self.revision,
+            "shapes": {key: list(shape) for key, shape in self._shapes.items()},
+            "episodes": {
+                key: {str(ep_idx): list(layout) for ep_idx, layout in layouts.items()}
+                for key, layouts in self._layouts.items()
+            },
+        }
+        write_json(info, self.root / FRAME_STORE_INFO_PATH)
+
+    def add_video_file(
+        self,
+        video_path: str | Path,
+        video_key: str,
+        episodes: list[tuple[int, float, int]],
+    ) -> None:
+        """Decode the given episodes of a video file into the store.
+
+        The file is decoded sequentially, in a single pass from the first to the last requested episode, which
+        is much faster than seeking to each frame.
+
+        Args:
+            video_path: Path to the (possibly concatenated) video file.
+            video_key: Video key of the dataset the file belongs to.
+            episodes: List of (episode_index, from_timestamp, num_frames) of the episodes to decode, where
+                from_timestamp is the start of the episode in the video file.
+        """
+        episodes = sorted(
+            (
+                ep
+                for ep in episodes
+                if not self.has_episode(video_key, ep[0], layout=(video_path, ep[1], ep[2]))
+            ),
+            key=lambda ep: ep[1],
+        )
+        if len(episodes) == 0:
+            return
+
+        from_timestamps = [from_ts for _, from_ts, _ in episodes]
+        last_ts = episodes[-1][1] + (episodes[-1][2] - 1) / self.fps
+        tolerance_s = 0.5 / self.fps
+
+        buffers: dict[int, np.memmap] = {}
+        num_written = dict.fromkeys(range(len(episodes)), 0)
+        logging.getLogger("libav").setLevel(av.logging.ERROR)
+        try:
+            with av.open(str(video_path), "r") as container:
+                stream = container.streams.video[0]
+                stream.thread_type = "AUTO"
+                container.seek(int(from_timestamps[0] / stream.time_base), stream=stream, backward=True)
+                for frame in container.decode(stream):
+                    if frame.time > last_ts + tolerance_s:
+                        break
+                    pos = bisect.bisect_right(from_timestamps, frame.time + tolerance_s) - 1
+                    if pos < 0:
+                        continue
+                    ep_idx, from_ts, num_frames = episodes[pos]
+                    frame_idx = round((frame.time - from_ts) * self.fps)
+                    if not 0 <= frame_idx < num_frames:
+                        continue
+
+                    # (H, W, C) -> (C, H, W)
+                    image = frame.to_ndarray(format="rgb24").transpose(2, 0, 1)
+                    if pos not in buffers:
+                        self._shapes.setdefault(video_key, image.shape)
+                        buffers[pos] = _make_memmap_safe(
+                            filename=self._get_tmp_path(video_key, ep_idx),
+                            dtype=np.dtype("uint8"),
+                            mode="w+",
+                            shape=(num_frames, *self._shapes[video_key]),
+                        )
+                    buffers[pos][frame_idx] = image
+                    num_written[pos] += 1
+        finally:
+            av.logging.restore_default_callback()
+
+        for pos, (ep_idx, _, num_frames) in enumerate(episodes):
+            if num_written[pos] < num_frames:
+                del buffers
+                for tmp_ep_idx, _, _ in episodes:
+                    self._get_tmp_path(video_key, tmp_ep_idx).unlink(missing_ok=True)
+                raise RuntimeError(
+                    f"Only {num_written[pos]}/{num_frames} frames of episode {ep_idx} could be decoded from "
+                    f"'{video_path}'."
+                )
+
+        for pos, buffer in buffers.items():
+            buffer.flush()
+            ep_idx, from_ts, num_frames = episodes[pos]
+            os.replace(self._get_tmp_path(video_key, ep_idx), self.get_episode_path(video_key, ep_idx))
+            self._memmaps.pop((video_key, ep_idx), None)
+            self._layouts.setdefault(video_key, {})[ep_idx] = _as_layout(video_path, from_ts, num_frames)
+        # Written once the episodes are in place, so that an interrupted build decodes them again
+        self._write_info()
+
+    def _get_tmp_path(self, video_key: str, episode_index: int) -> Path:
+        path = self.get_episode_path(video_key, episode_index).with_suffix(".tmp")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def get_episode(self, video_key: str, episode_index: int) -> np.memmap:
+        """Return the read-only memmap of shape (num_frames, C, H, W) of an episode."""
+        key = (video_key, episode_index)
+        if key not in self._memmaps:
+            path = self.get_episode_path(video_key, episode_index)
+            if not self.has_episode(video_key, episode_index):
+                raise FileNotFoundError(
+                    f"Episode {episode_index} of '{video_key}' is not in the frame store."
+                )
+            self._memmaps[key] = np.memmap(path, dtype=np.uint8, mode="r").reshape(
+                -1, *self._shapes[video_key]
+            )
+        return self._memmaps[key]
+
+    def get_frames(self, video_key: str, episode_index: int, timestamps: list[float]) -> np.ndarray:
+        """Return the uint8 frames of shape (len(timestamps), C, H, W) at the given episode timestamps."""
+        episode = self.get_episode(video_key, episode_index)
+        frame_indices = [round(ts * self.fps) for ts in timestamps]
+        start = frame_indices[0]
+        if frame_indices == list(range(start, start + len(frame_indices))):
+            return episode[start : start + len(frame_indices)]
+        return episode[frame_indices]
+
+
+def _as_layout(video_path: str | Path, from_timestamp: float, num_frames: int) -> tuple[str, float, int]:
+    return (str(video_path), float(from_timestamp), int(num_frames))
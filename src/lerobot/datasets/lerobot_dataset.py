@@ -17,8 +17,8 @@ import concurrent.futures
 import contextlib
 import logging
 import shutil
-import tempfile
 from collections.abc import Callable
+from functools import partial
 from pathlib import Path
 
 import datasets
@@ -34,6 +34,7 @@ from huggingface_hub import HfApi, snapshot_download
 from huggingface_hub.errors import RevisionNotFoundError
 
 from lerobot.datasets.compute_stats import aggregate_stats, compute_episode_stats
+from lerobot.datasets.frame_store import VideoFrameStore
 from lerobot.datasets.image_writer import AsyncImageWriter, write_image
 from lerobot.datasets.utils import (
     DEFAULT_EPISODES_PATH,
@@ -66,14 +67,17 @@ from lerobot.datasets.utils import (
     write_stats,
     write_tasks,
 )
+from lerobot.datasets.video_encoder import AsyncVideoEncoder, StreamingVideoEncoder, _encode_video_worker
 from lerobot.datasets.video_utils import (
     VideoFrame,
     concatenate_video_files,
     decode_video_frames,
-    encode_video_frames,
     get_safe_default_codec,
     get_video_duration_in_s,
+    get_video_index_path,
     get_video_info,
+    load_video_index,
+    write_video_index,
 )
 from lerobot.utils.constants import HF_LEROBOT_HOME
 
@@ -432,7 +436,12 @@ class LeRobotDatasetMetadata:
         for key in video_keys:
             if not self.features[key].get("info", None):
                 video_path = self.root / self.video_path.format(video_key=key, chunk_index=0, file_index=0)
-                self.info["features"][key]["info"] = get_video_info(video_path)
+                # The keyframe index written with the video already holds its stream info
+                video_index = load_video_index(video_path)
+                if video_index is not None and video_index.info is not None:
+                    self.info["features"][key]["info"] = dict(video_index.info)
+                else:
+                    self.info["features"][key]["info"] = get_video_info(video_path)
 
     def update_chunk_settings(
         self,
@@ -540,15 +549,6 @@ class LeRobotDatasetMetadata:
         return obj
 
 
-def _encode_video_worker(video_key: str, episode_index: int, root: Path, fps: int) -> Path:
-    temp_path = Path(tempfile.mkdtemp(dir=root)) / f"{video_key}_{episode_index:03d}.mp4"
-    fpath = DEFAULT_IMAGE_PATH.format(image_key=video_key, episode_index=episode_index, frame_index=0)
-    img_dir = (root / fpath).parent
-    encode_video_frames(img_dir, temp_path, fps, overwrite=True)
-    shutil.rmtree(img_dir)
-    return temp_path
-
-
 class LeRobotDataset(torch.utils.data.Dataset):
     def __init__(
         self,
@@ -563,6 +563,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
         download_videos: bool = True,
         video_backend: str | None = None,
         batch_encoding_size: int = 1,
+        frame_store_root: str | Path | None = None,
+        return_uint8_images: bool = False,
     ):
         """
         2 modes are available for instantiating this class, depending on 2 different use cases:
@@ -675,6 +677,15 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 You can also use the 'pyav' decoder used by Torchvision, which used to be the default option, or 'video_reader' which is another decoder of Torchvision.
             batch_encoding_size (int, optional): Number of episodes to accumulate before batch encoding videos.
                 Set to 1 for immediate encoding (default), or higher for batched encoding. Defaults to 1.
+            frame_store_root (str | Path | None, optional): If provided, video frames are decoded once into a
+                memory-mapped uint8 frame store in this local directory, and are then read from it instead of
+                being decoded from the video files at every access. This trades disk space (num_frames x C x H x W
+                bytes per camera) for much cheaper data loading. An existing store is reused and completed if
+                needed. Defaults to None.
+            return_uint8_images (bool, optional): If True, camera frames are returned as uint8 tensors in
+                [0, 255] instead of float32 tensors in [0, 1]. Batches are then 4 times smaller in worker and
+                pinned memory and during host-to-device copies; the conversion to float is done on the target
+                device by `DeviceProcessorStep`. Defaults to False.
         """
         super().__init__()
         self.repo_id = repo_id
@@ -688,9 +699,13 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self.delta_indices = None
         self.batch_encoding_size = batch_encoding_size
         self.episodes_since_last_encoding = 0
+        self.return_uint8_images = return_uint8_images
 
         # Unused attributes
         self.image_writer = None
+        self.video_encoder = None
+        self._pending_video_episodes = {}
+        self.streaming_video_encoder = None
         self.episode_buffer = None
         self.writer = None
         self.latest_episode = None
@@ -736,6 +751,14 @@ class LeRobotDataset(torch.utils.data.Dataset):
             check_delta_timestamps(self.delta_timestamps, self.fps, self.tolerance_s)
             self.delta_indices = get_delta_indices(self.delta_timestamps, self.fps)
 
+        # Decode videos once into the frame store
+        self.frame_store = None
+        if frame_store_root is not None and len(self.meta.video_keys) > 0:
+            self.frame_store = VideoFrameStore(
+                frame_store_root, self.fps, repo_id=self.repo_id, revision=self.revision
+            )
+            self.build_frame_store()
+
     def _close_writer(self) -> None:
         """Close and cleanup the parquet writer if it exists."""
         writer = getattr(self, "writer", None)
@@ -841,7 +864,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 for vid_key in self.meta.video_keys
                 for ep_idx in episodes
             ]
-            fpaths += video_files
+            # keyframe indices are optional, they are simply not downloaded if the dataset doesn't have them
+            fpaths += video_files + [str(get_video_index_path(fpath)) for fpath in video_files]
         # episodes are stored in the same files, so we return unique paths only
         fpaths = list(set(fpaths))
         return fpaths
@@ -850,7 +874,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         """hf_dataset contains all the observations, states, actions, rewards, etc."""
         features = get_hf_features_from_features(self.features)
         hf_dataset = load_nested_dataset(self.root / "data", features=features, episodes=self.episodes)
-        hf_dataset.set_transform(hf_transform_to_torch)
+        hf_dataset.set_transform(partial(hf_transform_to_torch, uint8_images=self.return_uint8_images))
         return hf_dataset
 
     def _check_cached_episodes_sufficient(self) -> bool:
@@ -884,6 +908,27 @@ class LeRobotDataset(torch.utils.data.Dataset):
 
         return True
 
+    def build_frame_store(self) -> None:
+        """Decode the videos of the selected episodes which are not already in the frame store."""
+        episodes = self.episodes if self.episodes is not None else list(range(self.meta.total_episodes))
+        for vid_key in self.meta.video_keys:
+            # Group episodes by video file to decode each file in a single pass
+            episodes_per_file: dict[Path, list[tuple[int, float, int]]] = {}
+            for ep_idx in episodes:
+                ep = self.meta.episodes[ep_idx]
+                video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
+                from_timestamp = ep[f"videos/{vid_key}/from_timestamp"]
+                num_frames = ep["dataset_to_index"] - ep["dataset_from_index"]
+                if self.frame_store.has_episode(
+                    vid_key, ep_idx, layout=(video_path, from_timestamp, num_frames)
+                ):
+                    continue
+                episodes_per_file.setdefault(video_path, []).append((ep_idx, from_timestamp, num_frames))
+
+            for video_path, file_episodes in episodes_per_file.items():
+                logging.info(f"Decoding {len(file_episodes)} episodes of '{video_path}' into the frame store")
+                self.frame_store.add_video_file(video_path, vid_key, file_episodes)
+
     def create_hf_dataset(self) -> datasets.Dataset:
         features = get_hf_features_from_features(self.features)
         ft_dict = {col: [] for col in features}
@@ -997,6 +1042,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
         ep = self.meta.episodes[ep_idx]
         item = {}
         for vid_key, query_ts in query_timestamps.items():
+            if self.frame_store is not None:
+                item[vid_key] = self._query_frame_store(vid_key, ep_idx, query_ts).squeeze(0)
+                continue
+
             # Episodes are stored sequentially on a single mp4 to reduce the number of files.
             # Thus we load the start timestamp of the episode on this mp4 and,
             # shift the query timestamp accordingly.
@@ -1004,11 +1053,25 @@ class LeRobotDataset(torch.utils.data.Dataset):
             shifted_query_ts = [from_timestamp + ts for ts in query_ts]
 
             video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
-            frames = decode_video_frames(video_path, shifted_query_ts, self.tolerance_s, self.video_backend)
+            frames = decode_video_frames(
+                video_path,
+                shifted_query_ts,
+                self.tolerance_s,
+                self.video_backend,
+                return_uint8=self.return_uint8_images,
+            )
             item[vid_key] = frames.squeeze(0)
 
         return item
 
+    def _query_frame_store(self, vid_key: str, ep_idx: int, query_ts: list[float]) -> torch.Tensor:
+        frames = self.frame_store.get_frames(vid_key, ep_idx, query_ts)
+        # Copy out of the read-only memmap, then convert to float32 in [0,1] range like the video decoders
+        frames = torch.from_numpy(np.array(frames))
+        if self.return_uint8_images:
+            return frames
+        return frames.type(torch.float32) / 255
+
     def _ensure_hf_dataset_loaded(self):
         """Lazy load the HF dataset only when needed for reading."""
         if self._lazy_loading or self.hf_dataset is None:
@@ -1052,6 +1115,164 @@ class LeRobotDataset(torch.utils.data.Dataset):
         item["task"] = self.meta.tasks.iloc[task_idx].name
         return item
 
+    def _get_batch_query_indices(
+        self, indices: np.ndarray, ep_start: np.ndarray, ep_end: np.ndarray
+    ) -> tuple[dict[str, np.ndarray], dict[str, torch.Tensor]]:
+        """Vectorized version of `_get_query_indices` for a batch of absolute indices.
+
+        Returns query indices of shape (batch_size, len(delta_indices[key])) for each key, along with the
+        corresponding padding masks.
+        """
+        query_indices = {}
+        padding = {}
+        for key, delta_idx in self.delta_indices.items():
+            target = indices[:, None] + np.asarray(delta_idx, dtype=np.int64)[None, :]
+            query_indices[key] = np.clip(target, ep_start[:, None], ep_end[:, None] - 1)
+            padding[f"{key}_is_pad"] = torch.from_numpy(
+                (target < ep_start[:, None]) | (target >= ep_end[:, None])
+            )
+        return query_indices, padding
+
+    def _query_hf_dataset_batch(self, query_indices: dict[str, np.ndarray]) -> dict[str, torch.Tensor]:
+        """Query the hf_dataset for the delta indices of a whole batch at once.
+
+        All the rows needed by the batch are fetched with a single take over the queried columns. Video keys are
+        skipped, but the timestamps of their queried frames are returned under their key so that
+        `_query_videos_batch` can use them.
+
+        Args:
+            query_indices: Dict mapping keys to arrays of absolute indices of shape (batch_size, num_deltas).
+
+        Returns:
+            Dict mapping keys to tensors of shape (batch_size, num_deltas, *feature_shape).
+        """
+        unique_indices = np.unique(np.concatenate([q_idx.ravel() for q_idx in query_indices.values()]))
+        relative_indices = (
+            unique_indices.tolist()
+            if self._absolute_to_relative_idx is None
+            else [self._absolute_to_relative_idx[idx] for idx in unique_indices.tolist()]
+        )
+
+        columns = [key for key in query_indices if key not in self.meta.video_keys]
+        if any(key in self.meta.video_keys for key in query_indices):
+            columns.append("timestamp")
+        rows = self.hf_dataset.select_columns(columns)[relative_indices]
+
+        result = {}
+        for key, q_idx in query_indices.items():
+            column = "timestamp" if key in self.meta.video_keys else key
+            positions = torch.from_numpy(np.searchsorted(unique_indices, q_idx))
+            result[key] = torch.stack(rows[column])[positions]
+        return result
+
+    def _query_videos_batch(
+        self, query_timestamps: dict[str, torch.Tensor], ep_indices: np.ndarray, episodes: dict[str, list]
+    ) -> dict[str, list[torch.Tensor]]:
+        """Batched version of `_query_videos`.
+
+        Timestamps are grouped by video file so that each file is opened and decoded once per batch, and frames
+        shared by several samples of the batch are only decoded once.
+
+        Args:
+            query_timestamps: Dict mapping video keys to timestamps of shape (batch_size, num_frames), relative
+                to the start of their episode.
+            ep_indices: Episode index of each sample of the batch.
+            episodes: Columns of `meta.episodes` for each sample of the batch.
+
+        Returns:
+            Dict mapping video keys to the list of decoded frames of each sample of the batch.
+        """
+        item = {}
+        for vid_key, query_ts in query_timestamps.items():
+            if self.frame_store is not None:
+                item[vid_key] = [
+                    self._query_frame_store(vid_key, ep_idx, sample_ts.tolist()).squeeze(0)
+                    for ep_idx, sample_ts in zip(ep_indices.tolist(), query_ts, strict=True)
+                ]
+                continue
+
+            from_timestamps = torch.tensor(episodes[f"videos/{vid_key}/from_timestamp"], dtype=torch.float64)
+            shifted_query_ts = (from_timestamps[:, None] + query_ts.to(torch.float64)).numpy()
+
+            # Only torchcodec can seek accurately within a file, other backends decode everything between the
+            # first and last requested timestamps, so we restrict their groups to a single episode.
+            groups: dict[tuple[Path, int], list[int]] = {}
+            for batch_idx, ep_idx in enumerate(ep_indices.tolist()):
+                video_path = self.root / self.meta.get_video_file_path(ep_idx, vid_key)
+                group_key = (video_path, -1 if self.video_backend == "torchcodec" else ep_idx)
+                groups.setdefault(group_key, []).append(batch_idx)
+
+            frames_per_sample: list[torch.Tensor | None] = [None] * len(ep_indices)
+            for (video_path, _), batch_indices in groups.items():
+                group_ts = shifted_query_ts[batch_indices]
+                unique_ts, inverse = np.unique(group_ts, return_inverse=True)
+                frames = decode_video_frames(
+                    video_path,
+                    unique_ts.tolist(),
+                    self.tolerance_s,
+                    self.video_backend,
+                    return_uint8=self.return_uint8_images,
+                )
+                frames = frames[torch.from_numpy(inverse.reshape(group_ts.shape))]
+                for batch_idx, sample_frames in zip(batch_indices, frames, strict=True):
+                    frames_per_sample[batch_idx] = sample_frames.squeeze(0)
+            item[vid_key] = frames_per_sample
+
+        return item
+
+    def __getitems__(self, indices: list[int]) -> list[dict]:
+        """Batched version of `__getitem__`, used by `torch.utils.data.DataLoader` when batching is enabled.
+
+        Instead of querying each sample separately, the delta indices of the whole batch are gathered in a single
+        take on the hf_dataset, and video frames are decoded once per video file. The returned samples are
+        identical to the ones returned by `__getitem__` and are collated by the DataLoader's `collate_fn`.
+        """
+        self._ensure_hf_dataset_loaded()
+        indices = [int(idx) for idx in indices]
+        batch = self.hf_dataset[indices]
+        batch_size = len(indices)
+
+        ep_indices = torch.stack(batch["episode_index"]).numpy()
+        unique_eps, ep_inverse = np.unique(ep_indices, return_inverse=True)
+        unique_episodes = self.meta.episodes[unique_eps.tolist()]
+        episodes = {key: [values[i] for i in ep_inverse] for key, values in unique_episodes.items()}
+
+        items = [{key: values[i] for key, values in batch.items()} for i in range(batch_size)]
+
+        query_result = {}
+        if self.delta_indices is not None:
+            query_indices, padding = self._get_batch_query_indices(
+                torch.stack(batch["index"]).numpy(),
+                np.asarray(episodes["dataset_from_index"]),
+                np.asarray(episodes["dataset_to_index"]),
+            )
+            query_result = self._query_hf_dataset_batch(query_indices)
+            for key, val in {**padding, **query_result}.items():
+                if key in self.meta.video_keys:
+                    continue
+                for item, sample_val in zip(items, val, strict=True):
+                    item[key] = sample_val
+
+        if len(self.meta.video_keys) > 0:
+            current_ts = torch.stack(batch["timestamp"])[:, None]
+            query_timestamps = {key: query_result.get(key, current_ts) for key in self.meta.video_keys}
+            video_frames = self._query_videos_batch(query_timestamps, ep_indices, episodes)
+            items = [
+                {**{key: frames[i] for key, frames in video_frames.items()}, **item}
+                for i, item in enumerate(items)
+            ]
+
+        for item in items:
+            if self.image_transforms is not None:
+                for cam in self.meta.camera_keys:
+                    item[cam] = self.image_transforms(item[cam])
+
+            # Add task as a string
+            task_idx = item["task_index"].item()
+            item["task"] = self.meta.tasks.iloc[task_idx].name
+
+        return items
+
     def __repr__(self):
         feature_keys = list(self.features)
         return (
@@ -1068,11 +1289,12 @@ class LeRobotDataset(torch.utils.data.Dataset):
         Close the parquet writers. This function needs to be called after data collection/conversion, else footer metadata won't be written to the parquet files.
         The dataset won't be valid and can't be loaded as ds = LeRobotDataset(repo_id=repo, root=HF_LEROBOT_HOME.joinpath(repo))
         """
+        self._save_encoded_episodes(wait=True)
         self._close_writer()
         self.meta._close_writer()
 
     def create_episode_buffer(self, episode_index: int | None = None) -> dict:
-        current_ep_idx = self.meta.total_episodes if episode_index is None else episode_index
+        current_ep_idx = self._get_next_episode_index() if episode_index is None else episode_index
         ep_buffer = {}
         # size and task are special cases that are not in self.features
         ep_buffer["size"] = 0
@@ -1106,6 +1328,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         This function only adds the frame to the episode_buffer. Apart from images — which are written in a
         temporary directory — nothing is written to disk. To save those frames, the 'save_episode()' method
         then needs to be called.
+
+        When the streaming video encoder is started (see `start_streaming_video_encoder`), the frames of video
+        features are sent directly to their video encoder instead of being written as PNG files.
         """
         # Convert torch to numpy if needed
         for name in frame:
@@ -1124,6 +1349,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         self.episode_buffer["timestamp"].append(timestamp)
         self.episode_buffer["task"].append(frame.pop("task"))  # Remove task from frame after processing
 
+        if self.streaming_video_encoder is not None and frame_index == 0:
+            self.streaming_video_encoder.start_episode(self.episode_buffer["episode_index"], self.root)
+
         # Add frame features to episode_buffer
         for key in frame:
             if key not in self.features:
@@ -1131,7 +1359,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
                     f"An element of the frame is not in the features. '{key}' not in '{self.features.keys()}'."
                 )
 
-            if self.features[key]["dtype"] in ["image", "video"]:
+            if self.features[key]["dtype"] == "video" and self.streaming_video_encoder is not None:
+                # The frames used for the image statistics are kept by the encoder
+                self.streaming_video_encoder.add_frame(key, frame[key])
+            elif self.features[key]["dtype"] in ["image", "video"]:
                 img_path = self._get_image_file_path(
                     episode_index=self.episode_buffer["episode_index"], image_key=key, frame_index=frame_index
                 )
@@ -1156,6 +1387,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
         Video encoding is handled automatically based on batch_encoding_size:
         - If batch_encoding_size == 1: Videos are encoded immediately after each episode
         - If batch_encoding_size > 1: Videos are encoded in batches.
+        - If a video encoder is started (see `start_video_encoder`): Videos are encoded in background
+          processes and the episode metadata is saved once they are encoded, at the latest in `finalize()`.
+        - If the streaming video encoder is started (see `start_streaming_video_encoder`): Videos are encoded
+          while the frames are added, and only need to be moved into the dataset.
 
         Args:
             episode_data (dict | None, optional): Dict containing the episode data to save. If None, this will
@@ -1166,7 +1401,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
         """
         episode_buffer = episode_data if episode_data is not None else self.episode_buffer
 
-        validate_episode_buffer(episode_buffer, self.meta.total_episodes, self.features)
+        validate_episode_buffer(episode_buffer, self._get_next_episode_index(), self.features)
 
         # size and task are special cases that won't be added to hf_dataset
         episode_length = episode_buffer.pop("size")
@@ -1174,7 +1409,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
         episode_tasks = list(set(tasks))
         episode_index = episode_buffer["episode_index"]
 
-        episode_buffer["index"] = np.arange(self.meta.total_frames, self.meta.total_frames + episode_length)
+        total_frames = self.meta.total_frames + sum(
+            pending["episode_length"] for pending in self._pending_video_episodes.values()
+        )
+        episode_buffer["index"] = np.arange(total_frames, total_frames + episode_length)
         episode_buffer["episode_index"] = np.full((episode_length,), episode_index)
 
         # Update tasks and task indices with new tasks if any
@@ -1190,15 +1428,46 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 continue
             episode_buffer[key] = np.stack(episode_buffer[key])
 
+        has_video_keys = len(self.meta.video_keys) > 0
+        use_streaming_encoding = has_video_keys and self.streaming_video_encoder is not None
+        if use_streaming_encoding:
+            # Videos are already encoded, only the frames kept for the image statistics are needed
+            streamed_video_paths, stats_frames = self.streaming_video_encoder.finish_episode()
+            episode_buffer.update(stats_frames)
+
         # Wait for image writer to end, so that episode stats over images can be computed
         self._wait_image_writer()
         ep_stats = compute_episode_stats(episode_buffer, self.features)
 
         ep_metadata = self._save_episode_data(episode_buffer)
-        has_video_keys = len(self.meta.video_keys) > 0
         use_batched_encoding = self.batch_encoding_size > 1
+        use_async_encoding = has_video_keys and self.video_encoder is not None and not use_streaming_encoding
 
-        if has_video_keys and not use_batched_encoding:
+        if use_streaming_encoding:
+            for video_key in self.meta.video_keys:
+                ep_metadata.update(
+                    self._save_episode_video(
+                        video_key, episode_index, temp_path=streamed_video_paths[video_key]
+                    )
+                )
+        elif use_async_encoding:
+            # Encode videos in the background while recording continues
+            if self.video_encoder.is_full():
+                logging.info(
+                    f"Video encoding queue is full ({self.video_encoder.max_pending_episodes} episodes), "
+                    "waiting for the oldest episode to be encoded."
+                )
+                self._save_encoded_episodes(
+                    wait=True, max_pending_episodes=self.video_encoder.max_pending_episodes - 1
+                )
+            self.video_encoder.submit_episode(episode_index, self.meta.video_keys, self.root, self.fps)
+            self._pending_video_episodes[episode_index] = {
+                "episode_length": episode_length,
+                "episode_tasks": episode_tasks,
+                "episode_stats": ep_stats,
+                "episode_metadata": ep_metadata,
+            }
+        elif has_video_keys and not use_batched_encoding:
             num_cameras = len(self.meta.video_keys)
             if parallel_encoding and num_cameras > 1:
                 # TODO(Steven): Ideally we would like to control the number of threads per encoding such that:
@@ -1234,8 +1503,12 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 for video_key in self.meta.video_keys:
                     ep_metadata.update(self._save_episode_video(video_key, episode_index))
 
-        # `meta.save_episode` need to be executed after encoding the videos
-        self.meta.save_episode(episode_index, episode_length, episode_tasks, ep_stats, ep_metadata)
+        if use_async_encoding:
+            # `meta.save_episode` is executed for each episode once its videos are encoded
+            self._save_encoded_episodes(wait=False)
+        else:
+            # `meta.save_episode` need to be executed after encoding the videos
+            self.meta.save_episode(episode_index, episode_length, episode_tasks, ep_stats, ep_metadata)
 
         if has_video_keys and use_batched_encoding:
             # Check if we should trigger batch encoding
@@ -1433,6 +1706,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
             )
             new_path.parent.mkdir(parents=True, exist_ok=True)
             shutil.move(str(ep_path), str(new_path))
+            write_video_index(new_path)
         else:
             # Retrieve information from the latest updated video file using latest_episode
             latest_ep = self.meta.latest_episode
@@ -1453,6 +1727,7 @@ class LeRobotDataset(torch.utils.data.Dataset):
                 )
                 new_path.parent.mkdir(parents=True, exist_ok=True)
                 shutil.move(str(ep_path), str(new_path))
+                write_video_index(new_path)
                 latest_duration_in_s = 0.0
             else:
                 # Update latest video file
@@ -1479,6 +1754,10 @@ class LeRobotDataset(torch.utils.data.Dataset):
         return metadata
 
     def clear_episode_buffer(self, delete_images: bool = True) -> None:
+        # Discard the videos of the current episode if it is being streamed to the encoders
+        if self.streaming_video_encoder is not None:
+            self.streaming_video_encoder.discard_episode()
+
         # Clean up image files for the current episode buffer
         if delete_images:
             # Wait for the async image writer to finish
@@ -1488,6 +1767,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
             if isinstance(episode_index, np.ndarray):
                 episode_index = episode_index.item() if episode_index.size == 1 else episode_index[0]
             for cam_key in self.meta.camera_keys:
+                if cam_key in self.meta.video_keys and episode_index in self._pending_video_episodes:
+                    # The frames are deleted by the video encoder once encoded
+                    continue
                 img_dir = self._get_image_file_dir(episode_index, cam_key)
                 if img_dir.is_dir():
                     shutil.rmtree(img_dir)
@@ -1515,6 +1797,92 @@ class LeRobotDataset(torch.utils.data.Dataset):
             self.image_writer.stop()
             self.image_writer = None
 
+    def start_video_encoder(self, num_workers: int = 2, max_pending_episodes: int = 4) -> None:
+        if self.batch_encoding_size > 1:
+            raise ValueError(
+                "Asynchronous video encoding can't be used together with batch encoding "
+                f"(batch_encoding_size={self.batch_encoding_size})."
+            )
+        if isinstance(self.video_encoder, AsyncVideoEncoder):
+            logging.warning(
+                "You are starting a new AsyncVideoEncoder that is replacing an already existing one in the dataset."
+            )
+            self.stop_video_encoder()
+
+        self.video_encoder = AsyncVideoEncoder(
+            num_workers=num_workers,
+            max_pending_episodes=max_pending_episodes,
+        )
+
+    def stop_video_encoder(self) -> None:
+        """
+        Wait for the episodes being encoded to be saved and stop the video encoder. Like `stop_image_writer`,
+        this needs to be called before wrapping this dataset inside a parallelized DataLoader.
+        """
+        if self.video_encoder is not None:
+            self._save_encoded_episodes(wait=True)
+            self.video_encoder.stop()
+            self.video_encoder = None
+
+    def start_streaming_video_encoder(self, buffer_size: int = 16) -> None:
+        if self.batch_encoding_size > 1:
+            raise ValueError(
+                "Streaming video encoding can't be used together with batch encoding "
+                f"(batch_encoding_size={self.batch_encoding_size})."
+            )
+        if isinstance(self.streaming_video_encoder, StreamingVideoEncoder):
+            logging.warning(
+                "You are starting a new StreamingVideoEncoder that is replacing an already existing one in the dataset."
+            )
+            self.stop_streaming_video_encoder()
+
+        frame_shapes = {}
+        for key in self.meta.video_keys:
+            shape = self.features[key]["shape"]
+            names = self.features[key]["names"]
+            # (channels, height, width) -> (height, width, channels)
+            frame_shapes[key] = (shape[1], shape[2], shape[0]) if names and names[0] == "channels" else shape
+        self.streaming_video_encoder = StreamingVideoEncoder(frame_shapes, self.fps, buffer_size=buffer_size)
+
+    def stop_streaming_video_encoder(self) -> None:
+        """
+        Stop the streaming video encoder processes, discarding the episode being recorded if any. Like
+        `stop_image_writer`, this needs to be called before wrapping this dataset inside a parallelized DataLoader.
+        """
+        if self.streaming_video_encoder is not None:
+            self.streaming_video_encoder.stop()
+            self.streaming_video_encoder = None
+
+    def _get_next_episode_index(self) -> int:
+        return self.meta.total_episodes + len(self._pending_video_episodes)
+
+    def _save_encoded_episodes(self, wait: bool, max_pending_episodes: int = 0) -> None:
+        """Move the videos encoded by the video encoder into the dataset and save their episodes metadata.
+
+        Episodes are saved in order, and an episode only appears in the metadata once all its videos have been
+        encoded and moved into the dataset. If `wait` is True, this blocks until at most `max_pending_episodes`
+        episodes are still being encoded, otherwise only the episodes already encoded are saved.
+        """
+        while len(self._pending_video_episodes) > max_pending_episodes:
+            episode_index = next(iter(self._pending_video_episodes))
+            if not wait and not self.video_encoder.is_episode_done(episode_index):
+                break
+
+            temp_paths = self.video_encoder.pop_episode(episode_index)
+            pending = self._pending_video_episodes.pop(episode_index)
+            ep_metadata = pending["episode_metadata"]
+            for video_key in self.meta.video_keys:
+                ep_metadata.update(
+                    self._save_episode_video(video_key, episode_index, temp_path=temp_paths[video_key])
+                )
+            self.meta.save_episode(
+                episode_index,
+                pending["episode_length"],
+                pending["episode_tasks"],
+                pending["episode_stats"],
+                ep_metadata,
+            )
+
     def _wait_image_writer(self) -> None:
         """Wait for asynchronous image writer to finish."""
         if self.image_writer is not None:
@@ -1542,6 +1910,9 @@ class LeRobotDataset(torch.utils.data.Dataset):
         image_writer_threads: int = 0,
         video_backend: str | None = None,
         batch_encoding_size: int = 1,
+        video_encoder_workers: int = 0,
+        video_encoder_max_pending_episodes: int = 4,
+        streaming_encoding: bool = False,
     ) -> "LeRobotDataset":
         """Create a LeRobot Dataset from scratch in order to record data."""
         obj = cls.__new__(cls)
@@ -1558,12 +1929,21 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.revision = None
         obj.tolerance_s = tolerance_s
         obj.image_writer = None
+        obj.video_encoder = None
+        obj._pending_video_episodes = {}
+        obj.streaming_video_encoder = None
         obj.batch_encoding_size = batch_encoding_size
         obj.episodes_since_last_encoding = 0
 
         if image_writer_processes or image_writer_threads:
             obj.start_image_writer(image_writer_processes, image_writer_threads)
 
+        if video_encoder_workers:
+            obj.start_video_encoder(video_encoder_workers, video_encoder_max_pending_episodes)
+
+        if streaming_encoding:
+            obj.start_streaming_video_encoder()
+
         # TODO(aliberts, rcadene, alexander-soare): Merge this with OnlineBuffer/DataBuffer
         obj.episode_buffer = obj.create_episode_buffer()
 
@@ -1573,6 +1953,8 @@ class LeRobotDataset(torch.utils.data.Dataset):
         obj.delta_timestamps = None
         obj.delta_indices = None
         obj._absolute_to_relative_idx = None
+        obj.frame_store = None
+        obj.return_uint8_images = False
         obj.video_backend = video_backend if video_backend is not None else get_safe_default_codec()
         obj.writer = None
         obj.latest_episode = None
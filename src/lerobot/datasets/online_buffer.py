@@ -21,7 +21,6 @@ faster than using HuggingFace Datasets as there's no conversion to an intermedia
 supports in-place slicing and mutation which is very handy for a dynamic buffer.
 """
 
-import os
 from pathlib import Path
 from typing import Any
 
@@ -29,25 +28,7 @@ import numpy as np
 import torch
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-
-
-def _make_memmap_safe(**kwargs) -> np.memmap:
-    """Make a numpy memmap with checks on available disk space first.
-
-    Expected kwargs are: "filename", "dtype" (must by np.dtype), "mode" and "shape"
-
-    For information on dtypes:
-    https://numpy.org/doc/stable/reference/arrays.dtypes.html#arrays-dtypes-constructing
-    """
-    if kwargs["mode"].startswith("w"):
-        required_space = kwargs["dtype"].itemsize * np.prod(kwargs["shape"])  # bytes
-        stats = os.statvfs(Path(kwargs["filename"]).parent)
-        available_space = stats.f_bavail * stats.f_frsize  # bytes
-        if required_space >= available_space * 0.8:
-            raise RuntimeError(
-                f"You're about to take up {required_space} of {available_space} bytes available."
-            )
-    return np.memmap(**kwargs)
+from lerobot.datasets.utils import _make_memmap_safe
 
 
 class OnlineBuffer(torch.utils.data.Dataset):
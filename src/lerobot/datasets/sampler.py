@@ -15,8 +15,12 @@
 # limitations under the License.
 from collections.abc import Iterator
 
+import numpy as np
 import torch
 
+# Number of indices converted to python ints at once when iterating over the sampler
+_ITER_CHUNK_SIZE = 65536
+
 
 class EpisodeAwareSampler:
     def __init__(
@@ -27,9 +31,18 @@ class EpisodeAwareSampler:
         drop_n_first_frames: int = 0,
         drop_n_last_frames: int = 0,
         shuffle: bool = False,
+        block_size: int = 1,
+        interleave_blocks: int = 1,
     ):
         """Sampler that optionally incorporates episode boundary information.
 
+        When shuffling with `block_size > 1`, the shuffling is done at the level of blocks of `block_size`
+        consecutive frames of the same episode instead of individual frames. The blocks are shuffled, grouped
+        `interleave_blocks` at a time, and the frames of each group are yielded in random order. Consecutive
+        samples (and thus the samples of a batch) then come from a few blocks, which share video files and key
+        frames, which makes video decoding much cheaper. Block boundaries are randomly shifted at each epoch and
+        every frame is still sampled exactly once per epoch.
+
         Args:
             dataset_from_indices: List of indices containing the start of each episode in the dataset.
             dataset_to_indices: List of indices containing the end of each episode in the dataset.
@@ -38,24 +51,69 @@ class EpisodeAwareSampler:
             drop_n_first_frames: Number of frames to drop from the start of each episode.
             drop_n_last_frames: Number of frames to drop from the end of each episode.
             shuffle: Whether to shuffle the indices.
+            block_size: Number of consecutive frames of an episode shuffled together. 1 shuffles frames
+                independently.
+            interleave_blocks: Number of shuffled blocks whose frames are interleaved together.
         """
-        indices = []
-        for episode_idx, (start_index, end_index) in enumerate(
-            zip(dataset_from_indices, dataset_to_indices, strict=True)
-        ):
-            if episode_indices_to_use is None or episode_idx in episode_indices_to_use:
-                indices.extend(range(start_index + drop_n_first_frames, end_index - drop_n_last_frames))
-
-        self.indices = indices
+        if block_size < 1 or interleave_blocks < 1:
+            raise ValueError(
+                f"block_size and interleave_blocks must be at least 1, got {block_size} and {interleave_blocks}."
+            )
+
+        starts = np.asarray(dataset_from_indices, dtype=np.int64) + drop_n_first_frames
+        ends = np.asarray(dataset_to_indices, dtype=np.int64) - drop_n_last_frames
+        if episode_indices_to_use is not None:
+            mask = np.isin(np.arange(len(starts)), np.asarray(episode_indices_to_use, dtype=np.int64))
+            starts, ends = starts[mask], ends[mask]
+        lengths = np.clip(ends - starts, 0, None)
+
+        # Vectorized concatenation of range(start, end) for each episode
+        total = int(lengths.sum())
+        episode_offsets = np.cumsum(lengths) - lengths
+        self.indices = np.arange(total, dtype=np.int64) + np.repeat(starts - episode_offsets, lengths)
+        self._episode_lengths = lengths
+
         self.shuffle = shuffle
+        self.block_size = block_size
+        self.interleave_blocks = interleave_blocks
+
+    def _get_block_shuffled_order(self) -> np.ndarray:
+        num_indices = len(self.indices)
+        lengths = self._episode_lengths
+        episode_ids = np.repeat(np.arange(len(lengths), dtype=np.int64), lengths)
+        episode_positions = np.arange(num_indices, dtype=np.int64) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths
+        )
+
+        # Randomly shift the block boundaries of each episode so that blocks differ across epochs
+        shifts = torch.randint(self.block_size, (len(lengths),)).numpy()
+        shifted_positions = episode_positions + shifts[episode_ids]
+        is_block_start = (episode_positions == 0) | (shifted_positions % self.block_size == 0)
+        block_ids = np.cumsum(is_block_start) - 1
+
+        # Shuffle blocks, group them `interleave_blocks` at a time, and shuffle frames within each group
+        num_blocks = int(block_ids[-1]) + 1
+        block_ranks = torch.randperm(num_blocks).numpy()
+        groups = block_ranks[block_ids] // self.interleave_blocks
+        frame_keys = torch.randperm(num_indices).numpy()
+        return np.lexsort((frame_keys, groups))
 
     def __iter__(self) -> Iterator[int]:
-        if self.shuffle:
-            for i in torch.randperm(len(self.indices)):
-                yield self.indices[i]
+        if len(self.indices) == 0:
+            return
+        if not self.shuffle:
+            order = None
+        elif self.block_size == 1 and self.interleave_blocks == 1:
+            order = torch.randperm(len(self.indices)).numpy()
         else:
-            for i in self.indices:
-                yield i
+            order = self._get_block_shuffled_order()
+
+        for start in range(0, len(self.indices), _ITER_CHUNK_SIZE):
+            if order is None:
+                chunk = self.indices[start : start + _ITER_CHUNK_SIZE]
+            else:
+                chunk = self.indices[order[start : start + _ITER_CHUNK_SIZE]]
+            yield from chunk.tolist()
 
     def __len__(self) -> int:
         return len(self.indices)
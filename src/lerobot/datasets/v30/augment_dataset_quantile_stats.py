@@ -34,17 +34,14 @@ python src/lerobot/datasets/v30/augment_dataset_quantile_stats.py \
 """
 
 import argparse
-import concurrent.futures
 import logging
 from pathlib import Path
 
-import numpy as np
-import torch
 from huggingface_hub import HfApi
 from requests import HTTPError
-from tqdm import tqdm
 
-from lerobot.datasets.compute_stats import DEFAULT_QUANTILES, aggregate_stats, get_feature_stats
+from lerobot.datasets.compute_stats import DEFAULT_QUANTILES
+from lerobot.datasets.dataset_stats import compute_dataset_stats
 from lerobot.datasets.lerobot_dataset import CODEBASE_VERSION, LeRobotDataset
 from lerobot.datasets.utils import write_stats
 from lerobot.utils.utils import init_logging
@@ -72,117 +69,37 @@ def has_quantile_stats(stats: dict[str, dict] | None, quantile_list_keys: list[s
     return False
 
 
-def process_single_episode(dataset: LeRobotDataset, episode_idx: int) -> dict:
-    """Process a single episode and return its statistics.
-
-    Args:
-        dataset: The LeRobot dataset
-        episode_idx: Index of the episode to process
-
-    Returns:
-        Dictionary containing episode statistics
-    """
-    logging.info(f"Computing stats for episode {episode_idx}")
-
-    start_idx = dataset.meta.episodes[episode_idx]["dataset_from_index"]
-    end_idx = dataset.meta.episodes[episode_idx]["dataset_to_index"]
-
-    collected_data: dict[str, list] = {}
-    for idx in range(start_idx, end_idx):
-        item = dataset[idx]
-        for key, value in item.items():
-            if key not in dataset.features:
-                continue
-
-            if key not in collected_data:
-                collected_data[key] = []
-            collected_data[key].append(value)
-
-    ep_stats = {}
-    for key, data_list in collected_data.items():
-        if dataset.features[key]["dtype"] == "string":
-            continue
-
-        data = torch.stack(data_list).cpu().numpy()
-        if dataset.features[key]["dtype"] in ["image", "video"]:
-            if data.dtype == np.uint8:
-                data = data.astype(np.float32) / 255.0
-
-            axes_to_reduce = (0, 2, 3)
-            keepdims = True
-        else:
-            axes_to_reduce = 0
-            keepdims = data.ndim == 1
-
-        ep_stats[key] = get_feature_stats(
-            data, axis=axes_to_reduce, keepdims=keepdims, quantile_list=DEFAULT_QUANTILES
-        )
-
-        if dataset.features[key]["dtype"] in ["image", "video"]:
-            ep_stats[key] = {
-                k: v if k == "count" else np.squeeze(v, axis=0) for k, v in ep_stats[key].items()
-            }
-
-    return ep_stats
-
-
-def compute_quantile_stats_for_dataset(dataset: LeRobotDataset) -> dict[str, dict]:
+def compute_quantile_stats_for_dataset(
+    dataset: LeRobotDataset, num_workers: int | None = None
+) -> dict[str, dict]:
     """Compute quantile statistics for all episodes in the dataset.
 
     Args:
         dataset: The LeRobot dataset to compute statistics for
+        num_workers: Number of worker processes. Defaults to the ProcessPoolExecutor default.
 
     Returns:
         Dictionary containing aggregated statistics with quantiles
 
     Note:
-        Video decoding operations are not thread-safe, so we process episodes sequentially
-        when video keys are present. For datasets without videos, we use parallel processing
-        with ThreadPoolExecutor for better performance.
+        Episodes are processed in parallel worker processes and their quantile sketches are merged, so
+        quantiles are computed over the whole dataset (see `compute_dataset_stats`).
     """
     logging.info(f"Computing quantile statistics for dataset with {dataset.num_episodes} episodes")
-
-    episode_stats_list = []
-    has_videos = len(dataset.meta.video_keys) > 0
-
-    if has_videos:
-        logging.info("Dataset contains video keys - using sequential processing for thread safety")
-        for episode_idx in tqdm(range(dataset.num_episodes), desc="Processing episodes"):
-            ep_stats = process_single_episode(dataset, episode_idx)
-            episode_stats_list.append(ep_stats)
-    else:
-        logging.info("Dataset has no video keys - using parallel processing for better performance")
-        max_workers = min(dataset.num_episodes, 16)
-
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_episode = {
-                executor.submit(process_single_episode, dataset, episode_idx): episode_idx
-                for episode_idx in range(dataset.num_episodes)
-            }
-
-            episode_results = {}
-            with tqdm(total=dataset.num_episodes, desc="Processing episodes") as pbar:
-                for future in concurrent.futures.as_completed(future_to_episode):
-                    episode_idx = future_to_episode[future]
-                    ep_stats = future.result()
-                    episode_results[episode_idx] = ep_stats
-                    pbar.update(1)
-
-        for episode_idx in range(dataset.num_episodes):
-            if episode_idx in episode_results:
-                episode_stats_list.append(episode_results[episode_idx])
-
-    if not episode_stats_list:
-        raise ValueError("No episode data found for computing statistics")
-
-    logging.info(f"Aggregating statistics from {len(episode_stats_list)} episodes")
-    return aggregate_stats(episode_stats_list)
+    return compute_dataset_stats(
+        dataset.meta,
+        quantile_list=DEFAULT_QUANTILES,
+        num_workers=num_workers,
+        video_backend=dataset.video_backend,
+        tolerance_s=dataset.tolerance_s,
+    )
 
 
 def augment_dataset_with_quantile_stats(
     repo_id: str,
     root: str | Path | None = None,
     overwrite: bool = False,
+    num_workers: int | None = None,
 ) -> None:
     """Augment a dataset with quantile statistics if they are missing.
 
@@ -190,6 +107,7 @@ def augment_dataset_with_quantile_stats(
         repo_id: Repository ID of the dataset
         root: Local root directory for the dataset
         overwrite: Overwrite existing quantile statistics if they already exist
+        num_workers: Number of worker processes computing the statistics
     """
     logging.info(f"Loading dataset: {repo_id}")
     dataset = LeRobotDataset(
@@ -203,7 +121,7 @@ def augment_dataset_with_quantile_stats(
 
     logging.info("Dataset does not contain quantile statistics. Computing them now...")
 
-    new_stats = compute_quantile_stats_for_dataset(dataset)
+    new_stats = compute_quantile_stats_for_dataset(dataset, num_workers=num_workers)
 
     logging.info("Updating dataset metadata with new quantile statistics")
     dataset.meta.stats = new_stats
@@ -243,6 +161,11 @@ def main():
         action="store_true",
         help="Overwrite existing quantile statistics if they already exist",
     )
+    parser.add_argument(
+        "--num-workers",
+        type=int,
+        help="Number of worker processes computing the statistics (defaults to the number of CPUs)",
+    )
 
     args = parser.parse_args()
     root = Path(args.root) if args.root else None
@@ -253,6 +176,7 @@ def main():
         repo_id=args.repo_id,
         root=root,
         overwrite=args.overwrite,
+        num_workers=args.num_workers,
     )
 
 
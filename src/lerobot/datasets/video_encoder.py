@@ -0,0 +1,354 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import concurrent.futures
+import logging
+import multiprocessing
+import queue
+import shutil
+import tempfile
+from pathlib import Path
+
+import av
+import numpy as np
+import PIL.Image
+
+from lerobot.datasets.compute_stats import auto_downsample_height_width
+from lerobot.datasets.utils import DEFAULT_IMAGE_PATH
+from lerobot.datasets.video_utils import encode_video_frames, open_video_encoder
+
+# Maximum number of downsampled frames kept per camera and per episode to compute image statistics
+MAX_STATS_FRAMES = 512
+# Time to wait for a streaming encoder process to answer before considering it dead
+STREAMING_ENCODER_TIMEOUT_S = 60
+
+
+def _encode_video_worker(video_key: str, episode_index: int, root: Path, fps: int) -> Path:
+    temp_path = Path(tempfile.mkdtemp(dir=root)) / f"{video_key}_{episode_index:03d}.mp4"
+    fpath = DEFAULT_IMAGE_PATH.format(image_key=video_key, episode_index=episode_index, frame_index=0)
+    img_dir = (root / fpath).parent
+    encode_video_frames(img_dir, temp_path, fps, overwrite=True)
+    shutil.rmtree(img_dir)
+    return temp_path
+
+
+class AsyncVideoEncoder:
+    """
+    Encodes the frames of recorded episodes into temporary videos in a pool of background processes, so that
+    recording can continue while the videos of the previous episodes are being encoded.
+
+    Each (episode, camera) pair is a separate job, so the cameras of an episode and consecutive episodes are
+    encoded concurrently. The number of episodes waiting to be encoded is bounded by `max_pending_episodes`:
+    `is_full()` tells the caller to wait for the oldest episode before submitting a new one, which bounds the
+    disk space used by the temporary PNG frames.
+
+    Jobs only produce temporary videos. Moving them into the dataset and writing the episode metadata is done
+    by the caller, in episode order, with `pop_episode`.
+    """
+
+    def __init__(self, num_workers: int = 2, max_pending_episodes: int = 4):
+        if num_workers <= 0:
+            raise ValueError(f"Number of workers must be greater than zero, got {num_workers}.")
+        if max_pending_episodes <= 0:
+            raise ValueError(
+                f"Maximum number of pending episodes must be greater than zero, got {max_pending_episodes}."
+            )
+
+        self.num_workers = num_workers
+        self.max_pending_episodes = max_pending_episodes
+        self.executor = concurrent.futures.ProcessPoolExecutor(max_workers=num_workers)
+        self.jobs: dict[int, dict[str, concurrent.futures.Future]] = {}
+        self.num_completed_jobs = 0
+        self._stopped = False
+
+    def submit_episode(self, episode_index: int, video_keys: list[str], root: Path, fps: int) -> None:
+        if episode_index in self.jobs:
+            raise ValueError(f"Videos of episode {episode_index} are already being encoded.")
+
+        self.jobs[episode_index] = {
+            video_key: self.executor.submit(_encode_video_worker, video_key, episode_index, root, fps)
+            for video_key in video_keys
+        }
+
+    @property
+    def pending_episodes(self) -> list[int]:
+        return sorted(self.jobs)
+
+    def is_full(self) -> bool:
+        return len(self.jobs) >= self.max_pending_episodes
+
+    def is_episode_done(self, episode_index: int) -> bool:
+        return all(future.done() for future in self.jobs[episode_index].values())
+
+    def pop_episode(self, episode_index: int) -> dict[str, Path]:
+        """Wait for the videos of an episode to be encoded and return their temporary paths by video key.
+
+        Raises the exception of the first failed job, if any.
+        """
+        futures = self.jobs.pop(episode_index)
+        temp_paths = {video_key: future.result() for video_key, future in futures.items()}
+        self.num_completed_jobs += len(temp_paths)
+        return temp_paths
+
+    def progress(self) -> dict[str, int]:
+        """Number of pending episodes and of pending, running and completed (episode, camera) jobs."""
+        futures = [future for episode_futures in self.jobs.values() for future in episode_futures.values()]
+        num_done = sum(future.done() for future in futures)
+        num_running = sum(future.running() for future in futures)
+        return {
+            "pending_episodes": len(self.jobs),
+            "pending_jobs": len(futures) - num_done - num_running,
+            "running_jobs": num_running,
+            "completed_jobs": self.num_completed_jobs + num_done,
+        }
+
+    def stop(self) -> None:
+        if self._stopped:
+            return
+
+        self.executor.shutdown(wait=True, cancel_futures=False)
+        self._stopped = True
+
+
+def _streaming_encoder_worker(
+    frames_buffer,
+    buffer_size: int,
+    frame_shape: tuple[int, int, int],
+    fps: int,
+    commands: multiprocessing.Queue,
+    free_slots: multiprocessing.Semaphore,
+    results: multiprocessing.Queue,
+) -> None:
+    logging.getLogger("libav").setLevel(av.logging.ERROR)
+    ring = np.frombuffer(frames_buffer, dtype=np.uint8).reshape(buffer_size, *frame_shape)
+    height, width, _ = frame_shape
+    output = stream = video_path = None
+    error = None
+
+    while True:
+        command, arg = commands.get()
+        if command == "frame":
+            try:
+                # `from_ndarray` copies the frame, so the slot can be reused right away
+                frame = av.VideoFrame.from_ndarray(ring[arg], format="rgb24") if error is None else None
+            except Exception as e:
+                frame, error = None, e
+            free_slots.release()
+            try:
+                if frame is not None:
+                    for packet in stream.encode(frame):
+                        output.mux(packet)
+            except Exception as e:
+                error = e
+        elif command == "start":
+            video_path, error = Path(arg), None
+            try:
+                output, stream = open_video_encoder(video_path, fps, width, height)
+            except Exception as e:
+                error = e
+        elif command in ("finish", "discard"):
+            try:
+                if output is not None:
+                    if command == "finish" and error is None:
+                        for packet in stream.encode():
+                            output.mux(packet)
+                    output.close()
+            except Exception as e:
+                error = error or e
+            if command == "discard" and video_path is not None:
+                video_path.unlink(missing_ok=True)
+            results.put(repr(error) if error is not None else None)
+            output = stream = video_path = None
+        elif command == "stop":
+            break
+
+    av.logging.restore_default_callback()
+
+
+def _remove_temp_dirs(video_paths: dict[str, Path]) -> None:
+    for tmp_dir in {path.parent for path in video_paths.values()}:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
+class _StreamingEncoderProcess:
+    """Producer side of a streaming encoder process of one camera, see `StreamingVideoEncoder`."""
+
+    def __init__(self, frame_shape: tuple[int, int, int], fps: int, buffer_size: int):
+        self.frame_shape = frame_shape
+        self.buffer_size = buffer_size
+        # Ring buffer of frames in shared memory, the free slots are counted by a semaphore
+        self.frames_buffer = multiprocessing.RawArray("B", buffer_size * int(np.prod(frame_shape)))
+        self.ring = np.frombuffer(self.frames_buffer, dtype=np.uint8).reshape(buffer_size, *frame_shape)
+        self.free_slots = multiprocessing.Semaphore(buffer_size)
+        self.commands = multiprocessing.Queue()
+        self.results = multiprocessing.Queue()
+        self.next_slot = 0
+        self.process = multiprocessing.Process(
+            target=_streaming_encoder_worker,
+            args=(
+                self.frames_buffer,
+                buffer_size,
+                frame_shape,
+                fps,
+                self.commands,
+                self.free_slots,
+                self.results,
+            ),
+            daemon=True,
+        )
+        self.process.start()
+
+    def send_frame(self, image: np.ndarray) -> None:
+        # Blocks while all the slots are used, until the process catches up
+        if not self.free_slots.acquire(timeout=STREAMING_ENCODER_TIMEOUT_S):
+            raise RuntimeError("The streaming video encoder process is not consuming frames anymore.")
+        self.ring[self.next_slot] = image
+        self.commands.put(("frame", self.next_slot))
+        self.next_slot = (self.next_slot + 1) % self.buffer_size
+
+    def wait_result(self) -> str | None:
+        try:
+            return self.results.get(timeout=STREAMING_ENCODER_TIMEOUT_S)
+        except queue.Empty as e:
+            raise RuntimeError("The streaming video encoder process did not answer.") from e
+
+    def stop(self) -> None:
+        self.commands.put(("stop", None))
+        self.process.join(timeout=STREAMING_ENCODER_TIMEOUT_S)
+        if self.process.is_alive():
+            self.process.terminate()
+        self.commands.close()
+        self.results.close()
+
+
+class StreamingVideoEncoder:
+    """
+    Encodes camera frames into videos while they are being recorded, without writing them as PNG files first.
+
+    Each camera has its own encoder process, which keeps a PyAV encoder open for the episode being recorded.
+    Frames are copied into a ring buffer of `buffer_size` frames in shared memory and only their slot index is
+    sent to the process, so frames are never pickled. When the process falls behind and the ring buffer is
+    full, `add_frame` blocks until a slot is freed.
+
+    A downsampled subset of the frames of each episode is kept in memory to compute image statistics, since
+    there are no PNG files to sample them from.
+    """
+
+    def __init__(self, frame_shapes: dict[str, tuple[int, int, int]], fps: int, buffer_size: int = 16):
+        """
+        Args:
+            frame_shapes: (height, width, channels) of the frames of each video key.
+            fps: Frame rate of the videos.
+            buffer_size: Number of frames of the shared-memory ring buffer of each camera.
+        """
+        if buffer_size <= 0:
+            raise ValueError(f"Buffer size must be greater than zero, got {buffer_size}.")
+
+        self.fps = fps
+        self.buffer_size = buffer_size
+        self.encoders = {
+            key: _StreamingEncoderProcess(tuple(shape), fps, buffer_size)
+            for key, shape in frame_shapes.items()
+        }
+        self.episode_index = None
+        self.video_paths: dict[str, Path] = {}
+        self.num_frames: dict[str, int] = {}
+        self.stats_frames: dict[str, list[np.ndarray]] = {}
+        self.stats_stride: dict[str, int] = {}
+        self._stopped = False
+
+    def start_episode(self, episode_index: int, root: Path) -> None:
+        if self.episode_index is not None:
+            raise RuntimeError(f"Episode {self.episode_index} is still being encoded.")
+
+        self.episode_index = episode_index
+        for key, encoder in self.encoders.items():
+            # One temporary directory per camera, since each video is moved and its directory removed
+            # independently when the episode is saved
+            self.video_paths[key] = Path(tempfile.mkdtemp(dir=root)) / f"{key}_{episode_index:03d}.mp4"
+            self.num_frames[key] = 0
+            self.stats_frames[key] = []
+            self.stats_stride[key] = 1
+            encoder.commands.put(("start", str(self.video_paths[key])))
+
+    def add_frame(self, video_key: str, image: np.ndarray | PIL.Image.Image) -> None:
+        """Send a frame to the encoder of a camera.
+
+        Like for PNG frames, the image can be channel first or channel last, uint8 in [0, 255] or float in
+        [0, 1].
+        """
+        if isinstance(image, PIL.Image.Image):
+            image = np.asarray(image.convert("RGB"))
+        if image.shape[0] == 3:
+            # Transpose from pytorch convention (C, H, W) to (H, W, C)
+            image = image.transpose(1, 2, 0)
+        if image.dtype != np.uint8:
+            image = (image * 255).astype(np.uint8)
+
+        self.encoders[video_key].send_frame(image)
+
+        # Keep every `stride` frames, and halve the kept frames when there are too many of them, so that the
+        # kept frames always span the whole episode uniformly
+        if self.num_frames[video_key] % self.stats_stride[video_key] == 0:
+            stats_frame = auto_downsample_height_width(image.transpose(2, 0, 1))
+            self.stats_frames[video_key].append(np.ascontiguousarray(stats_frame))
+            if len(self.stats_frames[video_key]) == MAX_STATS_FRAMES:
+                self.stats_frames[video_key] = self.stats_frames[video_key][::2]
+                self.stats_stride[video_key] *= 2
+        self.num_frames[video_key] += 1
+
+    def finish_episode(self) -> tuple[dict[str, Path], dict[str, np.ndarray]]:
+        """Flush the encoders of the current episode.
+
+        Returns:
+            The temporary video path of each camera, and the downsampled (N, C, H, W) uint8 frames kept to
+            compute the image statistics of each camera.
+        """
+        video_paths, self.video_paths = self.video_paths, {}
+        self.episode_index = None
+        try:
+            for encoder in self.encoders.values():
+                encoder.commands.put(("finish", None))
+            errors = {key: encoder.wait_result() for key, encoder in self.encoders.items()}
+            errors = {key: error for key, error in errors.items() if error is not None}
+            if len(errors) > 0:
+                raise RuntimeError(f"Streaming video encoding failed: {errors}")
+            stats_frames = {key: np.stack(frames) for key, frames in self.stats_frames.items()}
+        except BaseException:
+            # Don't leave the partial videos of the other cameras behind
+            _remove_temp_dirs(video_paths)
+            raise
+        return video_paths, stats_frames
+
+    def discard_episode(self) -> None:
+        """Stop encoding the current episode and delete its videos."""
+        if self.episode_index is None:
+            return
+        for encoder in self.encoders.values():
+            encoder.commands.put(("discard", None))
+        for encoder in self.encoders.values():
+            encoder.wait_result()
+        _remove_temp_dirs(self.video_paths)
+        self.video_paths = {}
+        self.episode_index = None
+
+    def stop(self) -> None:
+        if self._stopped:
+            return
+
+        self.discard_episode()
+        for encoder in self.encoders.values():
+            encoder.stop()
+        self._stopped = True
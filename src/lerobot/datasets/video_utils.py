@@ -13,12 +13,17 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import functools
 import glob
 import importlib
+import json
 import logging
+import os
 import shutil
 import tempfile
 import warnings
+from collections import OrderedDict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
 from threading import Lock
@@ -26,6 +31,7 @@ from typing import Any, ClassVar
 
 import av
 import fsspec
+import numpy as np
 import pyarrow as pa
 import torch
 import torchvision
@@ -48,6 +54,7 @@ def decode_video_frames(
     timestamps: list[float],
     tolerance_s: float,
     backend: str | None = None,
+    return_uint8: bool = False,
 ) -> torch.Tensor:
     """
     Decodes video frames using the specified backend.
@@ -57,6 +64,8 @@ def decode_video_frames(
         timestamps (list[float]): List of timestamps to extract frames.
         tolerance_s (float): Allowed deviation in seconds for frame retrieval.
         backend (str, optional): Backend to use for decoding. Defaults to "torchcodec" when available in the platform; otherwise, defaults to "pyav"..
+        return_uint8 (bool, optional): If True, frames are returned as uint8 in [0, 255] instead of float32 in
+            [0, 1], which is 4 times smaller. Defaults to False.
 
     Returns:
         torch.Tensor: Decoded frames.
@@ -66,9 +75,11 @@ def decode_video_frames(
     if backend is None:
         backend = get_safe_default_codec()
     if backend == "torchcodec":
-        return decode_video_frames_torchcodec(video_path, timestamps, tolerance_s)
+        return decode_video_frames_torchcodec(video_path, timestamps, tolerance_s, return_uint8=return_uint8)
     elif backend in ["pyav", "video_reader"]:
-        return decode_video_frames_torchvision(video_path, timestamps, tolerance_s, backend)
+        return decode_video_frames_torchvision(
+            video_path, timestamps, tolerance_s, backend, return_uint8=return_uint8
+        )
     else:
         raise ValueError(f"Unsupported video backend: {backend}")
 
@@ -79,6 +90,7 @@ def decode_video_frames_torchvision(
     tolerance_s: float,
     backend: str = "pyav",
     log_loaded_timestamps: bool = False,
+    return_uint8: bool = False,
 ) -> torch.Tensor:
     """Loads frames associated to the requested timestamps of a video
 
@@ -111,27 +123,37 @@ def decode_video_frames_torchvision(
     # TODO(rcadene): also load audio stream at the same time
     reader = torchvision.io.VideoReader(video_path, "video")
 
-    # set the first and last requested timestamps
-    # Note: previous timestamps are usually loaded, since we need to access the previous key frame
-    first_ts = min(timestamps)
-    last_ts = max(timestamps)
-
-    # access closest key frame of the first requested frame
-    # Note: closest key frame timestamp is usually smaller than `first_ts` (e.g. key frame can be the first frame of the video)
-    # for details on what `seek` is doing see: https://pyav.basswood-io.com/docs/stable/api/container.html?highlight=inputcontainer#av.container.InputContainer.seek
-    reader.seek(first_ts, keyframes_only=keyframes_only)
+    video_index = load_video_index(video_path)
+    if video_index is None:
+        # set the first and last requested timestamps
+        # Note: previous timestamps are usually loaded, since we need to access the previous key frame
+        decode_ranges = [(min(timestamps), max(timestamps))]
+    else:
+        # seek exactly to the key frame of each group of requested frames instead of decoding all the frames
+        # between the first and last requested timestamps
+        frame_indices = video_index.get_frame_indices(timestamps)
+        decode_ranges = [
+            (video_index.pts[start], video_index.pts[end])
+            for start, end in video_index.plan_decode_ranges(frame_indices)
+        ]
 
-    # load all frames until last requested frame
     loaded_frames = []
     loaded_ts = []
-    for frame in reader:
-        current_ts = frame["pts"]
-        if log_loaded_timestamps:
-            logging.info(f"frame loaded at timestamp={current_ts:.4f}")
-        loaded_frames.append(frame["data"])
-        loaded_ts.append(current_ts)
-        if current_ts >= last_ts:
-            break
+    for first_ts, last_ts in decode_ranges:
+        # access closest key frame of the first requested frame
+        # Note: closest key frame timestamp is usually smaller than `first_ts` (e.g. key frame can be the first frame of the video)
+        # for details on what `seek` is doing see: https://pyav.basswood-io.com/docs/stable/api/container.html?highlight=inputcontainer#av.container.InputContainer.seek
+        reader.seek(first_ts, keyframes_only=keyframes_only)
+
+        # load all frames until last requested frame
+        for frame in reader:
+            current_ts = frame["pts"]
+            if log_loaded_timestamps:
+                logging.info(f"frame loaded at timestamp={current_ts:.4f}")
+            loaded_frames.append(frame["data"])
+            loaded_ts.append(current_ts)
+            if current_ts >= last_ts:
+                break
 
     if backend == "pyav":
         reader.container.close()
@@ -165,48 +187,303 @@ def decode_video_frames_torchvision(
         logging.info(f"{closest_ts=}")
 
     # convert to the pytorch format which is float32 in [0,1] range (and channel first)
-    closest_frames = closest_frames.type(torch.float32) / 255
+    if not return_uint8:
+        closest_frames = closest_frames.type(torch.float32) / 255
 
     assert len(timestamps) == len(closest_frames)
     return closest_frames
 
 
+DEFAULT_MAX_OPEN_VIDEO_FILES = 128
+DEFAULT_DECODED_FRAMES_CACHE_SIZE_IN_MB = 128
+VIDEO_INDEX_SUFFIX = ".index.npz"
+
+
+@dataclass
+class VideoIndex:
+    """Presentation timestamps and key frame flags of every frame of a video, sorted by timestamp.
+
+    It is written next to each video file of a dataset (see `write_video_index`) and lets readers map query
+    timestamps to exact frames and seek directly to the key frame preceding them, instead of relying on the
+    average frame rate and on approximate seeks. It also holds the stream information of the video (see
+    `get_video_info`), so that it doesn't have to be probed again.
+    """
+
+    # presentation timestamp of each frame in seconds
+    pts: np.ndarray
+    # whether each frame is a key frame
+    is_keyframe: np.ndarray
+    # stream information of the video, None for indices written without it
+    info: dict | None = None
+
+    def __len__(self) -> int:
+        return len(self.pts)
+
+    def get_frame_indices(self, timestamps: list[float]) -> np.ndarray:
+        """Return the indices of the frames closest to the given timestamps."""
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        right = np.clip(np.searchsorted(self.pts, timestamps), 1, len(self.pts) - 1)
+        left = right - 1
+        closest = np.where(
+            np.abs(self.pts[left] - timestamps) <= np.abs(self.pts[right] - timestamps), left, right
+        )
+        return closest if len(self.pts) > 1 else np.zeros_like(closest)
+
+    def plan_decode_ranges(self, frame_indices: np.ndarray | list[int]) -> list[tuple[int, int]]:
+        """Plan the decoding of the given frames as a list of (key_frame_index, last_frame_index) ranges.
+
+        Each range starts with a seek to a key frame and decodes sequentially until its last frame. A new range
+        is started whenever a key frame lies between two consecutive requested frames, since seeking to that
+        key frame is cheaper than decoding all the frames in between.
+        """
+        frame_indices = np.unique(np.asarray(frame_indices, dtype=np.int64))
+        keyframe_indices = np.flatnonzero(self.is_keyframe)
+        if len(keyframe_indices) == 0 or keyframe_indices[0] != 0:
+            keyframe_indices = np.concatenate([[0], keyframe_indices])
+        gop_starts = keyframe_indices[np.searchsorted(keyframe_indices, frame_indices, side="right") - 1]
+
+        ranges = []
+        for frame_idx, gop_start in zip(frame_indices.tolist(), gop_starts.tolist(), strict=True):
+            if len(ranges) > 0 and gop_start <= ranges[-1][1]:
+                ranges[-1] = (ranges[-1][0], frame_idx)
+            else:
+                ranges.append((gop_start, frame_idx))
+        return ranges
+
+
+def get_video_index_path(video_path: Path | str) -> Path:
+    return Path(f"{video_path}{VIDEO_INDEX_SUFFIX}")
+
+
+def write_video_index(video_path: Path | str) -> VideoIndex:
+    """Write the `VideoIndex` of a video file next to it.
+
+    Only packets are demuxed, no frame is decoded, so this is cheap compared to encoding. The size of the video
+    file is stored along the index so that stale indices of rewritten videos are ignored by readers.
+    """
+    pts, is_keyframe = [], []
+    logging.getLogger("libav").setLevel(av.logging.ERROR)
+    with av.open(str(video_path), "r") as container:
+        info = {**_get_video_stream_info(container), **_get_audio_stream_info(container)}
+        stream = container.streams.video[0]
+        for packet in container.demux(stream):
+            # Skip demux flushing packets
+            if packet.pts is None:
+                continue
+            pts.append(float(packet.pts * packet.time_base))
+            is_keyframe.append(packet.is_keyframe)
+    av.logging.restore_default_callback()
+
+    order = np.argsort(pts, kind="stable")
+    index = VideoIndex(
+        pts=np.asarray(pts, dtype=np.float64)[order],
+        is_keyframe=np.asarray(is_keyframe, dtype=bool)[order],
+        info=info,
+    )
+
+    index_path = get_video_index_path(video_path)
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.savez(
+            f,
+            pts=index.pts,
+            is_keyframe=index.is_keyframe,
+            info=json.dumps(index.info),
+            video_size=os.path.getsize(video_path),
+        )
+    os.replace(tmp_path, index_path)
+    return index
+
+
+def load_video_index(video_path: Path | str) -> VideoIndex | None:
+    """Load the `VideoIndex` of a video file, or return None if it is missing or stale."""
+    try:
+        index_mtime_ns = get_video_index_path(video_path).stat().st_mtime_ns
+        video_size = os.path.getsize(video_path)
+    except OSError:
+        return None
+    return _load_video_index(str(video_path), index_mtime_ns, video_size)
+
+
+@functools.lru_cache(maxsize=DEFAULT_MAX_OPEN_VIDEO_FILES)
+def _load_video_index(video_path: str, index_mtime_ns: int, video_size: int) -> VideoIndex | None:
+    with np.load(get_video_index_path(video_path)) as data:
+        if int(data["video_size"]) != video_size or len(data["pts"]) == 0:
+            return None
+        info = json.loads(str(data["info"])) if "info" in data else None
+        return VideoIndex(pts=data["pts"], is_keyframe=data["is_keyframe"], info=info)
+
+
+@dataclass
+class _CachedDecoder:
+    decoder: Any
+    file_handle: Any
+    # Number of threads using the decoder through `VideoDecoderCache.decoder`
+    users: int = 0
+    # Whether the decoder was returned by `VideoDecoderCache.get_decoder`, which doesn't track its users
+    untracked: bool = False
+    evicted: bool = False
+
+    def close_if_unused(self) -> None:
+        # The file of an untracked decoder is closed when the decoder is garbage collected
+        if self.evicted and self.users == 0 and not self.untracked:
+            self.file_handle.close()
+
+
 class VideoDecoderCache:
-    """Thread-safe cache for video decoders to avoid expensive re-initialization."""
+    """Thread-safe cache for video decoders and decoded frames to avoid expensive re-initialization and decoding.
+
+    Decoders are kept in least-recently-used order and the oldest ones are evicted once more than
+    `max_open_files` are open. The file handle of an evicted decoder is closed once no thread uses it anymore,
+    so decoders should be used through the `decoder` context manager. Decoded frames are cached separately, keyed by
+    (video_path, frame_index), and the least recently used ones are evicted once their total size exceeds
+    `max_frames_size_in_mb`. Frames are stored as decoded by the backend (uint8), before any conversion.
+
+    Note: each DataLoader worker holds its own copy of the cache, so the memory budget applies per worker.
 
-    def __init__(self):
-        self._cache: dict[str, tuple[Any, Any]] = {}
+    Args:
+        max_open_files: Maximum number of decoders (and file handles) kept open. None means unbounded.
+        max_frames_size_in_mb: Memory budget of the decoded frames cache. Set to 0 to disable frame caching.
+    """
+
+    def __init__(
+        self,
+        max_open_files: int | None = DEFAULT_MAX_OPEN_VIDEO_FILES,
+        max_frames_size_in_mb: float = DEFAULT_DECODED_FRAMES_CACHE_SIZE_IN_MB,
+    ):
+        if max_open_files is not None and max_open_files < 1:
+            raise ValueError(f"max_open_files must be at least 1, got {max_open_files}")
+        if max_frames_size_in_mb < 0:
+            raise ValueError(f"max_frames_size_in_mb must be non-negative, got {max_frames_size_in_mb}")
+
+        self.max_open_files = max_open_files
+        self.max_frames_bytes = int(max_frames_size_in_mb * 1024**2)
+        self._cache: OrderedDict[str, _CachedDecoder] = OrderedDict()
+        self._frames: OrderedDict[tuple[str, int], tuple[torch.Tensor, float]] = OrderedDict()
+        self._frames_bytes = 0
         self._lock = Lock()
 
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
     def get_decoder(self, video_path: str):
-        """Get a cached decoder or create a new one."""
+        """Get a cached decoder or create a new one.
+
+        The cache doesn't know when the returned decoder is no longer used, so its file is left open on eviction
+        until the decoder is garbage collected. Prefer `decoder`, which closes it as soon as it's released.
+        """
+        with self._lock:
+            entry = self._acquire(str(video_path))
+            entry.untracked = True
+            return entry.decoder
+
+    @contextmanager
+    def decoder(self, video_path: str):
+        """Context manager giving a cached or new decoder, whose file stays open until it's released."""
+        with self._lock:
+            entry = self._acquire(str(video_path))
+            entry.users += 1
+        try:
+            yield entry.decoder
+        finally:
+            with self._lock:
+                entry.users -= 1
+                entry.close_if_unused()
+
+    def _acquire(self, video_path: str) -> _CachedDecoder:
+        if video_path in self._cache:
+            self._cache.move_to_end(video_path)
+            return self._cache[video_path]
+
+        entry = _CachedDecoder(*self._open_decoder(video_path))
+        self._cache[video_path] = entry
+
+        if self.max_open_files is not None:
+            while len(self._cache) > self.max_open_files:
+                _, oldest = self._cache.popitem(last=False)
+                oldest.evicted = True
+                oldest.close_if_unused()
+
+        return entry
+
+    @staticmethod
+    def _open_decoder(video_path: str) -> tuple[Any, Any]:
         if importlib.util.find_spec("torchcodec"):
             from torchcodec.decoders import VideoDecoder
         else:
             raise ImportError("torchcodec is required but not available.")
 
-        video_path = str(video_path)
+        file_handle = fsspec.open(video_path).__enter__()
+        return VideoDecoder(file_handle, seek_mode="approximate"), file_handle
 
+    def get_frames(self, video_path: str, frame_indices: list[int]) -> dict[int, tuple[torch.Tensor, float]]:
+        """Return the cached (frame, pts_seconds) of the requested frame indices that are in the cache."""
+        video_path = str(video_path)
+        cached = {}
         with self._lock:
-            if video_path not in self._cache:
-                file_handle = fsspec.open(video_path).__enter__()
-                decoder = VideoDecoder(file_handle, seek_mode="approximate")
-                self._cache[video_path] = (decoder, file_handle)
+            for idx in frame_indices:
+                key = (video_path, idx)
+                if key in self._frames:
+                    self._frames.move_to_end(key)
+                    cached[idx] = self._frames[key]
+                    self.hits += 1
+                else:
+                    self.misses += 1
+        return cached
+
+    def put_frames(self, video_path: str, frames: dict[int, tuple[torch.Tensor, float]]) -> None:
+        """Add decoded (frame, pts_seconds) to the cache, evicting the least recently used frames if needed."""
+        if self.max_frames_bytes == 0:
+            return
 
-            return self._cache[video_path][0]
+        video_path = str(video_path)
+        with self._lock:
+            for idx, (frame, pts) in frames.items():
+                key = (video_path, idx)
+                frame_bytes = frame.numel() * frame.element_size()
+                if key in self._frames or frame_bytes > self.max_frames_bytes:
+                    continue
+                self._frames[key] = (frame, pts)
+                self._frames_bytes += frame_bytes
+
+            while self._frames_bytes > self.max_frames_bytes:
+                _, (oldest_frame, _) = self._frames.popitem(last=False)
+                self._frames_bytes -= oldest_frame.numel() * oldest_frame.element_size()
+                self.evictions += 1
 
     def clear(self):
-        """Clear the cache and close file handles."""
+        """Clear the cache and close file handles, once they're no longer used."""
         with self._lock:
-            for _, file_handle in self._cache.values():
-                file_handle.close()
+            for entry in self._cache.values():
+                entry.evicted = True
+                entry.close_if_unused()
             self._cache.clear()
+            self._frames.clear()
+            self._frames_bytes = 0
 
     def size(self) -> int:
         """Return the number of cached decoders."""
         with self._lock:
             return len(self._cache)
 
+    def frames_size_in_bytes(self) -> int:
+        """Return the total size of the cached decoded frames."""
+        with self._lock:
+            return self._frames_bytes
+
+    def stats(self) -> dict[str, int]:
+        """Return the decoded frames cache counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "num_frames": len(self._frames),
+                "num_bytes": self._frames_bytes,
+                "num_open_files": len(self._cache),
+            }
+
 
 class FrameTimestampError(ValueError):
     """Helper error to indicate the retrieved timestamps exceed the queried ones"""
@@ -223,6 +500,7 @@ def decode_video_frames_torchcodec(
     tolerance_s: float,
     log_loaded_timestamps: bool = False,
     decoder_cache: VideoDecoderCache | None = None,
+    return_uint8: bool = False,
 ) -> torch.Tensor:
     """Loads frames associated with the requested timestamps of a video using torchcodec.
 
@@ -232,6 +510,7 @@ def decode_video_frames_torchcodec(
         tolerance_s: Allowed deviation in seconds for frame retrieval.
         log_loaded_timestamps: Whether to log loaded timestamps.
         decoder_cache: Optional decoder cache instance. Uses default if None.
+        return_uint8: Whether to return frames as uint8 in [0, 255] instead of float32 in [0, 1].
 
     Note: Setting device="cuda" outside the main process, e.g. in data loader workers, will lead to CUDA initialization errors.
 
@@ -244,23 +523,47 @@ def decode_video_frames_torchcodec(
     if decoder_cache is None:
         decoder_cache = _default_decoder_cache
 
-    # Use cached decoder instead of creating new one each time
-    decoder = decoder_cache.get_decoder(str(video_path))
-
     loaded_ts = []
     loaded_frames = []
 
-    # get metadata for frame information
-    metadata = decoder.metadata
-    average_fps = metadata.average_fps
-    # convert timestamps to frame indices
-    frame_indices = [round(ts * average_fps) for ts in timestamps]
-    # retrieve frames based on indices
-    frames_batch = decoder.get_frames_at(indices=frame_indices)
-
-    for frame, pts in zip(frames_batch.data, frames_batch.pts_seconds, strict=True):
+    # Use cached decoder instead of creating new one each time, kept open until the frames are decoded
+    with decoder_cache.decoder(str(video_path)) as decoder:
+        video_index = load_video_index(video_path)
+        if video_index is not None:
+            # map timestamps to the exact frame indices of the video
+            frame_indices = video_index.get_frame_indices(timestamps).tolist()
+        else:
+            # get metadata for frame information
+            metadata = decoder.metadata
+            average_fps = metadata.average_fps
+            # convert timestamps to frame indices
+            frame_indices = [round(ts * average_fps) for ts in timestamps]
+
+        # only decode the frames that are not already in the cache
+        frames = decoder_cache.get_frames(video_path, frame_indices)
+        missing_indices = sorted(set(frame_indices) - frames.keys())
+        if len(missing_indices) > 0:
+            if video_index is not None:
+                # seeking by exact presentation timestamps avoids the approximation made by indices in
+                # approximate seek mode, which assumes a constant frame rate
+                frames_batch = decoder.get_frames_played_at(seconds=video_index.pts[missing_indices].tolist())
+            else:
+                frames_batch = decoder.get_frames_at(indices=missing_indices)
+            # clone cached frames to avoid keeping the whole decoded batch alive through views
+            clone = decoder_cache.max_frames_bytes > 0
+            decoded = {
+                idx: (frame.clone() if clone else frame, pts.item())
+                for idx, frame, pts in zip(
+                    missing_indices, frames_batch.data, frames_batch.pts_seconds, strict=True
+                )
+            }
+            decoder_cache.put_frames(video_path, decoded)
+            frames.update(decoded)
+
+    for idx in frame_indices:
+        frame, pts = frames[idx]
         loaded_frames.append(frame)
-        loaded_ts.append(pts.item())
+        loaded_ts.append(pts)
         if log_loaded_timestamps:
             logging.info(f"Frame loaded at timestamp={pts:.4f}")
 
@@ -290,7 +593,8 @@ def decode_video_frames_torchcodec(
         logging.info(f"{closest_ts=}")
 
     # convert to float32 in [0,1] range
-    closest_frames = (closest_frames / 255.0).type(torch.float32)
+    if not return_uint8:
+        closest_frames = (closest_frames / 255.0).type(torch.float32)
 
     if not len(timestamps) == len(closest_frames):
         raise FrameTimestampError(
@@ -327,13 +631,6 @@ def encode_video_frames(
 
     video_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Encoders/pixel formats incompatibility check
-    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
-        logging.warning(
-            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
-        )
-        pix_fmt = "yuv420p"
-
     # Get input frames
     template = "frame-" + ("[0-9]" * 6) + ".png"
     input_list = sorted(
@@ -346,35 +643,16 @@ def encode_video_frames(
     with Image.open(input_list[0]) as dummy_image:
         width, height = dummy_image.size
 
-    # Define video codec options
-    video_options = {}
-
-    if g is not None:
-        video_options["g"] = str(g)
-
-    if crf is not None:
-        video_options["crf"] = str(crf)
-
-    if fast_decode:
-        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
-        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
-        video_options[key] = value
-
-    if vcodec == "libsvtav1":
-        video_options["preset"] = str(preset) if preset is not None else "12"
-
     # Set logging level
     if log_level is not None:
         # "While less efficient, it is generally preferable to modify logging with Python's logging"
         logging.getLogger("libav").setLevel(log_level)
 
     # Create and open output file (overwrite by default)
-    with av.open(str(video_path), "w") as output:
-        output_stream = output.add_stream(vcodec, fps, options=video_options)
-        output_stream.pix_fmt = pix_fmt
-        output_stream.width = width
-        output_stream.height = height
-
+    output, output_stream = open_video_encoder(
+        video_path, fps, width, height, vcodec, pix_fmt, g, crf, fast_decode, preset
+    )
+    with output:
         # Loop through input frames and encode them
         for input_data in input_list:
             with Image.open(input_data) as input_image:
@@ -397,6 +675,58 @@ def encode_video_frames(
         raise OSError(f"Video encoding did not work. File not found: {video_path}.")
 
 
+def open_video_encoder(
+    video_path: Path | str,
+    fps: int,
+    width: int,
+    height: int,
+    vcodec: str = "libsvtav1",
+    pix_fmt: str = "yuv420p",
+    g: int | None = 2,
+    crf: int | None = 30,
+    fast_decode: int = 0,
+    preset: int | None = None,
+) -> tuple[av.container.OutputContainer, av.VideoStream]:
+    """Open an output video container and its video stream, configured like `encode_video_frames`.
+
+    Frames are encoded by passing `av.VideoFrame`s to `stream.encode` and muxing the resulting packets in the
+    container, which must be flushed and closed by the caller.
+    """
+    if vcodec not in ["h264", "hevc", "libsvtav1"]:
+        raise ValueError(f"Unsupported video codec: {vcodec}. Supported codecs are: h264, hevc, libsvtav1.")
+
+    # Encoders/pixel formats incompatibility check
+    if (vcodec == "libsvtav1" or vcodec == "hevc") and pix_fmt == "yuv444p":
+        logging.warning(
+            f"Incompatible pixel format 'yuv444p' for codec {vcodec}, auto-selecting format 'yuv420p'"
+        )
+        pix_fmt = "yuv420p"
+
+    # Define video codec options
+    video_options = {}
+
+    if g is not None:
+        video_options["g"] = str(g)
+
+    if crf is not None:
+        video_options["crf"] = str(crf)
+
+    if fast_decode:
+        key = "svtav1-params" if vcodec == "libsvtav1" else "tune"
+        value = f"fast-decode={fast_decode}" if vcodec == "libsvtav1" else "fastdecode"
+        video_options[key] = value
+
+    if vcodec == "libsvtav1":
+        video_options["preset"] = str(preset) if preset is not None else "12"
+
+    output = av.open(str(video_path), "w")
+    output_stream = output.add_stream(vcodec, fps, options=video_options)
+    output_stream.pix_fmt = pix_fmt
+    output_stream.width = width
+    output_stream.height = height
+    return output, output_stream
+
+
 def concatenate_video_files(
     input_video_paths: list[Path | str], output_video_path: Path, overwrite: bool = True
 ):
@@ -414,6 +744,7 @@ def concatenate_video_files(
 
     Note:
         - Creates a temporary directory for intermediate files that is cleaned up after use.
+        - Writes the keyframe index of the output video next to it (see `write_video_index`).
         - Uses ffmpeg's concat demuxer which requires all input videos to have the same
           codec, resolution, and frame rate for proper concatenation.
     """
@@ -478,6 +809,7 @@ def concatenate_video_files(
     output_container.close()
     shutil.move(tmp_output_video_path, output_video_path)
     Path(tmp_concatenate_path).unlink()
+    write_video_index(output_video_path)
 
 
 @dataclass
@@ -516,27 +848,8 @@ def get_audio_info(video_path: Path | str) -> dict:
     # Set logging level
     logging.getLogger("libav").setLevel(av.logging.ERROR)
 
-    # Getting audio stream information
-    audio_info = {}
     with av.open(str(video_path), "r") as audio_file:
-        try:
-            audio_stream = audio_file.streams.audio[0]
-        except IndexError:
-            # Reset logging level
-            av.logging.restore_default_callback()
-            return {"has_audio": False}
-
-        audio_info["audio.channels"] = audio_stream.channels
-        audio_info["audio.codec"] = audio_stream.codec.canonical_name
-        # In an ideal loseless case : bit depth x sample rate x channels = bit rate.
-        # In an actual compressed case, the bit rate is set according to the compression level : the lower the bit rate, the more compression is applied.
-        audio_info["audio.bit_rate"] = audio_stream.bit_rate
-        audio_info["audio.sample_rate"] = audio_stream.sample_rate  # Number of samples per second
-        # In an ideal loseless case : fixed number of bits per sample.
-        # In an actual compressed case : variable number of bits per sample (often reduced to match a given depth rate).
-        audio_info["audio.bit_depth"] = audio_stream.format.bits
-        audio_info["audio.channel_layout"] = audio_stream.layout.name
-        audio_info["has_audio"] = True
+        audio_info = _get_audio_stream_info(audio_file)
 
     # Reset logging level
     av.logging.restore_default_callback()
@@ -544,37 +857,64 @@ def get_audio_info(video_path: Path | str) -> dict:
     return audio_info
 
 
+def _get_audio_stream_info(container: av.container.InputContainer) -> dict:
+    # Getting audio stream information
+    audio_info = {}
+    try:
+        audio_stream = container.streams.audio[0]
+    except IndexError:
+        return {"has_audio": False}
+
+    audio_info["audio.channels"] = audio_stream.channels
+    audio_info["audio.codec"] = audio_stream.codec.canonical_name
+    # In an ideal loseless case : bit depth x sample rate x channels = bit rate.
+    # In an actual compressed case, the bit rate is set according to the compression level : the lower the bit rate, the more compression is applied.
+    audio_info["audio.bit_rate"] = audio_stream.bit_rate
+    audio_info["audio.sample_rate"] = audio_stream.sample_rate  # Number of samples per second
+    # In an ideal loseless case : fixed number of bits per sample.
+    # In an actual compressed case : variable number of bits per sample (often reduced to match a given depth rate).
+    audio_info["audio.bit_depth"] = audio_stream.format.bits
+    audio_info["audio.channel_layout"] = audio_stream.layout.name
+    audio_info["has_audio"] = True
+
+    return audio_info
+
+
 def get_video_info(video_path: Path | str) -> dict:
     # Set logging level
     logging.getLogger("libav").setLevel(av.logging.ERROR)
 
-    # Getting video stream information
-    video_info = {}
     with av.open(str(video_path), "r") as video_file:
-        try:
-            video_stream = video_file.streams.video[0]
-        except IndexError:
-            # Reset logging level
-            av.logging.restore_default_callback()
-            return {}
+        video_info = _get_video_stream_info(video_file)
+        # Adding audio stream information
+        if video_info:
+            video_info.update(**_get_audio_stream_info(video_file))
+
+    # Reset logging level
+    av.logging.restore_default_callback()
 
-        video_info["video.height"] = video_stream.height
-        video_info["video.width"] = video_stream.width
-        video_info["video.codec"] = video_stream.codec.canonical_name
-        video_info["video.pix_fmt"] = video_stream.pix_fmt
-        video_info["video.is_depth_map"] = False
+    return video_info
 
-        # Calculate fps from r_frame_rate
-        video_info["video.fps"] = int(video_stream.base_rate)
 
-        pixel_channels = get_video_pixel_channels(video_stream.pix_fmt)
-        video_info["video.channels"] = pixel_channels
+def _get_video_stream_info(container: av.container.InputContainer) -> dict:
+    # Getting video stream information
+    video_info = {}
+    try:
+        video_stream = container.streams.video[0]
+    except IndexError:
+        return {}
 
-    # Reset logging level
-    av.logging.restore_default_callback()
+    video_info["video.height"] = video_stream.height
+    video_info["video.width"] = video_stream.width
+    video_info["video.codec"] = video_stream.codec.canonical_name
+    video_info["video.pix_fmt"] = video_stream.pix_fmt
+    video_info["video.is_depth_map"] = False
+
+    # Calculate fps from r_frame_rate
+    video_info["video.fps"] = int(video_stream.base_rate)
 
-    # Adding audio stream information
-    video_info.update(**get_audio_info(video_path))
+    pixel_channels = get_video_pixel_channels(video_stream.pix_fmt)
+    video_info["video.channels"] = pixel_channels
 
     return video_info
 
@@ -647,8 +987,10 @@ class VideoEncodingManager:
             )
             self.dataset._batch_save_episode_video(start_ep, end_ep)
 
-        # Finalize the dataset to properly close all writers
+        # Finalize the dataset to properly close all writers, saving the episodes still being encoded
         self.dataset.finalize()
+        self.dataset.stop_video_encoder()
+        self.dataset.stop_streaming_video_encoder()
 
         # Clean up episode images if recording was interrupted
         if exc_type is not None:
@@ -15,3 +15,4 @@
 # limitations under the License.
 
 from .motors_bus import Motor, MotorCalibration, MotorNormMode, MotorsBus
+from .motors_bus_thread import BusSnapshot, MotorsBusThread
@@ -21,8 +21,9 @@
 
 import abc
 import logging
+import time
 from contextlib import contextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from functools import cached_property
 from pprint import pformat
@@ -203,6 +204,67 @@ class GroupSyncWrite(Protocol):
     def txPacket(self): ...
 
 
+# Upper bounds of the buckets of the latency histograms, in seconds
+LATENCY_HISTOGRAM_BOUNDS = (0.0005, 0.001, 0.002, 0.004, 0.008, 0.016, 0.032, 0.064, float("inf"))
+
+
+@dataclass
+class LatencyHistogram:
+    """Histogram of the latencies of one type of bus transaction."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * len(LATENCY_HISTOGRAM_BOUNDS))
+    total: float = 0.0
+    max: float = 0.0
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def record(self, latency: float) -> None:
+        for i, bound in enumerate(LATENCY_HISTOGRAM_BOUNDS):
+            if latency <= bound:
+                self.counts[i] += 1
+                break
+        self.total += latency
+        self.max = max(self.max, latency)
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th percentile, or the max latency for the last bucket."""
+        rank = q / 100 * self.count
+        cumulative = 0
+        for bound, count in zip(LATENCY_HISTOGRAM_BOUNDS, self.counts, strict=True):
+            cumulative += count
+            if count and cumulative >= rank:
+                return min(bound, self.max)
+        return 0.0
+
+    def as_dict(self) -> dict:
+        count = self.count
+        return {
+            "count": count,
+            "mean_ms": 1e3 * self.total / count if count else 0.0,
+            "p50_ms": 1e3 * self.percentile(50),
+            "p99_ms": 1e3 * self.percentile(99),
+            "max_ms": 1e3 * self.max,
+            "buckets_ms": {
+                f"<={1e3 * bound:g}": n
+                for bound, n in zip(LATENCY_HISTOGRAM_BOUNDS, self.counts, strict=True)
+            },
+        }
+
+
+@dataclass
+class PendingSyncRead:
+    """A sync read whose instruction packet was sent, see `MotorsBus.sync_read_begin`."""
+
+    reads: dict[str, list[int]]
+    motor_ids: list[int]
+    address: int
+    length: int
+    reader: "GroupSyncRead"
+    comm: int
+
+
 class MotorsBus(abc.ABC):
     """
     A MotorsBus allows to efficiently read and write to the attached motors.
@@ -275,6 +337,11 @@ class MotorsBus(abc.ABC):
         self._id_to_name_dict = {m.id: motor for motor, m in self.motors.items()}
         self._model_nb_to_model_dict = {v: k for k, v in self.model_number_table.items()}
 
+        # Sync readers set up once per (address, length, ids) instead of before every read
+        self._sync_readers: dict[tuple[int, int, tuple[int, ...]], GroupSyncRead] = {}
+        self._pending_read: PendingSyncRead | None = None
+        self.latency_histograms: dict[str, LatencyHistogram] = {}
+
         self._validate_motors()
 
     def __len__(self):
@@ -965,6 +1032,7 @@ class MotorsBus(abc.ABC):
         else:
             raise ValueError(length)
 
+        start = time.perf_counter()
         for n_try in range(1 + num_retry):
             value, comm, error = read_fn(self.port_handler, motor_id, address)
             if self._is_comm_success(comm):
@@ -973,6 +1041,7 @@ class MotorsBus(abc.ABC):
                 f"Failed to read @{address=} ({length=}) on {motor_id=} ({n_try=}): "
                 + self.packet_handler.getTxRxResult(comm)
             )
+        self._record_latency("read", start)
 
         if not self._is_comm_success(comm) and raise_on_error:
             raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
@@ -1028,6 +1097,7 @@ class MotorsBus(abc.ABC):
         err_msg: str = "",
     ) -> tuple[int, int]:
         data = self._serialize_data(value, length)
+        start = time.perf_counter()
         for n_try in range(1 + num_retry):
             comm, error = self.packet_handler.writeTxRx(self.port_handler, motor_id, addr, length, data)
             if self._is_comm_success(comm):
@@ -1036,6 +1106,7 @@ class MotorsBus(abc.ABC):
                 f"Failed to sync write @{addr=} ({length=}) on id={motor_id} with {value=} ({n_try=}): "
                 + self.packet_handler.getTxRxResult(comm)
             )
+        self._record_latency("write", start)
 
         if not self._is_comm_success(comm) and raise_on_error:
             raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
@@ -1102,42 +1173,168 @@ class MotorsBus(abc.ABC):
         raise_on_error: bool = True,
         err_msg: str = "",
     ) -> tuple[dict[int, int], int]:
-        self._setup_sync_reader(motor_ids, addr, length)
+        reader = self._get_sync_reader(motor_ids, addr, length)
+        start = time.perf_counter()
         for n_try in range(1 + num_retry):
-            comm = self.sync_reader.txRxPacket()
+            comm = reader.txRxPacket()
             if self._is_comm_success(comm):
                 break
             logger.debug(
                 f"Failed to sync read @{addr=} ({length=}) on {motor_ids=} ({n_try=}): "
                 + self.packet_handler.getTxRxResult(comm)
             )
+        self._record_latency("sync_read", start)
 
         if not self._is_comm_success(comm) and raise_on_error:
             raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
 
-        values = {id_: self.sync_reader.getData(id_, addr, length) for id_ in motor_ids}
+        values = {id_: reader.getData(id_, addr, length) for id_ in motor_ids}
         return values, comm
 
-    def _setup_sync_reader(self, motor_ids: list[int], addr: int, length: int) -> None:
-        self.sync_reader.clearParam()
-        self.sync_reader.start_address = addr
-        self.sync_reader.data_length = length
-        for id_ in motor_ids:
-            self.sync_reader.addParam(id_)
-
-    # TODO(aliberts, pkooij): Implementing something like this could get even much faster read times if need be.
-    # Would have to handle the logic of checking if a packet has been sent previously though but doable.
-    # This could be at the cost of increase latency between the moment the data is produced by the motors and
-    # the moment it is used by a policy.
-    # def _async_read(self, motor_ids: list[int], address: int, length: int):
-    #     if self.sync_reader.start_address != address or self.sync_reader.data_length != length or ...:
-    #         self._setup_sync_reader(motor_ids, address, length)
-    #     else:
-    #         self.sync_reader.rxPacket()
-    #         self.sync_reader.txPacket()
-
-    #     for id_ in motor_ids:
-    #         value = self.sync_reader.getData(id_, address, length)
+    def _get_sync_reader(self, motor_ids: list[int], addr: int, length: int) -> GroupSyncRead:
+        """Return a sync reader set up for these motors and register span, creating it on first use."""
+        key = (addr, length, tuple(motor_ids))
+        reader = self._sync_readers.get(key)
+        if reader is None:
+            # Same class as the sync reader of the subclass, i.e. of its SDK
+            reader = type(self.sync_reader)(self.port_handler, self.packet_handler, addr, length)
+            for id_ in motor_ids:
+                reader.addParam(id_)
+            self._sync_readers[key] = reader
+        return reader
+
+    def sync_read_begin(
+        self, reads: dict[str, str | list[str] | None], *, num_retry: int = 0
+    ) -> PendingSyncRead:
+        """Send the instruction packet of a sync read, and return without waiting for the motors to reply.
+
+        Several registers can be read at once, in a single transaction spanning all their addresses. The
+        motors reply while the caller does something else, and `sync_read_end` collects the values. No other
+        transaction can happen on the bus in between.
+
+        Args:
+            reads (dict[str, str | list[str] | None]): Mapping *register name → motors to query*, with `None`
+                for every motor.
+            num_retry (int, optional): Retry attempts to send the packet.  Defaults to `0`.
+
+        Returns:
+            PendingSyncRead: The read to pass to `sync_read_end`.
+        """
+        if not self.is_connected:
+            raise DeviceNotConnectedError(
+                f"{self.__class__.__name__}('{self.port}') is not connected. You need to run `{self.__class__.__name__}.connect()`."
+            )
+        if self._pending_read is not None:
+            raise RuntimeError("A sync read is already pending, call `sync_read_end` first.")
+
+        self._assert_protocol_is_compatible("sync_read")
+
+        ids_reads: dict[str, list[int]] = {}
+        spans = []
+        for data_name, motors in reads.items():
+            names = self._get_motors_list(motors)
+            spans.append(get_address(self.model_ctrl_table, self.motors[names[0]].model, data_name))
+            ids_reads[data_name] = [self.motors[motor].id for motor in names]
+
+        if self._has_different_ctrl_tables:
+            # The registers of the other motors must be at the same addresses for a single transaction
+            all_models = list({self._id_to_model(id_) for ids in ids_reads.values() for id_ in ids})
+            for data_name in ids_reads:
+                assert_same_address(self.model_ctrl_table, all_models, data_name)
+
+        address = min(addr for addr, _ in spans)
+        length = max(addr + size for addr, size in spans) - address
+        motor_ids = list(dict.fromkeys(id_ for ids in ids_reads.values() for id_ in ids))
+        reader = self._get_sync_reader(motor_ids, address, length)
+
+        start = time.perf_counter()
+        for n_try in range(1 + num_retry):
+            comm = reader.txPacket()
+            if self._is_comm_success(comm):
+                break
+            logger.debug(
+                f"Failed to send sync read @{address=} ({length=}) on {motor_ids=} ({n_try=}): "
+                + self.packet_handler.getTxRxResult(comm)
+            )
+        self._record_latency("sync_read_tx", start)
+
+        self._pending_read = PendingSyncRead(ids_reads, motor_ids, address, length, reader, comm)
+        return self._pending_read
+
+    def sync_read_end(
+        self, pending: PendingSyncRead, *, normalize: bool = True, num_retry: int = 0
+    ) -> dict[str, dict[str, Value]]:
+        """Wait for the replies of a read started with `sync_read_begin`.
+
+        Args:
+            pending (PendingSyncRead): The read returned by `sync_read_begin`.
+            normalize (bool, optional): Normalisation flag.  Defaults to `True`.
+            num_retry (int, optional): Retry attempts of the whole transaction.  Defaults to `0`.
+
+        Returns:
+            dict[str, dict[str, Value]]: Mapping *register name → motor name → value*.
+        """
+        if pending is not self._pending_read:
+            raise RuntimeError("This sync read is not the one pending on the bus.")
+        self._pending_read = None
+
+        reader = pending.reader
+        start = time.perf_counter()
+        comm = reader.rxPacket() if self._is_comm_success(pending.comm) else pending.comm
+        for n_try in range(num_retry):
+            if self._is_comm_success(comm):
+                break
+            logger.debug(
+                f"Failed to sync read @{pending.address=} ({pending.length=}) on {pending.motor_ids=} "
+                f"({n_try=}): " + self.packet_handler.getTxRxResult(comm)
+            )
+            comm = reader.txRxPacket()
+        self._record_latency("sync_read_rx", start)
+
+        if not self._is_comm_success(comm):
+            raise ConnectionError(
+                f"Failed to sync read {list(pending.reads)} on ids={pending.motor_ids} after {num_retry + 1} "
+                f"tries. {self.packet_handler.getTxRxResult(comm)}"
+            )
+
+        values = {}
+        for data_name, ids in pending.reads.items():
+            addr, length = get_address(self.model_ctrl_table, self._id_to_model(ids[0]), data_name)
+            ids_values = {id_: reader.getData(id_, addr, length) for id_ in ids}
+            ids_values = self._decode_sign(data_name, ids_values)
+            if normalize and data_name in self.normalized_data:
+                ids_values = self._normalize(ids_values)
+            values[data_name] = {self._id_to_name(id_): value for id_, value in ids_values.items()}
+        return values
+
+    def sync_read_multi(
+        self,
+        reads: dict[str, str | list[str] | None],
+        *,
+        normalize: bool = True,
+        num_retry: int = 0,
+    ) -> dict[str, dict[str, Value]]:
+        """Read several registers from several motors in a single transaction.
+
+        Args:
+            reads (dict[str, str | list[str] | None]): Mapping *register name → motors to query*, with `None`
+                for every motor.
+            normalize (bool, optional): Normalisation flag.  Defaults to `True`.
+            num_retry (int, optional): Retry attempts.  Defaults to `0`.
+
+        Returns:
+            dict[str, dict[str, Value]]: Mapping *register name → motor name → value*.
+        """
+        pending = self.sync_read_begin(reads, num_retry=num_retry)
+        return self.sync_read_end(pending, normalize=normalize, num_retry=num_retry)
+
+    def _record_latency(self, transaction: str, start: float) -> None:
+        histogram = self.latency_histograms.setdefault(transaction, LatencyHistogram())
+        histogram.record(time.perf_counter() - start)
+
+    def transaction_latencies(self) -> dict[str, dict]:
+        """Latency histograms of the transactions on the bus, by type of transaction."""
+        return {transaction: hist.as_dict() for transaction, hist in self.latency_histograms.items()}
 
     def sync_write(
         self,
@@ -1191,6 +1388,7 @@ class MotorsBus(abc.ABC):
         err_msg: str = "",
     ) -> int:
         self._setup_sync_writer(ids_values, addr, length)
+        start = time.perf_counter()
         for n_try in range(1 + num_retry):
             comm = self.sync_writer.txPacket()
             if self._is_comm_success(comm):
@@ -1199,6 +1397,7 @@ class MotorsBus(abc.ABC):
                 f"Failed to sync write @{addr=} ({length=}) with {ids_values=} ({n_try=}): "
                 + self.packet_handler.getTxRxResult(comm)
             )
+        self._record_latency("sync_write", start)
 
         if not self._is_comm_success(comm) and raise_on_error:
             raise ConnectionError(f"{err_msg} {self.packet_handler.getTxRxResult(comm)}")
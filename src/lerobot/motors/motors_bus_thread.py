@@ -0,0 +1,239 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from typing import Any
+
+from lerobot.utils.robot_utils import precise_sleep
+
+from .motors_bus import MotorsBus, Value
+
+logger = logging.getLogger(__name__)
+
+# Snapshots older than this number of cycle periods are stale, e.g. because the last cycles failed
+STALE_SNAPSHOT_CYCLES = 3
+
+
+@dataclass(frozen=True)
+class BusSnapshot:
+    """State of the motors read during a cycle of a `MotorsBusThread`."""
+
+    values: dict[str, dict[str, Value]]
+    timestamp: float
+    cycle: int
+
+
+@dataclass
+class BusThreadStats:
+    cycles: int = 0
+    overruns: int = 0
+    errors: int = 0
+    total_cycle_time: float = 0.0
+    max_cycle_time: float = 0.0
+
+    def as_dict(self) -> dict[str, float]:
+        return {
+            "cycles": self.cycles,
+            "overruns": self.overruns,
+            "errors": self.errors,
+            "avg_cycle_ms": 1e3 * self.total_cycle_time / self.cycles if self.cycles else 0.0,
+            "max_cycle_ms": 1e3 * self.max_cycle_time,
+        }
+
+
+@dataclass
+class _BusCall:
+    fn: Callable[..., Any]
+    args: tuple
+    kwargs: dict
+    future: Future = field(default_factory=Future)
+
+
+class MotorsBusThread:
+    """A thread owning a `MotorsBus`, which reads and writes the motors at a fixed rate.
+
+    Every cycle, the thread writes the latest goals, then reads the registers and publishes them as a new
+    `BusSnapshot`. Publishing swaps the reference to an immutable snapshot, so `get_state` never waits for
+    the bus nor for a lock, however many threads read it. Goals go through a single-slot mailbox: the goals
+    set between two cycles are merged, the latest value of each register of each motor winning, and sent
+    at the next cycle.
+
+    Any other bus operation must go through `call` once the thread is started, since the bus can't be used
+    from several threads.
+
+    Args:
+        bus: The connected bus.
+        reads: Mapping *register name → motors to read*, read in a single transaction every cycle.
+        fps: Frequency of the read/write cycle.
+        normalize: Whether to normalize the values read and unnormalize the goals written.
+    """
+
+    def __init__(
+        self,
+        bus: MotorsBus,
+        reads: dict[str, str | list[str] | None],
+        fps: float = 60,
+        normalize: bool = True,
+    ):
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, got {fps}")
+        self.bus = bus
+        self.reads = reads
+        self.fps = fps
+        self.normalize = normalize
+        self.stats = BusThreadStats()
+
+        self._snapshot: BusSnapshot | None = None
+        self._snapshot_ready = threading.Event()
+        self._mailbox: dict[str, dict[str, Value]] | None = None
+        self._mailbox_lock = threading.Lock()
+        self._calls: Queue[_BusCall] = Queue()
+        self._calls_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, timeout: float = 1.0) -> None:
+        """Start the thread, and wait for the first snapshot."""
+        if self.is_running:
+            raise RuntimeError("The bus thread is already running.")
+        self._stop_event.clear()
+        self._snapshot_ready.clear()
+        self._snapshot = None
+        self._thread = threading.Thread(
+            target=self._run, name=f"{self.bus.__class__.__name__}Thread", daemon=True
+        )
+        self._thread.start()
+        if not self._snapshot_ready.wait(timeout):
+            self.stop()
+            raise TimeoutError(f"No state read from the bus on {self.bus.port} within {timeout}s")
+
+    def stop(self) -> None:
+        """Send the pending goals and calls, then stop the thread."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._calls_lock:
+            self._thread = None
+            # Calls queued while the thread was stopping
+            self._run_calls()
+
+    def get_state(self) -> BusSnapshot:
+        """Latest state read from the motors, without blocking."""
+        if self._snapshot is None:
+            raise RuntimeError("No state was read from the bus yet, call `start` first.")
+        return self._snapshot
+
+    def is_stale(self, snapshot: BusSnapshot, max_cycles: float = STALE_SNAPSHOT_CYCLES) -> bool:
+        """Whether a snapshot is older than `max_cycles` cycle periods."""
+        return time.perf_counter() - snapshot.timestamp > max_cycles / self.fps
+
+    def get_fresh_state(self, max_cycles: float = STALE_SNAPSHOT_CYCLES, timeout: float = 1.0) -> BusSnapshot:
+        """Latest state read from the motors, or the state read between two cycles if the latest is stale.
+
+        Raises:
+            Exception: The error of the bus, if the state can't be read either between two cycles.
+            TimeoutError: If the thread doesn't read the state within `timeout`.
+        """
+        snapshot = self.get_state()
+        if not self.is_stale(snapshot, max_cycles):
+            return snapshot
+
+        age = time.perf_counter() - snapshot.timestamp
+        logger.warning(f"State read from the bus on {self.bus.port} {1e3 * age:.0f}ms ago, reading it again")
+        start = time.perf_counter()
+        values = self.call(self.bus.sync_read_multi, self.reads, normalize=self.normalize, timeout=timeout)
+        return BusSnapshot(values, (start + time.perf_counter()) / 2, self.stats.cycles)
+
+    def set_goals(self, goals: dict[str, dict[str, Value]]) -> None:
+        """Set goals, as a mapping *register name → motor name → value*, sent at the next cycle."""
+        with self._mailbox_lock:
+            if self._mailbox is None:
+                self._mailbox = {}
+            for data_name, values in goals.items():
+                self._mailbox.setdefault(data_name, {}).update(values)
+
+    def call(self, fn: Callable[..., Any], *args, timeout: float | None = None, **kwargs) -> Any:
+        """Run `fn(*args, **kwargs)`, e.g. a `bus.write`, in the bus thread between two cycles."""
+        bus_call = _BusCall(fn, args, kwargs)
+        with self._calls_lock:
+            running = self._thread is not None
+            if running:
+                self._calls.put(bus_call)
+        if not running:
+            return fn(*args, **kwargs)
+        return bus_call.future.result(timeout)
+
+    def _run(self) -> None:
+        period = 1 / self.fps
+        next_cycle = time.perf_counter()
+        while True:
+            stopping = self._stop_event.is_set()
+            start = time.perf_counter()
+            try:
+                self._cycle()
+            except Exception as e:
+                self.stats.errors += 1
+                logger.warning(f"Bus cycle {self.stats.cycles} on {self.bus.port} failed: {e}")
+            self._run_calls()
+
+            cycle_time = time.perf_counter() - start
+            self.stats.cycles += 1
+            self.stats.total_cycle_time += cycle_time
+            self.stats.max_cycle_time = max(self.stats.max_cycle_time, cycle_time)
+            if stopping:
+                break
+
+            next_cycle += period
+            delay = next_cycle - time.perf_counter()
+            if delay > 0:
+                precise_sleep(delay)
+            else:
+                # Skip the cycles that can't be made up for, instead of running them back to back
+                self.stats.overruns += 1
+                next_cycle = time.perf_counter()
+
+    def _cycle(self) -> None:
+        with self._mailbox_lock:
+            goals, self._mailbox = self._mailbox, None
+        for data_name, values in (goals or {}).items():
+            self.bus.sync_write(data_name, values, normalize=self.normalize)
+
+        values = self.bus.sync_read_multi(self.reads, normalize=self.normalize)
+        self._snapshot = BusSnapshot(values, time.perf_counter(), self.stats.cycles)
+        self._snapshot_ready.set()
+
+    def _run_calls(self) -> None:
+        while True:
+            try:
+                bus_call = self._calls.get_nowait()
+            except Empty:
+                return
+            if not bus_call.future.set_running_or_notify_cancel():
+                continue
+            try:
+                bus_call.future.set_result(bus_call.fn(*bus_call.args, **bus_call.kwargs))
+            except Exception as e:
+                bus_call.future.set_exception(e)
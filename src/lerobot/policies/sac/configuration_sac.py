@@ -53,6 +53,27 @@ class ActorLearnerConfig:
     learner_port: int = 50051
     policy_parameters_push_frequency: int = 4
     queue_get_timeout: float = 2
+    # Send the policy parameters as deltas against the previous push of the stream, skipping unchanged tensors
+    parameters_delta_encoding: bool = False
+    # Quantization of the sent floating point parameters: None, "fp16" or "int8"
+    parameters_quantization: str | None = None
+    # Identity of the actor on the learner, its address is used if None
+    actor_id: str | None = None
+    # Number of actors the learner serves concurrently
+    max_actors: int = 4
+    # Transition messages buffered on the learner for each actor, before the actor is slowed down
+    actor_queue_size: int = 4
+    # gRPC compression of each stream: None, "gzip" or "deflate"
+    transitions_compression: str | None = None
+    interactions_compression: str | None = None
+    parameters_compression: str | None = None
+    # Send the images of the transitions as uint8 instead of floats
+    compress_transition_images: bool = False
+    # Coalesce the transition messages smaller than this size in bytes, waiting at most this time in seconds
+    transitions_batch_bytes: int = 0
+    transitions_batch_timeout: float = 0.0
+    # Interval in seconds between the logs of the bytes sent and serialization time of the streams
+    stream_stats_log_interval: float = 60.0
 
 
 @dataclass
@@ -145,6 +166,19 @@ class SACConfig(PreTrainedConfig):
     offline_buffer_capacity: int = 100000
     # Whether to use asynchronous prefetching for the buffers
     async_prefetch: bool = False
+    # Number of worker processes sampling batches from the buffers, 0 samples them in the learner process
+    num_sampling_workers: int = 0
+    # Whether to sample the online buffer with prioritized experience replay, based on the critic TD errors
+    prioritized_replay: bool = False
+    # Priority exponent of prioritized replay, 0 corresponds to uniform sampling
+    priority_alpha: float = 0.6
+    # Importance sampling exponent of prioritized replay, 1 fully corrects the sampling bias
+    priority_beta: float = 0.4
+    # Whether to store the buffer images as uint8, sharing frames between consecutive transitions
+    compress_buffer_images: bool = False
+    # Whether to store the online replay buffer in memory-mapped files in the output directory, so that it can
+    # exceed the RAM, is not re-encoded as a dataset at each checkpoint and is restored as is when resuming
+    memmap_online_buffer: bool = False
     # Number of steps before learning starts
     online_step_before_learning: int = 100
     # Frequency of policy updates
@@ -200,6 +234,18 @@ class SACConfig(PreTrainedConfig):
     def __post_init__(self):
         super().__post_init__()
         # Any validation specific to SAC configuration
+        for stream in ["transitions", "interactions", "parameters"]:
+            compression = getattr(self.actor_learner_config, f"{stream}_compression")
+            if compression not in (None, "gzip", "deflate"):
+                raise ValueError(
+                    f"actor_learner_config.{stream}_compression must be None, 'gzip' or 'deflate', got "
+                    f"{compression}"
+                )
+        if self.actor_learner_config.parameters_quantization not in (None, "fp16", "int8"):
+            raise ValueError(
+                "actor_learner_config.parameters_quantization must be None, 'fp16' or 'int8', got "
+                f"{self.actor_learner_config.parameters_quantization}"
+            )
 
     def get_optimizer_preset(self) -> MultiAdamConfig:
         return MultiAdamConfig(
@@ -63,6 +63,8 @@ from lerobot.configs.train import TrainRLServerPipelineConfig
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
 from lerobot.processor import TransitionKey
+from lerobot.rl.learner_service import ACTOR_ID_METADATA_KEY
+from lerobot.rl.parameter_sync import ParameterDecoder, load_trainable_state_dict
 from lerobot.rl.process import ProcessSignalHandler
 from lerobot.rl.queue import get_last_item_from_queue
 from lerobot.robots import so100_follower  # noqa: F401
@@ -70,17 +72,22 @@ from lerobot.teleoperators import gamepad, so101_leader  # noqa: F401
 from lerobot.teleoperators.utils import TeleopEvents
 from lerobot.transport import services_pb2, services_pb2_grpc
 from lerobot.transport.utils import (
+    StreamStats,
     bytes_to_state_dict,
+    bytes_to_transitions,
     grpc_channel_options,
+    grpc_compression,
     python_object_to_bytes,
     receive_bytes_in_chunks,
     send_bytes_in_chunks,
+    state_to_bytes,
     transitions_to_bytes,
 )
 from lerobot.utils.random_utils import set_seed
 from lerobot.utils.robot_utils import precise_sleep
 from lerobot.utils.transition import (
     Transition,
+    compress_transition_images,
     move_state_dict_to_device,
     move_transition_to_device,
 )
@@ -275,6 +282,9 @@ def act_with_policy(
     episode_total_steps = 0
 
     policy_timer = TimerManager("Policy inference", log=False)
+    serialization_stats = StreamStats(
+        "[ACTOR] transitions serialization", cfg.policy.actor_learner_config.stream_stats_log_interval
+    )
 
     for interaction_step in range(cfg.policy.online_steps):
         start_time = time.perf_counter()
@@ -357,6 +367,8 @@ def act_with_policy(
                 push_transitions_to_transport_queue(
                     transitions=list_transition_to_send_to_learner,
                     transitions_queue=transitions_queue,
+                    compress_images=cfg.policy.actor_learner_config.compress_transition_images,
+                    stats=serialization_stats,
                 )
                 list_transition_to_send_to_learner = []
 
@@ -455,6 +467,12 @@ def learner_service_client(
     return stub, channel
 
 
+def actor_metadata(cfg: TrainRLServerPipelineConfig) -> tuple[tuple[str, str], ...] | None:
+    """gRPC metadata identifying the actor on the learner, which serves several actors."""
+    actor_id = cfg.policy.actor_learner_config.actor_id
+    return ((ACTOR_ID_METADATA_KEY, actor_id),) if actor_id is not None else None
+
+
 def receive_policy(
     cfg: TrainRLServerPipelineConfig,
     parameters_queue: Queue,
@@ -491,13 +509,26 @@ def receive_policy(
         )
 
     try:
-        iterator = learner_client.StreamParameters(services_pb2.Empty())
-        receive_bytes_in_chunks(
-            iterator,
-            parameters_queue,
-            shutdown_event,
-            log_prefix="[ACTOR] parameters",
-        )
+        iterator = learner_client.StreamParameters(services_pb2.Empty(), metadata=actor_metadata(cfg))
+        # The messages may be deltas against the previous ones, so they are decoded in order here and the
+        # queue only holds full state dicts, of which the policy loads the last one
+        decoder = ParameterDecoder()
+        while not shutdown_event.is_set():
+            message = receive_bytes_in_chunks(
+                iterator,
+                None,
+                shutdown_event,
+                log_prefix="[ACTOR] parameters",
+            )
+            if message is None:
+                break
+
+            state_dicts = decoder.decode(message)
+            if state_dicts is None:
+                logging.debug("[ACTOR] Skip stale parameters")
+                continue
+            logging.debug(f"[ACTOR] Received parameters version {decoder.version}")
+            parameters_queue.put(state_to_bytes(state_dicts))
 
     except grpc.RpcError as e:
         logging.error(f"[ACTOR] gRPC error: {e}")
@@ -542,10 +573,18 @@ def send_transitions(
         )
 
     try:
+        actor_learner_config = cfg.policy.actor_learner_config
         learner_client.SendTransitions(
             transitions_stream(
-                shutdown_event, transitions_queue, cfg.policy.actor_learner_config.queue_get_timeout
-            )
+                shutdown_event,
+                transitions_queue,
+                actor_learner_config.queue_get_timeout,
+                batch_bytes=actor_learner_config.transitions_batch_bytes,
+                batch_timeout=actor_learner_config.transitions_batch_timeout,
+                stats=StreamStats("[ACTOR] transitions", actor_learner_config.stream_stats_log_interval),
+            ),
+            metadata=actor_metadata(cfg),
+            compression=grpc_compression(actor_learner_config.transitions_compression),
         )
     except grpc.RpcError as e:
         logging.error(f"[ACTOR] gRPC error: {e}")
@@ -598,7 +637,9 @@ def send_interactions(
         learner_client.SendInteractions(
             interactions_stream(
                 shutdown_event, interactions_queue, cfg.policy.actor_learner_config.queue_get_timeout
-            )
+            ),
+            metadata=actor_metadata(cfg),
+            compression=grpc_compression(cfg.policy.actor_learner_config.interactions_compression),
         )
     except grpc.RpcError as e:
         logging.error(f"[ACTOR] gRPC error: {e}")
@@ -610,7 +651,19 @@ def send_interactions(
     logging.info("[ACTOR] Interactions process stopped")
 
 
-def transitions_stream(shutdown_event: Event, transitions_queue: Queue, timeout: float) -> services_pb2.Empty:  # type: ignore
+def transitions_stream(
+    shutdown_event: Event,  # type: ignore
+    transitions_queue: Queue,
+    timeout: float,
+    batch_bytes: int = 0,
+    batch_timeout: float = 0.0,
+    stats: StreamStats | None = None,
+) -> services_pb2.Empty:
+    """Stream the transition messages of the queue.
+
+    Messages smaller than `batch_bytes` are coalesced with the next ones of the queue, for at most
+    `batch_timeout` seconds, so that short episodes are sent in fewer and larger messages.
+    """
     while not shutdown_event.is_set():
         try:
             message = transitions_queue.get(block=True, timeout=timeout)
@@ -618,6 +671,26 @@ def transitions_stream(shutdown_event: Event, transitions_queue: Queue, timeout:
             logging.debug("[ACTOR] Transition queue is empty")
             continue
 
+        messages = [message]
+        size = len(message)
+        deadline = time.perf_counter() + batch_timeout
+        while size < batch_bytes and not shutdown_event.is_set():
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                message = transitions_queue.get(block=True, timeout=remaining)
+            except Empty:
+                break
+            messages.append(message)
+            size += len(message)
+
+        start_time = time.perf_counter()
+        if len(messages) > 1:
+            message = transitions_to_bytes([t for m in messages for t in bytes_to_transitions(m)])
+        if stats is not None:
+            stats.record(len(message), time.perf_counter() - start_time)
+
         yield from send_bytes_in_chunks(
             message, services_pb2.Transition, log_prefix="[ACTOR] Send transitions"
         )
@@ -658,37 +731,42 @@ def update_policy_parameters(policy: SACPolicy, parameters_queue: Queue, device)
         # TODO: check encoder parameter synchronization possible issues:
         # 1. When shared_encoder=True, we're loading stale encoder params from actor's state_dict
         #    instead of the updated encoder params from critic (which is optimized separately)
-        # 2. When freeze_vision_encoder=True, we waste bandwidth sending/loading frozen params
-        # 3. Need to handle encoder params correctly for both actor and discrete_critic
+        # 2. Need to handle encoder params correctly for both actor and discrete_critic
         # Potential fixes:
         # - Send critic's encoder state when shared_encoder=True
-        # - Skip encoder params entirely when freeze_vision_encoder=True
         # - Ensure discrete_critic gets correct encoder state (currently uses encoder_critic)
 
-        # Load actor state dict
+        # Load actor state dict, which only holds the trainable tensors
         actor_state_dict = move_state_dict_to_device(state_dicts["policy"], device=device)
-        policy.actor.load_state_dict(actor_state_dict)
+        load_trainable_state_dict(policy.actor, actor_state_dict)
 
         # Load discrete critic if present
         if hasattr(policy, "discrete_critic") and "discrete_critic" in state_dicts:
             discrete_critic_state_dict = move_state_dict_to_device(
                 state_dicts["discrete_critic"], device=device
             )
-            policy.discrete_critic.load_state_dict(discrete_critic_state_dict)
+            load_trainable_state_dict(policy.discrete_critic, discrete_critic_state_dict)
             logging.info("[ACTOR] Loaded discrete critic parameters from Learner.")
 
 
 #  Utilities functions
 
 
-def push_transitions_to_transport_queue(transitions: list, transitions_queue):
+def push_transitions_to_transport_queue(
+    transitions: list,
+    transitions_queue,
+    compress_images: bool = False,
+    stats: StreamStats | None = None,
+):
     """Send transitions to learner in smaller chunks to avoid network issues.
 
     Args:
         transitions: List of transitions to send
         message_queue: Queue to send messages to learner
-        chunk_size: Size of each chunk to send
+        compress_images: Send the images as uint8 instead of floats
+        stats: Statistics of the serialization of the transitions
     """
+    start_time = time.perf_counter()
     transition_to_send_to_learner = []
     for transition in transitions:
         tr = move_transition_to_device(transition=transition, device="cpu")
@@ -696,9 +774,14 @@ def push_transitions_to_transport_queue(transitions: list, transitions_queue):
             if torch.isnan(value).any():
                 logging.warning(f"Found NaN values in transition {key}")
 
+        if compress_images:
+            tr = compress_transition_images(tr)
         transition_to_send_to_learner.append(tr)
 
-    transitions_queue.put(transitions_to_bytes(transition_to_send_to_learner))
+    message = transitions_to_bytes(transition_to_send_to_learner)
+    if stats is not None:
+        stats.record(len(message), time.perf_counter() - start_time)
+    transitions_queue.put(message)
 
 
 def get_frequency_stats(timer: TimerManager) -> dict[str, float]:
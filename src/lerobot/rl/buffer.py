@@ -15,8 +15,13 @@
 # limitations under the License.
 
 import functools
+import json
+import os
+import threading
+import time
 from collections.abc import Callable, Sequence
 from contextlib import suppress
+from pathlib import Path
 from typing import TypedDict
 
 import torch
@@ -24,8 +29,27 @@ import torch.nn.functional as F  # noqa: N812
 from tqdm import tqdm
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
+from lerobot.datasets.utils import _make_memmap_safe
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, REWARD
-from lerobot.utils.transition import Transition
+from lerobot.utils.transition import Transition, move_state_dict_to_device
+
+# File describing the layout of the memory-mapped files of a ReplayBuffer with a `storage_dir`
+BUFFER_LAYOUT_FILE = "buffer_layout.json"
+# Memory-mapped file holding the position, size and max priority of a ReplayBuffer with a `storage_dir`
+BUFFER_CURSOR_FILE = "_cursor"
+# Attributes of a ReplayBuffer holding its storage tensors, memory-mapped if it has a `storage_dir`
+_MEMMAP_ATTRIBUTES = [
+    "states",
+    "next_states",
+    "actions",
+    "rewards",
+    "dones",
+    "truncateds",
+    "complementary_info",
+    "frames",
+    "state_frames",
+    "next_state_frames",
+]
 
 
 class BatchTransition(TypedDict):
@@ -36,6 +60,10 @@ class BatchTransition(TypedDict):
     done: torch.Tensor
     truncated: torch.Tensor
     complementary_info: dict[str, torch.Tensor | float | int] | None = None
+    # Buffer indices of the sampled transitions, used to update their priorities
+    indices: torch.Tensor | None = None
+    # Importance sampling weights, only present when sampling with priorities
+    weights: torch.Tensor | None = None
 
 
 def random_crop_vectorized(images: torch.Tensor, output_size: tuple) -> torch.Tensor:
@@ -77,6 +105,54 @@ def random_shift(images: torch.Tensor, pad: int = 4):
     return random_crop_vectorized(images=images, output_size=(h, w))
 
 
+class SumTree:
+    """
+    Vectorized sum-tree over `capacity` non-negative priorities, stored as a flat tensor on `device`.
+
+    The leaves hold the priorities and every inner node holds the sum of its two children. Batches of
+    priorities are updated and batches of indices are sampled proportionally to their priorities one
+    tree level at a time, in O(log N) tensor operations.
+    """
+
+    def __init__(self, capacity: int, device: str = "cpu"):
+        self.capacity = capacity
+        self.num_leaves = 1 << max(0, (capacity - 1).bit_length())
+        self.depth = self.num_leaves.bit_length() - 1
+        self.tree = torch.zeros(2 * self.num_leaves, dtype=torch.float64, device=device)
+
+    @property
+    def total(self) -> torch.Tensor:
+        return self.tree[1]
+
+    def get(self, indices: torch.Tensor) -> torch.Tensor:
+        return self.tree[indices.to(self.tree.device) + self.num_leaves]
+
+    def update(self, indices: torch.Tensor, priorities: torch.Tensor) -> None:
+        nodes = indices.to(self.tree.device).long() + self.num_leaves
+        self.tree[nodes] = priorities.to(self.tree)
+        for _ in range(self.depth):
+            nodes = torch.unique(nodes // 2)
+            self.tree[nodes] = self.tree[2 * nodes] + self.tree[2 * nodes + 1]
+
+    def sample(self, batch_size: int) -> torch.Tensor:
+        """Sample `batch_size` indices with stratified sampling over the total priority."""
+        device = self.tree.device
+        targets = torch.arange(batch_size, device=device) + torch.rand(
+            batch_size, dtype=torch.float64, device=device
+        )
+        targets = targets * (self.total / batch_size)
+
+        nodes = torch.ones(batch_size, dtype=torch.long, device=device)
+        for _ in range(self.depth):
+            left = self.tree[2 * nodes]
+            right = self.tree[2 * nodes + 1]
+            # Never descend into an empty subtree, even with floating point errors in the sums
+            go_right = ((targets >= left) & (right > 0)) | (left <= 0)
+            targets = torch.where(go_right, targets - left, targets)
+            nodes = 2 * nodes + go_right.long()
+        return nodes - self.num_leaves
+
+
 class ReplayBuffer:
     def __init__(
         self,
@@ -87,6 +163,12 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+        priority_beta: float = 0.4,
+        priority_eps: float = 1e-6,
+        compress_images: bool = False,
+        storage_dir: str | Path | None = None,
     ):
         """
         Replay buffer for storing transitions.
@@ -104,9 +186,27 @@ class ReplayBuffer:
                 Using "cpu" can help save GPU memory.
             optimize_memory (bool): If True, optimizes memory by not storing duplicate next_states when
                 they can be derived from states. This is useful for large datasets where next_state[i] = state[i+1].
+            prioritized (bool): If True, transitions are sampled proportionally to their priority (prioritized
+                experience replay), and the sampled batches contain importance sampling weights. New transitions
+                get the highest priority seen so far, and priorities are updated with `update_priorities`.
+            priority_alpha (float): Exponent applied to the priorities, 0 corresponds to uniform sampling.
+            priority_beta (float): Exponent of the importance sampling weights, 1 fully compensates the bias.
+            priority_eps (float): Small value added to the TD errors so that no transition has a zero priority.
+            compress_images (bool): If True, images (keys starting with `observation.image`), expected as floats
+                in [0, 1], are stored as uint8 and converted back to floats on the target device when sampling.
+                Without `optimize_memory`, image frames are also shared between `state` and `next_state`: a
+                state equal to the next state of the previous transition reuses its frame.
+            storage_dir (str | Path | None): If provided, the buffer is stored in fixed-layout numpy memmap
+                files in this directory instead of in memory, so that its capacity is only limited by the disk.
+                Transitions are written to the files as they are added, so they survive a crash of the
+                process, and `flush` makes sure they are written to disk. If the directory already contains a
+                buffer, it is opened and restored (used for training resumption). Requires a "cpu"
+                `storage_device`.
         """
         if capacity <= 0:
             raise ValueError("Capacity must be greater than 0.")
+        if storage_dir is not None and torch.device(storage_device).type != "cpu":
+            raise ValueError("A ReplayBuffer with a storage_dir must use the 'cpu' storage device.")
 
         self.capacity = capacity
         self.device = device
@@ -115,12 +215,21 @@ class ReplayBuffer:
         self.size = 0
         self.initialized = False
         self.optimize_memory = optimize_memory
+        self.compress_images = compress_images
+
+        self.storage_dir = Path(storage_dir) if storage_dir is not None else None
+        self._memmaps = []
+        # Shared position, size and max priority, for a memory-mapped or shared memory buffer
+        self._cursor = None
+        if self.storage_dir is not None:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            self._cursor = self._allocate(BUFFER_CURSOR_FILE, (3,), torch.float64, zeros=True)
 
         # Track episode boundaries for memory optimization
-        self.episode_ends = torch.zeros(capacity, dtype=torch.bool, device=storage_device)
+        self.episode_ends = self._allocate("episode_ends", (capacity,), torch.bool, zeros=True)
 
         # If no state_keys provided, default to an empty list
-        self.state_keys = state_keys if state_keys is not None else []
+        self.state_keys = list(state_keys) if state_keys is not None else []
 
         self.image_augmentation_function = image_augmentation_function
 
@@ -128,6 +237,45 @@ class ReplayBuffer:
             base_function = functools.partial(random_shift, pad=4)
             self.image_augmentation_function = torch.compile(base_function)
         self.use_drq = use_drq
+        self._default_augmentation = image_augmentation_function is None
+
+        # Duration of the last `sample` call, and time spent waiting for the last batch of an iterator
+        self.sample_latency_s = 0.0
+        self.batch_wait_s = 0.0
+
+        self.prioritized = prioritized
+        self.priority_alpha = priority_alpha
+        self.priority_beta = priority_beta
+        self.priority_eps = priority_eps
+        self.max_priority = 1.0
+        self.sum_tree = SumTree(capacity, device=storage_device) if prioritized else None
+        # Sampling may happen in a prefetching thread while the learner updates the priorities
+        self._priority_lock = threading.Lock()
+
+        if self.storage_dir is not None and (self.storage_dir / BUFFER_LAYOUT_FILE).exists():
+            self._restore_storage()
+
+    def __getstate__(self) -> dict:
+        state = self.__dict__.copy()
+        if self._default_augmentation:
+            # The compiled default augmentation can't be pickled, it is compiled again when unpickling
+            state["image_augmentation_function"] = None
+        if self.storage_dir is not None:
+            # Pickling memory-mapped tensors would copy them to shared memory, the files are reopened instead
+            for key in [*_MEMMAP_ATTRIBUTES, "_memmaps", "_cursor", "episode_ends"]:
+                state.pop(key, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        if self._default_augmentation:
+            self.image_augmentation_function = torch.compile(functools.partial(random_shift, pad=4))
+        if self.storage_dir is not None:
+            self._memmaps = []
+            self._cursor = self._allocate(BUFFER_CURSOR_FILE, (3,), torch.float64, zeros=True)
+            self.episode_ends = self._allocate("episode_ends", (self.capacity,), torch.bool, zeros=True)
+            if self.initialized:
+                self._open_storage()
 
     def _initialize_storage(
         self,
@@ -137,53 +285,200 @@ class ReplayBuffer:
     ):
         """Initialize the storage tensors based on the first transition."""
         # Determine shapes from the first transition
-        state_shapes = {key: val.squeeze(0).shape for key, val in state.items()}
-        action_shape = action.squeeze(0).shape
+        state_shapes = {key: tuple(val.squeeze(0).shape) for key, val in state.items()}
+        action_shape = tuple(action.squeeze(0).shape)
+
+        complementary_info_shapes = None
+        if complementary_info is not None:
+            complementary_info_shapes = {}
+            for key, value in complementary_info.items():
+                if isinstance(value, torch.Tensor):
+                    complementary_info_shapes[key] = tuple(value.squeeze(0).shape)
+                elif isinstance(value, (int | float)):
+                    # Handle scalar values similar to reward
+                    complementary_info_shapes[key] = ()
+                else:
+                    raise ValueError(f"Unsupported type {type(value)} for complementary_info[{key}]")
+
+        self._create_storage(state_shapes, action_shape, complementary_info_shapes)
+
+    def _create_storage(
+        self,
+        state_shapes: dict[str, tuple[int, ...]],
+        action_shape: tuple[int, ...],
+        complementary_info_shapes: dict[str, tuple[int, ...]] | None,
+    ):
+        """Allocate the storage tensors for transitions of the given shapes."""
+        self.stored_state_keys = list(state_shapes)
+        self.compressed_keys = (
+            [key for key in state_shapes if key.startswith(OBS_IMAGE)] if self.compress_images else []
+        )
+        # Without memory optimization, compressed images are stored in shared frame pools instead
+        pooled_keys = self.compressed_keys if not self.optimize_memory else []
 
         # Pre-allocate tensors for storage
         self.states = {
-            key: torch.empty((self.capacity, *shape), device=self.storage_device)
+            key: self._allocate(
+                f"states.{key}",
+                (self.capacity, *shape),
+                torch.uint8 if key in self.compressed_keys else torch.get_default_dtype(),
+            )
             for key, shape in state_shapes.items()
+            if key not in pooled_keys
         }
-        self.actions = torch.empty((self.capacity, *action_shape), device=self.storage_device)
-        self.rewards = torch.empty((self.capacity,), device=self.storage_device)
+        self.actions = self._allocate("actions", (self.capacity, *action_shape), torch.get_default_dtype())
+        self.rewards = self._allocate("rewards", (self.capacity,), torch.get_default_dtype())
 
         if not self.optimize_memory:
             # Standard approach: store states and next_states separately
             self.next_states = {
-                key: torch.empty((self.capacity, *shape), device=self.storage_device)
+                key: self._allocate(f"next_states.{key}", (self.capacity, *shape), torch.get_default_dtype())
                 for key, shape in state_shapes.items()
+                if key not in pooled_keys
             }
         else:
             # Memory-optimized approach: don't allocate next_states buffer
             # Just create a reference to states for consistent API
             self.next_states = self.states  # Just a reference for API consistency
 
-        self.dones = torch.empty((self.capacity,), dtype=torch.bool, device=self.storage_device)
-        self.truncateds = torch.empty((self.capacity,), dtype=torch.bool, device=self.storage_device)
+        # Frame pools of the compressed images: each transition references the frames of its state and next
+        # state, and frames are reference counted so that the pool only grows when no frame is free.
+        # Memory-mapped pools can't grow, but their untouched pages don't take any disk space.
+        pool_size = 2 * self.capacity if self.storage_dir is not None else self.capacity + 1
+        self.frames = {}
+        self.frame_refcounts = {}
+        self.free_frames = {}
+        self.state_frames = {}
+        self.next_state_frames = {}
+        self.last_next_frame = {}
+        for key in pooled_keys:
+            self.frames[key] = self._allocate(f"frames.{key}", (pool_size, *state_shapes[key]), torch.uint8)
+            self.frame_refcounts[key] = [0] * pool_size
+            self.free_frames[key] = list(range(pool_size - 1, -1, -1))
+            self.state_frames[key] = self._allocate(
+                f"state_frames.{key}", (self.capacity,), torch.long, zeros=True
+            )
+            self.next_state_frames[key] = self._allocate(
+                f"next_state_frames.{key}", (self.capacity,), torch.long, zeros=True
+            )
+            self.last_next_frame[key] = None
+
+        self.dones = self._allocate("dones", (self.capacity,), torch.bool)
+        self.truncateds = self._allocate("truncateds", (self.capacity,), torch.bool)
 
         # Initialize storage for complementary_info
-        self.has_complementary_info = complementary_info is not None
+        self.has_complementary_info = complementary_info_shapes is not None
         self.complementary_info_keys = []
         self.complementary_info = {}
 
         if self.has_complementary_info:
-            self.complementary_info_keys = list(complementary_info.keys())
+            self.complementary_info_keys = list(complementary_info_shapes)
             # Pre-allocate tensors for each key in complementary_info
-            for key, value in complementary_info.items():
-                if isinstance(value, torch.Tensor):
-                    value_shape = value.squeeze(0).shape
-                    self.complementary_info[key] = torch.empty(
-                        (self.capacity, *value_shape), device=self.storage_device
-                    )
-                elif isinstance(value, (int | float)):
-                    # Handle scalar values similar to reward
-                    self.complementary_info[key] = torch.empty((self.capacity,), device=self.storage_device)
-                else:
-                    raise ValueError(f"Unsupported type {type(value)} for complementary_info[{key}]")
+            for key, shape in complementary_info_shapes.items():
+                self.complementary_info[key] = self._allocate(
+                    f"complementary_info.{key}", (self.capacity, *shape), torch.get_default_dtype()
+                )
+
+        if self.storage_dir is not None and not (self.storage_dir / BUFFER_LAYOUT_FILE).exists():
+            layout = {
+                "capacity": self.capacity,
+                "optimize_memory": self.optimize_memory,
+                "compress_images": self.compress_images,
+                "state_shapes": state_shapes,
+                "action_shape": action_shape,
+                "complementary_info_shapes": complementary_info_shapes,
+            }
+            # Write the layout atomically, so that a buffer is never restored from a partial layout
+            tmp_path = self.storage_dir / f"{BUFFER_LAYOUT_FILE}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(layout, f, indent=4)
+            os.replace(tmp_path, self.storage_dir / BUFFER_LAYOUT_FILE)
 
         self.initialized = True
 
+    def _allocate(
+        self, name: str, shape: tuple[int, ...], dtype: torch.dtype, zeros: bool = False
+    ) -> torch.Tensor:
+        """Allocate a storage tensor, backed by a memmap file named `name` if the buffer has a `storage_dir`.
+
+        Existing memmap files are opened in read-write mode, and new ones are initialized with zeros.
+        """
+        if self.storage_dir is None:
+            if zeros:
+                return torch.zeros(shape, dtype=dtype, device=self.storage_device)
+            return torch.empty(shape, dtype=dtype, device=self.storage_device)
+
+        path = self.storage_dir / name
+        array = _make_memmap_safe(
+            filename=path,
+            dtype=torch.empty(0, dtype=dtype).numpy().dtype,
+            mode="r+" if path.exists() else "w+",
+            shape=shape,
+        )
+        self._memmaps.append(array)
+        return torch.from_numpy(array)
+
+    def _open_storage(self):
+        """Open the memory-mapped storage files described by the layout file of `storage_dir`."""
+        with open(self.storage_dir / BUFFER_LAYOUT_FILE) as f:
+            layout = json.load(f)
+        for key in ["capacity", "optimize_memory", "compress_images"]:
+            if layout[key] != getattr(self, key):
+                raise ValueError(
+                    f"The replay buffer stored in {self.storage_dir} has {key}={layout[key]}, "
+                    f"which differs from the requested {key}={getattr(self, key)}."
+                )
+
+        complementary_info_shapes = layout["complementary_info_shapes"]
+        self._create_storage(
+            state_shapes={key: tuple(shape) for key, shape in layout["state_shapes"].items()},
+            action_shape=tuple(layout["action_shape"]),
+            complementary_info_shapes={key: tuple(shape) for key, shape in complementary_info_shapes.items()}
+            if complementary_info_shapes is not None
+            else None,
+        )
+
+    def _restore_storage(self):
+        """Open and restore the state of a buffer previously stored in `storage_dir`."""
+        self._open_storage()
+        position, size, max_priority = self._cursor.tolist()
+        self.position, self.size = int(position), int(size)
+        self.max_priority = max(self.max_priority, max_priority)
+
+        valid_indices = torch.arange(self.size)
+        # Rebuild the reference counts of the frame pools from the transitions in the buffer
+        for key in self.frames:
+            refcounts = torch.bincount(
+                torch.cat(
+                    [self.state_frames[key][valid_indices], self.next_state_frames[key][valid_indices]]
+                ),
+                minlength=len(self.frame_refcounts[key]),
+            )
+            self.frame_refcounts[key] = refcounts.tolist()
+            self.free_frames[key] = torch.nonzero(refcounts == 0).flatten().flip(0).tolist()
+            if self.size > 0:
+                self.last_next_frame[key] = self.next_state_frames[key][
+                    (self.position - 1) % self.capacity
+                ].item()
+
+        # Priorities are not stored, all the restored transitions get the max priority
+        if self.prioritized and self.size > 0:
+            priorities = torch.full((self.size,), self.max_priority**self.priority_alpha, dtype=torch.float64)
+            if self.optimize_memory:
+                priorities[(self.position - 1) % self.capacity] = 0.0
+            self.sum_tree.update(valid_indices, priorities)
+
+    def flush(self) -> None:
+        """Flush the memory-mapped storage of a buffer with a `storage_dir` to disk.
+
+        The transitions are already in the memory-mapped files once added, so they survive a crash of the
+        process, but flushing also makes them survive a crash of the machine, e.g. before a checkpoint.
+        """
+        if self.storage_dir is None:
+            raise RuntimeError("Only a ReplayBuffer with a storage_dir can be flushed to disk.")
+        for array in self._memmaps:
+            array.flush()
+
     def __len__(self):
         return self.size
 
@@ -203,8 +498,15 @@ class ReplayBuffer:
             self._initialize_storage(state=state, action=action, complementary_info=complementary_info)
 
         # Store the transition in pre-allocated tensors
-        for key in self.states:
-            self.states[key][self.position].copy_(state[key].squeeze(dim=0))
+        for key in self.stored_state_keys:
+            if key in self.frames:
+                self._add_frames(key, state[key], next_state[key])
+                continue
+
+            value = state[key].squeeze(dim=0)
+            self.states[key][self.position].copy_(
+                self._compress_image(value) if key in self.compressed_keys else value
+            )
 
             if not self.optimize_memory:
                 # Only store next_states if not optimizing memory
@@ -226,38 +528,42 @@ class ReplayBuffer:
                     elif isinstance(value, (int | float)):
                         self.complementary_info[key][self.position] = value
 
+        if self.prioritized:
+            self._set_new_transition_priority()
+
         self.position = (self.position + 1) % self.capacity
         self.size = min(self.size + 1, self.capacity)
+        if self._cursor is not None:
+            # Only count the transition as stored once it is fully written
+            self._cursor[:2] = torch.tensor([self.position, self.size], dtype=torch.float64)
 
     def sample(self, batch_size: int) -> BatchTransition:
         """Sample a random batch of transitions and collate them into batched tensors."""
         if not self.initialized:
             raise RuntimeError("Cannot sample from an empty buffer. Add transitions first.")
+        start_time = time.perf_counter()
 
         batch_size = min(batch_size, self.size)
-        high = max(0, self.size - 1) if self.optimize_memory and self.size < self.capacity else self.size
+        batch_weights = None
+        if self.prioritized:
+            idx, batch_weights = self._sample_prioritized_indices(batch_size)
+        else:
+            high = max(0, self.size - 1) if self.optimize_memory and self.size < self.capacity else self.size
 
-        # Random indices for sampling - create on the same device as storage
-        idx = torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
+            # Random indices for sampling - create on the same device as storage
+            idx = torch.randint(low=0, high=high, size=(batch_size,), device=self.storage_device)
 
         # Identify image keys that need augmentation
-        image_keys = [k for k in self.states if k.startswith(OBS_IMAGE)] if self.use_drq else []
+        image_keys = [k for k in self.stored_state_keys if k.startswith(OBS_IMAGE)] if self.use_drq else []
 
         # Create batched state and next_state
         batch_state = {}
         batch_next_state = {}
 
         # First pass: load all state tensors to target device
-        for key in self.states:
-            batch_state[key] = self.states[key][idx].to(self.device)
-
-            if not self.optimize_memory:
-                # Standard approach - load next_states directly
-                batch_next_state[key] = self.next_states[key][idx].to(self.device)
-            else:
-                # Memory-optimized approach - get next_state from the next index
-                next_idx = (idx + 1) % self.capacity
-                batch_next_state[key] = self.states[key][next_idx].to(self.device)
+        for key in self.stored_state_keys:
+            batch_state[key] = self._get_states(key, idx, device=self.device)
+            batch_next_state[key] = self._get_next_states(key, idx, device=self.device)
 
         # Apply image augmentation in a batched way if needed
         if self.use_drq and image_keys:
@@ -293,7 +599,7 @@ class ReplayBuffer:
             for key in self.complementary_info_keys:
                 batch_complementary_info[key] = self.complementary_info[key][idx].to(self.device)
 
-        return BatchTransition(
+        batch = BatchTransition(
             state=batch_state,
             action=batch_actions,
             reward=batch_rewards,
@@ -301,28 +607,230 @@ class ReplayBuffer:
             done=batch_dones,
             truncated=batch_truncateds,
             complementary_info=batch_complementary_info,
+            indices=idx.to(self.device),
         )
+        if batch_weights is not None:
+            batch["weights"] = batch_weights
+        self.sample_latency_s = time.perf_counter() - start_time
+        return batch
+
+    @property
+    def nbytes(self) -> int:
+        """Number of bytes allocated by the storage of the buffer."""
+        return sum(tensor.nbytes for tensor in self._storage_tensors())
+
+    def _storage_tensors(self) -> list[torch.Tensor]:
+        """Get all the tensors storing the transitions."""
+        tensors = [self.episode_ends]
+        if self.initialized:
+            for key in _MEMMAP_ATTRIBUTES:
+                value = getattr(self, key)
+                tensors += list(value.values()) if isinstance(value, dict) else [value]
+        # With memory optimization, next_states holds the same tensors as states
+        return list({id(tensor): tensor for tensor in tensors}.values())
+
+    def share_memory_(self) -> "ReplayBuffer":
+        """Move the storage of the buffer to shared memory, so that it can be sampled by other processes.
+
+        The transitions added afterwards are visible from the processes the buffer is sent to, e.g. through
+        `torch.multiprocessing`. Memory-mapped storages are already shared through their files, and are
+        reopened by the processes instead of being sent.
+        """
+        if not self.initialized:
+            raise RuntimeError("Cannot share the storage of an empty buffer. Add transitions first.")
+        if torch.device(self.storage_device).type != "cpu":
+            raise ValueError("Only a ReplayBuffer with the 'cpu' storage device can be shared.")
+
+        if self._cursor is None:
+            self._cursor = torch.tensor([self.position, self.size, self.max_priority], dtype=torch.float64)
+            self._cursor.share_memory_()
+        if self.storage_dir is None:
+            # Shared frame pools can't be reallocated, so they are grown to their maximum size first
+            for key in self.frames:
+                self._grow_frame_pool(key, 2 * self.capacity)
+            for tensor in self._storage_tensors():
+                tensor.share_memory_()
+        if self.sum_tree is not None:
+            self.sum_tree.tree.share_memory_()
+        if isinstance(self._priority_lock, type(threading.Lock())):
+            self._priority_lock = torch.multiprocessing.get_context("spawn").Lock()
+        return self
+
+    def _sync_cursor(self) -> None:
+        """Read the position and size of a shared buffer, updated by the process adding transitions."""
+        position, size, _ = self._cursor.tolist()
+        self.position, self.size = int(position), int(size)
+
+    @property
+    def bytes_per_transition(self) -> float:
+        """Number of bytes allocated by the storage of the buffer per transition it can hold."""
+        return self.nbytes / self.capacity
+
+    def _get_states(self, key: str, idx: torch.Tensor, device: str | None = None) -> torch.Tensor:
+        """Get the state values of `key` of the transitions at `idx`, decompressed on `device`."""
+        if key in self.frames:
+            values = self.frames[key][self.state_frames[key][idx]]
+        else:
+            values = self.states[key][idx]
+        values = values.to(device)
+        return self._decompress_image(values) if key in self.compressed_keys else values
+
+    def _get_next_states(self, key: str, idx: torch.Tensor, device: str | None = None) -> torch.Tensor:
+        """Get the next state values of `key` of the transitions at `idx`, decompressed on `device`."""
+        if key in self.frames:
+            values = self.frames[key][self.next_state_frames[key][idx]].to(device)
+            return self._decompress_image(values)
+        if self.optimize_memory:
+            # Memory-optimized approach - get next_state from the next index
+            return self._get_states(key, (idx + 1) % self.capacity, device=device)
+        return self.next_states[key][idx].to(device)
+
+    @staticmethod
+    def _compress_image(image: torch.Tensor) -> torch.Tensor:
+        return (image * 255).round().clamp(0, 255).to(torch.uint8)
+
+    @staticmethod
+    def _decompress_image(image: torch.Tensor) -> torch.Tensor:
+        return image.to(torch.get_default_dtype()) / 255
+
+    def _add_frames(self, key: str, state: torch.Tensor, next_state: torch.Tensor) -> None:
+        """Store the image frames of `key` of the transition being added at `self.position` in the frame pool."""
+        frame = self._compress_image(state.squeeze(dim=0).to(self.storage_device))
+        next_frame = self._compress_image(next_state.squeeze(dim=0).to(self.storage_device))
+
+        # A state equal to the next state of the previous transition shares its frame
+        state_slot = self.last_next_frame[key]
+        if state_slot is not None and torch.equal(self.frames[key][state_slot], frame):
+            self.frame_refcounts[key][state_slot] += 1
+        else:
+            state_slot = None
+
+        # Release the frames of the overwritten transition before storing new ones, so that the frames of
+        # the transitions in the buffer never exceed 2 * capacity
+        if self.size == self.capacity:
+            self._release_frame(key, self.state_frames[key][self.position].item())
+            self._release_frame(key, self.next_state_frames[key][self.position].item())
+
+        if state_slot is None:
+            state_slot = self._store_frame(key, frame)
+        next_slot = self._store_frame(key, next_frame)
+
+        self.state_frames[key][self.position] = state_slot
+        self.next_state_frames[key][self.position] = next_slot
+        self.last_next_frame[key] = next_slot
+
+    def _store_frame(self, key: str, frame: torch.Tensor) -> int:
+        if not self.free_frames[key]:
+            # Every transition holds at most two frames, so the pool never needs more than 2 * capacity frames
+            pool_size = len(self.frame_refcounts[key])
+            self._grow_frame_pool(key, min(2 * self.capacity, pool_size + max(1, pool_size // 4)))
+
+        slot = self.free_frames[key].pop()
+        self.frames[key][slot].copy_(frame)
+        self.frame_refcounts[key][slot] = 1
+        return slot
+
+    def _grow_frame_pool(self, key: str, new_pool_size: int) -> None:
+        pool_size = len(self.frame_refcounts[key])
+        if new_pool_size <= pool_size:
+            return
+        self.frames[key] = torch.cat(
+            [
+                self.frames[key],
+                self.frames[key].new_empty((new_pool_size - pool_size, *self.frames[key].shape[1:])),
+            ]
+        )
+        self.frame_refcounts[key] += [0] * (new_pool_size - pool_size)
+        self.free_frames[key] = list(range(new_pool_size - 1, pool_size - 1, -1)) + self.free_frames[key]
+
+    def _release_frame(self, key: str, slot: int) -> None:
+        self.frame_refcounts[key][slot] -= 1
+        if self.frame_refcounts[key][slot] == 0:
+            self.free_frames[key].append(slot)
+
+    def update_priorities(self, indices: torch.Tensor, td_errors: torch.Tensor) -> None:
+        """Update the priorities of sampled transitions from their TD errors.
+
+        Args:
+            indices (torch.Tensor): Buffer indices of the transitions, as returned in `BatchTransition["indices"]`.
+            td_errors (torch.Tensor): TD errors of the transitions, of the same length as `indices`.
+        """
+        if not self.prioritized:
+            raise RuntimeError("Priorities can only be updated when the buffer is prioritized.")
+
+        indices = indices.to(self.storage_device)
+        priorities = td_errors.detach().abs().to(device=self.storage_device, dtype=torch.float64)
+        priorities = priorities + self.priority_eps
+
+        if self.optimize_memory:
+            # The last added transition must keep a zero priority until its next state is stored
+            keep = indices != (self.position - 1) % self.capacity
+            indices, priorities = indices[keep], priorities[keep]
+        if len(indices) == 0:
+            return
+
+        with self._priority_lock:
+            self.max_priority = max(self.max_priority, priorities.max().item())
+            if self._cursor is not None:
+                self._cursor[2] = self.max_priority
+            self.sum_tree.update(indices, priorities**self.priority_alpha)
+
+    def _set_new_transition_priority(self) -> None:
+        """Give the transition being added at `self.position` the highest priority seen so far."""
+        max_priority = torch.tensor([self.max_priority**self.priority_alpha], dtype=torch.float64)
+        with self._priority_lock:
+            if not self.optimize_memory:
+                self.sum_tree.update(torch.tensor([self.position]), max_priority)
+                return
+
+            # The next state of the new transition is only stored with the next transition, so it can't be
+            # sampled until then, while the previous transition can now be sampled.
+            self.sum_tree.update(torch.tensor([self.position]), torch.zeros(1, dtype=torch.float64))
+            if self.size > 0:
+                self.sum_tree.update(torch.tensor([(self.position - 1) % self.capacity]), max_priority)
+
+    def _sample_prioritized_indices(self, batch_size: int) -> tuple[torch.Tensor, torch.Tensor]:
+        """Sample indices proportionally to their priorities along with their importance sampling weights."""
+        with self._priority_lock:
+            if self.sum_tree.total <= 0:
+                raise RuntimeError(
+                    "Cannot sample from a prioritized buffer without any sampleable transition."
+                )
+            idx = self.sum_tree.sample(batch_size)
+            probabilities = self.sum_tree.get(idx) / self.sum_tree.total
+
+        weights = (self.size * probabilities) ** (-self.priority_beta)
+        weights = (weights / weights.max()).float().to(self.device)
+        return idx, weights
 
     def get_iterator(
         self,
         batch_size: int,
         async_prefetch: bool = True,
         queue_size: int = 2,
+        num_workers: int = 0,
     ):
         """
         Creates an infinite iterator that yields batches of transitions.
         Will automatically restart when internal iterator is exhausted.
+        The time spent waiting for each batch is stored in `batch_wait_s`.
 
         Args:
             batch_size (int): Size of batches to sample
             async_prefetch (bool): Whether to use asynchronous prefetching with threads (default: True)
             queue_size (int): Number of batches to prefetch (default: 2)
+            num_workers (int): If greater than 0, batches are sampled by this many worker processes reading the
+                buffer from shared memory instead of by a thread, see `_get_multiprocess_iterator` (default: 0)
 
         Yields:
             BatchTransition: Batched transitions
         """
         while True:  # Create an infinite loop
-            if async_prefetch:
+            if num_workers > 0:
+                iterator = self._get_multiprocess_iterator(
+                    batch_size=batch_size, num_workers=num_workers, queue_size=queue_size
+                )
+            elif async_prefetch:
                 # Get the standard iterator
                 iterator = self._get_async_iterator(queue_size=queue_size, batch_size=batch_size)
             else:
@@ -330,7 +838,71 @@ class ReplayBuffer:
 
             # Yield all items from the iterator
             with suppress(StopIteration):
-                yield from iterator
+                while True:
+                    start_time = time.perf_counter()
+                    batch = next(iterator)
+                    self.batch_wait_s = time.perf_counter() - start_time
+                    yield batch
+
+    def _get_multiprocess_iterator(self, batch_size: int, num_workers: int, queue_size: int = 2):
+        """
+        Create an iterator that yields batches sampled by worker processes.
+
+        The storage of the buffer is moved to shared memory (see `share_memory_`), so that the workers see the
+        transitions added afterwards. Each worker gathers and augments batches on the CPU, outside of the GIL
+        of the training loop, and hands them over through a `torch.multiprocessing` queue, which shares their
+        memory instead of copying them. The batches are moved to `self.device` when they are yielded, and the
+        time the worker took to sample them is stored in `sample_latency_s`.
+
+        Args:
+            batch_size (int): Size of batches to sample.
+            num_workers (int): Number of worker processes.
+            queue_size (int): Maximum number of prefetched batches to keep in memory.
+
+        Yields:
+            BatchTransition: A batch sampled from the replay buffer.
+        """
+        import queue
+
+        self.share_memory_()
+        ctx = torch.multiprocessing.get_context("spawn")
+        batch_queue = ctx.Queue(maxsize=queue_size)
+        shutdown_event = ctx.Event()
+        workers = [
+            ctx.Process(
+                target=_sampling_worker,
+                args=(
+                    self,
+                    batch_size,
+                    batch_queue,
+                    shutdown_event,
+                    (torch.initial_seed() + worker_idx + 1) % 2**63,
+                ),
+                daemon=True,
+            )
+            for worker_idx in range(num_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            while True:
+                try:
+                    batch, self.sample_latency_s = batch_queue.get(timeout=1.0)
+                except queue.Empty:
+                    if not any(worker.is_alive() for worker in workers):
+                        raise RuntimeError(
+                            "The replay buffer sampling workers exited unexpectedly."
+                        ) from None
+                    continue
+                yield move_state_dict_to_device(batch, device=self.device)
+        finally:
+            # The workers check the shutdown event between their attempts to put a batch in the queue
+            shutdown_event.set()
+            for worker in workers:
+                worker.join(timeout=1.0)
+                if worker.is_alive():
+                    worker.terminate()
 
     def _get_async_iterator(self, batch_size: int, queue_size: int = 2):
         """
@@ -422,6 +994,10 @@ class ReplayBuffer:
         use_drq: bool = True,
         storage_device: str = "cpu",
         optimize_memory: bool = False,
+        prioritized: bool = False,
+        priority_alpha: float = 0.6,
+        priority_beta: float = 0.4,
+        compress_images: bool = False,
     ) -> "ReplayBuffer":
         """
         Convert a LeRobotDataset into a ReplayBuffer.
@@ -437,6 +1013,10 @@ class ReplayBuffer:
             use_drq (bool): Whether to use DrQ image augmentation when sampling.
             storage_device (str): Device for storing tensor data. Using "cpu" saves GPU memory.
             optimize_memory (bool): If True, reduces memory usage by not duplicating state data.
+            prioritized (bool): If True, sample transitions proportionally to their priority.
+            priority_alpha (float): Exponent applied to the priorities.
+            priority_beta (float): Exponent of the importance sampling weights.
+            compress_images (bool): If True, store images as uint8 and share frames between states.
 
         Returns:
             ReplayBuffer: The replay buffer with dataset transitions.
@@ -458,6 +1038,10 @@ class ReplayBuffer:
             use_drq=use_drq,
             storage_device=storage_device,
             optimize_memory=optimize_memory,
+            prioritized=prioritized,
+            priority_alpha=priority_alpha,
+            priority_beta=priority_beta,
+            compress_images=compress_images,
         )
 
         # Convert dataset to transitions
@@ -538,8 +1122,8 @@ class ReplayBuffer:
         features[DONE] = {"dtype": "bool", "shape": (1,)}
 
         # Add state keys
-        for key in self.states:
-            sample_val = self.states[key][0]
+        for key in self.stored_state_keys:
+            sample_val = self._get_states(key, torch.tensor([0], device=self.storage_device))[0]
             f_info = guess_feature_info(t=sample_val, name=key)
             features[key] = f_info
 
@@ -573,8 +1157,10 @@ class ReplayBuffer:
             frame_dict = {}
 
             # Fill the data for state keys
-            for key in self.states:
-                frame_dict[key] = self.states[key][actual_idx].cpu()
+            for key in self.stored_state_keys:
+                frame_dict[key] = self._get_states(
+                    key, torch.tensor([actual_idx], device=self.storage_device)
+                )[0].cpu()
 
             # Fill action, reward, done
             frame_dict[ACTION] = self.actions[actual_idx].cpu()
@@ -758,6 +1344,34 @@ def guess_feature_info(t, name: str):
         }
 
 
+def _sampling_worker(
+    replay_buffer: ReplayBuffer,
+    batch_size: int,
+    batch_queue: torch.multiprocessing.Queue,
+    shutdown_event: torch.multiprocessing.Event,
+    seed: int,
+) -> None:
+    """Sample batches on the CPU from a shared replay buffer and put them in `batch_queue` until shutdown."""
+    import queue
+
+    # Don't wait for the batches left in the queue to be consumed when exiting
+    batch_queue.cancel_join_thread()
+    torch.manual_seed(seed)
+    # Workers run in parallel, each one doesn't need the intra-op threads of the whole machine
+    torch.set_num_threads(1)
+    replay_buffer.device = "cpu"
+
+    while not shutdown_event.is_set():
+        replay_buffer._sync_cursor()
+        batch = replay_buffer.sample(batch_size)
+        while not shutdown_event.is_set():
+            try:
+                batch_queue.put((batch, replay_buffer.sample_latency_s), timeout=0.5)
+                break
+            except queue.Full:
+                continue
+
+
 def concatenate_batch_transitions(
     left_batch_transitions: BatchTransition, right_batch_transition: BatchTransition
 ) -> BatchTransition:
@@ -778,6 +1392,10 @@ def concatenate_batch_transitions(
 
     Warning:
         This function modifies the left_batch_transitions object in place.
+
+    Note:
+        The `indices` of the result are those of the left batch, which comes first, since indices of
+        different buffers can't be mixed. Missing importance sampling weights are set to 1.
     """
     # Concatenate state fields
     left_batch_transitions["state"] = {
@@ -831,4 +1449,14 @@ def concatenate_batch_transitions(
                 else:
                     left_info[key] = right_info[key]
 
+    # Handle importance sampling weights
+    left_weights = left_batch_transitions.get("weights")
+    right_weights = right_batch_transition.get("weights")
+    if left_weights is not None or right_weights is not None:
+        if left_weights is None:
+            left_weights = torch.ones_like(left_batch_transitions["reward"])
+        if right_weights is None:
+            right_weights = torch.ones_like(right_batch_transition["reward"])
+        left_batch_transitions["weights"] = torch.cat([left_weights, right_weights], dim=0)
+
     return left_batch_transitions
@@ -66,7 +66,8 @@ from lerobot.datasets.factory import make_dataset
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
 from lerobot.policies.factory import make_policy
 from lerobot.policies.sac.modeling_sac import SACPolicy
-from lerobot.rl.buffer import ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.buffer import BUFFER_LAYOUT_FILE, ReplayBuffer, concatenate_batch_transitions
+from lerobot.rl.parameter_sync import ParameterEncoder, trainable_state_dict
 from lerobot.rl.process import ProcessSignalHandler
 from lerobot.rl.wandb_utils import WandBLogger
 from lerobot.robots import so100_follower  # noqa: F401
@@ -77,7 +78,6 @@ from lerobot.transport.utils import (
     MAX_MESSAGE_SIZE,
     bytes_to_python_object,
     bytes_to_transitions,
-    state_to_bytes,
 )
 from lerobot.utils.constants import (
     ACTION,
@@ -93,7 +93,7 @@ from lerobot.utils.train_utils import (
     save_checkpoint,
     update_last_checkpoint,
 )
-from lerobot.utils.transition import move_state_dict_to_device, move_transition_to_device
+from lerobot.utils.transition import decompress_transition_images, move_transition_to_device
 from lerobot.utils.utils import (
     format_big_number,
     get_safe_torch_device,
@@ -190,8 +190,10 @@ def start_learner_threads(
         wandb_logger (WandBLogger | None): Logger for metrics
         shutdown_event: Event to signal shutdown
     """
-    # Create multiprocessing queues
-    transition_queue = Queue()
+    # Create multiprocessing queues, the transition queue is bounded so that the actors are slowed down
+    # when the learner can't keep up
+    actor_learner_config = cfg.policy.actor_learner_config
+    transition_queue = Queue(maxsize=actor_learner_config.max_actors * actor_learner_config.actor_queue_size)
     interaction_message_queue = Queue()
     parameters_queue = Queue()
 
@@ -315,7 +317,8 @@ def add_actor_information_and_train(
 
     policy.train()
 
-    push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+    parameters_version = 0
+    push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy, version=parameters_version)
 
     last_time_policy_pushed = time.time()
 
@@ -382,12 +385,18 @@ def add_actor_information_and_train(
 
         if online_iterator is None:
             online_iterator = replay_buffer.get_iterator(
-                batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
+                batch_size=batch_size,
+                async_prefetch=async_prefetch,
+                queue_size=2,
+                num_workers=cfg.policy.num_sampling_workers,
             )
 
         if offline_replay_buffer is not None and offline_iterator is None:
             offline_iterator = offline_replay_buffer.get_iterator(
-                batch_size=batch_size, async_prefetch=async_prefetch, queue_size=2
+                batch_size=batch_size,
+                async_prefetch=async_prefetch,
+                queue_size=2,
+                num_workers=cfg.policy.num_sampling_workers,
             )
 
         time_for_one_optimization_step = time.time()
@@ -422,10 +431,12 @@ def add_actor_information_and_train(
                 "observation_feature": observation_features,
                 "next_observation_feature": next_observation_features,
                 "complementary_info": batch["complementary_info"],
+                "weights": batch.get("weights"),
             }
 
             # Use the forward method for critic loss
             critic_output = policy.forward(forward_batch, model="critic")
+            update_replay_priorities(replay_buffer, batch, critic_output)
 
             # Main critic optimization
             loss_critic = critic_output["loss_critic"]
@@ -480,9 +491,11 @@ def add_actor_information_and_train(
             "done": done,
             "observation_feature": observation_features,
             "next_observation_feature": next_observation_features,
+            "weights": batch.get("weights"),
         }
 
         critic_output = policy.forward(forward_batch, model="critic")
+        update_replay_priorities(replay_buffer, batch, critic_output)
 
         loss_critic = critic_output["loss_critic"]
         optimizers["critic"].zero_grad()
@@ -550,7 +563,10 @@ def add_actor_information_and_train(
 
         # Push policy to actors if needed
         if time.time() - last_time_policy_pushed > policy_parameters_push_frequency:
-            push_actor_policy_to_queue(parameters_queue=parameters_queue, policy=policy)
+            parameters_version += 1
+            push_actor_policy_to_queue(
+                parameters_queue=parameters_queue, policy=policy, version=parameters_version
+            )
             last_time_policy_pushed = time.time()
 
         # Update target networks (main and discrete)
@@ -559,6 +575,9 @@ def add_actor_information_and_train(
         # Log training metrics at specified intervals
         if optimization_step % log_freq == 0:
             training_infos["replay_buffer_size"] = len(replay_buffer)
+            training_infos["replay_buffer_bytes_per_transition"] = replay_buffer.bytes_per_transition
+            training_infos["replay_buffer_sample_latency_s"] = replay_buffer.sample_latency_s
+            training_infos["replay_buffer_wait_s"] = replay_buffer.batch_wait_s
             if offline_replay_buffer is not None:
                 training_infos["offline_replay_buffer_size"] = len(offline_replay_buffer)
             training_infos["Optimization step"] = optimization_step
@@ -646,10 +665,15 @@ def start_learner(
         transition_queue=transition_queue,
         interaction_message_queue=interaction_message_queue,
         queue_get_timeout=cfg.policy.actor_learner_config.queue_get_timeout,
+        parameters_delta_encoding=cfg.policy.actor_learner_config.parameters_delta_encoding,
+        parameters_quantization=cfg.policy.actor_learner_config.parameters_quantization,
+        actor_queue_size=cfg.policy.actor_learner_config.actor_queue_size,
+        stats_log_interval=cfg.policy.actor_learner_config.stream_stats_log_interval,
+        parameters_compression=cfg.policy.actor_learner_config.parameters_compression,
     )
 
     server = grpc.server(
-        ThreadPoolExecutor(max_workers=MAX_WORKERS),
+        ThreadPoolExecutor(max_workers=MAX_WORKERS * cfg.policy.actor_learner_config.max_actors),
         options=[
             ("grpc.max_receive_message_length", MAX_MESSAGE_SIZE),
             ("grpc.max_send_message_length", MAX_MESSAGE_SIZE),
@@ -694,7 +718,7 @@ def save_training_checkpoint(
     2. Saves the policy model, configuration, and optimizer states
     3. Saves the current interaction step for resuming training
     4. Updates the "last" checkpoint symlink to point to this checkpoint
-    5. Saves the replay buffer as a dataset for later use
+    5. Saves the replay buffer as a dataset for later use, or flushes it if it is memory-mapped
     6. If an offline replay buffer exists, saves it as a separate dataset
 
     Args:
@@ -735,17 +759,21 @@ def save_training_checkpoint(
     # Update the "last" symlink
     update_last_checkpoint(checkpoint_dir)
 
-    # TODO : temporary save replay buffer here, remove later when on the robot
-    # We want to control this with the keyboard inputs
-    dataset_dir = os.path.join(cfg.output_dir, "dataset")
-    if os.path.exists(dataset_dir) and os.path.isdir(dataset_dir):
-        shutil.rmtree(dataset_dir)
-
-    # Save dataset
-    # NOTE: Handle the case where the dataset repo id is not specified in the config
-    # eg. RL training without demonstrations data
-    repo_id_buffer_save = cfg.env.task if dataset_repo_id is None else dataset_repo_id
-    replay_buffer.to_lerobot_dataset(repo_id=repo_id_buffer_save, fps=fps, root=dataset_dir)
+    if replay_buffer.storage_dir is not None:
+        # The memory-mapped replay buffer is already stored on disk, only make sure it is flushed
+        replay_buffer.flush()
+    else:
+        # TODO : temporary save replay buffer here, remove later when on the robot
+        # We want to control this with the keyboard inputs
+        dataset_dir = os.path.join(cfg.output_dir, "dataset")
+        if os.path.exists(dataset_dir) and os.path.isdir(dataset_dir):
+            shutil.rmtree(dataset_dir)
+
+        # Save dataset
+        # NOTE: Handle the case where the dataset repo id is not specified in the config
+        # eg. RL training without demonstrations data
+        repo_id_buffer_save = cfg.env.task if dataset_repo_id is None else dataset_repo_id
+        replay_buffer.to_lerobot_dataset(repo_id=repo_id_buffer_save, fps=fps, root=dataset_dir)
 
     if offline_replay_buffer is not None:
         dataset_offline_dir = os.path.join(cfg.output_dir, "dataset_offline")
@@ -938,6 +966,9 @@ def initialize_replay_buffer(
     """
     Initialize a replay buffer, either empty or from a dataset if resuming.
 
+    With `memmap_online_buffer`, the buffer is stored in memory-mapped files in the output directory, and is
+    reopened from them when resuming.
+
     Args:
         cfg (TrainRLServerPipelineConfig): Training configuration
         device (str): Device to store tensors on
@@ -946,6 +977,27 @@ def initialize_replay_buffer(
     Returns:
         ReplayBuffer: Initialized replay buffer
     """
+    buffer_dir = os.path.join(cfg.output_dir, "replay_buffer")
+    if cfg.policy.memmap_online_buffer and (
+        not cfg.resume or os.path.exists(os.path.join(buffer_dir, BUFFER_LAYOUT_FILE))
+    ):
+        if not cfg.resume and os.path.isdir(buffer_dir):
+            # Left by a run that crashed before its first checkpoint, which can't be resumed
+            logging.warning(f"Removing the replay buffer of a previous run in {buffer_dir}")
+            shutil.rmtree(buffer_dir)
+        return ReplayBuffer(
+            capacity=cfg.policy.online_buffer_capacity,
+            device=device,
+            state_keys=cfg.policy.input_features.keys(),
+            storage_device="cpu",
+            optimize_memory=True,
+            prioritized=cfg.policy.prioritized_replay,
+            priority_alpha=cfg.policy.priority_alpha,
+            priority_beta=cfg.policy.priority_beta,
+            compress_images=cfg.policy.compress_buffer_images,
+            storage_dir=buffer_dir,
+        )
+
     if not cfg.resume:
         return ReplayBuffer(
             capacity=cfg.policy.online_buffer_capacity,
@@ -953,6 +1005,10 @@ def initialize_replay_buffer(
             state_keys=cfg.policy.input_features.keys(),
             storage_device=storage_device,
             optimize_memory=True,
+            prioritized=cfg.policy.prioritized_replay,
+            priority_alpha=cfg.policy.priority_alpha,
+            priority_beta=cfg.policy.priority_beta,
+            compress_images=cfg.policy.compress_buffer_images,
         )
 
     logging.info("Resume training load the online dataset")
@@ -972,6 +1028,10 @@ def initialize_replay_buffer(
         device=device,
         state_keys=cfg.policy.input_features.keys(),
         optimize_memory=True,
+        prioritized=cfg.policy.prioritized_replay,
+        priority_alpha=cfg.policy.priority_alpha,
+        priority_beta=cfg.policy.priority_beta,
+        compress_images=cfg.policy.compress_buffer_images,
     )
 
 
@@ -1010,6 +1070,7 @@ def initialize_offline_replay_buffer(
         storage_device=storage_device,
         optimize_memory=True,
         capacity=cfg.policy.offline_buffer_capacity,
+        compress_images=cfg.policy.compress_buffer_images,
     )
     return offline_replay_buffer
 
@@ -1044,6 +1105,24 @@ def get_observation_features(
     return observation_features, next_observation_features
 
 
+def update_replay_priorities(replay_buffer: ReplayBuffer, batch: dict, critic_output: dict) -> None:
+    """
+    Update the priorities of the online transitions of a batch from the TD errors of the critic.
+
+    The online transitions come first in the batch when it is concatenated with offline transitions, and
+    only them are updated since the offline buffer is sampled uniformly.
+
+    Args:
+        replay_buffer: The online replay buffer the batch was sampled from
+        batch: The sampled batch, with the buffer indices of its online transitions
+        critic_output: The output of the critic forward pass, with the per-transition TD errors
+    """
+    if not replay_buffer.prioritized:
+        return
+    indices = batch["indices"]
+    replay_buffer.update_priorities(indices, critic_output["td_error"][: len(indices)])
+
+
 def use_threads(cfg: TrainRLServerPipelineConfig) -> bool:
     return cfg.policy.concurrency.learner == "threads"
 
@@ -1094,21 +1173,20 @@ def check_nan_in_transition(
     return nan_detected
 
 
-def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module):
-    logging.debug("[LEARNER] Pushing actor policy to the queue")
+def push_actor_policy_to_queue(parameters_queue: Queue, policy: nn.Module, version: int = 0):
+    logging.debug(f"[LEARNER] Pushing actor policy version {version} to the queue")
 
-    # Create a dictionary to hold all the state dicts
-    state_dicts = {"policy": move_state_dict_to_device(policy.actor.state_dict(), device="cpu")}
+    # Create a dictionary to hold the trainable tensors of all the state dicts, the frozen ones (e.g. the
+    # vision encoder) are never updated on the actor
+    state_dicts = {"policy": trainable_state_dict(policy.actor)}
 
     # Add discrete critic if it exists
     if hasattr(policy, "discrete_critic") and policy.discrete_critic is not None:
-        state_dicts["discrete_critic"] = move_state_dict_to_device(
-            policy.discrete_critic.state_dict(), device="cpu"
-        )
+        state_dicts["discrete_critic"] = trainable_state_dict(policy.discrete_critic)
         logging.debug("[LEARNER] Including discrete critic in state dict push")
 
-    state_bytes = state_to_bytes(state_dicts)
-    parameters_queue.put(state_bytes)
+    # Each push is a full snapshot, the learner service encodes the deltas for each actor stream
+    parameters_queue.put(ParameterEncoder().encode(version, state_dicts))
 
 
 def process_interaction_message(
@@ -1149,6 +1227,8 @@ def process_transitions(
         transition_list = bytes_to_transitions(buffer=transition_list)
 
         for transition in transition_list:
+            # The actor may send the images as uint8
+            transition = decompress_transition_images(transition)
             transition = move_transition_to_device(transition=transition, device=device)
 
             # Skip transitions with NaN values
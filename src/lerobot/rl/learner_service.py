@@ -16,22 +16,91 @@
 # limitations under the License.
 
 import logging
+import queue
+import threading
 import time
+from dataclasses import dataclass, field
 from multiprocessing import Event, Queue
 
+from lerobot.rl.parameter_sync import ParameterDecoder, ParameterEncoder
 from lerobot.rl.queue import get_last_item_from_queue
 from lerobot.transport import services_pb2, services_pb2_grpc
-from lerobot.transport.utils import receive_bytes_in_chunks, send_bytes_in_chunks
+from lerobot.transport.utils import grpc_compression, receive_bytes_in_chunks, send_bytes_in_chunks
 
-MAX_WORKERS = 3  # Stream parameters, send transitions and interactions
+MAX_WORKERS = 3  # Stream parameters, send transitions and interactions, for each actor
 SHUTDOWN_TIMEOUT = 10
+# gRPC metadata key with which the actors identify themselves, their peer address is used otherwise
+ACTOR_ID_METADATA_KEY = "actor-id"
+POLL_TIMEOUT = 0.1
+
+
+@dataclass
+class ActorStats:
+    """Throughput and staleness of the data exchanged with one actor."""
+
+    first_seen: float = field(default_factory=time.time)
+    transition_messages: int = 0
+    transition_bytes: int = 0
+    last_transition_time: float | None = None
+    parameters_pushes: int = 0
+    last_parameters_time: float | None = None
+    last_parameters_sequence: int = 0
+
+    def as_dict(self, parameters_sequence: int) -> dict[str, float]:
+        now = time.time()
+        elapsed = max(now - self.first_seen, 1e-6)
+        return {
+            "transition_messages_per_s": self.transition_messages / elapsed,
+            "transition_mb_per_s": self.transition_bytes / elapsed / 1024 / 1024,
+            "s_since_last_transition": (
+                now - self.last_transition_time if self.last_transition_time is not None else float("nan")
+            ),
+            "s_since_last_parameters": (
+                now - self.last_parameters_time if self.last_parameters_time is not None else float("nan")
+            ),
+            "parameters_versions_behind": parameters_sequence - self.last_parameters_sequence,
+        }
+
+
+class _ActorQueue(queue.Queue):
+    """Bounded queue of the transition messages of one actor.
+
+    Puts block while it's full, which stops reading the actor stream and lets gRPC flow control slow this
+    actor down, without affecting the others.
+    """
+
+    def __init__(self, maxsize: int, shutdown_event: Event, on_put):  # type: ignore
+        super().__init__(maxsize=maxsize)
+        self.shutdown_event = shutdown_event
+        self.on_put = on_put
+
+    def put(self, item, block=True, timeout=None):
+        while not self.shutdown_event.is_set():
+            try:
+                super().put(item, timeout=POLL_TIMEOUT)
+            except queue.Full:
+                continue
+            self.on_put(item)
+            return
+
+
+def get_actor_id(context) -> str:
+    for key, value in context.invocation_metadata() or ():
+        if key == ACTOR_ID_METADATA_KEY:
+            return value
+    return context.peer()
 
 
 class LearnerService(services_pb2_grpc.LearnerServiceServicer):
     """
     Implementation of the LearnerService gRPC service
-    This service is used to send parameters to the Actor and receive transitions and interactions from the Actor
+    This service is used to send parameters to the Actors and receive transitions and interactions from them
     check transport.proto for the gRPC service definition
+
+    Several actors can be connected at once. The parameters pushed by the learner are read once and broadcast
+    to all the parameter streams. The transitions of each actor go through a bounded queue, and are merged
+    into the learner transition queue one message per actor at a time, so that a fast actor can't starve the
+    others.
     """
 
     def __init__(
@@ -42,6 +111,11 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         transition_queue: Queue,
         interaction_message_queue: Queue,
         queue_get_timeout: float = 0.001,
+        parameters_delta_encoding: bool = False,
+        parameters_quantization: str | None = None,
+        actor_queue_size: int = 4,
+        stats_log_interval: float = 60.0,
+        parameters_compression: str | None = None,
     ):
         self.shutdown_event = shutdown_event
         self.parameters_queue = parameters_queue
@@ -49,12 +123,115 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
         self.transition_queue = transition_queue
         self.interaction_message_queue = interaction_message_queue
         self.queue_get_timeout = queue_get_timeout
+        self.parameters_delta_encoding = parameters_delta_encoding
+        self.parameters_quantization = parameters_quantization
+        self.actor_queue_size = actor_queue_size
+        self.stats_log_interval = stats_log_interval
+        self.parameters_compression = parameters_compression
+
+        # Last parameters pushed by the learner, shared by all the parameter streams
+        self._parameters: bytes | None = None
+        self._parameters_sequence = 0
+        self._parameters_condition = threading.Condition()
+
+        self._actors_lock = threading.Lock()
+        self._actor_stats: dict[str, ActorStats] = {}
+        self._actor_queues: dict[str, _ActorQueue] = {}
+        self._transitions_available = threading.Event()
+
+        self._threads: dict[str, threading.Thread] = {}
+
+    def actor_stats(self) -> dict[str, dict[str, float]]:
+        """Per actor throughput and staleness metrics."""
+        with self._actors_lock:
+            return {
+                actor_id: stats.as_dict(self._parameters_sequence)
+                for actor_id, stats in self._actor_stats.items()
+            }
+
+    def _get_actor_stats(self, actor_id: str) -> ActorStats:
+        with self._actors_lock:
+            if actor_id not in self._actor_stats:
+                logging.info(f"[LEARNER] New actor {actor_id}")
+                self._actor_stats[actor_id] = ActorStats()
+            return self._actor_stats[actor_id]
+
+    def _start_thread(self, name: str, target) -> None:
+        with self._actors_lock:
+            if name not in self._threads:
+                self._threads[name] = threading.Thread(target=target, name=name, daemon=True)
+                self._threads[name].start()
+
+    def _broadcast_parameters(self):
+        while not self.shutdown_event.is_set():
+            buffer = get_last_item_from_queue(self.parameters_queue, block=True, timeout=POLL_TIMEOUT)
+            if buffer is None:
+                continue
+            with self._parameters_condition:
+                self._parameters = buffer
+                self._parameters_sequence += 1
+                self._parameters_condition.notify_all()
+
+    def _wait_for_parameters(self, last_sequence: int) -> tuple[bytes | None, int]:
+        with self._parameters_condition:
+            self._parameters_condition.wait_for(
+                lambda: self._parameters_sequence > last_sequence, timeout=self.queue_get_timeout
+            )
+            if self._parameters_sequence > last_sequence:
+                return self._parameters, self._parameters_sequence
+            return None, last_sequence
+
+    def _forward_transitions(self):
+        last_stats_log = time.time()
+        while not self.shutdown_event.is_set():
+            self._transitions_available.clear()
+            with self._actors_lock:
+                actor_queues = list(self._actor_queues.values())
+
+            # One message per actor and round, for a fair merging of the actors
+            forwarded = False
+            for actor_queue in actor_queues:
+                try:
+                    data = actor_queue.get_nowait()
+                except queue.Empty:
+                    continue
+                self._put_transitions(data)
+                actor_queue.task_done()
+                forwarded = True
+
+            if not forwarded:
+                self._transitions_available.wait(POLL_TIMEOUT)
+
+            if time.time() - last_stats_log > self.stats_log_interval:
+                for actor_id, stats in self.actor_stats().items():
+                    logging.info(f"[LEARNER] Actor {actor_id} stats: {stats}")
+                last_stats_log = time.time()
+
+    def _put_transitions(self, data: bytes):
+        # The learner queue may be bounded, in which case waiting here applies backpressure to all the actors
+        while not self.shutdown_event.is_set():
+            try:
+                self.transition_queue.put(data, timeout=POLL_TIMEOUT)
+                return
+            except queue.Full:
+                continue
 
     def StreamParameters(self, request, context):  # noqa: N802
         # TODO: authorize the request
-        logging.info("[LEARNER] Received request to stream parameters from the Actor")
+        actor_id = get_actor_id(context)
+        logging.info(f"[LEARNER] Received request to stream parameters from the Actor {actor_id}")
+        stats = self._get_actor_stats(actor_id)
+        self._start_thread("parameters_broadcast", self._broadcast_parameters)
+        if self.parameters_compression is not None:
+            context.set_compression(grpc_compression(self.parameters_compression))
 
         last_push_time = 0
+        last_sequence = 0
+        # The stream is ordered and reliable, so the deltas are computed against the last message sent on it
+        reencode = self.parameters_delta_encoding or self.parameters_quantization is not None
+        if reencode:
+            decoder = ParameterDecoder()
+            encoder = ParameterEncoder(self.parameters_delta_encoding, self.parameters_quantization)
 
         while not self.shutdown_event.is_set():
             time_since_last_push = time.time() - last_push_time
@@ -64,14 +241,22 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
                 # and it's checked in the while loop
                 continue
 
-            logging.info("[LEARNER] Push parameters to the Actor")
-            buffer = get_last_item_from_queue(
-                self.parameters_queue, block=True, timeout=self.queue_get_timeout
-            )
+            logging.info(f"[LEARNER] Push parameters to the Actor {actor_id}")
+            buffer, sequence = self._wait_for_parameters(last_sequence)
 
             if buffer is None:
                 continue
 
+            if reencode:
+                state_dicts = decoder.decode(buffer)
+                if state_dicts is None:
+                    continue
+                buffer = encoder.encode(decoder.version, state_dicts)
+
+            stats.parameters_pushes += 1
+            stats.last_parameters_time = time.time()
+            stats.last_parameters_sequence = sequence
+
             yield from send_bytes_in_chunks(
                 buffer,
                 services_pb2.Parameters,
@@ -80,28 +265,49 @@ class LearnerService(services_pb2_grpc.LearnerServiceServicer):
             )
 
             last_push_time = time.time()
+            last_sequence = sequence
             logging.info("[LEARNER] Parameters sent")
 
         logging.info("[LEARNER] Stream parameters finished")
         return services_pb2.Empty()
 
-    def SendTransitions(self, request_iterator, _context):  # noqa: N802
+    def SendTransitions(self, request_iterator, context):  # noqa: N802
         # TODO: authorize the request
-        logging.info("[LEARNER] Received request to receive transitions from the Actor")
+        actor_id = get_actor_id(context)
+        logging.info(f"[LEARNER] Received request to receive transitions from the Actor {actor_id}")
+        stats = self._get_actor_stats(actor_id)
+
+        def on_put(data: bytes):
+            stats.transition_messages += 1
+            stats.transition_bytes += len(data)
+            stats.last_transition_time = time.time()
+            self._transitions_available.set()
+
+        with self._actors_lock:
+            if actor_id not in self._actor_queues:
+                self._actor_queues[actor_id] = _ActorQueue(self.actor_queue_size, self.shutdown_event, on_put)
+            actor_queue = self._actor_queues[actor_id]
+        self._start_thread("transitions_forward", self._forward_transitions)
 
         receive_bytes_in_chunks(
             request_iterator,
-            self.transition_queue,
+            actor_queue,
             self.shutdown_event,
-            log_prefix="[LEARNER] transitions",
+            log_prefix=f"[LEARNER] transitions of {actor_id}",
         )
 
+        # Return once the transitions of the actor are in the learner queue
+        with actor_queue.all_tasks_done:
+            while actor_queue.unfinished_tasks and not self.shutdown_event.is_set():
+                actor_queue.all_tasks_done.wait(POLL_TIMEOUT)
+
         logging.debug("[LEARNER] Finished receiving transitions")
         return services_pb2.Empty()
 
-    def SendInteractions(self, request_iterator, _context):  # noqa: N802
+    def SendInteractions(self, request_iterator, context):  # noqa: N802
         # TODO: authorize the request
-        logging.info("[LEARNER] Received request to receive interactions from the Actor")
+        actor_id = get_actor_id(context)
+        logging.info(f"[LEARNER] Received request to receive interactions from the Actor {actor_id}")
 
         receive_bytes_in_chunks(
             request_iterator,
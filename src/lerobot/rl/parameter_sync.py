@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""
+Synchronization of the policy parameters from the learner to the actors.
+
+A parameters message holds a version and the state dicts of the modules pushed by the learner (e.g. "policy"
+and "discrete_critic"). Only the trainable tensors are sent, since the frozen ones are identical on both sides.
+
+With delta encoding, the tensors are sent as differences with the values the receiver reconstructed from the
+previous message of the stream, and unchanged tensors are skipped. The floating point values can be
+quantized to fp16 or int8; the quantization error is carried over to the next delta, so the actor's
+parameters don't drift away from the learner's.
+"""
+
+import torch
+from torch import nn
+
+from lerobot.transport.utils import bytes_to_tensors, tensors_to_bytes
+
+QUANTIZATIONS = ("fp16", "int8")
+
+
+def trainable_state_dict(module: nn.Module) -> dict[str, torch.Tensor]:
+    """Return the parameters requiring gradients and the buffers of a module, on cpu."""
+    state_dict = {
+        name: param.detach().cpu() for name, param in module.named_parameters() if param.requires_grad
+    }
+    state_dict.update({name: buffer.detach().cpu() for name, buffer in module.named_buffers()})
+    return state_dict
+
+
+def load_trainable_state_dict(module: nn.Module, state_dict: dict[str, torch.Tensor]) -> None:
+    """Load a state dict created with `trainable_state_dict`, keeping the frozen tensors of the module."""
+    _, unexpected_keys = module.load_state_dict(state_dict, strict=False)
+    if unexpected_keys:
+        raise KeyError(f"Unexpected keys in the parameters: {unexpected_keys}")
+
+
+class ParameterEncoder:
+    """Encode successive versions of the parameters for one receiver.
+
+    Args:
+        delta_encoding: Send the differences with the previously sent parameters instead of their values.
+        quantization: None, "fp16" or "int8", the quantization of the floating point tensors.
+    """
+
+    def __init__(self, delta_encoding: bool = False, quantization: str | None = None):
+        if quantization is not None and quantization not in QUANTIZATIONS:
+            raise ValueError(f"Unknown quantization {quantization}, must be None or one of {QUANTIZATIONS}")
+        self.delta_encoding = delta_encoding
+        self.quantization = quantization
+        self.version: int | None = None
+        # Parameters as reconstructed by the receiver, which the next deltas are computed against
+        self._reference: dict[str, dict[str, torch.Tensor]] = {}
+
+    def encode(self, version: int, state_dicts: dict[str, dict[str, torch.Tensor]]) -> bytes:
+        use_delta = self.delta_encoding and self.version is not None
+        encoded_state_dicts = {}
+        for module_name, state_dict in state_dicts.items():
+            reference = self._reference.setdefault(module_name, {})
+            encoded_state_dict = {}
+            for name, value in state_dict.items():
+                # Copy, so that the reference isn't updated along with the parameters of the learner
+                value = value.detach().to("cpu", copy=True)
+                base = reference.get(name) if use_delta else None
+                if base is not None and (base.shape != value.shape or base.dtype != value.dtype):
+                    base = None
+                if base is not None and torch.equal(base, value):
+                    continue
+
+                entry = self._encode_tensor(value if base is None else value - base, delta=base is not None)
+                encoded_state_dict[name] = entry
+                reference[name] = _decode_tensor(entry, base, value.dtype)
+            encoded_state_dicts[module_name] = encoded_state_dict
+
+        message = {
+            "version": version,
+            "base_version": self.version if use_delta else None,
+            "state_dicts": encoded_state_dicts,
+        }
+        self.version = version
+        return tensors_to_bytes(message)
+
+    def _encode_tensor(self, value: torch.Tensor, delta: bool) -> dict:
+        entry = {
+            "delta": delta,
+            "dtype": str(value.dtype).removeprefix("torch."),
+            "value": value,
+            "scale": None,
+        }
+        if not value.is_floating_point() or self.quantization is None:
+            return entry
+        if self.quantization == "fp16":
+            entry["value"] = value.to(torch.float16)
+            return entry
+
+        # Symmetric per tensor int8 quantization
+        scale = value.abs().max().item() / 127 if value.numel() > 0 else 0.0
+        scale = scale if scale > 0 else 1.0
+        entry["value"] = torch.round(value / scale).clamp(-127, 127).to(torch.int8)
+        entry["scale"] = scale
+        return entry
+
+
+class ParameterDecoder:
+    """Reconstruct the parameters from the successive messages of a `ParameterEncoder`."""
+
+    def __init__(self):
+        self.version: int | None = None
+        self._state_dicts: dict[str, dict[str, torch.Tensor]] = {}
+
+    def decode(self, buffer: bytes | bytearray) -> dict[str, dict[str, torch.Tensor]] | None:
+        """Apply a message and return the full parameters, or None if the message is stale."""
+        message = bytes_to_tensors(buffer)
+        version, base_version = message["version"], message["base_version"]
+        if self.version is not None and version <= self.version:
+            return None
+        if base_version is not None and base_version != self.version:
+            raise ValueError(
+                f"Parameters version {version} is a delta against version {base_version}, "
+                f"but version {self.version} was received last"
+            )
+
+        for module_name, encoded_state_dict in message["state_dicts"].items():
+            state_dict = self._state_dicts.setdefault(module_name, {})
+            for name, entry in encoded_state_dict.items():
+                base = state_dict.get(name) if entry["delta"] else None
+                if entry["delta"] and base is None:
+                    raise ValueError(f"Received a delta for {module_name}.{name} without its previous value")
+                dtype = getattr(torch, entry["dtype"], None)
+                if not isinstance(dtype, torch.dtype):
+                    raise ValueError(f"Unknown dtype {entry['dtype']} for {module_name}.{name}")
+                state_dict[name] = _decode_tensor(entry, base, dtype)
+        self.version = version
+
+        return {module_name: dict(state_dict) for module_name, state_dict in self._state_dicts.items()}
+
+
+def _decode_tensor(entry: dict, base: torch.Tensor | None, dtype: torch.dtype) -> torch.Tensor:
+    value = entry["value"]
+    if entry["scale"] is not None:
+        value = value.to(torch.float32) * entry["scale"]
+    if base is not None:
+        value = base + value.to(base.dtype)
+    return value.to(dtype)
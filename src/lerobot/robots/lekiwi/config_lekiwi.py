@@ -48,6 +48,15 @@ class LeKiwiConfig(RobotConfig):
     # Set to `True` for backward compatibility with previous policies/dataset
     use_degrees: bool = False
 
+    # Frequency of a dedicated thread reading and writing the motors. When set, `get_observation` returns the
+    # latest state read by the thread instead of reading the bus, and `send_action` doesn't wait for the bus.
+    motor_io_fps: float | None = None
+
+    # Bound on the difference between the capture time of the camera frames and the time the motor state was
+    # read, in ms. When the nearest frame is further, `get_observation` waits for the next frame if it would
+    # be nearer. If None, the frames captured nearest to the motor state are returned without waiting.
+    max_camera_skew_ms: float | None = None
+
 
 @dataclass
 class LeKiwiHostConfig:
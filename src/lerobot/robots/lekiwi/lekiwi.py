@@ -22,8 +22,9 @@ from typing import Any
 
 import numpy as np
 
+from lerobot.cameras.capture_sync import CaptureSynchronizer
 from lerobot.cameras.utils import make_cameras_from_configs
-from lerobot.motors import Motor, MotorCalibration, MotorNormMode
+from lerobot.motors import Motor, MotorCalibration, MotorNormMode, MotorsBusThread
 from lerobot.motors.feetech import (
     FeetechMotorsBus,
     OperatingMode,
@@ -76,6 +77,9 @@ class LeKiwi(Robot):
         logger.info(f"Initializing cameras with config: {config.cameras}")
         logger.info(f"Camera config keys: {list(config.cameras.keys()) if config.cameras else 'No cameras configured'}")
         self.cameras = make_cameras_from_configs(config.cameras)
+        self.capture_sync = CaptureSynchronizer(self.cameras, max_skew_ms=config.max_camera_skew_ms)
+        # Owns the bus once connected, when `motor_io_fps` is set
+        self.bus_thread: MotorsBusThread | None = None
         logger.info(f"Cameras created: {list(self.cameras.keys()) if self.cameras else 'No cameras created'}")
 
     @property
@@ -97,8 +101,12 @@ class LeKiwi(Robot):
 
     @property
     def _cameras_ft(self) -> dict[str, tuple]:
+        # Shape of the frames after the optional crop, resize and channels first of the camera
         return {
-            cam: (self.config.cameras[cam].height, self.config.cameras[cam].width, 3) for cam in self.cameras
+            cam: getattr(
+                camera, "output_shape", (self.config.cameras[cam].height, self.config.cameras[cam].width, 3)
+            )
+            for cam, camera in self.cameras.items()
         }
 
     @cached_property
@@ -132,6 +140,13 @@ class LeKiwi(Robot):
         logger.info(f"All cameras connected successfully")
 
         self.configure()
+        if self.config.motor_io_fps is not None:
+            self.bus_thread = MotorsBusThread(
+                self.bus,
+                {"Present_Position": self.arm_motors, "Present_Velocity": self.base_motors},
+                fps=self.config.motor_io_fps,
+            )
+            self.bus_thread.start()
         logger.info(f"{self} connected.")
 
     @property
@@ -352,10 +367,19 @@ class LeKiwi(Robot):
         if not self.is_connected:
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
-        # Read actuators position for arm and vel for base
+        # Read actuators position for arm and vel for base, in a single bus transaction
         start = time.perf_counter()
-        arm_pos = self.bus.sync_read("Present_Position", self.arm_motors)
-        base_wheel_vel = self.bus.sync_read("Present_Velocity", self.base_motors)
+        if self.bus_thread is not None:
+            # Latest state read by the motor I/O thread, without waiting for the bus unless it's stale
+            snapshot = self.bus_thread.get_fresh_state()
+            present, state_timestamp = snapshot.values, snapshot.timestamp
+        else:
+            present = self.bus.sync_read_multi(
+                {"Present_Position": self.arm_motors, "Present_Velocity": self.base_motors}
+            )
+            state_timestamp = (start + time.perf_counter()) / 2
+        arm_pos = present["Present_Position"]
+        base_wheel_vel = present["Present_Velocity"]
 
         base_vel = self._wheel_raw_to_body(
             base_wheel_vel["base_left_wheel"],
@@ -370,12 +394,12 @@ class LeKiwi(Robot):
         dt_ms = (time.perf_counter() - start) * 1e3
         logger.debug(f"{self} read state: {dt_ms:.1f}ms")
 
-        # Capture images from cameras
-        for cam_key, cam in self.cameras.items():
-            start = time.perf_counter()
-            obs_dict[cam_key] = cam.async_read()
-            dt_ms = (time.perf_counter() - start) * 1e3
-            logger.debug(f"{self} read {cam_key}: {dt_ms:.1f}ms")
+        # Capture images from cameras, the frames captured nearest to the motor state
+        start = time.perf_counter()
+        bundle = self.capture_sync.capture(state_timestamp)
+        obs_dict.update(bundle.frames)
+        dt_ms = (time.perf_counter() - start) * 1e3
+        logger.debug(f"{self} read cameras: {dt_ms:.1f}ms, max skew: {bundle.max_skew * 1e3:.1f}ms")
 
         return obs_dict
 
@@ -405,20 +429,39 @@ class LeKiwi(Robot):
         # Cap goal position when too far away from present position.
         # /!\ Slower fps expected due to reading from the follower.
         if self.config.max_relative_target is not None:
-            present_pos = self.bus.sync_read("Present_Position", self.arm_motors)
+            if self.bus_thread is not None:
+                present_pos = self.bus_thread.get_fresh_state().values["Present_Position"]
+            else:
+                present_pos = self.bus.sync_read("Present_Position", self.arm_motors)
             goal_present_pos = {key: (g_pos, present_pos[key]) for key, g_pos in arm_goal_pos.items()}
             arm_safe_goal_pos = ensure_safe_goal_position(goal_present_pos, self.config.max_relative_target)
             arm_goal_pos = arm_safe_goal_pos
 
         # Send goal position to the actuators
         arm_goal_pos_raw = {k.replace(".pos", ""): v for k, v in arm_goal_pos.items()}
-        self.bus.sync_write("Goal_Position", arm_goal_pos_raw)
-        self.bus.sync_write("Goal_Velocity", base_wheel_goal_vel)
+        if self.bus_thread is not None:
+            # Written at the next cycle of the motor I/O thread
+            self.bus_thread.set_goals(
+                {"Goal_Position": arm_goal_pos_raw, "Goal_Velocity": base_wheel_goal_vel}
+            )
+        else:
+            self.bus.sync_write("Goal_Position", arm_goal_pos_raw)
+            self.bus.sync_write("Goal_Velocity", base_wheel_goal_vel)
 
         return {**arm_goal_pos, **base_goal_vel}
 
+    def call_bus(self, fn, *args, **kwargs):
+        """Run a bus operation, e.g. `self.bus.write`, in the motor I/O thread when it is running."""
+        if self.bus_thread is None:
+            return fn(*args, **kwargs)
+        return self.bus_thread.call(fn, *args, **kwargs)
+
     def stop_base(self):
-        self.bus.sync_write("Goal_Velocity", dict.fromkeys(self.base_motors, 0), num_retry=5)
+        stop_vel = dict.fromkeys(self.base_motors, 0)
+        if self.bus_thread is not None:
+            # Overrides the velocities not sent yet
+            self.bus_thread.set_goals({"Goal_Velocity": stop_vel})
+        self.call_bus(self.bus.sync_write, "Goal_Velocity", stop_vel, num_retry=5)
         logger.info("Base motors stopped")
 
     def disconnect(self):
@@ -426,6 +469,9 @@ class LeKiwi(Robot):
             raise DeviceNotConnectedError(f"{self} is not connected.")
 
         self.stop_base()
+        if self.bus_thread is not None:
+            self.bus_thread.stop()
+            self.bus_thread = None
         self.bus.disconnect(self.config.disable_torque_on_disconnect)
         for cam in self.cameras.values():
             cam.disconnect()
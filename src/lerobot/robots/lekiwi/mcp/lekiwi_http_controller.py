@@ -30,6 +30,7 @@ if __name__ == "__main__":
     sys.path.insert(0, project_root)
 
 import cv2
+import numpy as np
 from flask import Flask, jsonify, request, render_template, Response, make_response, redirect, url_for
 
 # 条件导入，支持直接运行和模块导入两种方式
@@ -723,6 +724,10 @@ def setup_routes():
             last_frame_time = 0
             # 限制Web预览最高帧率为10fps，节省带宽
             min_interval = 0.1
+            # 本连接自己的帧游标（不与其他读取方抢帧），以及每帧复用的缩放/颜色转换缓冲区
+            cursor = None
+            resized_buffer = None
+            bgr_buffer = None
             
             while True:
                 try:
@@ -735,20 +740,47 @@ def setup_routes():
                     if service.robot.is_connected and camera in service.robot.cameras:
                         # 使用async_read方法读取摄像头帧，设置较短的超时时间
                         try:
-                            frame = service.robot.cameras[camera].async_read(timeout_ms=100)
+                            cam = service.robot.cameras[camera]
+                            bus_frame = None
+                            if hasattr(cam, "frame_cursor"):
+                                # 直接读取帧总线中的帧，不复制（缩放后即不再使用）
+                                if cursor is None or cursor.bus is not cam.frame_bus:
+                                    cursor = cam.frame_cursor()
+                                bus_frame = cursor.latest(timeout=0.1, copy=False)
+                                frame = bus_frame.data
+                            else:
+                                frame = cam.async_read(timeout_ms=100)
+                            channels_first = getattr(getattr(cam, "config", None), "channels_first", False)
+                            if frame is not None and frame.ndim == 3 and channels_first:
+                                # (C, H, W) -> (H, W, C)，仅为视图，不复制
+                                frame = frame.transpose(1, 2, 0)
                             if frame is not None and frame.size > 0:
                                 # 压缩策略1: 降低分辨率 (缩小至原来的70%)
                                 # 保持 10fps 的同时提供较好的画质
                                 height, width = frame.shape[:2]
                                 new_width = int(width * 0.7)
                                 new_height = int(height * 0.7)
-                                frame_resized = cv2.resize(frame, (new_width, new_height), interpolation=cv2.INTER_AREA)
+                                new_size = (new_height, new_width)
+                                if resized_buffer is None or resized_buffer.shape[:2] != new_size:
+                                    resized_buffer = np.empty((*new_size, 3), dtype=np.uint8)
+                                    bgr_buffer = np.empty_like(resized_buffer)
+                                frame_resized = cv2.resize(
+                                    frame,
+                                    (new_width, new_height),
+                                    dst=resized_buffer,
+                                    interpolation=cv2.INTER_AREA,
+                                )
+                                if bus_frame is not None and not cursor.bus.is_current(bus_frame):
+                                    # 缩放期间该帧已被摄像头覆盖，丢弃并读取下一帧
+                                    continue
                                 
                                 # 颜色通道调整
                                 # frame 来自 lerobot (通常是 RGB)
                                 # imencode 需要 BGR
                                 # 所以需要 RGB -> BGR (虽然调用的是 COLOR_BGR2RGB，但效果是交换 R/B 通道)
-                                frame_encoded_ready = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2RGB)
+                                frame_encoded_ready = cv2.cvtColor(
+                                    frame_resized, cv2.COLOR_BGR2RGB, dst=bgr_buffer
+                                )
                                 
                                 # 压缩策略2: 适度降低JPEG质量 (恢复到60)
                                 ret, jpeg = cv2.imencode('.jpg', frame_encoded_ready, [cv2.IMWRITE_JPEG_QUALITY, 60])
@@ -144,8 +144,8 @@ def _smooth_arm_motion(service, target_positions: Dict[str, float], duration: fl
         
         for motor in arm_motors:
             try:
-                service.robot.bus.write("Goal_Acc", motor, temp_acceleration)
-                service.robot.bus.write("Goal_Speed", motor, temp_goal_speed)
+                service.robot.call_bus(service.robot.bus.write, "Goal_Acc", motor, temp_acceleration)
+                service.robot.call_bus(service.robot.bus.write, "Goal_Speed", motor, temp_goal_speed)
             except Exception as e:
                 logger.warning(f"设置舵机 {motor} 临时速度失败: {e}")
         
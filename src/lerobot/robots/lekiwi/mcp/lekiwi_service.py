@@ -360,17 +360,17 @@ class LeKiwiService:
         for motor in arm_motors:
             try:
                 # 设置加速度（降低加速度以获得更平滑的运动）
-                self.robot.bus.write("Goal_Acc", motor, acceleration)
+                self.robot.call_bus(self.robot.bus.write, "Goal_Acc", motor, acceleration)
                 
                 # 设置目标速度
-                self.robot.bus.write("Goal_Speed", motor, goal_speed)
+                self.robot.call_bus(self.robot.bus.write, "Goal_Speed", motor, goal_speed)
                 
                 # 设置更低的P系数以减少震动（默认是12）
-                self.robot.bus.write("P_Coefficient", motor, 8)
+                self.robot.call_bus(self.robot.bus.write, "P_Coefficient", motor, 8)
                 
                 # 设置扭矩限制，防止堵转时电流过大导致系统崩溃
                 # 这是一个非常重要的安全设置
-                self.robot.bus.write("Torque_Limit", motor, torque_limit)
+                self.robot.call_bus(self.robot.bus.write, "Torque_Limit", motor, torque_limit)
                 
             except Exception as e:
                 self.logger.warning(f"设置舵机 {motor} 速度/扭矩失败: {e}")
@@ -572,7 +572,8 @@ def create_default_service(robot_id: str = "my_awesome_kiwi") -> LeKiwiService:
     
     robot_config = LeKiwiConfig(
         id=robot_id,
-        cameras=cameras_config  # 显式传入摄像头配置
+        cameras=cameras_config,  # 显式传入摄像头配置
+        motor_io_fps=60,  # 舵机读写由独立线程以固定频率执行，各线程共享最新状态
     )
     
     logger.info(f"机器人配置创建完成，摄像头: {list(robot_config.cameras.keys())}")
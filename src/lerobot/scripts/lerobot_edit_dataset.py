@@ -59,6 +59,13 @@ Merge multiple datasets:
         --operation.type merge \
         --operation.repo_ids "['lerobot/pusht_train', 'lerobot/pusht_val']"
 
+Append new datasets to an existing merged dataset:
+    python -m lerobot.scripts.lerobot_edit_dataset \
+        --repo_id lerobot/pusht_merged \
+        --operation.type merge \
+        --operation.repo_ids "['lerobot/pusht_new']" \
+        --operation.append true
+
 Remove camera feature:
     python -m lerobot.scripts.lerobot_edit_dataset \
         --repo_id lerobot/pusht \
@@ -103,6 +110,10 @@ class SplitConfig:
 class MergeConfig:
     type: str = "merge"
     repo_ids: list[str] | None = None
+    # Number of threads writing the merged files (None uses the executor default)
+    num_workers: int | None = None
+    # Append to the output dataset if it already exists instead of failing
+    append: bool = False
 
 
 @dataclass
@@ -215,6 +226,8 @@ def handle_merge(cfg: EditDatasetConfig) -> None:
         datasets,
         output_repo_id=cfg.repo_id,
         output_dir=output_dir,
+        num_workers=cfg.operation.num_workers,
+        append=cfg.operation.append,
     )
 
     logging.info(f"Merged dataset saved to {output_dir}")
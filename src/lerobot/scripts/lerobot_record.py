@@ -165,6 +165,14 @@ class DatasetRecordConfig:
     # Number of episodes to record before batch encoding videos
     # Set to 1 for immediate encoding (default behavior), or higher for batched encoding
     video_encoding_batch_size: int = 1
+    # Number of subprocesses encoding videos in the background while recording continues. Set to 0 to encode
+    # the videos of each episode before starting the next one. Can't be used with video_encoding_batch_size > 1.
+    num_video_encoder_workers: int = 0
+    # Maximum number of episodes waiting to be encoded in the background. Saving an episode blocks when reached.
+    max_pending_video_episodes: int = 4
+    # Send camera frames directly to a video encoder process per camera instead of writing them as PNG files
+    # and encoding them at the end of each episode. Can't be used with video_encoding_batch_size > 1.
+    streaming_encoding: bool = False
     # Rename map for the observation to override the image and state keys
     rename_map: dict[str, str] = field(default_factory=dict)
 
@@ -409,6 +417,13 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
                 num_processes=cfg.dataset.num_image_writer_processes,
                 num_threads=cfg.dataset.num_image_writer_threads_per_camera * len(robot.cameras),
             )
+        if cfg.dataset.num_video_encoder_workers > 0:
+            dataset.start_video_encoder(
+                num_workers=cfg.dataset.num_video_encoder_workers,
+                max_pending_episodes=cfg.dataset.max_pending_video_episodes,
+            )
+        if cfg.dataset.streaming_encoding:
+            dataset.start_streaming_video_encoder()
         sanity_check_dataset_robot_compatibility(dataset, robot, cfg.dataset.fps, dataset_features)
     else:
         # Create empty dataset or load existing saved episodes
@@ -423,6 +438,9 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
             image_writer_processes=cfg.dataset.num_image_writer_processes,
             image_writer_threads=cfg.dataset.num_image_writer_threads_per_camera * len(robot.cameras),
             batch_encoding_size=cfg.dataset.video_encoding_batch_size,
+            video_encoder_workers=cfg.dataset.num_video_encoder_workers,
+            video_encoder_max_pending_episodes=cfg.dataset.max_pending_video_episodes,
+            streaming_encoding=cfg.dataset.streaming_encoding,
         )
 
     # Load pretrained policy
@@ -495,6 +513,8 @@ def record(cfg: RecordConfig) -> LeRobotDataset:
 
             dataset.save_episode()
             recorded_episodes += 1
+            if dataset.video_encoder is not None:
+                logging.info(f"Background video encoding: {dataset.video_encoder.progress()}")
 
     log_say("Stop recording", cfg.play_sounds, blocking=True)
 
@@ -18,11 +18,14 @@
 import io
 import json
 import logging
-import pickle  # nosec B403: Safe usage for internal serialization only
+import math
+import struct
+import time
 from multiprocessing.synchronize import Event as MpEvent
 from queue import Queue
 from typing import Any
 
+import numpy as np
 import torch
 
 from lerobot.transport import services_pb2
@@ -34,6 +37,36 @@ TransferState = services_pb2.TransferState  # type: ignore[attr-defined]
 CHUNK_SIZE = 2 * 1024 * 1024  # 2 MB
 MAX_MESSAGE_SIZE = 4 * 1024 * 1024  # 4 MB
 
+# Tensor wire format: a prefix with the magic, the total size and the header size, a JSON header describing
+# the structure and the buffers, then the raw contiguous buffers, each aligned to TENSOR_FORMAT_ALIGNMENT bytes.
+TENSOR_FORMAT_MAGIC = b"LRT\x01"
+TENSOR_FORMAT_ALIGNMENT = 64
+_TENSOR_FORMAT_PREFIX = struct.Struct("<4sQQ")
+_TENSOR_DTYPES = {
+    str(dtype).removeprefix("torch."): dtype
+    for dtype in [
+        torch.bool,
+        torch.uint8,
+        torch.int8,
+        torch.int16,
+        torch.int32,
+        torch.int64,
+        torch.float16,
+        torch.bfloat16,
+        torch.float32,
+        torch.float64,
+        torch.complex64,
+        torch.complex128,
+    ]
+}
+# Keys of the JSON objects standing for the values which are not JSON types
+_TENSOR_KEY = "__tensor__"
+_BYTES_KEY = "__bytes__"
+_TUPLE_KEY = "__tuple__"
+_DICT_KEY = "__dict__"
+# Compressions implemented by gRPC python, zstd isn't
+GRPC_COMPRESSIONS = ("gzip", "deflate")
+
 
 def bytes_buffer_size(buffer: io.BytesIO) -> int:
     buffer.seek(0, io.SEEK_END)
@@ -42,9 +75,11 @@ def bytes_buffer_size(buffer: io.BytesIO) -> int:
     return result
 
 
-def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = "", silent: bool = True):
-    bytes_buffer: io.BytesIO = io.BytesIO(buffer)
-    size_in_bytes = bytes_buffer_size(bytes_buffer)
+def send_bytes_in_chunks(
+    buffer: bytes | bytearray, message_class: Any, log_prefix: str = "", silent: bool = True
+):
+    view = memoryview(buffer)
+    size_in_bytes = len(view)
 
     sent_bytes = 0
 
@@ -61,7 +96,7 @@ def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = ""
             transfer_state = TransferState.TRANSFER_BEGIN
 
         size_to_read = min(CHUNK_SIZE, size_in_bytes - sent_bytes)
-        chunk = bytes_buffer.read(size_to_read)
+        chunk = view[sent_bytes : sent_bytes + size_to_read].tobytes()
 
         yield message_class(transfer_state=transfer_state, data=chunk)
         sent_bytes += size_to_read
@@ -71,9 +106,27 @@ def send_bytes_in_chunks(buffer: bytes, message_class: Any, log_prefix: str = ""
 
 
 def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEvent, log_prefix: str = ""):
-    bytes_buffer = io.BytesIO()
+    """Reassemble the messages sent with `send_bytes_in_chunks`.
+
+    Messages in the tensor wire format are written into a buffer preallocated from the total size in their
+    prefix, and put in the queue as a `bytearray` which can be decoded without copies. Other messages are put
+    as `bytes`.
+    """
+    chunks: list[bytes] = []
+    message: bytearray | None = None
+    received_bytes = 0
     step = 0
 
+    def write(data: bytes) -> None:
+        nonlocal received_bytes
+        if message is None:
+            chunks.append(data)
+            return
+        if received_bytes + len(data) > len(message):
+            raise ValueError(f"Received more data than the {len(message)} bytes announced by the message")
+        message[received_bytes : received_bytes + len(data)] = data
+        received_bytes += len(data)
+
     logging.info(f"{log_prefix} Starting receiver")
     for item in iterator:
         logging.debug(f"{log_prefix} Received item")
@@ -82,26 +135,31 @@ def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEve
             return
 
         if item.transfer_state == TransferState.TRANSFER_BEGIN:
-            bytes_buffer.seek(0)
-            bytes_buffer.truncate(0)
-            bytes_buffer.write(item.data)
+            chunks = []
+            message = _allocate_message_buffer(item.data)
+            received_bytes = 0
+            write(item.data)
             logging.debug(f"{log_prefix} Received data at step 0")
             step = 0
         elif item.transfer_state == TransferState.TRANSFER_MIDDLE:
-            bytes_buffer.write(item.data)
+            write(item.data)
             step += 1
             logging.debug(f"{log_prefix} Received data at step {step}")
         elif item.transfer_state == TransferState.TRANSFER_END:
-            bytes_buffer.write(item.data)
-            logging.debug(f"{log_prefix} Received data at step end size {bytes_buffer_size(bytes_buffer)}")
+            write(item.data)
+            data = message if message is not None else b"".join(chunks)
+            logging.debug(f"{log_prefix} Received data at step end size {len(data)}")
+            if message is not None and received_bytes != len(message):
+                raise ValueError(f"Received {received_bytes} bytes instead of the {len(message)} announced")
 
             if queue is not None:
-                queue.put(bytes_buffer.getvalue())
+                queue.put(data)
             else:
-                return bytes_buffer.getvalue()
+                return data
 
-            bytes_buffer.seek(0)
-            bytes_buffer.truncate(0)
+            chunks = []
+            message = None
+            received_bytes = 0
             step = 0
 
             logging.debug(f"{log_prefix} Queue updated")
@@ -110,44 +168,231 @@ def receive_bytes_in_chunks(iterator, queue: Queue | None, shutdown_event: MpEve
             raise ValueError(f"Received unknown transfer state {item.transfer_state}")
 
 
-def state_to_bytes(state_dict: dict[str, torch.Tensor]) -> bytes:
-    """Convert model state dict to flat array for transmission"""
-    bytes_buffer = io.BytesIO()
+def _allocate_message_buffer(first_chunk: bytes) -> bytearray | None:
+    """Preallocate the buffer of a message in the tensor wire format from the total size in its prefix."""
+    if len(first_chunk) < _TENSOR_FORMAT_PREFIX.size or not first_chunk.startswith(TENSOR_FORMAT_MAGIC):
+        return None
+    _, total_size, _ = _TENSOR_FORMAT_PREFIX.unpack_from(first_chunk)
+    if total_size < len(first_chunk):
+        return None
+    return bytearray(total_size)
+
+
+def tensors_to_bytes(obj: Any) -> bytes:
+    """Serialize nested dicts, lists and tuples of tensors, bytes and JSON values, without pickle.
 
-    torch.save(state_dict, bytes_buffer)
+    The tensors are copied once, straight from their memory into the returned buffer. See `bytes_to_tensors`.
+    """
+    buffers: list[memoryview] = []
+    buffer_infos: list[dict] = []
+    structure = _encode_structure(obj, buffers, buffer_infos)
 
-    return bytes_buffer.getvalue()
+    data_size = 0
+    for view, info in zip(buffers, buffer_infos, strict=True):
+        info["offset"] = data_size
+        info["nbytes"] = view.nbytes
+        data_size += _align(view.nbytes)
+
+    header = json.dumps({"structure": structure, "buffers": buffer_infos}).encode()
+    data_start = _align(_TENSOR_FORMAT_PREFIX.size + len(header))
+    total_size = data_start + data_size
+
+    parts = [
+        _TENSOR_FORMAT_PREFIX.pack(TENSOR_FORMAT_MAGIC, total_size, len(header)),
+        header,
+        bytes(data_start - _TENSOR_FORMAT_PREFIX.size - len(header)),
+    ]
+    for view in buffers:
+        parts.append(view)
+        parts.append(bytes(_align(view.nbytes) - view.nbytes))
+    return b"".join(parts)
+
+
+def bytes_to_tensors(buffer: bytes | bytearray | memoryview) -> Any:
+    """Deserialize a buffer created with `tensors_to_bytes`.
+
+    Only tensors of known dtypes and JSON values are created, so that untrusted buffers can't run code. The
+    tensors of a writable buffer, like the ones of `receive_bytes_in_chunks`, are views of it, and read-only
+    buffers are copied once.
+    """
+    view = memoryview(buffer)
+    if view.readonly:
+        view = memoryview(bytearray(view))
+    if view.nbytes < _TENSOR_FORMAT_PREFIX.size:
+        raise ValueError("The buffer is too small to be in the tensor wire format")
+    magic, total_size, header_size = _TENSOR_FORMAT_PREFIX.unpack_from(view)
+    if magic != TENSOR_FORMAT_MAGIC:
+        raise ValueError("The buffer is not in the tensor wire format")
+    if total_size != view.nbytes or _TENSOR_FORMAT_PREFIX.size + header_size > total_size:
+        raise ValueError(f"Invalid sizes in the tensor wire format: {total_size=}, {header_size=}")
+
+    header_end = _TENSOR_FORMAT_PREFIX.size + header_size
+    try:
+        header = json.loads(bytes(view[_TENSOR_FORMAT_PREFIX.size : header_end]))
+        structure, buffer_infos = header["structure"], header["buffers"]
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError("Invalid header in the tensor wire format") from e
+
+    data_start = _align(header_end)
+    values = [_decode_buffer(view, data_start, info) for info in buffer_infos]
+    return _decode_structure(structure, values)
+
+
+def _align(size: int) -> int:
+    return -(-size // TENSOR_FORMAT_ALIGNMENT) * TENSOR_FORMAT_ALIGNMENT
+
+
+def _encode_structure(obj: Any, buffers: list[memoryview], buffer_infos: list[dict]) -> Any:
+    if isinstance(obj, torch.Tensor):
+        tensor = obj.detach()
+        info = {"dtype": str(tensor.dtype).removeprefix("torch."), "shape": list(tensor.shape)}
+        if info["dtype"] not in _TENSOR_DTYPES:
+            raise TypeError(f"Unsupported tensor dtype {tensor.dtype}")
+        info["device"] = str(tensor.device)
+        # Reinterpret the memory as bytes, which numpy can expose for every dtype
+        buffers.append(memoryview(tensor.cpu().contiguous().reshape(-1).view(torch.uint8).numpy()))
+        buffer_infos.append(info)
+        return {_TENSOR_KEY: len(buffers) - 1}
+    if isinstance(obj, (bytes | bytearray)):
+        buffers.append(memoryview(obj))
+        buffer_infos.append({"dtype": "bytes"})
+        return {_BYTES_KEY: len(buffers) - 1}
+    if isinstance(obj, dict):
+        if not all(isinstance(key, str) for key in obj):
+            raise TypeError("Only dicts with str keys can be serialized")
+        encoded = {key: _encode_structure(value, buffers, buffer_infos) for key, value in obj.items()}
+        # Escape the dicts that could be mistaken for an encoded value
+        return {_DICT_KEY: encoded} if len(obj) == 1 and next(iter(obj)).startswith("__") else encoded
+    if isinstance(obj, tuple):
+        return {_TUPLE_KEY: [_encode_structure(value, buffers, buffer_infos) for value in obj]}
+    if isinstance(obj, list):
+        return [_encode_structure(value, buffers, buffer_infos) for value in obj]
+    if obj is None or isinstance(obj, (bool | int | float | str)):
+        return obj
+    # Numpy values, e.g. rewards and infos of gym environments, become python scalars and tensors
+    if isinstance(obj, np.generic):
+        return _encode_structure(obj.item(), buffers, buffer_infos)
+    if isinstance(obj, np.ndarray):
+        return _encode_structure(torch.from_numpy(obj), buffers, buffer_infos)
+    raise TypeError(f"Unsupported type {type(obj)} for the tensor wire format")
+
+
+def _decode_buffer(view: memoryview, data_start: int, info: dict) -> torch.Tensor | bytes:
+    try:
+        start = data_start + int(info["offset"])
+        if info["dtype"] == "bytes":
+            nbytes = int(info["nbytes"])
+        else:
+            dtype = _TENSOR_DTYPES[info["dtype"]]
+            shape = [int(dim) for dim in info["shape"]]
+            nbytes = math.prod(shape) * dtype.itemsize
+            if any(dim < 0 for dim in shape) or nbytes != int(info["nbytes"]):
+                raise ValueError(f"Shape {shape} doesn't match {info['nbytes']} bytes")
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid buffer description {info} in the tensor wire format") from e
+    if start < data_start or nbytes < 0 or start + nbytes > view.nbytes:
+        raise ValueError(f"Buffer {info} is out of bounds in the tensor wire format")
+
+    if info["dtype"] == "bytes":
+        return view[start : start + nbytes].tobytes()
+    if nbytes == 0:
+        tensor = torch.empty(shape, dtype=dtype)
+    else:
+        tensor = torch.frombuffer(view, dtype=torch.uint8, count=nbytes, offset=start)
+        tensor = tensor.view(dtype).reshape(shape)
+    device = info.get("device", "cpu")
+    return tensor if device == "cpu" else tensor.to(device)
+
+
+def _decode_structure(structure: Any, values: list[torch.Tensor | bytes]) -> Any:
+    if isinstance(structure, list):
+        return [_decode_structure(value, values) for value in structure]
+    if not isinstance(structure, dict):
+        return structure
+    if len(structure) == 1:
+        key, value = next(iter(structure.items()))
+        if key in (_TENSOR_KEY, _BYTES_KEY):
+            if not isinstance(value, int) or not 0 <= value < len(values):
+                raise ValueError(f"Invalid buffer index {value} in the tensor wire format")
+            return values[value]
+        if key == _TUPLE_KEY:
+            if not isinstance(value, list):
+                raise ValueError(f"Invalid tuple {value} in the tensor wire format")
+            return tuple(_decode_structure(item, values) for item in value)
+        if key == _DICT_KEY:
+            if not isinstance(value, dict):
+                raise ValueError(f"Invalid dict {value} in the tensor wire format")
+            return {k: _decode_structure(v, values) for k, v in value.items()}
+    return {key: _decode_structure(value, values) for key, value in structure.items()}
+
+
+def state_to_bytes(state_dict: dict[str, torch.Tensor]) -> bytes:
+    """Convert model state dict to flat array for transmission"""
+    return tensors_to_bytes(state_dict)
 
 
 def bytes_to_state_dict(buffer: bytes) -> dict[str, torch.Tensor]:
-    bytes_buffer = io.BytesIO(buffer)
-    bytes_buffer.seek(0)
-    return torch.load(bytes_buffer, weights_only=True)
+    return bytes_to_tensors(buffer)
 
 
 def python_object_to_bytes(python_object: Any) -> bytes:
-    return pickle.dumps(python_object)
+    return tensors_to_bytes(python_object)
 
 
 def bytes_to_python_object(buffer: bytes) -> Any:
-    bytes_buffer = io.BytesIO(buffer)
-    bytes_buffer.seek(0)
-    obj = pickle.load(bytes_buffer)  # nosec B301: Safe usage of pickle.load
-    # Add validation checks here
-    return obj
+    return bytes_to_tensors(buffer)
 
 
 def bytes_to_transitions(buffer: bytes) -> list[Transition]:
-    bytes_buffer = io.BytesIO(buffer)
-    bytes_buffer.seek(0)
-    transitions = torch.load(bytes_buffer, weights_only=True)
-    return transitions
+    return bytes_to_tensors(buffer)
 
 
 def transitions_to_bytes(transitions: list[Transition]) -> bytes:
-    bytes_buffer = io.BytesIO()
-    torch.save(transitions, bytes_buffer)
-    return bytes_buffer.getvalue()
+    return tensors_to_bytes(transitions)
+
+
+def grpc_compression(name: str | None):
+    """Return the `grpc.Compression` of a stream from its name: None, "gzip" or "deflate"."""
+    import grpc
+
+    if name is None:
+        return grpc.Compression.NoCompression
+    if name not in GRPC_COMPRESSIONS:
+        raise ValueError(f"Unsupported gRPC compression {name}, must be None or one of {GRPC_COMPRESSIONS}")
+    return grpc.Compression.Gzip if name == "gzip" else grpc.Compression.Deflate
+
+
+class StreamStats:
+    """Payload bytes and serialization time of the messages of a stream, logged periodically.
+
+    The bytes are counted before gRPC compression.
+    """
+
+    def __init__(self, name: str, log_interval: float = 60.0):
+        self.name = name
+        self.log_interval = log_interval
+        self.messages = 0
+        self.bytes = 0
+        self.serialization_s = 0.0
+        self._start_time = time.perf_counter()
+        self._last_log_time = self._start_time
+
+    def record(self, nbytes: int, serialization_s: float = 0.0) -> None:
+        self.messages += 1
+        self.bytes += nbytes
+        self.serialization_s += serialization_s
+        if time.perf_counter() - self._last_log_time > self.log_interval:
+            logging.info(f"{self.name} stream stats: {self.as_dict()}")
+            self._last_log_time = time.perf_counter()
+
+    def as_dict(self) -> dict[str, float]:
+        elapsed = max(time.perf_counter() - self._start_time, 1e-6)
+        return {
+            "messages": self.messages,
+            "mb": self.bytes / 1024 / 1024,
+            "mb_per_s": self.bytes / elapsed / 1024 / 1024,
+            "serialization_ms_per_message": 1000 * self.serialization_s / max(self.messages, 1),
+        }
 
 
 def grpc_channel_options(
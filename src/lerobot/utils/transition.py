@@ -18,7 +18,7 @@ from typing import TypedDict
 
 import torch
 
-from lerobot.utils.constants import ACTION
+from lerobot.utils.constants import ACTION, OBS_IMAGE
 
 
 class Transition(TypedDict):
@@ -70,6 +70,30 @@ def move_transition_to_device(transition: Transition, device: str = "cpu") -> Tr
     return transition
 
 
+def compress_transition_images(transition: Transition) -> Transition:
+    """Quantize the floating point images in [0, 1] of a transition to uint8, to send 4 times fewer bytes."""
+    for state_key in ["state", "next_state"]:
+        transition[state_key] = {
+            key: (value * 255).round().clamp(0, 255).to(torch.uint8)
+            if key.startswith(OBS_IMAGE) and value.is_floating_point()
+            else value
+            for key, value in transition[state_key].items()
+        }
+    return transition
+
+
+def decompress_transition_images(transition: Transition) -> Transition:
+    """Convert back the uint8 images of a transition compressed with `compress_transition_images`."""
+    for state_key in ["state", "next_state"]:
+        transition[state_key] = {
+            key: value.to(torch.get_default_dtype()) / 255
+            if key.startswith(OBS_IMAGE) and value.dtype == torch.uint8
+            else value
+            for key, value in transition[state_key].items()
+        }
+    return transition
+
+
 def move_state_dict_to_device(state_dict, device="cpu"):
     """
     Recursively move all tensors in a (potentially) nested
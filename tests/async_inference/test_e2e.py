@@ -89,7 +89,6 @@ def test_async_inference_e2e(monkeypatch):
     policy_server = PolicyServer(policy_server_config)
     # Replace the real policy with our fast, deterministic stub.
     policy_server.policy = MockPolicy()
-    policy_server.actions_per_chunk = 20
     policy_server.device = "cpu"
     # NOTE(Steven): Smelly tests as the Server is a state machine being partially mocked. Adding these processors as a quick fix.
     policy_server.preprocessor = lambda obs: obs
@@ -100,15 +99,13 @@ def test_async_inference_e2e(monkeypatch):
     mock_robot = make_robot_from_config(robot_config)
 
     lerobot_features = map_robot_keys_to_lerobot_features(mock_robot)
-    policy_server.lerobot_features = lerobot_features
 
     # Force server to produce deterministic action chunks in test mode
     policy_server.policy_type = "act"
 
-    def _fake_get_action_chunk(_self, _obs, _type="test"):
+    def _fake_get_action_chunk(_self, _obs, actions_per_chunk):
         action_dim = 6
         batch_size = 1
-        actions_per_chunk = policy_server.actions_per_chunk
 
         return torch.zeros(batch_size, actions_per_chunk, action_dim)
 
@@ -116,6 +113,9 @@ def test_async_inference_e2e(monkeypatch):
 
     # Bypass potentially heavy model loading inside SendPolicyInstructions
     def _fake_send_policy_instructions(self, request, context):  # noqa: N802
+        session = self.sessions[context.peer()]
+        session.lerobot_features = lerobot_features
+        session.actions_per_chunk = 20
         return services_pb2.Empty()
 
     monkeypatch.setattr(PolicyServer, "SendPolicyInstructions", _fake_send_policy_instructions, raising=True)
@@ -167,7 +167,9 @@ def test_async_inference_e2e(monkeypatch):
     server.wait_for_termination(timeout=5)
 
     assert action_chunks_received["count"] > 0, "Client did not receive any action chunks"
-    assert len(policy_server._predicted_timesteps) > 0, "Server did not record any predicted timesteps"
+    assert any(session.predicted_timesteps for session in policy_server.sessions.values()), (
+        "Server did not record any predicted timesteps"
+    )
 
     # ------------------------------------------------------------------
     # 4. Stop the system
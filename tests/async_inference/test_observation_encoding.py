@@ -0,0 +1,128 @@
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+import time
+
+import numpy as np
+import pytest
+import torch
+
+from lerobot.async_inference.helpers import TimedObservation
+from lerobot.async_inference.observation_encoding import ObservationDecoder, encode_observation
+
+
+def _make_obs(image: np.ndarray, timestep: int = 3) -> TimedObservation:
+    return TimedObservation(
+        timestamp=time.time(),
+        timestep=timestep,
+        observation={"shoulder.pos": 0.5, "elbow.pos": np.float32(-1.0), "laptop": image, "task": "pick"},
+        must_go=True,
+    )
+
+
+def _smooth_image(height: int = 48, width: int = 64) -> np.ndarray:
+    # A gradient, which JPEG compresses well with little error
+    rows = np.linspace(0, 255, height, dtype=np.float32)[:, None]
+    cols = np.linspace(0, 255, width, dtype=np.float32)[None, :]
+    image = np.stack([rows + 0 * cols, cols + 0 * rows, (rows + cols) / 2], axis=-1)
+    return image.astype(np.uint8)
+
+
+def test_raw_round_trip():
+    obs = _make_obs(_smooth_image())
+    decoded = ObservationDecoder(pin_memory=False).decode(bytearray(encode_observation(obs)))
+
+    assert decoded.get_timestamp() == obs.get_timestamp()
+    assert decoded.get_timestep() == obs.get_timestep()
+    assert decoded.must_go is True
+    observation = decoded.get_observation()
+    assert observation["shoulder.pos"] == 0.5
+    assert observation["elbow.pos"] == -1.0
+    assert observation["task"] == "pick"
+    np.testing.assert_array_equal(observation["laptop"], obs.get_observation()["laptop"])
+
+
+def test_jpeg_round_trip_is_smaller():
+    obs = _make_obs(_smooth_image())
+    raw = encode_observation(obs)
+    jpeg = encode_observation(obs, image_encoding="jpeg", jpeg_quality=95)
+    assert len(jpeg) < len(raw)
+
+    image = ObservationDecoder(pin_memory=False).decode(jpeg).get_observation()["laptop"]
+    assert image.shape == obs.get_observation()["laptop"].shape
+    error = np.abs(image.astype(np.int16) - obs.get_observation()["laptop"].astype(np.int16))
+    assert error.mean() < 3
+
+
+def test_images_are_resized_on_the_client():
+    obs = _make_obs(_smooth_image(48, 64))
+    decoded = ObservationDecoder(pin_memory=False).decode(
+        encode_observation(obs, image_sizes={"laptop": (24, 32)})
+    )
+    assert decoded.get_observation()["laptop"].shape == (24, 32, 3)
+
+
+def test_decoder_reuses_released_image_buffers():
+    decoder = ObservationDecoder(num_buffers=2, pin_memory=False)
+    message = encode_observation(_make_obs(_smooth_image()), image_encoding="jpeg")
+    first, second = decoder.decode(message), decoder.decode(message)
+    assert not np.shares_memory(first.get_observation()["laptop"], second.get_observation()["laptop"])
+
+    decoder.release(first)
+    third = decoder.decode(message)
+    assert np.shares_memory(first.get_observation()["laptop"], third.get_observation()["laptop"])
+
+    # Releasing twice doesn't give the buffer to two observations
+    decoder.release(first)
+    fourth = decoder.decode(message)
+    assert not np.shares_memory(third.get_observation()["laptop"], fourth.get_observation()["laptop"])
+
+
+def test_decoded_images_outlive_later_decodes():
+    decoder = ObservationDecoder(num_buffers=2, pin_memory=False)
+    images = [np.full((48, 64, 3), 40 * i, dtype=np.uint8) for i in range(5)]
+    # Held like observations waiting in the queue or kept as the last processed observation
+    decoded = [
+        decoder.decode(encode_observation(_make_obs(image), image_encoding="jpeg")) for image in images
+    ]
+
+    for obs, image in zip(decoded, images, strict=True):
+        np.testing.assert_allclose(obs.get_observation()["laptop"], image, atol=2)
+
+
+def test_invalid_tensor_gives_back_image_buffers():
+    decoder = ObservationDecoder(num_buffers=2, pin_memory=False)
+    obs = _make_obs(_smooth_image())
+    # numpy can't represent bfloat16
+    obs.observation["state"] = torch.zeros(6, dtype=torch.bfloat16)
+    with pytest.raises(ValueError):
+        decoder.decode(encode_observation(obs, image_encoding="jpeg"))
+
+    # The buffer taken for the image is back in the pool, and reused by the next observation
+    assert len(decoder._free_buffers["laptop"]) == 1
+    buffer = decoder._free_buffers["laptop"][0]
+    image = decoder.decode(encode_observation(_make_obs(_smooth_image()), image_encoding="jpeg"))
+    assert np.shares_memory(image.get_observation()["laptop"], buffer.numpy())
+
+
+def test_decoder_rejects_pickle():
+    obs = _make_obs(_smooth_image())
+    with pytest.raises(ValueError):
+        ObservationDecoder().decode(pickle.dumps(obs))
+
+
+def test_unknown_image_encoding():
+    with pytest.raises(ValueError):
+        encode_observation(_make_obs(_smooth_image()), image_encoding="h264")
@@ -73,18 +73,8 @@ def policy_server():
     server = PolicyServer(test_config)
     # Replace the real policy with our fast, deterministic stub.
     server.policy = MockPolicy()
-    server.actions_per_chunk = 20
     server.device = "cpu"
 
-    # Add mock lerobot_features that the observation similarity functions need
-    server.lerobot_features = {
-        OBS_STATE: {
-            "dtype": "float32",
-            "shape": [6],
-            "names": ["joint1", "joint2", "joint3", "joint4", "joint5", "joint6"],
-        }
-    }
-
     return server
 
 
@@ -92,6 +82,49 @@ def policy_server():
 # Helper utilities for tests
 # -----------------------------------------------------------------------------
 
+# Mock lerobot_features that the observation similarity functions need
+LEROBOT_FEATURES = {
+    OBS_STATE: {
+        "dtype": "float32",
+        "shape": [6],
+        "names": ["joint1", "joint2", "joint3", "joint4", "joint5", "joint6"],
+    }
+}
+
+
+def _connect(server, client_id: str = "client", actions_per_chunk: int = 20):
+    """Add the session of a client which called Ready and sent its policy instructions."""
+    from lerobot.async_inference.helpers import FPSTracker
+    from lerobot.async_inference.policy_server import ClientSession
+
+    session = ClientSession(
+        client_id,
+        FPSTracker(target_fps=server.config.fps),
+        lerobot_features=LEROBOT_FEATURES,
+        actions_per_chunk=actions_per_chunk,
+    )
+    server.sessions[client_id] = session
+    return session
+
+
+class _AbortedError(Exception):
+    pass
+
+
+class _MockContext:
+    """The gRPC context of a call from a client."""
+
+    def __init__(self, peer: str):
+        self._peer = peer
+        self.code = None
+
+    def peer(self) -> str:
+        return self._peer
+
+    def abort(self, code, details):
+        self.code = code
+        raise _AbortedError(details)
+
 
 def _make_obs(state: torch.Tensor, timestep: int = 0, must_go: bool = False):
     """Create a TimedObservation with a given state vector."""
@@ -142,51 +175,66 @@ def test_time_action_chunk(policy_server):
 
 def test_maybe_enqueue_observation_must_go(policy_server):
     """An observation with `must_go=True` is always enqueued."""
+    session = _connect(policy_server)
     obs = _make_obs(torch.zeros(6), must_go=True)
-    assert policy_server._enqueue_observation(obs) is True
-    assert policy_server.observation_queue.qsize() == 1
-    assert policy_server.observation_queue.get_nowait() is obs
+    assert policy_server._enqueue_observation(session, obs) is True
+    assert session.observation_queue.qsize() == 1
+    assert session.observation_queue.get_nowait() is obs
 
 
 def test_maybe_enqueue_observation_dissimilar(policy_server):
     """A dissimilar observation (not `must_go`) is enqueued."""
+    session = _connect(policy_server)
     # Set a last predicted observation.
-    policy_server.last_processed_obs = _make_obs(torch.zeros(6))
+    session.last_processed_obs = _make_obs(torch.zeros(6))
     # Create a new, dissimilar observation.
     new_obs = _make_obs(torch.ones(6) * 5)  # High norm difference
 
-    assert policy_server._enqueue_observation(new_obs) is True
-    assert policy_server.observation_queue.qsize() == 1
+    assert policy_server._enqueue_observation(session, new_obs) is True
+    assert session.observation_queue.qsize() == 1
 
 
 def test_maybe_enqueue_observation_is_skipped(policy_server):
     """A similar observation (not `must_go`) is skipped."""
+    session = _connect(policy_server)
     # Set a last predicted observation.
-    policy_server.last_processed_obs = _make_obs(torch.zeros(6))
+    session.last_processed_obs = _make_obs(torch.zeros(6))
     # Create a new, very similar observation.
     new_obs = _make_obs(torch.zeros(6) + 1e-4)
 
-    assert policy_server._enqueue_observation(new_obs) is False
-    assert policy_server.observation_queue.empty() is True
+    assert policy_server._enqueue_observation(session, new_obs) is False
+    assert session.observation_queue.empty() is True
+
+
+def test_maybe_enqueue_observation_is_per_client(policy_server):
+    """The observations of a client are filtered against its own last processed observation."""
+    session = _connect(policy_server)
+    other_session = _connect(policy_server, "other_client")
+    session.last_processed_obs = _make_obs(torch.zeros(6))
+
+    assert policy_server._enqueue_observation(other_session, _make_obs(torch.zeros(6))) is True
+    assert session.observation_queue.empty() is True
+    assert other_session.observation_queue.qsize() == 1
 
 
 def test_obs_sanity_checks(policy_server):
     """Unit-test the private `_obs_sanity_checks` helper."""
+    session = _connect(policy_server)
     prev = _make_obs(torch.zeros(6), timestep=0)
 
     # Case 1 – timestep already predicted
-    policy_server._predicted_timesteps.add(1)
+    session.predicted_timesteps.add(1)
     obs_same_ts = _make_obs(torch.ones(6), timestep=1)
-    assert policy_server._obs_sanity_checks(obs_same_ts, prev) is False
+    assert policy_server._obs_sanity_checks(session, obs_same_ts, prev) is False
 
     # Case 2 – observation too similar
-    policy_server._predicted_timesteps.clear()
+    session.predicted_timesteps.clear()
     obs_similar = _make_obs(torch.zeros(6) + 1e-4, timestep=2)
-    assert policy_server._obs_sanity_checks(obs_similar, prev) is False
+    assert policy_server._obs_sanity_checks(session, obs_similar, prev) is False
 
     # Case 3 – genuinely new & dissimilar observation passes
     obs_ok = _make_obs(torch.ones(6) * 5, timestep=3)
-    assert policy_server._obs_sanity_checks(obs_ok, prev) is True
+    assert policy_server._obs_sanity_checks(session, obs_ok, prev) is True
 
 
 def test_predict_action_chunk(monkeypatch, policy_server):
@@ -201,15 +249,16 @@ def test_predict_action_chunk(monkeypatch, policy_server):
     policy_server.postprocessor = lambda tensor: tensor
     action_dim = 6
     batch_size = 1
-    actions_per_chunk = policy_server.actions_per_chunk
+    session = _connect(policy_server)
+    actions_per_chunk = session.actions_per_chunk
 
-    def _fake_get_action_chunk(_self, _obs, _type="act"):
+    def _fake_get_action_chunk(_self, _obs, actions_per_chunk):
         return torch.zeros(batch_size, actions_per_chunk, action_dim)
 
     monkeypatch.setattr(PolicyServer, "_get_action_chunk", _fake_get_action_chunk, raising=True)
 
     obs = _make_obs(torch.zeros(6), timestep=5)
-    timed_actions = policy_server._predict_action_chunk(obs)
+    timed_actions = policy_server._predict_action_chunk(session, obs)
 
     assert len(timed_actions) == actions_per_chunk
     assert [ta.get_timestep() for ta in timed_actions] == list(range(5, 5 + actions_per_chunk))
@@ -217,3 +266,72 @@ def test_predict_action_chunk(monkeypatch, policy_server):
     for i, ta in enumerate(timed_actions):
         expected_ts = obs.get_timestamp() + i * policy_server.config.environment_dt
         assert abs(ta.get_timestamp() - expected_ts) < 1e-6
+
+
+def test_predict_action_chunks_batched(policy_server):
+    """A batch of observations runs through the policy at once, and each gets its own action chunk."""
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+
+    session = _connect(policy_server)
+    observations = [_make_obs(torch.ones(6) * i, timestep=10 * i) for i in range(3)]
+    action_chunks = policy_server._predict_action_chunks([(session, obs) for obs in observations])
+
+    assert len(action_chunks) == 3
+    for obs, timed_actions in zip(observations, action_chunks, strict=True):
+        assert len(timed_actions) == session.actions_per_chunk
+        assert timed_actions[0].get_timestep() == obs.get_timestep()
+        assert timed_actions[0].get_timestamp() == obs.get_timestamp()
+        assert timed_actions[0].get_action().shape == (6,)
+
+
+def test_batcher_routes_action_chunks_to_clients(policy_server):
+    """The batcher batches the observations of all the clients and routes the chunks back to each of them."""
+    policy_server.config.batch_timeout = 1.0
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+    sessions = [_connect(policy_server, f"client_{i}") for i in range(2)]
+
+    policy_server._start_batcher()
+    try:
+        for i, session in enumerate(sessions):
+            assert policy_server._enqueue_observation(session, _make_obs(torch.ones(6) * i, timestep=i))
+
+        for i, session in enumerate(sessions):
+            obs, timed_actions = session.action_queue.get(timeout=5)
+            assert obs.get_timestep() == i
+            assert timed_actions[0].get_timestep() == i
+            assert session.predicted_timesteps == {i}
+            assert session.metrics()["avg_batch_size"] == 2
+    finally:
+        policy_server.stop()
+
+    assert policy_server.sessions == {}
+
+
+def test_clients_sharing_the_policy_keep_their_chunk_size(policy_server):
+    """Each observation of a batch gets a chunk of the number of actions asked by its client."""
+    policy_server.preprocessor = lambda obs: obs
+    policy_server.postprocessor = lambda tensor: tensor
+    sessions = [_connect(policy_server, f"client_{i}", actions_per_chunk=10 * (i + 1)) for i in range(2)]
+
+    action_chunks = policy_server._predict_action_chunks(
+        [(session, _make_obs(torch.ones(6), timestep=i)) for i, session in enumerate(sessions)]
+    )
+
+    assert [len(timed_actions) for timed_actions in action_chunks] == [10, 20]
+
+
+def test_unknown_clients_are_rejected(policy_server):
+    """Only Ready creates sessions, so that the calls of other clients can't bypass max_clients."""
+    import grpc
+
+    from lerobot.transport import services_pb2  # type: ignore
+
+    context = _MockContext("unknown")
+    with pytest.raises(_AbortedError):
+        policy_server.SendObservations(iter([]), context)
+    assert context.code == grpc.StatusCode.FAILED_PRECONDITION
+    with pytest.raises(_AbortedError):
+        policy_server.GetActions(services_pb2.Empty(), context)
+    assert policy_server.sessions == {}
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.capture_sync import CaptureClock, CaptureSynchronizer, CaptureTimingStats
+from lerobot.cameras.frame_bus import FrameBus
+
+SHAPE = (2, 2, 3)
+
+
+class FakeCamera:
+    """A camera whose frames are published by the test."""
+
+    def __init__(self, num_slots: int = 4):
+        self.frame_bus = FrameBus(SHAPE, num_slots=num_slots)
+        self.timing_stats = CaptureTimingStats()
+        self.is_connected = True
+
+    def frame_cursor(self):
+        return self.frame_bus.cursor()
+
+    def publish(self, value: int, timestamp: float) -> None:
+        self.frame_bus.publish(np.full(SHAPE, value, dtype=np.uint8), timestamp)
+        self.timing_stats.record(timestamp, timestamp + 0.01)
+
+    def __str__(self) -> str:
+        return "FakeCamera"
+
+
+def test_capture_clock():
+    clock = CaptureClock()
+    # No driver timestamp
+    assert clock.stamp(10.0, 0.0) == 10.0
+    # Driver timestamps in the same time base
+    assert clock.stamp(10.0, 9_950.0) == pytest.approx(9.95)
+    # Driver timestamps in another time base, the offset is the smallest delay
+    clock.reset()
+    assert clock.stamp(100.0, 2_000.0) == pytest.approx(100.0)
+    assert clock.stamp(100.05, 2_040.0) == pytest.approx(100.04)
+    assert clock.stamp(100.12, 2_080.0) == pytest.approx(100.08)
+
+
+def test_timing_stats():
+    stats = CaptureTimingStats()
+    for i, interval in enumerate([0.03, 0.04, 0.03, 0.04]):
+        stats.record(capture_timestamp=i + interval, publish_timestamp=i + interval + 0.02)
+    stats = stats.as_dict()
+    assert stats["frames"] == 4
+    assert stats["avg_latency_ms"] == pytest.approx(20)
+    assert stats["jitter_ms"] > 0
+
+
+def test_nearest_frames_are_selected():
+    front, wrist = FakeCamera(), FakeCamera()
+    for i in range(1, 4):
+        front.publish(i, timestamp=0.1 * i)
+        wrist.publish(i, timestamp=0.1 * i + 0.04)
+
+    sync = CaptureSynchronizer({"front": front, "wrist": wrist})
+    bundle = sync.capture(reference_timestamp=0.21)
+
+    assert bundle.timestamps == {"front": pytest.approx(0.2), "wrist": pytest.approx(0.24)}
+    assert bundle.frames["front"][0, 0, 0] == 2
+    assert bundle.frames["wrist"][0, 0, 0] == 2
+    assert bundle.max_skew == pytest.approx(0.03)
+    stats = sync.stats()
+    assert stats["wrist"]["max_skew_ms"] == pytest.approx(30)
+    assert stats["wrist"]["fps"] == pytest.approx(10)
+
+
+def test_waits_for_next_frame_out_of_bound():
+    camera = FakeCamera()
+    camera.publish(1, timestamp=0.0)
+    camera.publish(2, timestamp=0.1)
+
+    sync = CaptureSynchronizer({"front": camera}, max_skew_ms=20, timeout_ms=2000)
+    timer = threading.Timer(0.05, camera.publish, args=(3, 0.2))
+    timer.start()
+    bundle = sync.capture(reference_timestamp=0.19)
+    timer.join()
+
+    assert bundle.frames["front"][0, 0, 0] == 3
+    assert sync.stats()["front"]["waits"] == 1
+    assert sync.stats()["front"]["out_of_bound"] == 0
+
+
+def test_out_of_bound_frames_are_counted():
+    camera = FakeCamera()
+    camera.publish(1, timestamp=0.0)
+    camera.publish(2, timestamp=0.1)
+
+    # The next frame wouldn't be nearer, no need to wait for it
+    sync = CaptureSynchronizer({"front": camera}, max_skew_ms=10)
+    start = time.perf_counter()
+    bundle = sync.capture(reference_timestamp=0.13)
+
+    assert time.perf_counter() - start < 0.1
+    assert bundle.frames["front"][0, 0, 0] == 2
+    assert sync.stats()["front"]["out_of_bound"] == 1
+
+
+def test_cameras_without_frame_bus():
+    camera = MagicMock()
+    camera.async_read.return_value = np.zeros(SHAPE, dtype=np.uint8)
+
+    before = time.perf_counter()
+    bundle = CaptureSynchronizer({"front": camera}).capture()
+
+    camera.async_read.assert_called_once()
+    assert bundle.timestamps["front"] >= before
+
+
+def test_timeout_without_frames():
+    sync = CaptureSynchronizer({"front": FakeCamera()}, timeout_ms=10)
+    with pytest.raises(TimeoutError):
+        sync.capture()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+
+import numpy as np
+import pytest
+
+from lerobot.cameras.frame_bus import FrameBus
+
+SHAPE = (4, 6, 3)
+
+
+def _frame(value: int) -> np.ndarray:
+    return np.full(SHAPE, value, dtype=np.uint8)
+
+
+def test_cursors_are_independent():
+    bus = FrameBus(SHAPE, num_slots=4)
+    first, second = bus.cursor(), bus.cursor()
+    bus.publish(_frame(1), timestamp=1.0)
+    bus.publish(_frame(2), timestamp=2.0)
+
+    frame = first.latest(timeout=0)
+    assert (frame.seq, frame.timestamp, frame.data[0, 0, 0]) == (2, 2.0, 2)
+    # Reading with a cursor doesn't consume the frame for the other cursors
+    assert second.next(timeout=0).seq == 1
+    assert second.next(timeout=0).seq == 2
+    with pytest.raises(TimeoutError):
+        first.latest(timeout=0)
+    with pytest.raises(TimeoutError):
+        second.next(timeout=0)
+
+
+def test_new_cursor_starts_at_last_frame():
+    bus = FrameBus(SHAPE)
+    bus.publish(_frame(1))
+    bus.publish(_frame(2))
+
+    cursor = bus.cursor()
+    assert cursor.next(timeout=0).seq == 2
+    with pytest.raises(TimeoutError):
+        cursor.latest(timeout=0)
+
+
+def test_next_skips_overwritten_frames():
+    bus = FrameBus(SHAPE, num_slots=3)
+    cursor = bus.cursor()
+    for value in range(1, 7):
+        bus.publish(_frame(value))
+
+    frame = cursor.next(timeout=0)
+    # The ring holds the last num_slots - 1 frames which are safe to read
+    assert frame.seq == 5
+    assert frame.data[0, 0, 0] == 5
+    assert cursor.dropped == 4
+
+
+def test_frames_read_without_copy():
+    bus = FrameBus(SHAPE, num_slots=2)
+    cursor = bus.cursor()
+    bus.publish(_frame(1))
+    frame = cursor.latest(timeout=0, copy=False)
+    copied = bus.read(frame.seq)
+
+    assert bus.is_current(frame)
+    assert not np.shares_memory(frame.data, copied.data)
+    bus.publish(_frame(2))
+    bus.publish(_frame(3))
+    assert not bus.is_current(frame)
+    assert bus.read(frame.seq) is None
+    assert copied.data[0, 0, 0] == 1
+
+
+def test_slot_being_written_is_not_read():
+    bus = FrameBus(SHAPE, num_slots=2)
+    bus.publish(_frame(1))
+    bus.begin_write()[:] = 2
+    # The slot of frame 1 is reused by frame 3, not frame 2
+    assert bus.read(1) is not None
+    assert bus.read(2) is None
+    assert bus.end_write() == 2
+    assert bus.read(2).data[0, 0, 0] == 2
+
+
+def test_reader_is_woken_up():
+    bus = FrameBus(SHAPE)
+    cursor = bus.cursor()
+    timer = threading.Timer(0.05, bus.publish, args=(_frame(7),))
+    timer.start()
+    frame = cursor.next(timeout=2)
+    timer.join()
+    assert frame.data[0, 0, 0] == 7
+
+
+def test_publish_checks_shape():
+    bus = FrameBus(SHAPE)
+    with pytest.raises(ValueError):
+        bus.publish(np.zeros((2, 2, 3), dtype=np.uint8))
+
+
+def test_attach_shared_memory():
+    name = f"lerobot_test_frame_bus_{os.getpid()}"
+    bus = FrameBus(SHAPE, num_slots=3, name=name)
+    attached = FrameBus.attach(name)
+    try:
+        assert (attached.shape, attached.dtype, attached.num_slots) == (SHAPE, np.uint8, 3)
+        cursor = attached.cursor()
+        bus.publish(_frame(5), timestamp=3.0)
+        frame = cursor.latest(timeout=1)
+        assert (frame.seq, frame.timestamp, frame.data[0, 0, 0]) == (1, 3.0, 5)
+        with pytest.raises(RuntimeError):
+            attached.publish(_frame(6))
+    finally:
+        attached.close()
+        bus.close()
+
+    with pytest.raises(FileNotFoundError):
+        FrameBus.attach(name)
@@ -20,7 +20,9 @@
 # ```
 
 from pathlib import Path
+from threading import Thread
 
+import cv2
 import numpy as np
 import pytest
 
@@ -226,3 +228,66 @@ def test_rotation(rotation, index_or_path):
         assert camera.width == original_width
         assert camera.height == original_height
         assert img.shape[:2] == (original_height, original_width)
+
+
+def test_async_read_from_several_threads():
+    config = OpenCVCameraConfig(index_or_path=DEFAULT_PNG_FILE_PATH)
+    camera = OpenCVCamera(config)
+    camera.connect(warmup=False)
+
+    try:
+        cursor = camera.frame_cursor()
+        # Each thread has its own cursor, reading a frame doesn't hide it from the others
+        frames = []
+        reader = Thread(target=lambda: frames.append(camera.async_read(timeout_ms=1000)))
+        reader.start()
+        frames.append(camera.async_read(timeout_ms=1000))
+        reader.join()
+
+        assert len(frames) == 2
+        frame = cursor.next(timeout=1)
+        assert frame.seq == 1
+        assert frame.data.shape == frames[0].shape
+    finally:
+        if camera.is_connected:
+            camera.disconnect()
+
+
+@pytest.mark.parametrize("channels_first", [False, True], ids=["hwc", "chw"])
+def test_postprocess_into_preallocated_output(channels_first):
+    config = OpenCVCameraConfig(
+        index_or_path=DEFAULT_PNG_FILE_PATH,
+        width=120,
+        height=160,
+        rotation=Cv2Rotation.ROTATE_90,
+        crop=(10, 20, 100, 80),
+        resize=(50, 40),
+        channels_first=channels_first,
+    )
+    camera = OpenCVCamera(config)
+    raw = np.random.default_rng(0).integers(0, 256, (120, 160, 3), dtype=np.uint8)
+
+    expected = cv2.rotate(raw, cv2.ROTATE_90_CLOCKWISE)[10:110, 20:100]
+    expected = cv2.resize(expected, (40, 50), interpolation=cv2.INTER_AREA)[..., ::-1]
+    if channels_first:
+        expected = expected.transpose(2, 0, 1)
+
+    out = np.empty(camera.output_shape, dtype=np.uint8)
+    first = camera._postprocess_image(raw, out=out)
+    buffers = {name: buffer.ctypes.data for name, buffer in camera._buffers.items()}
+    second = camera._postprocess_image(raw, out=out)
+
+    assert first is out and second is out
+    assert out.shape == ((3, 50, 40) if channels_first else (50, 40, 3))
+    np.testing.assert_array_equal(out, expected)
+    # The intermediate buffers are reused
+    assert {name: buffer.ctypes.data for name, buffer in camera._buffers.items()} == buffers
+    with pytest.raises(ValueError):
+        camera._postprocess_image(raw, out=np.empty((10, 10, 3), dtype=np.uint8))
+
+
+def test_invalid_crop_and_resize():
+    with pytest.raises(ValueError):
+        OpenCVCameraConfig(index_or_path=DEFAULT_PNG_FILE_PATH, crop=(0, 0, 10))
+    with pytest.raises(ValueError):
+        OpenCVCameraConfig(index_or_path=DEFAULT_PNG_FILE_PATH, resize=(0, 10))
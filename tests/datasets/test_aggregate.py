@@ -380,3 +380,61 @@ def test_video_timestamps_regression(tmp_path, lerobot_dataset_factory):
         for key in aggr_ds.meta.video_keys:
             assert key in item, f"Video key {key} missing from item {i}"
             assert item[key].shape[0] == 3, f"Expected 3 channels for video key {key}"
+
+
+def test_aggregate_append(tmp_path, lerobot_dataset_factory):
+    """Test appending a dataset to an existing aggregated dataset without rewriting its files."""
+    ds_0 = lerobot_dataset_factory(
+        root=tmp_path / "append_0",
+        repo_id=f"{DUMMY_REPO_ID}_append_0",
+        total_episodes=10,
+        total_frames=400,
+    )
+    ds_1 = lerobot_dataset_factory(
+        root=tmp_path / "append_1",
+        repo_id=f"{DUMMY_REPO_ID}_append_1",
+        total_episodes=15,
+        total_frames=600,
+    )
+    aggr_root = tmp_path / "append_aggr"
+
+    aggregate_datasets(
+        repo_ids=[ds_0.repo_id],
+        roots=[ds_0.root],
+        aggr_repo_id=f"{DUMMY_REPO_ID}_append_aggr",
+        aggr_root=aggr_root,
+        num_workers=2,
+    )
+    existing_files = {
+        path: path.read_bytes()
+        for path in aggr_root.rglob("*")
+        if path.is_file() and path.parent.name.startswith("chunk-")
+    }
+
+    aggregate_datasets(
+        repo_ids=[ds_1.repo_id],
+        roots=[ds_1.root],
+        aggr_repo_id=f"{DUMMY_REPO_ID}_append_aggr",
+        aggr_root=aggr_root,
+        num_workers=2,
+        append=True,
+    )
+
+    for path, content in existing_files.items():
+        assert path.read_bytes() == content, f"{path} should not be rewritten when appending"
+
+    with (
+        patch("lerobot.datasets.lerobot_dataset.get_safe_version") as mock_get_safe_version,
+        patch("lerobot.datasets.lerobot_dataset.snapshot_download") as mock_snapshot_download,
+    ):
+        mock_get_safe_version.return_value = "v3.0"
+        mock_snapshot_download.return_value = str(aggr_root)
+        aggr_ds = LeRobotDataset(f"{DUMMY_REPO_ID}_append_aggr", root=aggr_root)
+
+    assert_episode_and_frame_counts(aggr_ds, ds_0.num_episodes + ds_1.num_episodes, 1000)
+    assert_dataset_content_integrity(aggr_ds, ds_0, ds_1)
+    assert_metadata_consistency(aggr_ds, ds_0, ds_1)
+    assert_episode_indices_updated_correctly(aggr_ds, ds_0, ds_1)
+    assert_video_frames_integrity(aggr_ds, ds_0, ds_1)
+    assert_video_timestamps_within_bounds(aggr_ds)
+    assert_dataset_iteration_works(aggr_ds)
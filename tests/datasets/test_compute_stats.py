@@ -19,12 +19,14 @@ import numpy as np
 import pytest
 
 from lerobot.datasets.compute_stats import (
+    MergeableQuantileStats,
     RunningQuantileStats,
     _assert_type_and_shape,
     aggregate_feature_stats,
     aggregate_stats,
     compute_episode_stats,
     estimate_num_samples,
+    get_feature_sketch,
     get_feature_stats,
     sample_images,
     sample_indices,
@@ -832,3 +834,56 @@ def test_fixed_quantiles_always_computed():
         for q_key in expected_quantiles:
             assert q_key in episode_stats[key]
             assert episode_stats[key][q_key].shape == (features[key]["shape"][0],)
+
+
+def test_mergeable_quantile_stats_exact_on_small_data():
+    """Test that quantiles are exact while no compaction happened."""
+    stats = MergeableQuantileStats()
+    stats.update(np.arange(1, 10, dtype=np.float64).reshape(-1, 1))
+    result = stats.get_statistics()
+
+    assert result["q50"][0] == 5
+    assert result["q10"][0] == 1
+    assert result["q90"][0] == 9
+    assert result["count"][0] == 9
+    np.testing.assert_allclose(result["std"], np.std(np.arange(1, 10)))
+
+
+def test_mergeable_quantile_stats_merge():
+    """Test that merged sketches match the statistics of the whole data."""
+    rng = np.random.default_rng(0)
+    data = rng.normal(size=(50_000, 3)) * [1.0, 5.0, 10.0] + [0.0, 3.0, -2.0]
+
+    chunks = np.array_split(data, 10)
+    sketches = [MergeableQuantileStats(capacity=512, seed=i) for i in range(len(chunks))]
+    for sketch, chunk in zip(sketches, chunks, strict=True):
+        sketch.update(chunk)
+    merged = sketches[0]
+    for sketch in sketches[1:]:
+        merged.merge(sketch)
+    result = merged.get_statistics()
+
+    assert result["count"][0] == len(data)
+    np.testing.assert_allclose(result["mean"], data.mean(axis=0))
+    np.testing.assert_allclose(result["std"], data.std(axis=0))
+    np.testing.assert_allclose(result["min"], data.min(axis=0))
+    np.testing.assert_allclose(result["max"], data.max(axis=0))
+
+    # Quantiles are approximate, compare their ranks in the data
+    for q, q_key in [(0.01, "q01"), (0.5, "q50"), (0.99, "q99")]:
+        ranks = (data < result[q_key]).mean(axis=0)
+        np.testing.assert_allclose(ranks, q, atol=0.01)
+
+    # The sketch memory is bounded
+    assert sum(len(level) for level in merged._levels) < 512 * 10
+
+
+def test_get_feature_sketch_images():
+    """Test that image sketches count images and reduce over pixels."""
+    images = np.random.randint(0, 256, size=(10, 3, 8, 8), dtype=np.uint8)
+    sketch = get_feature_sketch(images, axis=(0, 2, 3))
+    result = sketch.get_statistics()
+
+    assert result["count"][0] == 10
+    assert result["mean"].shape == (3,)
+    np.testing.assert_allclose(result["mean"], images.mean(axis=(0, 2, 3)))
@@ -0,0 +1,57 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import numpy as np
+
+from lerobot.datasets.compute_stats import DEFAULT_QUANTILES
+from lerobot.datasets.dataset_stats import compute_dataset_stats
+
+
+def test_compute_dataset_stats(tmp_path, lerobot_dataset_factory):
+    dataset = lerobot_dataset_factory(root=tmp_path / "test", total_episodes=4, total_frames=200)
+
+    stats = compute_dataset_stats(dataset.meta, num_workers=2)
+
+    quantile_keys = [f"q{int(q * 100):02d}" for q in DEFAULT_QUANTILES]
+    for key, ft in dataset.features.items():
+        if ft["dtype"] == "string":
+            continue
+        assert key in stats
+        for stat_key in ["min", "max", "mean", "std", *quantile_keys]:
+            assert stats[key][stat_key].shape == (
+                (3, 1, 1) if ft["dtype"] in ["image", "video"] else ft["shape"]
+            )
+
+    for key in dataset.meta.camera_keys:
+        assert np.all(stats[key]["min"] >= 0) and np.all(stats[key]["max"] <= 1)
+
+    # Numerical features are read entirely, so their moments are exact
+    for key in ["index", "timestamp"]:
+        values = np.asarray(dataset.hf_dataset.with_format("numpy")[key])
+        assert stats[key]["count"][0] == len(values)
+        np.testing.assert_allclose(stats[key]["mean"], [values.mean()], rtol=1e-6)
+        np.testing.assert_allclose(stats[key]["std"], [values.std()], rtol=1e-6)
+        np.testing.assert_allclose(stats[key]["min"], [values.min()])
+        np.testing.assert_allclose(stats[key]["q50"], [np.quantile(values, 0.5)], atol=1)
+
+
+def test_compute_dataset_stats_subset_of_episodes(tmp_path, lerobot_dataset_factory):
+    dataset = lerobot_dataset_factory(root=tmp_path / "test", total_episodes=4, total_frames=200)
+
+    stats = compute_dataset_stats(dataset.meta, episodes=[1, 2], num_workers=1)
+
+    ep_lengths = [dataset.meta.episodes[ep_idx]["length"] for ep_idx in [1, 2]]
+    assert stats["index"]["count"][0] == sum(ep_lengths)
+    assert stats["index"]["min"][0] == dataset.meta.episodes[1]["dataset_from_index"]
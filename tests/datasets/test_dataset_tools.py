@@ -26,9 +26,11 @@ from lerobot.datasets.dataset_tools import (
     delete_episodes,
     merge_datasets,
     modify_features,
+    recompute_stats,
     remove_feature,
     split_dataset,
 )
+from lerobot.datasets.utils import load_stats
 
 
 @pytest.fixture
@@ -1047,3 +1049,20 @@ def test_modify_features_preserves_file_structure(sample_dataset, tmp_path):
         assert new_chunk_indices == original_chunk_indices, "Chunk indices should be preserved"
         assert new_file_indices == original_file_indices, "File indices should be preserved"
         assert "reward" in modified_dataset.meta.features
+
+
+def test_recompute_stats(sample_dataset):
+    """Test recomputing the stats of a dataset in place."""
+    recorded_stats = sample_dataset.meta.stats
+    stats = recompute_stats(sample_dataset, num_workers=1)
+
+    assert set(stats) == {key for key, ft in sample_dataset.features.items() if ft["dtype"] != "string"}
+    assert sample_dataset.meta.stats is stats
+    saved_stats = load_stats(sample_dataset.meta.root)
+    np.testing.assert_allclose(saved_stats["action"]["mean"], stats["action"]["mean"])
+    assert "q99" in saved_stats["action"]
+
+    # Same frames as when recording, so the moments match the recorded stats
+    for key in ["action", "observation.images.top"]:
+        np.testing.assert_allclose(stats[key]["mean"], recorded_stats[key]["mean"], rtol=1e-5)
+        np.testing.assert_allclose(stats[key]["max"], recorded_stats[key]["max"], rtol=1e-5)
@@ -29,6 +29,7 @@ import lerobot
 from lerobot.configs.default import DatasetConfig
 from lerobot.configs.train import TrainPipelineConfig
 from lerobot.datasets.factory import make_dataset
+from lerobot.datasets.frame_store import VideoFrameStore
 from lerobot.datasets.image_writer import image_array_to_pil_image
 from lerobot.datasets.lerobot_dataset import (
     LeRobotDataset,
@@ -660,6 +661,35 @@ def test_check_cached_episodes_sufficient(tmp_path, lerobot_dataset_factory):
     assert sparse_dataset._check_cached_episodes_sufficient() is False
 
 
+@pytest.mark.parametrize("use_delta_timestamps", [False, True])
+def test_getitems_matches_getitem(tmp_path, lerobot_dataset_factory, use_delta_timestamps):
+    """The batched `__getitems__` path must return the same samples as `__getitem__`."""
+    dataset = lerobot_dataset_factory(root=tmp_path / "test", total_episodes=3, total_frames=90)
+    if use_delta_timestamps:
+        dt = 1 / dataset.fps
+        keys = [ACTION, *dataset.meta.video_keys]
+        dataset.delta_timestamps = {key: [-2 * dt, -dt, 0.0, dt] for key in keys}
+        dataset.delta_indices = {key: [-2, -1, 0, 1] for key in keys}
+
+    # Indices at episode boundaries, in different episodes and with duplicates
+    indices = [0, 1, 29, 30, 45, 89, 45]
+    batch = dataset.__getitems__(indices)
+
+    assert len(batch) == len(indices)
+    for idx, batched_item in zip(indices, batch, strict=True):
+        item = dataset[idx]
+        assert batched_item.keys() == item.keys()
+        for key, val in item.items():
+            if isinstance(val, torch.Tensor):
+                assert torch.equal(batched_item[key], val), key
+            else:
+                assert batched_item[key] == val, key
+
+    dataloader = torch.utils.data.DataLoader(dataset, batch_size=4, num_workers=0)
+    collated = next(iter(dataloader))
+    assert collated["index"].tolist() == [0, 1, 2, 3]
+
+
 def test_update_chunk_settings(tmp_path, empty_lerobot_dataset_factory):
     """Test the update_chunk_settings functionality for both LeRobotDataset and LeRobotDatasetMetadata."""
     features = {
@@ -1292,3 +1322,238 @@ def test_frames_in_current_file_calculation(tmp_path, empty_lerobot_dataset_fact
         frame = loaded_dataset[idx]
         expected_ep = idx // frames_per_episode
         assert frame["episode_index"].item() == expected_ep
+
+
+def test_frame_store(tmp_path, lerobot_dataset_factory):
+    """Frames read from the frame store must match the frames decoded from the videos."""
+    dataset = lerobot_dataset_factory(root=tmp_path / "test", total_episodes=3, total_frames=90)
+    stored_dataset = lerobot_dataset_factory(
+        root=tmp_path / "test", total_episodes=3, total_frames=90, frame_store_root=tmp_path / "store"
+    )
+    assert stored_dataset.frame_store is not None
+    for vid_key in dataset.meta.video_keys:
+        for ep_idx in range(3):
+            assert stored_dataset.frame_store.has_episode(vid_key, ep_idx)
+
+    for idx in [0, 29, 30, 89]:
+        item = dataset[idx]
+        stored_item = stored_dataset[idx]
+        for vid_key in dataset.meta.video_keys:
+            assert stored_item[vid_key].dtype == torch.float32
+            assert torch.equal(stored_item[vid_key], item[vid_key])
+
+    # The store is reused when it already exists
+    store_file = stored_dataset.frame_store.get_episode_path(dataset.meta.video_keys[0], 0)
+    mtime = store_file.stat().st_mtime_ns
+    lerobot_dataset_factory(
+        root=tmp_path / "test", total_episodes=3, total_frames=90, frame_store_root=tmp_path / "store"
+    )
+    assert store_file.stat().st_mtime_ns == mtime
+
+
+def test_frame_store_is_rebuilt_when_the_dataset_changes(tmp_path, lerobot_dataset_factory):
+    """A store built from another dataset or revision is cleared, and episodes moved in the videos are decoded
+    again."""
+    dataset = lerobot_dataset_factory(
+        root=tmp_path / "test", total_episodes=3, total_frames=90, frame_store_root=tmp_path / "store"
+    )
+    vid_key = dataset.meta.video_keys[0]
+    store_file = dataset.frame_store.get_episode_path(vid_key, 0)
+    assert store_file.exists()
+
+    store = VideoFrameStore(
+        tmp_path / "store", dataset.fps, repo_id=dataset.repo_id, revision=dataset.revision
+    )
+    ep = dataset.meta.episodes[0]
+    video_path = dataset.root / dataset.meta.get_video_file_path(0, vid_key)
+    from_timestamp = ep[f"videos/{vid_key}/from_timestamp"]
+    num_frames = ep["dataset_to_index"] - ep["dataset_from_index"]
+    assert store.has_episode(vid_key, 0, layout=(video_path, from_timestamp, num_frames))
+    assert not store.has_episode(vid_key, 0, layout=(video_path, from_timestamp + 1, num_frames))
+    assert not store.has_episode(vid_key, 0, layout=(video_path, from_timestamp, num_frames + 1))
+
+    store = VideoFrameStore(tmp_path / "store", dataset.fps, repo_id=dataset.repo_id, revision="other")
+    assert not store.has_episode(vid_key, 0)
+    assert not store_file.exists()
+
+
+def test_return_uint8_images(tmp_path, lerobot_dataset_factory):
+    dataset = lerobot_dataset_factory(root=tmp_path / "test", total_episodes=2, total_frames=60)
+    uint8_dataset = lerobot_dataset_factory(
+        root=tmp_path / "test", total_episodes=2, total_frames=60, return_uint8_images=True
+    )
+    item = dataset[35]
+    uint8_item = uint8_dataset[35]
+    batch = uint8_dataset.__getitems__([35])
+    for cam in dataset.meta.camera_keys:
+        assert uint8_item[cam].dtype == torch.uint8
+        assert batch[0][cam].dtype == torch.uint8
+        torch.testing.assert_close(uint8_item[cam].float() / 255, item[cam])
+
+
+def test_async_video_encoding(tmp_path, empty_lerobot_dataset_factory):
+    """Episodes encoded in the background must be saved in order with the same content as synchronous ones."""
+    features = {
+        "image": {"dtype": "video", "shape": (32, 32, 3), "names": ["height", "width", "channels"]},
+        "state": {"dtype": "float32", "shape": (2,), "names": None},
+    }
+    frames_per_episode = [10, 15, 8]
+    datasets_ = {}
+    for name, num_workers in [("sync", 0), ("async", 2)]:
+        dataset = empty_lerobot_dataset_factory(root=tmp_path / name, features=features, use_videos=True)
+        if num_workers > 0:
+            dataset.start_video_encoder(num_workers=num_workers, max_pending_episodes=2)
+        for ep_idx, num_frames in enumerate(frames_per_episode):
+            for frame_idx in range(num_frames):
+                image = np.full((32, 32, 3), 10 * ep_idx + frame_idx, dtype=np.uint8)
+                dataset.add_frame({"image": image, "state": torch.randn(2), "task": "task"})
+            dataset.save_episode()
+        if num_workers > 0:
+            progress = dataset.video_encoder.progress()
+            assert progress["pending_episodes"] <= 2
+        dataset.finalize()
+        dataset.stop_video_encoder()
+        assert dataset.meta.total_episodes == 3
+        assert not (dataset.root / "images").exists() or not any((dataset.root / "images").rglob("*.png"))
+        datasets_[name] = LeRobotDataset(dataset.repo_id, root=dataset.root)
+
+    sync_dataset, async_dataset = datasets_["sync"], datasets_["async"]
+    assert async_dataset.meta.total_frames == sum(frames_per_episode)
+    for key in ["dataset_from_index", "dataset_to_index", "videos/image/from_timestamp"]:
+        assert async_dataset.meta.episodes[key] == sync_dataset.meta.episodes[key]
+    for idx in [0, 9, 10, 24, 25, 32]:
+        assert async_dataset[idx]["episode_index"] == sync_dataset[idx]["episode_index"]
+        assert torch.equal(async_dataset[idx]["image"], sync_dataset[idx]["image"])
+
+
+def test_async_video_encoding_with_batch_encoding(tmp_path, empty_lerobot_dataset_factory):
+    features = {"image": {"dtype": "video", "shape": (32, 32, 3), "names": ["height", "width", "channels"]}}
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features, use_videos=True)
+    dataset.batch_encoding_size = 2
+    with pytest.raises(ValueError):
+        dataset.start_video_encoder()
+
+
+def test_streaming_video_encoding(tmp_path, empty_lerobot_dataset_factory):
+    """Frames streamed to the encoders must be saved like frames written as PNG files and encoded afterwards."""
+    features = {
+        "image": {"dtype": "video", "shape": (32, 32, 3), "names": ["height", "width", "channels"]},
+        "state": {"dtype": "float32", "shape": (2,), "names": None},
+    }
+    frames_per_episode = [10, 15]
+    datasets_ = {}
+    for name, streaming_encoding in [("png", False), ("streaming", True)]:
+        dataset = empty_lerobot_dataset_factory(
+            root=tmp_path / name, features=features, use_videos=True, streaming_encoding=streaming_encoding
+        )
+        # A discarded episode must not leave any video behind
+        for _ in range(5):
+            image = np.full((32, 32, 3), 200, dtype=np.uint8)
+            dataset.add_frame({"image": image, "state": torch.randn(2), "task": "task"})
+        dataset.clear_episode_buffer()
+
+        for ep_idx, num_frames in enumerate(frames_per_episode):
+            for frame_idx in range(num_frames):
+                # float frames are converted like PNG frames
+                image = np.full((32, 32, 3), (10 * ep_idx + frame_idx) / 255, dtype=np.float32)
+                dataset.add_frame({"image": image, "state": torch.randn(2), "task": "task"})
+            dataset.save_episode()
+        dataset.finalize()
+        dataset.stop_streaming_video_encoder()
+        assert not (dataset.root / "images").exists() or not any((dataset.root / "images").rglob("*.png"))
+        datasets_[name] = LeRobotDataset(dataset.repo_id, root=dataset.root)
+
+    png_dataset, streaming_dataset = datasets_["png"], datasets_["streaming"]
+    for key in ["dataset_from_index", "dataset_to_index", "videos/image/to_timestamp"]:
+        assert streaming_dataset.meta.episodes[key] == png_dataset.meta.episodes[key]
+    for idx in [0, 9, 10, 24]:
+        assert torch.equal(streaming_dataset[idx]["image"], png_dataset[idx]["image"])
+    for stat in ["min", "max", "mean"]:
+        np.testing.assert_allclose(
+            streaming_dataset.meta.stats["image"][stat], png_dataset.meta.stats["image"][stat]
+        )
+
+
+def test_streaming_video_encoding_several_cameras(tmp_path, empty_lerobot_dataset_factory):
+    """Each camera streamed to its own encoder must be saved in its own video."""
+    features = {
+        "observation.images.a": {
+            "dtype": "video",
+            "shape": (32, 32, 3),
+            "names": ["height", "width", "channels"],
+        },
+        "observation.images.b": {
+            "dtype": "video",
+            "shape": (32, 32, 3),
+            "names": ["height", "width", "channels"],
+        },
+        "state": {"dtype": "float32", "shape": (2,), "names": None},
+    }
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "streaming", features=features, use_videos=True, streaming_encoding=True
+    )
+    for ep_idx in range(2):
+        for _ in range(10):
+            dataset.add_frame(
+                {
+                    "observation.images.a": np.full((32, 32, 3), 50 + ep_idx, dtype=np.uint8),
+                    "observation.images.b": np.full((32, 32, 3), 200 - ep_idx, dtype=np.uint8),
+                    "state": torch.randn(2),
+                    "task": "task",
+                }
+            )
+        dataset.save_episode()
+    dataset.finalize()
+    dataset.stop_streaming_video_encoder()
+
+    dataset = LeRobotDataset(dataset.repo_id, root=dataset.root)
+    assert len(dataset) == 20
+    for idx, (value_a, value_b) in [(0, (50, 200)), (19, (51, 199))]:
+        item = dataset[idx]
+        assert abs(item["observation.images.a"].mean().item() * 255 - value_a) < 3
+        assert abs(item["observation.images.b"].mean().item() * 255 - value_b) < 3
+
+
+def test_streaming_video_encoding_failure_removes_videos(tmp_path, empty_lerobot_dataset_factory):
+    """When the encoder of one camera fails, the temporary videos of all the cameras must be removed."""
+    features = {
+        key: {"dtype": "video", "shape": (32, 32, 3), "names": ["height", "width", "channels"]}
+        for key in ["observation.images.a", "observation.images.b"]
+    }
+    dataset = empty_lerobot_dataset_factory(
+        root=tmp_path / "streaming", features=features, use_videos=True, streaming_encoding=True
+    )
+    for _ in range(5):
+        dataset.add_frame(
+            {
+                "observation.images.a": np.full((32, 32, 3), 50, dtype=np.uint8),
+                "observation.images.b": np.full((32, 32, 3), 200, dtype=np.uint8),
+                "task": "task",
+            }
+        )
+    video_paths = dict(dataset.streaming_video_encoder.video_paths)
+    failing_encoder = dataset.streaming_video_encoder.encoders["observation.images.b"]
+    wait_result = failing_encoder.wait_result
+    failing_encoder.wait_result = lambda: wait_result() or "RuntimeError('encoding failed')"
+
+    with pytest.raises(RuntimeError, match="Streaming video encoding failed"):
+        dataset.save_episode()
+    dataset.stop_streaming_video_encoder()
+    assert not any(path.parent.exists() for path in video_paths.values())
+
+
+def test_video_info_read_from_video_index(tmp_path, empty_lerobot_dataset_factory, monkeypatch):
+    """The info of the videos of the first episode must be read from their index, without probing them."""
+    features = {"image": {"dtype": "video", "shape": (32, 32, 3), "names": ["height", "width", "channels"]}}
+    dataset = empty_lerobot_dataset_factory(root=tmp_path / "test", features=features, use_videos=True)
+
+    def probe(video_path):
+        raise AssertionError(f"{video_path} must not be probed")
+
+    monkeypatch.setattr("lerobot.datasets.lerobot_dataset.get_video_info", probe)
+    for _ in range(5):
+        dataset.add_frame({"image": np.full((32, 32, 3), 100, dtype=np.uint8), "task": "task"})
+    dataset.save_episode()
+
+    info = dataset.meta.features["image"]["info"]
+    assert (info["video.height"], info["video.width"], info["video.fps"]) == (32, 32, dataset.fps)
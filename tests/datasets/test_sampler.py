@@ -13,6 +13,8 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import numpy as np
+import pytest
 from datasets import Dataset
 
 from lerobot.datasets.push_dataset_to_hub.utils import calculate_episode_data_index
@@ -33,7 +35,7 @@ def test_drop_n_first_frames():
     dataset.set_transform(hf_transform_to_torch)
     episode_data_index = calculate_episode_data_index(dataset)
     sampler = EpisodeAwareSampler(episode_data_index["from"], episode_data_index["to"], drop_n_first_frames=1)
-    assert sampler.indices == [1, 4, 5]
+    assert sampler.indices.tolist() == [1, 4, 5]
     assert len(sampler) == 3
     assert list(sampler) == [1, 4, 5]
 
@@ -49,7 +51,7 @@ def test_drop_n_last_frames():
     dataset.set_transform(hf_transform_to_torch)
     episode_data_index = calculate_episode_data_index(dataset)
     sampler = EpisodeAwareSampler(episode_data_index["from"], episode_data_index["to"], drop_n_last_frames=1)
-    assert sampler.indices == [0, 3, 4]
+    assert sampler.indices.tolist() == [0, 3, 4]
     assert len(sampler) == 3
     assert list(sampler) == [0, 3, 4]
 
@@ -67,7 +69,7 @@ def test_episode_indices_to_use():
     sampler = EpisodeAwareSampler(
         episode_data_index["from"], episode_data_index["to"], episode_indices_to_use=[0, 2]
     )
-    assert sampler.indices == [0, 1, 3, 4, 5]
+    assert sampler.indices.tolist() == [0, 1, 3, 4, 5]
     assert len(sampler) == 5
     assert list(sampler) == [0, 1, 3, 4, 5]
 
@@ -83,10 +85,45 @@ def test_shuffle():
     dataset.set_transform(hf_transform_to_torch)
     episode_data_index = calculate_episode_data_index(dataset)
     sampler = EpisodeAwareSampler(episode_data_index["from"], episode_data_index["to"], shuffle=False)
-    assert sampler.indices == [0, 1, 2, 3, 4, 5]
+    assert sampler.indices.tolist() == [0, 1, 2, 3, 4, 5]
     assert len(sampler) == 6
     assert list(sampler) == [0, 1, 2, 3, 4, 5]
     sampler = EpisodeAwareSampler(episode_data_index["from"], episode_data_index["to"], shuffle=True)
-    assert sampler.indices == [0, 1, 2, 3, 4, 5]
+    assert sampler.indices.tolist() == [0, 1, 2, 3, 4, 5]
     assert len(sampler) == 6
     assert set(sampler) == {0, 1, 2, 3, 4, 5}
+
+
+def test_block_shuffle():
+    # 3 episodes of 100, 50 and 30 frames
+    from_indices = [0, 100, 150]
+    to_indices = [100, 150, 180]
+    block_size = 10
+    sampler = EpisodeAwareSampler(from_indices, to_indices, shuffle=True, block_size=block_size)
+    assert sampler.indices.dtype == np.int64
+
+    for _ in range(3):
+        samples = list(sampler)
+        # Every frame is sampled exactly once per epoch
+        assert sorted(samples) == list(range(180))
+        # Samples are yielded block by block, so consecutive samples are close frames of the same episode
+        # except at block boundaries. There are at most `len // block_size + 1` blocks per episode.
+        episodes = np.searchsorted(to_indices, samples, side="right")
+        jumps = (episodes[1:] != episodes[:-1]) | (np.abs(np.diff(samples)) >= block_size)
+        assert jumps.sum() < (100 // block_size + 1) + (50 // block_size + 1) + (30 // block_size + 1)
+
+
+def test_block_shuffle_interleave():
+    sampler = EpisodeAwareSampler(
+        [0, 100], [100, 200], drop_n_last_frames=4, shuffle=True, block_size=8, interleave_blocks=4
+    )
+    samples = list(sampler)
+    assert sorted(samples) == [*range(0, 96), *range(100, 196)]
+    # A window of `block_size * interleave_blocks` samples spans at most `interleave_blocks` blocks
+    window = samples[:32]
+    assert len({idx // 8 for idx in window}) <= 2 * 4
+
+
+def test_invalid_block_size():
+    with pytest.raises(ValueError):
+        EpisodeAwareSampler([0], [10], block_size=0)
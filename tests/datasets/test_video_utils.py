@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+import threading
+
+import fsspec
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+
+from lerobot.datasets.video_utils import (
+    VideoDecoderCache,
+    concatenate_video_files,
+    decode_video_frames_torchvision,
+    encode_video_frames,
+    get_video_index_path,
+    get_video_info,
+    load_video_index,
+    write_video_index,
+)
+
+FRAME_SHAPE = (3, 64, 64)
+FRAME_BYTES = 3 * 64 * 64
+
+
+def make_frames(indices: list[int]) -> dict[int, tuple[torch.Tensor, float]]:
+    return {idx: (torch.full(FRAME_SHAPE, idx, dtype=torch.uint8), idx / 30) for idx in indices}
+
+
+def test_frame_cache_hits_and_misses():
+    cache = VideoDecoderCache(max_frames_size_in_mb=1)
+    cache.put_frames("video.mp4", make_frames([0, 1, 2]))
+
+    cached = cache.get_frames("video.mp4", [1, 2, 3])
+    assert sorted(cached) == [1, 2]
+    assert torch.equal(cached[1][0], torch.full(FRAME_SHAPE, 1, dtype=torch.uint8))
+    assert cached[2][1] == pytest.approx(2 / 30)
+
+    # Frames are keyed by video path as well
+    assert cache.get_frames("other.mp4", [0]) == {}
+
+    stats = cache.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["num_frames"] == 3
+    assert stats["num_bytes"] == 3 * FRAME_BYTES
+
+
+def test_frame_cache_lru_eviction():
+    cache = VideoDecoderCache(max_frames_size_in_mb=3 * FRAME_BYTES / 1024**2)
+    cache.put_frames("video.mp4", make_frames([0, 1, 2]))
+
+    # Touch frame 0 so that frame 1 becomes the least recently used
+    cache.get_frames("video.mp4", [0])
+    cache.put_frames("video.mp4", make_frames([3]))
+
+    assert sorted(cache.get_frames("video.mp4", [0, 1, 2, 3])) == [0, 2, 3]
+    assert cache.frames_size_in_bytes() == 3 * FRAME_BYTES
+    assert cache.stats()["evictions"] == 1
+
+
+def test_frame_cache_disabled():
+    cache = VideoDecoderCache(max_frames_size_in_mb=0)
+    cache.put_frames("video.mp4", make_frames([0, 1]))
+    assert cache.get_frames("video.mp4", [0, 1]) == {}
+    assert cache.frames_size_in_bytes() == 0
+
+
+def test_frame_cache_clear():
+    cache = VideoDecoderCache()
+    cache.put_frames("video.mp4", make_frames([0, 1]))
+    cache.clear()
+    assert cache.frames_size_in_bytes() == 0
+    assert cache.get_frames("video.mp4", [0, 1]) == {}
+
+
+@pytest.mark.parametrize("kwargs", [{"max_open_files": 0}, {"max_frames_size_in_mb": -1}])
+def test_invalid_cache_limits(kwargs):
+    with pytest.raises(ValueError):
+        VideoDecoderCache(**kwargs)
+
+
+def test_decoder_evicted_while_in_use(tmp_path, monkeypatch):
+    # The decoders only read their file here, no need for torchcodec
+    monkeypatch.setattr(
+        VideoDecoderCache, "_open_decoder", staticmethod(lambda path: (path, fsspec.open(path).open()))
+    )
+    video_paths = [tmp_path / f"video_{i}.mp4" for i in range(2)]
+    for video_path in video_paths:
+        video_path.write_bytes(b"video")
+    cache = VideoDecoderCache(max_open_files=1)
+
+    in_use, evicted = threading.Event(), threading.Event()
+    file_handles = {}
+
+    def use_decoder():
+        with cache.decoder(video_paths[0]) as decoder:
+            file_handles["decoder"] = cache._cache[str(decoder)].file_handle
+            in_use.set()
+            evicted.wait(timeout=5)
+            # Still readable after the eviction by the other thread
+            file_handles["decoder"].seek(0)
+            file_handles["content"] = file_handles["decoder"].read()
+
+    thread = threading.Thread(target=use_decoder)
+    thread.start()
+    assert in_use.wait(timeout=5)
+    with cache.decoder(video_paths[1]):
+        pass
+    assert cache.size() == 1
+    evicted.set()
+    thread.join(timeout=5)
+
+    assert file_handles["content"] == b"video"
+    # Closed by the last release
+    assert file_handles["decoder"].closed
+
+
+def make_video(tmp_path, name: str, num_frames: int = 20, fps: int = 10, g: int = 5):
+    imgs_dir = tmp_path / f"{name}_images"
+    imgs_dir.mkdir()
+    for i in range(num_frames):
+        Image.fromarray(np.full((32, 32, 3), i * 10, dtype=np.uint8)).save(imgs_dir / f"frame-{i:06d}.png")
+    video_path = tmp_path / f"{name}.mp4"
+    encode_video_frames(imgs_dir, video_path, fps, g=g)
+    return video_path
+
+
+def test_write_and_load_video_index(tmp_path):
+    video_path = make_video(tmp_path, "video")
+    assert load_video_index(video_path) is None
+
+    write_video_index(video_path)
+    index = load_video_index(video_path)
+    assert len(index) == 20
+    np.testing.assert_allclose(index.pts, np.arange(20) / 10)
+    assert index.is_keyframe[0]
+    assert index.get_frame_indices([0.0, 0.31, 0.96, 5.0]).tolist() == [0, 3, 10, 19]
+
+    # Stale indices of rewritten videos are ignored
+    with open(video_path, "ab") as f:
+        f.write(b"0")
+    assert load_video_index(video_path) is None
+
+
+def test_plan_decode_ranges(tmp_path):
+    video_path = make_video(tmp_path, "video")
+    index = write_video_index(video_path)
+    keyframes = np.flatnonzero(index.is_keyframe).tolist()
+    assert len(keyframes) > 1
+
+    ranges = index.plan_decode_ranges([1, 2, 19])
+    assert ranges[0] == (0, 2)
+    # the last frame is decoded from its own key frame instead of decoding all the frames in between
+    assert ranges[-1] == (max(k for k in keyframes if k <= 19), 19)
+
+
+def test_decode_with_video_index(tmp_path):
+    video_path = make_video(tmp_path, "video")
+    timestamps = [0.1, 0.2, 1.8, 1.9]
+    expected = decode_video_frames_torchvision(video_path, timestamps, tolerance_s=1e-4)
+
+    write_video_index(video_path)
+    frames = decode_video_frames_torchvision(video_path, timestamps, tolerance_s=1e-4)
+    assert torch.equal(frames, expected)
+
+
+def test_concatenate_writes_video_index(tmp_path):
+    video_paths = [make_video(tmp_path, f"video_{i}", num_frames=10) for i in range(2)]
+    output_path = tmp_path / "concatenated.mp4"
+    concatenate_video_files(video_paths, output_path)
+
+    assert get_video_index_path(output_path).exists()
+    index = load_video_index(output_path)
+    np.testing.assert_allclose(index.pts, np.arange(20) / 10)
+
+
+def test_video_index_holds_video_info(tmp_path):
+    video_path = make_video(tmp_path, "video")
+    write_video_index(video_path)
+    assert load_video_index(video_path).info == get_video_info(video_path)
@@ -15,11 +15,12 @@
 # limitations under the License.
 
 import re
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from lerobot.motors.motors_bus import (
+    LatencyHistogram,
     Motor,
     MotorNormMode,
     assert_same_address,
@@ -356,3 +357,108 @@ def test_sync_write_by_value_dict(data_name, ids_values, dummy_motors):
     mock__encode_sign.assert_called_once_with(data_name, ids_values)
     if data_name in bus.normalized_data:
         mock__unnormalize.assert_called_once_with(ids_values)
+
+
+class FakeGroupSyncRead:
+    """Sync reader replying with `100 * id + address` for every register."""
+
+    def __init__(self, port, ph, start_address, data_length):
+        self.start_address = start_address
+        self.data_length = data_length
+        self.ids = []
+        self.transactions = 0
+
+    def addParam(self, id_):  # noqa: N802
+        self.ids.append(id_)
+
+    def txPacket(self):  # noqa: N802
+        self.transactions += 1
+        return 0
+
+    def rxPacket(self):  # noqa: N802
+        return 0
+
+    def txRxPacket(self):  # noqa: N802
+        self.transactions += 1
+        return 0
+
+    def getData(self, id_, address, length):  # noqa: N802
+        assert self.start_address <= address
+        assert address + length <= self.start_address + self.data_length
+        return 100 * id_ + address
+
+
+@pytest.fixture
+def sync_read_bus(dummy_motors) -> MockMotorsBus:
+    bus = MockMotorsBus("/dev/dummy-port", dummy_motors)
+    bus.connect(handshake=False)
+    bus._comm_success = 0
+    bus.packet_handler = MagicMock()
+    bus.sync_reader = FakeGroupSyncRead(bus.port_handler, bus.packet_handler, 0, 0)
+    return bus
+
+
+def test__sync_read_reuses_sync_reader(sync_read_bus):
+    for _ in range(3):
+        values, _ = sync_read_bus._sync_read(3, 4, [1, 2])
+        assert values == {1: 103, 2: 203}
+
+    assert len(sync_read_bus._sync_readers) == 1
+    reader = next(iter(sync_read_bus._sync_readers.values()))
+    assert reader.ids == [1, 2]
+    assert reader.transactions == 3
+    assert sync_read_bus.transaction_latencies()["sync_read"]["count"] == 3
+
+
+def test_sync_read_multi_single_transaction(sync_read_bus):
+    with patch.object(MockMotorsBus, "_decode_sign", side_effect=lambda data_name, ids_values: ids_values):
+        values = sync_read_bus.sync_read_multi(
+            {"Present_Position": ["dummy_1", "dummy_2"], "Present_Velocity": "dummy_3"}, normalize=False
+        )
+
+    assert values == {
+        "Present_Position": {"dummy_1": 103, "dummy_2": 203},
+        "Present_Velocity": {"dummy_3": 307},
+    }
+    # Present_Position (3, 4) and Present_Velocity (7, 4) are read together
+    (key, reader), *others = sync_read_bus._sync_readers.items()
+    assert not others
+    assert key == (3, 8, (1, 2, 3))
+    assert reader.transactions == 1
+
+
+def test_sync_read_begin_end(sync_read_bus):
+    pending = sync_read_bus.sync_read_begin({"Present_Velocity": None})
+    with pytest.raises(RuntimeError):
+        sync_read_bus.sync_read_begin({"Present_Position": None})
+
+    with patch.object(MockMotorsBus, "_decode_sign", side_effect=lambda data_name, ids_values: ids_values):
+        values = sync_read_bus.sync_read_end(pending, normalize=False)
+
+    assert values == {"Present_Velocity": {"dummy_1": 107, "dummy_2": 207, "dummy_3": 307}}
+    assert {"sync_read_tx", "sync_read_rx"} <= sync_read_bus.transaction_latencies().keys()
+    with pytest.raises(RuntimeError):
+        sync_read_bus.sync_read_end(pending)
+
+
+def test_sync_read_begin_different_addresses(dummy_motors):
+    motors = {**dummy_motors, "dummy_4": Motor(4, "model_1", MotorNormMode.RANGE_M100_100)}
+    bus = MockMotorsBus("/dev/dummy-port", motors)
+    bus.connect(handshake=False)
+
+    with pytest.raises(NotImplementedError):
+        bus.sync_read_begin({"Present_Position": "dummy_4", "Goal_Position": "dummy_1"})
+
+
+def test_latency_histogram():
+    histogram = LatencyHistogram()
+    for latency in [0.0003, 0.0015, 0.0015, 0.003, 0.1]:
+        histogram.record(latency)
+
+    stats = histogram.as_dict()
+    assert stats["count"] == 5
+    assert stats["p50_ms"] == pytest.approx(2.0)
+    assert stats["p99_ms"] == pytest.approx(100.0)
+    assert stats["max_ms"] == pytest.approx(100.0)
+    assert stats["buckets_ms"]["<=0.5"] == 1
+    assert stats["buckets_ms"]["<=inf"] == 1
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+import time
+from unittest.mock import MagicMock, call
+
+import pytest
+
+from lerobot.motors import MotorsBusThread
+
+READS = {"Present_Position": ["arm"], "Present_Velocity": ["wheel"]}
+
+
+@pytest.fixture
+def bus() -> MagicMock:
+    bus = MagicMock()
+    bus.port = "/dev/dummy-port"
+    positions = iter(range(1_000_000))
+    bus.sync_read_multi.side_effect = lambda reads, normalize: {
+        "Present_Position": {"arm": next(positions)},
+        "Present_Velocity": {"wheel": 0},
+    }
+    return bus
+
+
+def test_state_is_published_every_cycle(bus):
+    bus_thread = MotorsBusThread(bus, READS, fps=200)
+    bus_thread.start()
+    try:
+        first = bus_thread.get_state()
+        time.sleep(0.05)
+        last = bus_thread.get_state()
+    finally:
+        bus_thread.stop()
+
+    assert last.cycle > first.cycle
+    assert last.timestamp > first.timestamp
+    assert last.values["Present_Position"]["arm"] > first.values["Present_Position"]["arm"]
+    bus.sync_read_multi.assert_called_with(READS, normalize=True)
+    assert bus_thread.stats.cycles >= last.cycle
+
+
+def test_goals_are_merged_and_written_once(bus):
+    bus_thread = MotorsBusThread(bus, READS, fps=200)
+    bus_thread.set_goals({"Goal_Position": {"arm": 1.0}, "Goal_Velocity": {"wheel": 5}})
+    bus_thread.set_goals({"Goal_Position": {"arm": 2.0}})
+
+    bus_thread.start()
+    time.sleep(0.05)
+    bus_thread.set_goals({"Goal_Velocity": {"wheel": 0}})
+    bus_thread.stop()
+
+    assert bus.sync_write.call_args_list == [
+        call("Goal_Position", {"arm": 2.0}, normalize=True),
+        call("Goal_Velocity", {"wheel": 5}, normalize=True),
+        # Pending goals are sent when stopping
+        call("Goal_Velocity", {"wheel": 0}, normalize=True),
+    ]
+
+
+def test_call_runs_in_bus_thread(bus):
+    bus_thread = MotorsBusThread(bus, READS, fps=200)
+    bus_thread.start()
+    try:
+        thread_name = bus_thread.call(lambda: threading.current_thread().name)
+        with pytest.raises(ValueError):
+            bus_thread.call(int, "not a number")
+    finally:
+        bus_thread.stop()
+
+    assert thread_name == "MagicMockThread"
+    # Without the thread, calls run in the caller's thread
+    assert bus_thread.call(lambda: threading.current_thread().name) == threading.current_thread().name
+
+
+def test_start_times_out_without_state(bus):
+    bus.sync_read_multi.side_effect = ConnectionError("no reply")
+    bus_thread = MotorsBusThread(bus, READS, fps=200)
+
+    with pytest.raises(TimeoutError):
+        bus_thread.start(timeout=0.05)
+    assert not bus_thread.is_running
+    assert bus_thread.stats.errors > 0
+
+
+def test_stale_state_is_read_again(bus):
+    bus_thread = MotorsBusThread(bus, READS, fps=200)
+    bus_thread.start()
+    assert not bus_thread.is_stale(bus_thread.get_fresh_state())
+    bus_thread.stop()
+
+    time.sleep(5 / bus_thread.fps)
+    stale = bus_thread.get_state()
+    assert bus_thread.is_stale(stale)
+    fresh = bus_thread.get_fresh_state()
+    assert fresh.timestamp > stale.timestamp
+    assert fresh.values["Present_Position"]["arm"] > stale.values["Present_Position"]["arm"]
+
+
+def test_stale_state_raises_when_cycles_fail(bus):
+    bus_thread = MotorsBusThread(bus, READS, fps=200)
+    bus_thread.start()
+    try:
+        bus.sync_read_multi.side_effect = ConnectionError("no reply")
+        time.sleep(5 / bus_thread.fps)
+        with pytest.raises(ConnectionError):
+            bus_thread.get_fresh_state()
+    finally:
+        bus_thread.stop()
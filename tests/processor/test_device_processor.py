@@ -540,10 +540,11 @@ def test_float_dtype_with_mixed_tensors():
     processor = DeviceProcessorStep(device="cpu", float_dtype="float32")
 
     observation = {
-        OBS_IMAGE: torch.randint(0, 255, (3, 64, 64), dtype=torch.uint8),  # Should not convert
+        OBS_IMAGE: torch.randint(0, 255, (3, 64, 64), dtype=torch.uint8),  # Should convert to [0, 1]
         OBS_STATE: torch.randn(10, dtype=torch.float64),  # Should convert
         "observation.mask": torch.tensor([True, False, True], dtype=torch.bool),  # Should not convert
         "observation.indices": torch.tensor([1, 2, 3], dtype=torch.long),  # Should not convert
+        "observation.bytes": torch.tensor([1, 2, 3], dtype=torch.uint8),  # Should not convert
     }
     action = torch.randn(5, dtype=torch.float16)  # Should convert
 
@@ -551,13 +552,30 @@ def test_float_dtype_with_mixed_tensors():
     result = processor(transition)
 
     # Check conversions
-    assert result[TransitionKey.OBSERVATION][OBS_IMAGE].dtype == torch.uint8  # Unchanged
+    assert result[TransitionKey.OBSERVATION][OBS_IMAGE].dtype == torch.float32  # Converted
+    assert result[TransitionKey.OBSERVATION]["observation.bytes"].dtype == torch.uint8  # Unchanged
     assert result[TransitionKey.OBSERVATION][OBS_STATE].dtype == torch.float32  # Converted
     assert result[TransitionKey.OBSERVATION]["observation.mask"].dtype == torch.bool  # Unchanged
     assert result[TransitionKey.OBSERVATION]["observation.indices"].dtype == torch.long  # Unchanged
     assert result[TransitionKey.ACTION].dtype == torch.float32  # Converted
 
 
+@pytest.mark.parametrize("float_dtype", [None, "float16", "bfloat16"])
+def test_uint8_images_converted_to_float(float_dtype):
+    """uint8 images are transferred as is, then converted to float in [0, 1] on the target device."""
+    processor = DeviceProcessorStep(device="cpu", float_dtype=float_dtype)
+    image = torch.randint(0, 256, (2, 3, 64, 64), dtype=torch.uint8)
+    observation = {OBS_IMAGE: image, f"{OBS_IMAGE}s.wrist": image.clone()}
+
+    result = processor(create_transition(observation=observation))
+
+    expected_dtype = processor._target_float_dtype or torch.float32
+    for key in observation:
+        converted = result[TransitionKey.OBSERVATION][key]
+        assert converted.dtype == expected_dtype
+        torch.testing.assert_close(converted, (image.float() / 255).to(expected_dtype))
+
+
 def test_float_dtype_serialization():
     """Test that float_dtype is properly serialized in get_config."""
     device = "cuda" if torch.cuda.is_available() else "cpu"
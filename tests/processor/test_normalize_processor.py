@@ -150,6 +150,20 @@ def test_mean_std_normalization(observation_normalizer):
     assert torch.allclose(normalized_obs[OBS_IMAGE], expected_image)
 
 
+def test_mean_std_normalization_uint8_image(observation_normalizer):
+    """uint8 images are scaled to [0, 1] before being normalized with stats computed on [0, 1] images."""
+    observation = {OBS_IMAGE: torch.tensor([255, 127, 0], dtype=torch.uint8)}
+    transition = create_transition(observation=observation)
+
+    normalized_obs = observation_normalizer(transition)[TransitionKey.OBSERVATION]
+
+    expected_image = (torch.tensor([255, 127, 0]) / 255 - 0.5) / 0.2
+    assert normalized_obs[OBS_IMAGE].dtype == torch.float32
+    assert torch.allclose(normalized_obs[OBS_IMAGE], expected_image)
+    # Stats must keep their floating point dtype
+    assert observation_normalizer._tensor_stats[OBS_IMAGE]["mean"].dtype == torch.float32
+
+
 def test_min_max_normalization(observation_normalizer):
     observation = {
         OBS_STATE: torch.tensor([0.5, 0.0]),
@@ -21,7 +21,7 @@ import pytest
 import torch
 from torch.multiprocessing import Event, Queue
 
-from lerobot.utils.constants import OBS_STR
+from lerobot.utils.constants import OBS_IMAGE, OBS_STR
 from lerobot.utils.transition import Transition
 from tests.utils import require_package
 
@@ -207,3 +207,73 @@ def test_interactions_stream():
     for i, message in enumerate(streamed_data):
         deserialized_interaction = bytes_to_python_object(message.data)
         assert deserialized_interaction == test_interactions[i]
+
+
+@require_package("grpc")
+def test_push_transitions_to_transport_queue_compress_images():
+    from lerobot.rl.actor import push_transitions_to_transport_queue
+    from lerobot.transport.utils import StreamStats, bytes_to_transitions
+    from lerobot.utils.transition import decompress_transition_images
+
+    """Test that the images are sent as uint8 and converted back on the learner side."""
+    image = torch.rand(3, 64, 64)
+    transition = Transition(
+        state={OBS_IMAGE: image, "state": torch.randn(10)},
+        action=torch.randn(5),
+        reward=torch.tensor(1.0),
+        done=torch.tensor(False),
+        truncated=torch.tensor(False),
+        next_state={OBS_IMAGE: image, "state": torch.randn(10)},
+        complementary_info=None,
+    )
+    transitions_queue = Queue()
+    stats = StreamStats("transitions")
+
+    push_transitions_to_transport_queue([transition], transitions_queue, compress_images=True, stats=stats)
+
+    serialized_data = transitions_queue.get()
+    assert stats.messages == 1
+    assert stats.bytes == len(serialized_data)
+    # Both images take less space than a single float32 one
+    assert len(serialized_data) < image.numel() * 4
+    (received,) = bytes_to_transitions(serialized_data)
+    assert received["state"][OBS_IMAGE].dtype == torch.uint8
+
+    received = decompress_transition_images(received)
+    assert received["next_state"][OBS_IMAGE].dtype == torch.float32
+    assert torch.allclose(received["next_state"][OBS_IMAGE], image, atol=1 / 255)
+    assert torch.equal(received["state"]["state"], transition["state"]["state"])
+
+
+@require_package("grpc")
+@pytest.mark.timeout(3)  # force cross-platform watchdog
+def test_transitions_stream_coalesces_small_messages():
+    from lerobot.rl.actor import transitions_stream
+    from lerobot.transport.utils import StreamStats, bytes_to_transitions, transitions_to_bytes
+
+    """Test that small transition messages are merged until the batch size is reached."""
+    shutdown_event = Event()
+    transitions_queue = Queue()
+    for i in range(4):
+        transition = Transition(
+            state={"state": torch.full((10,), float(i))},
+            action=torch.randn(5),
+            reward=torch.tensor(float(i)),
+            done=torch.tensor(False),
+            truncated=torch.tensor(False),
+            next_state={"state": torch.randn(10)},
+            complementary_info=None,
+        )
+        transitions_queue.put(transitions_to_bytes([transition]))
+
+    stats = StreamStats("transitions")
+    stream_generator = transitions_stream(
+        shutdown_event, transitions_queue, 0.1, batch_bytes=1 << 20, batch_timeout=0.3, stats=stats
+    )
+    message = next(stream_generator)
+    shutdown_event.set()
+
+    transitions = bytes_to_transitions(message.data)
+    assert [t["reward"].item() for t in transitions] == [0.0, 1.0, 2.0, 3.0]
+    assert stats.messages == 1
+    assert stats.bytes == len(message.data)
@@ -229,7 +229,8 @@ def test_end_to_end_interactions_flow(cfg):
 def test_end_to_end_parameters_flow(cfg, data_size):
     from lerobot.rl.actor import establish_learner_connection, learner_service_client, receive_policy
     from lerobot.rl.learner import start_learner
-    from lerobot.transport.utils import bytes_to_state_dict, state_to_bytes
+    from lerobot.rl.parameter_sync import ParameterEncoder
+    from lerobot.transport.utils import bytes_to_state_dict
 
     """Test complete parameter flow from learner to actor, with small and large data."""
     # Actor's local queue to receive params
@@ -279,7 +280,7 @@ def test_end_to_end_parameters_flow(cfg, data_size):
         input_params = {"large_layer.weight": torch.randn(1024, 1024)}
 
     # Simulate learner having new parameters to send
-    parameters_learner_queue.put(state_to_bytes(input_params))
+    parameters_learner_queue.put(ParameterEncoder().encode(0, {"policy": input_params}))
 
     # Wait for the actor to receive the parameters
     time.sleep(0.1)
@@ -291,7 +292,7 @@ def test_end_to_end_parameters_flow(cfg, data_size):
     channel.close()
 
     # Verify that the actor received the parameters correctly
-    received_params = bytes_to_state_dict(parameters_actor_queue.get())
+    received_params = bytes_to_state_dict(parameters_actor_queue.get())["policy"]
 
     assert received_params.keys() == input_params.keys()
     for key in input_params:
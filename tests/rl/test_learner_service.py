@@ -372,3 +372,89 @@ def test_stream_parameters_waits_and_retries_on_empty_queue():
     close_learner_service_stub(channel, server)
 
     assert received_params == [b"param_after_wait", b"param_after_wait_2"]
+
+
+@require_package("grpc")
+@pytest.mark.timeout(10)  # force cross-platform watchdog
+def test_multiple_actors():
+    import grpc
+
+    from lerobot.rl.learner_service import ACTOR_ID_METADATA_KEY, LearnerService
+    from lerobot.transport import services_pb2, services_pb2_grpc
+
+    """Test that transitions of several actors are merged and parameters are broadcast to all of them."""
+    shutdown_event = Event()
+    parameters_queue = Queue()
+    transitions_queue = Queue()
+    servicer = LearnerService(
+        shutdown_event=shutdown_event,
+        parameters_queue=parameters_queue,
+        seconds_between_pushes=0.05,
+        transition_queue=transitions_queue,
+        interaction_message_queue=Queue(),
+        queue_get_timeout=0.1,
+        actor_queue_size=1,
+    )
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+    services_pb2_grpc.add_LearnerServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("[::]:0")
+    server.start()
+    channel = grpc.insecure_channel(f"localhost:{port}")
+    client = services_pb2_grpc.LearnerServiceStub(channel)
+
+    def send(actor_id: str):
+        messages = [
+            services_pb2.Transition(transfer_state=services_pb2.TransferState.TRANSFER_END, data=data)
+            for data in [f"{actor_id}_{i}".encode() for i in range(3)]
+        ]
+        client.SendTransitions(iter(messages), metadata=((ACTOR_ID_METADATA_KEY, actor_id),))
+
+    try:
+        senders = [threading.Thread(target=send, args=(actor_id,)) for actor_id in ["robot", "sim"]]
+        for sender in senders:
+            sender.start()
+        for sender in senders:
+            sender.join()
+
+        transitions = [transitions_queue.get(timeout=1) for _ in range(6)]
+        for actor_id in ["robot", "sim"]:
+            assert [t for t in transitions if t.startswith(actor_id.encode())] == [
+                f"{actor_id}_{i}".encode() for i in range(3)
+            ]
+
+        parameters_queue.put(b"params")
+        streams = [
+            client.StreamParameters(services_pb2.Empty(), metadata=((ACTOR_ID_METADATA_KEY, actor_id),))
+            for actor_id in ["robot", "sim"]
+        ]
+        assert [next(stream).data for stream in streams] == [b"params", b"params"]
+
+        stats = servicer.actor_stats()
+        assert stats.keys() == {"robot", "sim"}
+        assert stats["robot"]["transition_messages_per_s"] > 0
+        assert stats["sim"]["parameters_versions_behind"] == 0
+    finally:
+        shutdown_event.set()
+        close_learner_service_stub(channel, server)
+
+
+@require_package("grpc")
+@pytest.mark.timeout(3)  # force cross-platform watchdog
+def test_send_transitions_with_compression():
+    import grpc
+
+    from lerobot.transport import services_pb2
+
+    """Test that compressed transition streams are received unchanged."""
+    shutdown_event = Event()
+    transitions_queue = Queue()
+    client, channel, server = create_learner_service_stub(
+        shutdown_event, Queue(), transitions_queue, Queue(), 1
+    )
+
+    data = bytes(range(256)) * 1024
+    messages = [services_pb2.Transition(transfer_state=services_pb2.TransferState.TRANSFER_END, data=data)]
+    client.SendTransitions(iter(messages), compression=grpc.Compression.Gzip)
+
+    close_learner_service_stub(channel, server)
+    assert transitions_queue.get(timeout=1) == data
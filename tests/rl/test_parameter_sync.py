@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+
+# Copyright 2025 The HuggingFace Inc. team. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+from torch import nn
+
+from lerobot.rl.parameter_sync import (
+    ParameterDecoder,
+    ParameterEncoder,
+    load_trainable_state_dict,
+    trainable_state_dict,
+)
+
+
+def make_module() -> nn.Module:
+    module = nn.Sequential(nn.Linear(8, 16), nn.BatchNorm1d(16), nn.Linear(16, 4))
+    module[0].requires_grad_(False)
+    return module
+
+
+def test_trainable_state_dict_skips_frozen_parameters():
+    module = make_module()
+    state_dict = trainable_state_dict(module)
+
+    assert "0.weight" not in state_dict
+    assert "2.weight" in state_dict
+    assert "1.running_mean" in state_dict
+
+    other = make_module()
+    load_trainable_state_dict(other, state_dict)
+    assert torch.equal(other[2].weight, module[2].weight)
+    assert not torch.equal(other[0].weight, module[0].weight)
+
+    with pytest.raises(KeyError):
+        load_trainable_state_dict(other, {"unknown": torch.zeros(1)})
+
+
+@pytest.mark.parametrize(
+    "delta_encoding, quantization, atol",
+    [(False, None, 0), (True, None, 0), (True, "fp16", 1e-3), (True, "int8", 3e-2)],
+)
+def test_encoder_decoder_round_trip(delta_encoding, quantization, atol):
+    encoder = ParameterEncoder(delta_encoding=delta_encoding, quantization=quantization)
+    decoder = ParameterDecoder()
+    weight = torch.randn(32, 32)
+    steps = torch.tensor(0)
+
+    for version in range(10):
+        weight = weight + 0.01 * torch.randn_like(weight)
+        state_dicts = decoder.decode(encoder.encode(version, {"policy": {"weight": weight, "steps": steps}}))
+
+        assert decoder.version == version
+        assert state_dicts["policy"]["weight"].dtype == torch.float32
+        assert torch.allclose(state_dicts["policy"]["weight"], weight, atol=atol, rtol=0)
+        assert torch.equal(state_dicts["policy"]["steps"], steps)
+
+
+def test_encoder_quantized_deltas_are_smaller():
+    weight = torch.randn(64, 64)
+    full = ParameterEncoder().encode(0, {"policy": {"weight": weight}})
+
+    encoder = ParameterEncoder(delta_encoding=True, quantization="int8")
+    encoder.encode(0, {"policy": {"weight": weight}})
+    delta = encoder.encode(1, {"policy": {"weight": weight + 0.01}})
+    assert len(delta) < len(full) / 3
+
+    encoder = ParameterEncoder(delta_encoding=True)
+    encoder.encode(0, {"policy": {"weight": weight}})
+    unchanged = encoder.encode(1, {"policy": {"weight": weight}})
+    assert len(unchanged) < len(delta)
+
+
+def test_encoder_does_not_alias_the_parameters():
+    module = nn.Linear(4, 4)
+    encoder = ParameterEncoder(delta_encoding=True)
+    decoder = ParameterDecoder()
+
+    decoder.decode(encoder.encode(0, {"policy": trainable_state_dict(module)}))
+    with torch.no_grad():
+        module.weight.add_(1.0)
+    state_dicts = decoder.decode(encoder.encode(1, {"policy": trainable_state_dict(module)}))
+
+    assert torch.allclose(state_dicts["policy"]["weight"], module.weight)
+
+
+def test_decoder_skips_stale_versions():
+    encoder = ParameterEncoder()
+    decoder = ParameterDecoder()
+
+    assert decoder.decode(encoder.encode(5, {"policy": {"weight": torch.ones(2)}})) is not None
+    assert decoder.decode(encoder.encode(3, {"policy": {"weight": torch.zeros(2)}})) is None
+    assert decoder.version == 5
+
+
+def test_decoder_rejects_delta_against_unknown_version():
+    encoder = ParameterEncoder(delta_encoding=True)
+    encoder.encode(0, {"policy": {"weight": torch.ones(2)}})
+    delta = encoder.encode(1, {"policy": {"weight": torch.zeros(2)}})
+
+    with pytest.raises(ValueError):
+        ParameterDecoder().decode(delta)
+
+
+def test_encoder_unknown_quantization():
+    with pytest.raises(ValueError):
+        ParameterEncoder(quantization="int4")
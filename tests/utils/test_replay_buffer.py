@@ -21,7 +21,13 @@ import pytest
 import torch
 
 from lerobot.datasets.lerobot_dataset import LeRobotDataset
-from lerobot.rl.buffer import BatchTransition, ReplayBuffer, random_crop_vectorized
+from lerobot.rl.buffer import (
+    BatchTransition,
+    ReplayBuffer,
+    SumTree,
+    concatenate_batch_transitions,
+    random_crop_vectorized,
+)
 from lerobot.utils.constants import ACTION, DONE, OBS_IMAGE, OBS_STATE, OBS_STR, REWARD
 from tests.fixtures.constants import DUMMY_REPO_ID
 
@@ -43,6 +49,7 @@ def create_empty_replay_buffer(
     optimize_memory: bool = False,
     use_drq: bool = False,
     image_augmentation_function: Callable | None = None,
+    prioritized: bool = False,
 ) -> ReplayBuffer:
     buffer_capacity = 10
     device = "cpu"
@@ -53,6 +60,7 @@ def create_empty_replay_buffer(
         optimize_memory=optimize_memory,
         use_drq=use_drq,
         image_augmentation_function=image_augmentation_function,
+        prioritized=prioritized,
     )
 
 
@@ -679,3 +687,221 @@ def test_async_iterator_multiple_iterations():
 
     # Ensure iterator can be disposed without blocking
     del iterator
+
+
+def test_sum_tree_sample_proportional_to_priorities():
+    tree = SumTree(5)
+    tree.update(torch.arange(5), torch.tensor([0.0, 1.0, 0.0, 3.0, 0.0]))
+    assert tree.total.item() == pytest.approx(4.0)
+
+    indices = tree.sample(4000)
+    counts = torch.bincount(indices, minlength=tree.num_leaves)
+    assert counts[[0, 2, 4, 5, 6, 7]].sum() == 0
+    assert counts[3].item() / counts[1].item() == pytest.approx(3.0, rel=0.1)
+
+    tree.update(torch.tensor([3]), torch.tensor([0.0]))
+    assert torch.all(tree.sample(100) == 1)
+
+
+def test_prioritized_sample_and_update_priorities(dummy_state, dummy_action):
+    replay_buffer = create_empty_replay_buffer(prioritized=True)
+    for _ in range(4):
+        replay_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+
+    # New transitions all get the max priority, so sampling is uniform with unit weights
+    batch = replay_buffer.sample(4)
+    assert batch["indices"].shape == (4,)
+    assert torch.all(batch["indices"] < 4)
+    assert torch.allclose(batch["weights"], torch.ones(4))
+
+    replay_buffer.update_priorities(torch.tensor([0, 1, 2, 3]), torch.tensor([0.0, 0.0, 0.0, 10.0]))
+    indices = torch.cat([replay_buffer.sample(4)["indices"] for _ in range(25)])
+    assert (indices == 3).float().mean() > 0.9
+    # Weights are normalized by the largest one of the batch
+    assert replay_buffer.sample(4)["weights"].max() == pytest.approx(1.0)
+
+    # The max priority is given to new transitions
+    replay_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+    assert replay_buffer.sum_tree.get(torch.tensor([4])) == replay_buffer.sum_tree.get(torch.tensor([3]))
+
+
+def test_prioritized_sample_with_memory_optimization(dummy_state, dummy_action):
+    replay_buffer = create_empty_replay_buffer(optimize_memory=True, prioritized=True)
+    replay_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+    replay_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+
+    # The last transition has no next state yet and is never sampled, even after a priority update
+    assert torch.all(replay_buffer.sample(20)["indices"] == 0)
+    replay_buffer.update_priorities(torch.tensor([0, 1]), torch.tensor([1.0, 100.0]))
+    assert torch.all(replay_buffer.sample(20)["indices"] == 0)
+
+
+def test_update_priorities_requires_prioritized_buffer(replay_buffer, dummy_state, dummy_action):
+    replay_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+    with pytest.raises(RuntimeError):
+        replay_buffer.update_priorities(torch.tensor([0]), torch.tensor([1.0]))
+
+
+def test_concatenate_batch_transitions_with_weights(dummy_state, dummy_action):
+    online_buffer = create_empty_replay_buffer(prioritized=True)
+    offline_buffer = create_empty_replay_buffer()
+    for _ in range(3):
+        online_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+        offline_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+
+    online_batch = online_buffer.sample(2)
+    online_indices = online_batch["indices"].clone()
+    batch = concatenate_batch_transitions(online_batch, offline_buffer.sample(3))
+
+    assert batch["weights"].shape == (5,)
+    assert torch.all(batch["weights"][2:] == 1.0)
+    assert torch.equal(batch["indices"], online_indices)
+
+
+def test_compressed_images_share_frames():
+    replay_buffer = ReplayBuffer(5, "cpu", state_dims(), use_drq=False, compress_images=True)
+    states = [create_dummy_state() for _ in range(8)]
+    # The first episode ends with the 3rd transition
+    next_states = [states[i] if i == 2 else states[i + 1] for i in range(7)]
+    for i in range(7):
+        replay_buffer.add(states[i], create_dummy_action(), 1.0, next_states[i], i == 2, False)
+
+    assert replay_buffer.states[OBS_STATE].dtype == torch.float32
+    assert replay_buffer.frames[OBS_IMAGE].dtype == torch.uint8
+    # One frame per transition, plus the first state frame of each episode
+    assert sum(count > 0 for count in replay_buffer.frame_refcounts[OBS_IMAGE]) == 5 + 2
+
+    batch = replay_buffer.sample(5)
+    for i, state_image, next_state_image in zip(
+        batch["indices"], batch["state"][OBS_IMAGE], batch["next_state"][OBS_IMAGE], strict=True
+    ):
+        # The transitions at positions 0 and 1 were overwritten by the 6th and 7th transitions
+        transition_idx = i.item() if i >= 2 else i.item() + 5
+        assert state_image.dtype == torch.float32
+        torch.testing.assert_close(state_image, states[transition_idx][OBS_IMAGE], atol=1 / 255, rtol=0)
+        torch.testing.assert_close(
+            next_state_image, next_states[transition_idx][OBS_IMAGE], atol=1 / 255, rtol=0
+        )
+
+
+def test_compressed_images_bytes_per_transition(dummy_state, dummy_action):
+    replay_buffer = create_empty_replay_buffer()
+    compressed_replay_buffer = ReplayBuffer(10, "cpu", state_dims(), use_drq=False, compress_images=True)
+    compressed_optimized_replay_buffer = ReplayBuffer(
+        10, "cpu", state_dims(), use_drq=False, optimize_memory=True, compress_images=True
+    )
+    for buffer in [replay_buffer, compressed_replay_buffer, compressed_optimized_replay_buffer]:
+        buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+
+    image_bytes = dummy_state[OBS_IMAGE].numel()
+    assert replay_buffer.bytes_per_transition > 8 * image_bytes
+    assert compressed_replay_buffer.bytes_per_transition < 2 * image_bytes
+    assert compressed_optimized_replay_buffer.bytes_per_transition < 2 * image_bytes
+    assert compressed_optimized_replay_buffer.states[OBS_IMAGE].dtype == torch.uint8
+
+
+def test_memmap_buffer_restore(tmp_path):
+    def create_buffer():
+        return ReplayBuffer(
+            5,
+            "cpu",
+            state_dims(),
+            use_drq=False,
+            compress_images=True,
+            prioritized=True,
+            storage_dir=tmp_path / "buffer",
+        )
+
+    replay_buffer = create_buffer()
+    states = [create_dummy_state() for _ in range(9)]
+    for i in range(8):
+        replay_buffer.add(
+            states[i], create_dummy_action(), float(i), states[i + 1], False, False, {"discrete_penalty": 1.0}
+        )
+    replay_buffer.update_priorities(torch.tensor([0]), torch.tensor([4.0]))
+    replay_buffer.flush()
+    assert (tmp_path / "buffer" / "actions").exists()
+
+    restored_replay_buffer = create_buffer()
+    assert restored_replay_buffer.size == 5
+    assert restored_replay_buffer.position == 3
+    assert restored_replay_buffer.max_priority == replay_buffer.max_priority
+    assert restored_replay_buffer.frame_refcounts == replay_buffer.frame_refcounts
+    assert restored_replay_buffer.free_frames == replay_buffer.free_frames
+    assert restored_replay_buffer.complementary_info_keys == ["discrete_penalty"]
+    assert torch.equal(restored_replay_buffer.rewards, replay_buffer.rewards)
+
+    batch = restored_replay_buffer.sample(5)
+    for i, reward, next_state_image in zip(
+        batch["indices"], batch["reward"], batch["next_state"][OBS_IMAGE], strict=True
+    ):
+        torch.testing.assert_close(next_state_image, states[int(reward) + 1][OBS_IMAGE], atol=1 / 255, rtol=0)
+        assert i.item() == int(reward) % 5
+
+    # The restored buffer keeps sharing frames with the last stored transition
+    restored_replay_buffer.add(
+        states[8], create_dummy_action(), 8.0, states[0], False, False, {"discrete_penalty": 1.0}
+    )
+    assert restored_replay_buffer.state_frames[OBS_IMAGE][3] == replay_buffer.next_state_frames[OBS_IMAGE][2]
+
+
+def test_memmap_buffer_restore_with_different_layout_raises(tmp_path, dummy_state, dummy_action):
+    replay_buffer = ReplayBuffer(5, "cpu", state_dims(), use_drq=False, storage_dir=tmp_path)
+    replay_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+
+    with pytest.raises(ValueError):
+        ReplayBuffer(10, "cpu", state_dims(), use_drq=False, storage_dir=tmp_path)
+
+
+@pytest.mark.parametrize("memmap", [False, True])
+def test_share_memory_with_torch_device(tmp_path, memmap, dummy_state, dummy_action):
+    # The learner passes the storage device as a torch.device
+    replay_buffer = ReplayBuffer(
+        5,
+        "cpu",
+        state_dims(),
+        use_drq=False,
+        storage_device=torch.device("cpu"),
+        storage_dir=tmp_path if memmap else None,
+    )
+    replay_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+
+    assert replay_buffer.share_memory_() is replay_buffer
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="Requires a CUDA device")
+def test_share_memory_rejects_cuda_storage(dummy_state, dummy_action):
+    replay_buffer = ReplayBuffer(5, "cpu", state_dims(), use_drq=False, storage_device=torch.device("cuda"))
+    replay_buffer.add(dummy_state, dummy_action, 1.0, dummy_state, False, False)
+
+    with pytest.raises(ValueError):
+        replay_buffer.share_memory_()
+
+
+@pytest.mark.parametrize("memmap", [False, True])
+def test_multiprocess_iterator_sees_new_transitions(tmp_path, memmap):
+    replay_buffer = ReplayBuffer(
+        capacity=20,
+        device="cpu",
+        state_keys=[OBS_IMAGE, OBS_STATE],
+        use_drq=False,
+        compress_images=True,
+        storage_dir=tmp_path if memmap else None,
+    )
+    states = [{OBS_IMAGE: torch.rand(3, 16, 16), OBS_STATE: torch.randn(11)} for _ in range(21)]
+    for i in range(10):
+        replay_buffer.add(states[i], torch.tensor([0.0]), 0.0, states[i + 1], False, False)
+
+    iterator = replay_buffer.get_iterator(batch_size=4, num_workers=2, queue_size=2)
+    batch = next(iterator)
+    assert batch["state"][OBS_IMAGE].shape == (4, 3, 16, 16)
+    assert batch["state"][OBS_IMAGE].dtype == torch.float32
+    assert torch.all(batch["reward"] == 0.0)
+    assert replay_buffer.sample_latency_s > 0
+
+    # Transitions added after the workers started are sampled too
+    for i in range(10, 20):
+        replay_buffer.add(states[i], torch.tensor([0.0]), 1.0, states[i + 1], False, False)
+    assert any(torch.any(next(iterator)["reward"] == 1.0) for _ in range(50))
+
+    del iterator